@@ -0,0 +1,142 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Counts the TLS connections opened by many threads sharing one client.
+
+A local HTTPS server answers read_task after a short delay, and counts the connections it
+accepts. The threads call read_task with a random think time between the calls, once
+with the default connection pool and once with a pool sized for the threads. A pool
+smaller than the number of threads discards connections, so new ones must be opened.
+
+The server certificate is self-signed, generated with the openssl command unless given.
+
+Usage, from the root of the repository:
+    python -m benchmarks.connection_pool [--threads 32] [--calls 640]
+        [--certfile cert.pem --keyfile key.pem]
+"""
+
+import argparse
+from concurrent import futures
+import http.server
+import json
+import os
+import random
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Any
+import warnings
+
+from clumioapi import clumioapi_client
+from clumioapi import configuration
+import urllib3
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Answers every GET with a completed task, counting the connections."""
+
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self) -> None:
+        super().setup()
+        with _Handler.lock:
+            _Handler.connections += 1
+
+    def do_GET(self) -> None:
+        time.sleep(0.05)
+        body = json.dumps({'id': '1', 'status': 'completed'}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def _self_signed_certificate(directory: str) -> tuple[str, str]:
+    """Generates a self-signed certificate for localhost, returning its files."""
+    certfile = os.path.join(directory, 'cert.pem')
+    keyfile = os.path.join(directory, 'key.pem')
+    subprocess.run(
+        [
+            'openssl',
+            'req',
+            '-x509',
+            '-newkey',
+            'rsa:2048',
+            '-nodes',
+            '-days',
+            '1',
+            '-subj',
+            '/CN=localhost',
+            '-keyout',
+            keyfile,
+            '-out',
+            certfile,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return certfile, keyfile
+
+
+def run(port: int, threads: int, calls: int, **settings: Any) -> tuple[float, int]:
+    """Makes the calls, returning the elapsed seconds and the connections opened."""
+    config = configuration.Configuration(
+        api_token='token', hostname=f'localhost:{port}', **settings
+    )
+    client = clumioapi_client.ClumioAPIClient(config)
+
+    def call(task_id: int) -> None:
+        client.tasks_v1.read_task(str(task_id), verify=False)
+        time.sleep(random.random() * 0.05)
+
+    _Handler.connections = 0
+    start = time.perf_counter()
+    with futures.ThreadPoolExecutor(threads) as executor:
+        list(executor.map(call, range(calls)))
+    return time.perf_counter() - start, _Handler.connections
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=32, help='Number of threads.')
+    parser.add_argument('--calls', type=int, default=640, help='Number of read_task calls.')
+    parser.add_argument('--certfile', help='Certificate of the server.')
+    parser.add_argument('--keyfile', help='Private key of the server.')
+    args = parser.parse_args()
+    # The requests are not verified, as the certificate of the server is self-signed.
+    warnings.filterwarnings('ignore', category=urllib3.exceptions.InsecureRequestWarning)
+
+    with tempfile.TemporaryDirectory() as directory:
+        certfile, keyfile = args.certfile, args.keyfile
+        if certfile is None:
+            certfile, keyfile = _self_signed_certificate(directory)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile, keyfile)
+        server = http.server.ThreadingHTTPServer(('localhost', 0), _Handler)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            for label, settings in (
+                ('defaults', {}),
+                (
+                    f'max_connections_per_host={args.threads}',
+                    {'max_connections_per_host': args.threads},
+                ),
+            ):
+                elapsed, connections = run(server.server_port, args.threads, args.calls, **settings)
+                print(f'{label:30s} {elapsed:5.2f} s, {connections:4d} TLS connections opened')
+        finally:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Measures the import time of the client, with controllers imported lazily or eagerly.
+
+Every measurement runs in a fresh interpreter. The eager case imports all the controller
+modules with the client, as clumioapi_client did before the controllers were imported
+lazily.
+
+Usage, from the root of the repository:
+    python -m benchmarks.import_time [--runs 5]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+_MEASURE = '''
+import json, sys, time
+start = time.perf_counter()
+from clumioapi import clumioapi_client
+if {eager}:
+    import clumioapi.controllers
+    for name in clumioapi.controllers.__all__:
+        getattr(clumioapi.controllers, name)
+imported = time.perf_counter()
+from clumioapi.controllers import tasks_v1
+accessed = time.perf_counter()
+print(json.dumps({{
+    'import_ms': (imported - start) * 1000,
+    'first_access_ms': (accessed - imported) * 1000,
+    'modules': len(sys.modules),
+    'clumioapi_modules': len([m for m in sys.modules if m.startswith('clumioapi')]),
+}}))
+'''
+
+
+def measure(eager: bool) -> dict:
+    """Returns the timings of one import in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, '-c', _MEASURE.format(eager=eager)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='Number of imports to measure.')
+    args = parser.parse_args()
+
+    for label, eager in (('lazy controllers', False), ('eager controllers', True)):
+        runs = [measure(eager) for _ in range(args.runs)]
+        best = min(runs, key=lambda run: run['import_ms'])
+        print(
+            f'{label:18s} import {best["import_ms"]:8.1f} ms, '
+            f'{best["clumioapi_modules"]:4d} clumioapi modules, {best["modules"]:4d} modules; '
+            f'first controller access {best["first_access_ms"]:.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Measures the decoding of a 1000-item list response with each JSON decoder.
+
+The decoders that are not installed are skipped. decode_json is the default decoder of
+the SDK. jsonpickle, which the SDK used before, is measured too when installed.
+
+Usage, from the root of the repository:
+    python -m benchmarks.json_decode [--items 1000] [--number 50] [--repeat 5]
+"""
+
+import argparse
+import importlib
+import json
+import timeit
+from typing import Any, Callable
+
+TASK = {
+    'id': '123',
+    'type': 'aws_ebs_volume_restore',
+    'status': 'completed',
+    'progress_percentage': 100,
+    'created_timestamp': '2025-01-01T00:00:00Z',
+    'primary_entity': {'id': 'vol-1', 'type': 'aws_ebs_volume', 'value': 'vol-1'},
+    '_links': {'_self': {'href': '/tasks/123', 'type': 'get', 'templated': False}},
+    '_etag': 'abc',
+}
+
+AUDIT_TRAIL = {
+    'id': 'a1',
+    'action': 'login',
+    'category': 'user',
+    'status': 'success',
+    'timestamp': '2025-01-01T00:00:00Z',
+    'user': {'email': 'user@example.com', 'id': '1'},
+    'parent_entity': {'id': 'x', 'type': 'y', 'value': 'z'},
+    'primary_entity': {'id': 'x', 'type': 'y', 'value': 'z'},
+    'details': 'x' * 200,
+}
+
+
+def decoders() -> dict[str, Callable[[bytes], Any]]:
+    """Returns the installed decoders, by name."""
+    installed: dict[str, Callable[[bytes], Any]] = {}
+    for name, module, attribute in (
+        ('jsonpickle', 'jsonpickle', 'decode'),
+        ('json', 'json', 'loads'),
+        ('orjson', 'orjson', 'loads'),
+        ('msgspec', 'msgspec', 'json.decode'),
+        ('decode_json', 'clumioapi.api_helper', 'decode_json'),
+    ):
+        try:
+            decoder: Any = importlib.import_module(module)
+        except ImportError:
+            continue
+        for part in attribute.split('.'):
+            decoder = getattr(decoder, part)
+        installed[name] = decoder
+    return installed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=1000, help='Number of items per page.')
+    parser.add_argument('--number', type=int, default=50, help='Decodes per measurement.')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of measurements.')
+    args = parser.parse_args()
+
+    for response, item in (('ListTasksResponse', TASK), ('ListAuditTrailsResponse', AUDIT_TRAIL)):
+        items = [dict(item, id=str(i)) for i in range(args.items)]
+        body = json.dumps({'_embedded': {'items': items}, 'current_count': len(items)}).encode()
+        for name, decoder in decoders().items():
+            best = min(timeit.repeat(lambda: decoder(body), number=args.number, repeat=args.repeat))
+            print(f'{response:24s} {name:11s} {best / args.number * 1000:6.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Measures Model.dict() on 1000-item list responses.
+
+It is compared with dataclasses.asdict and an uncached camel_to_snake, which dict() used
+before api_helper.model_to_dict. Both must return the same dictionary.
+
+Usage, from the root of the repository:
+    python -m benchmarks.model_dict [--items 1000] [--number 5] [--repeat 5]
+"""
+
+import argparse
+import dataclasses
+import re
+import timeit
+from typing import Any
+
+from clumioapi.models import list_ec2_instances_response
+from clumioapi.models import list_tasks_response
+
+TASK = {
+    'id': '123',
+    'type': 'aws_ebs_volume_restore',
+    'status': 'completed',
+    'progress_percentage': 100,
+    'created_timestamp': '2025-01-01T00:00:00Z',
+    'primary_entity': {'id': 'vol-1', 'type': 'aws_ebs_volume', 'value': 'vol-1'},
+    'parent_entity': {'id': 'p', 'type': 't', 'value': 'v'},
+    '_links': {'_self': {'href': '/tasks/123', 'type': 'get', 'templated': False}},
+    '_etag': 'abc',
+}
+
+EC2_INSTANCE = {
+    'id': 'i',
+    'tags': [{'key': 'k', 'value': 'v'}] * 5,
+    'protection_info': {'policy_id': 'p'},
+    'backup_status_info': {'status': 'x'},
+    '_links': {'_self': {'href': 'x'}},
+}
+
+
+def uncached_camel_to_snake(name: str) -> str:
+    """Converts a camel case name to snake case, as api_helper did without a cache."""
+    name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
+    name = re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+    return name.replace('__', '_')
+
+
+def asdict(model: Any) -> dict:
+    """Returns the dictionary of a model, as Model.dict() did with dataclasses.asdict."""
+    return dataclasses.asdict(
+        model, dict_factory=lambda x: {uncached_camel_to_snake(k): v for (k, v) in x}
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=1000, help='Number of items per page.')
+    parser.add_argument('--number', type=int, default=5, help='Calls per measurement.')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of measurements.')
+    args = parser.parse_args()
+
+    for response_class, item in (
+        (list_tasks_response.ListTasksResponse, TASK),
+        (list_ec2_instances_response.ListEc2InstancesResponse, EC2_INSTANCE),
+    ):
+        items = [dict(item, id=str(i)) for i in range(args.items)]
+        response = response_class.from_dictionary({'_embedded': {'items': items}})
+        if response.dict() != asdict(response):
+            raise AssertionError(f'dict() of {response_class.__name__} differs from asdict.')
+        for label, function in (('asdict', asdict), ('dict()', response_class.dict)):
+            best = min(
+                timeit.repeat(lambda: function(response), number=args.number, repeat=args.repeat)
+            )
+            print(f'{response_class.__name__:24s} {label:7s} {best / args.number * 1000:6.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
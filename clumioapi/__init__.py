@@ -6,8 +6,24 @@ sdk_version = 'v1.0.3'
 
 __all__ = [
     'api_helper',
+    'artifact_download',
+    'async_clumioapi_client',
+    'async_transport',
+    'audit_trail_sync',
+    'bulk_restore',
+    'columnar_export',
     'configuration',
+    'file_search',
+    'filesystem_walker',
+    'fleet_snapshot',
+    'http_cache',
+    'instrumentation',
+    'lazy_model',
     'models',
+    'pitr_index',
+    'rate_limiter',
+    'retry_policy',
+    'task_waiter',
     'controllers',
     'exceptions',
     'clumioapi_client',
@@ -2,17 +2,90 @@
 # Copyright 2023. Clumio, A Commvault Company.
 #
 
+import copy
 import dataclasses
 import enum
+import fnmatch
+import functools
 import json
 import re
-from typing import Any, Dict, Mapping
+from typing import Any, Callable, Dict, Mapping
 from urllib import parse
 
-import jsonpickle
+from clumioapi import lazy_model
 
 """A Helper module for various functions associated with API Calls."""
 
+JsonDecoder = Callable[[str | bytes], Any]
+
+
+def _default_json_decoder() -> JsonDecoder:
+    """Returns the fastest JSON decoder installed, falling back to the standard library.
+
+    orjson and msgspec are optional dependencies. Both of them raise a ValueError on malformed
+    input, as json.loads does.
+    """
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+
+        decoder = msgspec.json.Decoder()
+
+        def msgspec_loads(data: str | bytes) -> Any:
+            try:
+                return decoder.decode(data)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+
+        return msgspec_loads
+    except ImportError:
+        pass
+    return json.loads
+
+
+_json_decoder: JsonDecoder = _default_json_decoder()
+
+
+def set_json_decoder(decoder: JsonDecoder | None) -> None:
+    """Sets the function used to decode the JSON payloads of all API responses.
+
+    Args:
+        decoder: A function taking a str or bytes JSON document and returning the decoded
+            object, raising a ValueError on malformed input. If None, the default decoder
+            is restored.
+    """
+    global _json_decoder
+    _json_decoder = decoder or _default_json_decoder()
+
+
+def decode_json(data: str | bytes) -> Any:
+    """Decodes a JSON document using the configured JSON decoder.
+
+    Args:
+        data: The JSON document, such as the content of a response.
+    Returns:
+        The decoded object.
+    Raises:
+        ValueError: If data is not a valid JSON document.
+    """
+    return _json_decoder(data)
+
+
+def model_from_json(cls: Any, data: Any) -> Any:
+    """Creates a model from the decoded JSON of a response.
+
+    The model is built eagerly with from_dictionary, or lazily when lazy models are enabled,
+    see lazy_model.
+    """
+    if lazy_model.is_enabled():
+        return lazy_model.wrap(cls, data)
+    return cls.from_dictionary(data)
+
 
 def json_deserialize(json_string, unboxing_function: Any = None) -> Any:
     """JSON Deserialization of a given string.
@@ -28,8 +101,8 @@ def json_deserialize(json_string, unboxing_function: Any = None) -> Any:
         return None
 
     try:
-        decoded = jsonpickle.decode(json_string)
-    except (json.decoder.JSONDecodeError, ValueError):
+        decoded = decode_json(json_string)
+    except ValueError:
         return json_string
 
     if not unboxing_function:
@@ -77,8 +150,64 @@ def append_url_with_template_parameters(
     return url
 
 
+def path_matches(url_path: str, pattern: str) -> bool:
+    """Returns whether the path of a URL belongs to the endpoint family of a path pattern.
+
+    Patterns are matched with fnmatch. A pattern also matches the paths below it, so '/tasks'
+    matches '/tasks/{task_id}'.
+    """
+    path = url_path.split('?', 1)[0]
+    return fnmatch.fnmatchcase(path, pattern) or fnmatch.fnmatchcase(
+        path, pattern.rstrip('/') + '/*'
+    )
+
+
+@functools.lru_cache(maxsize=4096)
 def camel_to_snake(name: str) -> str:
     """Utility to convert string from camel case to snake case."""
     name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
     name = re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
     return name.replace('__', '_')
+
+
+# The (attribute name, snake case key) pairs of the fields of each model class.
+_model_keys: Dict[type, tuple[tuple[str, str], ...]] = {}
+
+
+def _keys_of(cls: type) -> tuple[tuple[str, str], ...]:
+    """Returns the attribute names of the fields of a model class with their snake case keys."""
+    try:
+        return _model_keys[cls]
+    except KeyError:
+        keys = tuple((f.name, camel_to_snake(f.name)) for f in dataclasses.fields(cls))
+        return _model_keys.setdefault(cls, keys)
+
+
+def _to_primitive(value: Any) -> Any:
+    """Converts a field value of a model for model_to_dict."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {key: _to_primitive(getattr(value, name)) for name, key in _keys_of(type(value))}
+    if isinstance(value, list):
+        return [_to_primitive(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_primitive(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return type(value)(_to_primitive(v) for v in value)
+    return copy.deepcopy(value)
+
+
+def model_to_dict(model: Any) -> Dict[str, Any]:
+    """Returns the dictionary representation of a model, with snake case keys.
+
+    The result is the same as the one of dataclasses.asdict with a dict_factory converting the
+    keys with camel_to_snake, but the keys are converted once per model class and immutable
+    values are not deep copied.
+
+    Args:
+        model: An instance of a model class.
+    Returns:
+        The dictionary representation of the model.
+    """
+    return _to_primitive(model)
@@ -0,0 +1,571 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Streaming, resumable downloads of generated reports and shared restored files.
+
+create_report_download and download_shared_file only return where the artifact will be
+downloaded from. ArtifactDownloader waits for a report to be generated, then streams the
+artifact to disk in chunks, so that memory use does not depend on its size.
+
+The bytes are written to a '.part' file next to the destination, with the state of the
+download in a '.part.json' file. A download interrupted by a dropped connection is resumed
+in place with an HTTP Range request, and one interrupted by a crash or an expired link is
+resumed by downloading to the same path again, with a new link if needed. Large artifacts
+are downloaded as ranged segments in parallel.
+"""
+
+from concurrent import futures
+import dataclasses
+import datetime
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Any, BinaryIO
+
+from clumioapi import clumioapi_client
+from clumioapi import configuration
+from clumioapi import task_waiter
+from clumioapi.controllers.types import report_downloads_types
+from clumioapi.exceptions import clumio_exception
+from clumioapi.models import create_report_download_v1_request
+from clumioapi.models import download_shared_file_v1_request
+from clumioapi.models import report_download
+from dateutil import parser
+import requests
+from requests import adapters
+
+# Exceptions raised while reading the body of a response when the connection drops.
+_STREAM_ERRORS = (
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+_CONTENT_RANGE = re.compile(r'bytes (?:(\d+)-\d+|\*)/(\d+|\*)')
+
+# How long before its task was created a report may have been requested.
+_REPORT_REQUEST_MARGIN = datetime.timedelta(minutes=5)
+
+
+class _ArtifactChanged(clumio_exception.ClumioException):
+    """Raised when the artifact served is not the one being downloaded anymore."""
+
+
+@dataclasses.dataclass(slots=True)
+class DownloadResult:
+    """A downloaded artifact.
+
+    Attributes:
+        path: Path of the downloaded file.
+        size: Size of the file in bytes.
+        digest: Hex digest of the file, computed with the algorithm of the downloader.
+        resumed_from: Number of bytes downloaded by earlier attempts and kept.
+        segments: Number of ranged segments the file was downloaded in, 1 if streamed whole.
+    """
+
+    path: str
+    size: int
+    digest: str
+    resumed_from: int = 0
+    segments: int = 1
+
+
+@dataclasses.dataclass(slots=True)
+class _DownloadState:
+    """The state of a download, as saved next to its '.part' file."""
+
+    etag: str | None = None
+    size: int | None = None
+    segment_size: int | None = None
+    done: list[int] = dataclasses.field(default_factory=list)
+
+
+class ArtifactDownloader:
+    """Downloads reports and shared restored files to disk, resuming interrupted downloads.
+
+    The artifacts are fetched from their download link with a session of the downloader, not
+    the one of the client, so the API token is not sent to the storage serving them. Failed
+    requests are retried as allowed by the retry policy of the client configuration, and a
+    connection dropped while reading is resumed from the last byte written.
+
+    Artifacts of at least parallel_threshold bytes are downloaded as segments of
+    segment_size bytes, max_workers at a time, written in place in the '.part' file. The
+    segments done are saved as they complete, so a resumed download only fetches the others.
+    Smaller artifacts, and those served without range support, are streamed whole.
+
+    Example:
+        ```
+        downloader = ArtifactDownloader(client)
+        result = downloader.download_report(
+            CreateReportDownloadV1Request(Type='compliance', FileName='compliance'),
+            'compliance.csv',
+            timeout=3600,
+        )
+        print(result.path, result.size, result.digest)
+        ```
+
+    Attributes:
+        client: The ClumioAPIClient used to request and locate the artifacts.
+        session: The session downloading the artifacts.
+        chunk_size: Number of bytes read from the network and written to disk at a time.
+        max_workers: Maximum number of segments downloaded at the same time.
+        segment_size: Size in bytes of the segments of the artifacts downloaded in parallel.
+        parallel_threshold: Minimum size in bytes of the artifacts downloaded in parallel.
+        algorithm: Name of the hashlib algorithm computing the digests, such as 'sha256'.
+        poll_interval: Initial interval in seconds between the polls of a report.
+        max_interval: Maximum interval in seconds between the polls of a report.
+    """
+
+    def __init__(
+        self,
+        client: clumioapi_client.ClumioAPIClient,
+        chunk_size: int = 1 << 20,
+        max_workers: int = 4,
+        segment_size: int = 64 << 20,
+        parallel_threshold: int = 256 << 20,
+        algorithm: str = 'sha256',
+        poll_interval: float = 5.0,
+        max_interval: float = 60.0,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1.')
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+        if segment_size < 1:
+            raise ValueError('segment_size must be at least 1.')
+        hashlib.new(algorithm)
+        self.client = client
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.segment_size = segment_size
+        self.parallel_threshold = parallel_threshold
+        self.algorithm = algorithm
+        self.poll_interval = poll_interval
+        self.max_interval = max_interval
+        self.session = requests.Session()
+        self.session.mount('https://', adapters.HTTPAdapter(pool_maxsize=max_workers))
+        # The bytes must be stored as served for the ranges of a resumed download to match.
+        self.session.headers['Accept-Encoding'] = 'identity'
+
+    def download_report(
+        self,
+        body: create_report_download_v1_request.CreateReportDownloadV1Request,
+        path: str,
+        timeout: float | None = None,
+        checksum: str | None = None,
+    ) -> DownloadResult:
+        """Generates a report and downloads it to a file.
+
+        The report is generated anew on every call. To resume the download of a report
+        generated earlier, pass its task ID to wait_for_report and its link to download.
+
+        Args:
+            body: The request creating the report.
+            path: Path of the file to write.
+            timeout: Maximum number of seconds to wait for the report to be generated, or
+                None to wait indefinitely.
+            checksum: The expected hex digest of the report, if known.
+        Returns:
+            The downloaded report.
+        Raises:
+            TimeoutError: If the report was not generated within the timeout.
+            ClumioException: If the report cannot be generated or downloaded, or its digest
+                is not the expected one.
+        """
+        response = self.client.report_downloads_v1.create_report_download(body=body)
+        report = self.wait_for_report(response.TaskId, timeout)  # type: ignore
+        return self.download(report.DownloadLink, path, checksum)  # type: ignore
+
+    def wait_for_report(
+        self, task_id: str, timeout: float | None = None
+    ) -> report_download.ReportDownload:
+        """Waits for the task generating a report to complete, then returns the report.
+
+        Args:
+            task_id: The ID of the task returned by create_report_download.
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely.
+        Returns:
+            The report, with its download link.
+        Raises:
+            TimeoutError: If the report was not generated within the timeout.
+            ClumioException: If the task generating the report failed or was aborted.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waiter = task_waiter.TaskWaiter(
+            self.client, poll_interval=self.poll_interval, max_interval=self.max_interval
+        )
+        task = waiter.wait_for_all([task_id], timeout=timeout)[task_id]
+        if task.Status != 'completed':
+            raise clumio_exception.ClumioException(f'The report task {task_id} {task.Status}.')
+        # The reports cannot be filtered by task, only by the time they were requested.
+        query_filter = None
+        if task.CreatedTimestamp:
+            requested = parser.isoparse(task.CreatedTimestamp)
+            query_filter = report_downloads_types.ListReportDownloadsV1FilterT(
+                StartTimestamp={'gte': (requested - _REPORT_REQUEST_MARGIN).isoformat()}
+            )
+        # The report may be listed shortly after its task completes.
+        interval = self.poll_interval
+        while True:
+            reports = self.client.report_downloads_v1_paginator.list_report_downloads(
+                filter=query_filter
+            )
+            try:
+                for report in reports.iter_items():
+                    if report.TaskId == task_id and report.DownloadLink:
+                        return report
+            finally:
+                reports.close()
+            delay = interval
+            if deadline is not None:
+                delay = min(delay, deadline - time.monotonic())
+                if delay <= 0:
+                    raise TimeoutError(f'Timed out waiting for the report of task {task_id}.')
+            time.sleep(delay)
+            interval = min(self.max_interval, interval * 1.5)
+
+    def download_shared_file(
+        self,
+        body: download_shared_file_v1_request.DownloadSharedFileV1Request,
+        path: str,
+        checksum: str | None = None,
+    ) -> DownloadResult:
+        """Downloads the ZIP file of restored files shared by email.
+
+        Args:
+            body: The email link and passcode of the shared files.
+            path: Path of the file to write.
+            checksum: The expected hex digest of the ZIP file, if known.
+        Returns:
+            The downloaded ZIP file.
+        Raises:
+            ClumioException: If the file cannot be downloaded or its digest is not the
+                expected one.
+        """
+        response = self.client.restored_files_v1.download_shared_file(body=body)
+        if not response.DownloadUrl:
+            raise clumio_exception.ClumioException('No download URL returned for the shared file.')
+        return self.download(response.DownloadUrl, path, checksum)
+
+    def download(self, url: str, path: str, checksum: str | None = None) -> DownloadResult:
+        """Downloads an artifact from its link to a file, resuming an earlier download.
+
+        The file is only created once fully downloaded and verified. If the '.part' file of
+        an earlier download of the same artifact is found, only the missing bytes are
+        fetched; the link may differ, as long as the artifact has the same ETag.
+
+        Args:
+            url: The download link of the artifact.
+            path: Path of the file to write.
+            checksum: The expected hex digest of the artifact, if known.
+        Returns:
+            The downloaded artifact.
+        Raises:
+            ClumioException: If the artifact cannot be downloaded, changed during the
+                download, or its digest is not the expected one.
+        """
+        part_path, state_path = f'{path}.part', f'{path}.part.json'
+        state = self._load_state(state_path, part_path)
+        if state is None:
+            # A '.part' file without a state is not known to be of this artifact.
+            state, offset = _DownloadState(), 0
+        elif state.segment_size is not None:
+            return self._download_segments(url, path, state, checksum)
+        else:
+            offset = os.path.getsize(part_path)
+        response = self._get(url, offset, None, state.etag)
+        if response.status_code == 416 and _content_range(response)[1] != offset:
+            # The '.part' file is not a prefix of the artifact.
+            response.close()
+            offset, state = 0, _DownloadState()
+            response = self._get(url, 0, None, None)
+        if response.status_code == 416:
+            response.close()
+            if _content_range(response)[1] != offset:
+                raise clumio_exception.ClumioException(
+                    f'Requested the artifact from byte {offset}, which is not in its range.'
+                )
+            # The artifact was already downloaded whole, or is empty.
+            state.size = offset
+            self._save_state(state_path, state)
+            with open(part_path, 'ab'):
+                pass
+            return self._finish(path, state, self._file_digest(part_path), checksum, offset)
+        if response.status_code == 206:
+            start, state.size = _content_range(response)
+            if start != offset:
+                response.close()
+                raise clumio_exception.ClumioException(
+                    f'Requested the artifact from byte {offset}, received it from byte {start}.'
+                )
+        else:
+            # The artifact changed, or is served without range support.
+            offset = 0
+            length = response.headers.get('Content-Length')
+            state.size = int(length) if length and length.isdigit() else None
+        state.etag = response.headers.get('ETag')
+
+        if (
+            response.status_code == 206
+            and state.size is not None
+            and self.max_workers > 1
+            and state.size - offset >= self.parallel_threshold
+        ):
+            response.close()
+            state.segment_size = self.segment_size
+            # The segments already downloaded whole are kept.
+            state.done = list(range(offset // self.segment_size))
+            with open(part_path, 'ab') as f:
+                f.truncate(offset)
+            self._save_state(state_path, state)
+            return self._download_segments(url, path, state, checksum)
+
+        self._save_state(state_path, state)
+        digest = self._file_digest(part_path, offset) if offset else hashlib.new(self.algorithm)
+        with open(part_path, 'r+b' if os.path.exists(part_path) else 'wb') as f:
+            f.seek(offset)
+            f.truncate()
+            end = None if state.size is None else state.size - 1
+            self._fetch_range(url, f, offset, end, state.etag, digest, response)
+        return self._finish(path, state, digest, checksum, offset)
+
+    def _download_segments(
+        self, url: str, path: str, state: _DownloadState, checksum: str | None
+    ) -> DownloadResult:
+        """Downloads the segments of the artifact not done yet, max_workers at a time."""
+        part_path, state_path = f'{path}.part', f'{path}.part.json'
+        size, segment_size = state.size or 0, state.segment_size or self.segment_size
+        count = -(-size // segment_size)
+        done = set(state.done)
+        resumed_from = sum(min(segment_size, size - index * segment_size) for index in done)
+        pending = iter([index for index in range(count) if index not in done])
+        with open(part_path, 'ab') as f:
+            f.truncate(size)
+
+        def fetch(index: int) -> None:
+            start = index * segment_size
+            end = min(size, start + segment_size) - 1
+            with open(part_path, 'r+b') as f:
+                f.seek(start)
+                self._fetch_range(url, f, start, end, state.etag, None, None)
+                # The segment must be on disk before it is saved as done.
+                f.flush()
+                os.fsync(f.fileno())
+
+        in_flight: dict[futures.Future, int] = {}
+        with futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='clumioapi-download'
+        ) as executor:
+            try:
+                while True:
+                    while len(in_flight) < self.max_workers:
+                        index = next(pending, None)
+                        if index is None:
+                            break
+                        in_flight[executor.submit(fetch, index)] = index
+                    if not in_flight:
+                        break
+                    finished, _ = futures.wait(in_flight, return_when=futures.FIRST_COMPLETED)
+                    for future in finished:
+                        index = in_flight.pop(future)
+                        future.result()
+                        state.done.append(index)
+                    self._save_state(state_path, state)
+            except _ArtifactChanged:
+                # The segments done are of another version of the artifact.
+                os.remove(state_path)
+                raise
+            finally:
+                for future in in_flight:
+                    future.cancel()
+        result = self._finish(path, state, self._file_digest(part_path), checksum, resumed_from)
+        result.segments = count
+        return result
+
+    def _fetch_range(
+        self,
+        url: str,
+        f: BinaryIO,
+        position: int,
+        end: int | None,
+        etag: str | None,
+        digest: Any,
+        response: requests.Response | None,
+    ) -> None:
+        """Writes the bytes of the artifact from position to end, included, to f.
+
+        The bytes are written at the current position of f, and added to the digest if any.
+        A connection dropped while reading is resumed from the last byte written, as long as
+        bytes keep arriving or the retry policy allows another attempt. response is the
+        response to read first, if already requested. With no end, the artifact is read
+        until the end of the response. A server ignoring the range sends the artifact from
+        its start: the bytes before position are then skipped.
+        """
+        policy = self._config.retry_policy
+        attempt = 1
+        while end is None or position <= end:
+            if response is None:
+                response = self._get(url, position, end, etag)
+            received = position
+            error: Exception | None = None
+            try:
+                skip = _bytes_before(response, position, etag)
+                if skip is None:
+                    raise _ArtifactChanged(
+                        'The artifact changed during the download, download it again.'
+                    )
+                for chunk in response.iter_content(self.chunk_size):
+                    if skip:
+                        chunk, skip = chunk[skip:], max(0, skip - len(chunk))
+                    if end is not None:
+                        chunk = chunk[: end + 1 - position]
+                    f.write(chunk)
+                    if digest is not None:
+                        digest.update(chunk)
+                    position += len(chunk)
+                    if end is not None and position > end:
+                        break
+            except _STREAM_ERRORS as e:
+                error = e
+            finally:
+                response.close()
+                response = None
+            if error is None and (end is None or position > end):
+                return
+            if position > received:
+                attempt = 1
+            if attempt >= policy.max_attempts:
+                if error is not None:
+                    raise error
+                assert end is not None
+                raise clumio_exception.ClumioException(
+                    f'The download of the artifact ended at byte {position} of {end + 1}.'
+                )
+            time.sleep(policy.delay(attempt))
+            attempt += 1
+
+    def _get(self, url: str, start: int, end: int | None, etag: str | None) -> requests.Response:
+        """Requests a range of the artifact, retrying as allowed by the retry policy.
+
+        Returns the successful or 416 response, its body not read yet.
+        """
+        headers = {'Range': f'bytes={start}-{"" if end is None else end}'}
+        if etag:
+            # If the artifact changed, the server sends it whole rather than the range.
+            headers['If-Range'] = etag
+        config = self._config
+        policy = config.retry_policy
+        attempt = 1
+        while True:
+            try:
+                response = self.session.get(
+                    url, headers=headers, stream=True, timeout=config.timeout
+                )
+            except requests.exceptions.RequestException as e:
+                if not policy.should_retry('get', attempt, error=e):
+                    raise
+                time.sleep(policy.delay(attempt))
+                attempt += 1
+                continue
+            if response.ok or response.status_code == 416:
+                return response
+            response.close()
+            if not policy.should_retry('get', attempt, response=response):
+                reason = (
+                    f'Downloading the artifact failed: {response.status_code} {response.reason}.'
+                )
+                if response.status_code == 403:
+                    reason += ' The download link may have expired, download it again.'
+                raise clumio_exception.ClumioException(reason)
+            time.sleep(policy.delay(attempt, response))
+            attempt += 1
+
+    def _finish(
+        self,
+        path: str,
+        state: _DownloadState,
+        digest: Any,
+        checksum: str | None,
+        resumed_from: int,
+    ) -> DownloadResult:
+        """Verifies the downloaded '.part' file and moves it to the path."""
+        part_path, state_path = f'{path}.part', f'{path}.part.json'
+        hexdigest = digest.hexdigest()
+        if checksum is not None and hexdigest.lower() != checksum.lower():
+            os.remove(part_path)
+            os.remove(state_path)
+            raise clumio_exception.ClumioException(
+                f'The {self.algorithm} digest of the artifact is {hexdigest}, expected {checksum}.'
+            )
+        size = os.path.getsize(part_path)
+        if state.size is not None and size != state.size:
+            raise clumio_exception.ClumioException(
+                f'Downloaded {size} bytes of the artifact, expected {state.size}.'
+            )
+        os.replace(part_path, path)
+        os.remove(state_path)
+        return DownloadResult(path, size, hexdigest, resumed_from)
+
+    def _file_digest(self, part_path: str, size: int | None = None) -> Any:
+        """Returns the digest of the first size bytes of a file, or of all of it."""
+        digest = hashlib.new(self.algorithm)
+        remaining = os.path.getsize(part_path) if size is None else size
+        with open(part_path, 'rb') as f:
+            while remaining > 0:
+                chunk = f.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                digest.update(chunk)
+                remaining -= len(chunk)
+        return digest
+
+    @property
+    def _config(self) -> configuration.Configuration:
+        return self.client.base_controller.config
+
+    @staticmethod
+    def _load_state(state_path: str, part_path: str) -> _DownloadState | None:
+        """Returns the saved state of the download, if any."""
+        if not os.path.exists(state_path) or not os.path.exists(part_path):
+            return None
+        with open(state_path, encoding='utf-8') as f:
+            return _DownloadState(**json.load(f))
+
+    @staticmethod
+    def _save_state(state_path: str, state: _DownloadState) -> None:
+        """Atomically replaces the saved state of the download."""
+        tmp_path = f'{state_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dataclasses.asdict(state), f)
+        os.replace(tmp_path, state_path)
+
+
+def _content_range(response: requests.Response) -> tuple[int | None, int | None]:
+    """Returns the first byte and the total size given by the Content-Range of a response."""
+    match = _CONTENT_RANGE.fullmatch(response.headers.get('Content-Range', '').strip())
+    if match is None:
+        return None, None
+    start, total = match.groups()
+    return (
+        None if start is None else int(start),
+        None if total == '*' else int(total),
+    )
+
+
+def _bytes_before(response: requests.Response, position: int, etag: str | None) -> int | None:
+    """Returns the number of bytes before the requested position in the body of a response.
+
+    A server ignoring the range sends the artifact whole, with a 200 rather than a 206. None
+    is returned if the artifact is not the one requested, as when it changed and the server
+    sends the new one in response to If-Range.
+    """
+    if response.status_code == 206:
+        return 0
+    if response.status_code != 200:
+        return None
+    if etag is not None and response.headers.get('ETag') != etag:
+        return None
+    return position
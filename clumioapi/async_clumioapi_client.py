@@ -0,0 +1,1344 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Asynchronous client for the Clumio APIs."""
+
+from __future__ import annotations
+
+from typing import Any, TYPE_CHECKING
+
+from clumioapi import async_transport
+from clumioapi import configuration
+from clumioapi.controllers import base_controller
+
+if TYPE_CHECKING:
+    from clumioapi.controllers import audit_trails_v1
+    from clumioapi.controllers import auto_user_provisioning_rules_v1
+    from clumioapi.controllers import auto_user_provisioning_settings_v1
+    from clumioapi.controllers import aws_connection_groups_v1
+    from clumioapi.controllers import aws_connections_v1
+    from clumioapi.controllers import aws_dynamodb_tables_v1
+    from clumioapi.controllers import aws_ebs_volumes_v1
+    from clumioapi.controllers import aws_ec2_instances_v1
+    from clumioapi.controllers import aws_environment_tags_v1
+    from clumioapi.controllers import aws_environments_v1
+    from clumioapi.controllers import aws_rds_resource_restored_records_v1
+    from clumioapi.controllers import aws_rds_resources_v1
+    from clumioapi.controllers import aws_regions_v1
+    from clumioapi.controllers import aws_s3_buckets_v1
+    from clumioapi.controllers import aws_templates_v1
+    from clumioapi.controllers import backup_aws_dynamodb_tables_v1
+    from clumioapi.controllers import backup_aws_ebs_volumes_v1
+    from clumioapi.controllers import backup_aws_ebs_volumes_v2
+    from clumioapi.controllers import backup_aws_ec2_instances_v1
+    from clumioapi.controllers import backup_aws_rds_resource_database_tables_v1
+    from clumioapi.controllers import backup_aws_rds_resource_databases_v1
+    from clumioapi.controllers import backup_aws_rds_resources_v1
+    from clumioapi.controllers import backup_ec2_mssql_databases_v1
+    from clumioapi.controllers import backup_filesystem_directories_v1
+    from clumioapi.controllers import backup_filesystems_v1
+    from clumioapi.controllers import backup_protection_groups_v1
+    from clumioapi.controllers import backups_files_v1
+    from clumioapi.controllers import consolidated_alerts_v1
+    from clumioapi.controllers import ec2_mssql_availability_groups_v1
+    from clumioapi.controllers import ec2_mssql_databases_v1
+    from clumioapi.controllers import ec2_mssql_failover_cluster_v1
+    from clumioapi.controllers import ec2_mssql_failover_clusters_v1
+    from clumioapi.controllers import ec2_mssql_hosts_v1
+    from clumioapi.controllers import ec2_mssql_instance_v1
+    from clumioapi.controllers import general_settings_v2
+    from clumioapi.controllers import individual_alerts_v1
+    from clumioapi.controllers import management_groups_v1
+    from clumioapi.controllers import organizational_units_v1
+    from clumioapi.controllers import organizational_units_v2
+    from clumioapi.controllers import policy_assignments_v1
+    from clumioapi.controllers import policy_definitions_v1
+    from clumioapi.controllers import policy_rules_v1
+    from clumioapi.controllers import post_process_aws_connection_v1
+    from clumioapi.controllers import post_process_kms_v1
+    from clumioapi.controllers import protection_groups_s3_assets_v1
+    from clumioapi.controllers import protection_groups_v1
+    from clumioapi.controllers import report_compliance_runs_v1
+    from clumioapi.controllers import report_compliance_v1
+    from clumioapi.controllers import report_downloads_v1
+    from clumioapi.controllers import restore_ec2_mssql_database_v1
+    from clumioapi.controllers import restored_aws_dynamodb_tables_v1
+    from clumioapi.controllers import restored_aws_ebs_volumes_v1
+    from clumioapi.controllers import restored_aws_ebs_volumes_v2
+    from clumioapi.controllers import restored_aws_ec2_instances_v1
+    from clumioapi.controllers import restored_aws_rds_resources_v1
+    from clumioapi.controllers import restored_aws_s3_buckets_v1
+    from clumioapi.controllers import restored_files_v1
+    from clumioapi.controllers import restored_protection_group_instant_access_endpoints_v1
+    from clumioapi.controllers import restored_protection_group_s3_assets_v1
+    from clumioapi.controllers import restored_protection_groups_v1
+    from clumioapi.controllers import restored_records_aws_dynamodb_tables_v1
+    from clumioapi.controllers import roles_v1
+    from clumioapi.controllers import tasks_v1
+    from clumioapi.controllers import users_v1
+    from clumioapi.controllers import users_v2
+    from clumioapi.controllers import wallets_v1
+
+
+class AsyncClumioAPIClient:
+    """Asynchronous client for the Clumio APIs.
+
+    Every controller and paginator of ClumioAPIClient is available under the same property
+    name. Controller methods are coroutine functions and paginator methods return
+    asynchronous iterators. All the requests share the connection pool of the transport, so
+    a single event loop can drive many concurrent calls. Controllers and paginators are
+    built once and reused, as those of ClumioAPIClient.
+
+    Example:
+        ```
+        async with AsyncClumioAPIClient(config) as client:
+            task = await client.tasks_v1.read_task(task_id)
+            async for page in client.tasks_v1_paginator.list_tasks():
+                ...
+        ```
+    """
+
+    def __init__(
+        self,
+        config: configuration.Configuration,
+        transport: async_transport.AsyncTransport | None = None,
+    ) -> None:
+        self.transport = transport or async_transport.AsyncTransport(config)
+        self.base_controller = base_controller.AsyncBaseController(config, self.transport)
+
+    def invalidate_controllers(self) -> None:
+        """Discards the cached controllers so that they are rebuilt on their next access.
+
+        This must be called after mutating the custom_headers mapping of the configuration in
+        place, as such changes cannot be detected.
+        """
+        self.base_controller.invalidate_controllers()
+
+    async def aclose(self) -> None:
+        """Closes the connections of the transport."""
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> AsyncClumioAPIClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    @property
+    def consolidated_alerts_v1_paginator(
+        self,
+    ) -> consolidated_alerts_v1.ConsolidatedAlertsV1AsyncControllerPaginator:
+        from clumioapi.controllers import consolidated_alerts_v1
+
+        return self.base_controller.get_controller(
+            consolidated_alerts_v1.ConsolidatedAlertsV1AsyncControllerPaginator
+        )
+
+    @property
+    def consolidated_alerts_v1(self) -> consolidated_alerts_v1.ConsolidatedAlertsV1AsyncController:
+        from clumioapi.controllers import consolidated_alerts_v1
+
+        return self.base_controller.get_controller(
+            consolidated_alerts_v1.ConsolidatedAlertsV1AsyncController
+        )
+
+    @property
+    def individual_alerts_v1_paginator(
+        self,
+    ) -> individual_alerts_v1.IndividualAlertsV1AsyncControllerPaginator:
+        from clumioapi.controllers import individual_alerts_v1
+
+        return self.base_controller.get_controller(
+            individual_alerts_v1.IndividualAlertsV1AsyncControllerPaginator
+        )
+
+    @property
+    def individual_alerts_v1(self) -> individual_alerts_v1.IndividualAlertsV1AsyncController:
+        from clumioapi.controllers import individual_alerts_v1
+
+        return self.base_controller.get_controller(
+            individual_alerts_v1.IndividualAlertsV1AsyncController
+        )
+
+    @property
+    def audit_trails_v1_paginator(self) -> audit_trails_v1.AuditTrailsV1AsyncControllerPaginator:
+        from clumioapi.controllers import audit_trails_v1
+
+        return self.base_controller.get_controller(
+            audit_trails_v1.AuditTrailsV1AsyncControllerPaginator
+        )
+
+    @property
+    def audit_trails_v1(self) -> audit_trails_v1.AuditTrailsV1AsyncController:
+        from clumioapi.controllers import audit_trails_v1
+
+        return self.base_controller.get_controller(audit_trails_v1.AuditTrailsV1AsyncController)
+
+    @property
+    def backup_aws_dynamodb_tables_v1_paginator(
+        self,
+    ) -> backup_aws_dynamodb_tables_v1.BackupAwsDynamodbTablesV1AsyncControllerPaginator:
+        from clumioapi.controllers import backup_aws_dynamodb_tables_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_dynamodb_tables_v1.BackupAwsDynamodbTablesV1AsyncControllerPaginator
+        )
+
+    @property
+    def backup_aws_dynamodb_tables_v1(
+        self,
+    ) -> backup_aws_dynamodb_tables_v1.BackupAwsDynamodbTablesV1AsyncController:
+        from clumioapi.controllers import backup_aws_dynamodb_tables_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_dynamodb_tables_v1.BackupAwsDynamodbTablesV1AsyncController
+        )
+
+    @property
+    def backup_aws_ebs_volumes_v2_paginator(
+        self,
+    ) -> backup_aws_ebs_volumes_v2.BackupAwsEbsVolumesV2AsyncControllerPaginator:
+        from clumioapi.controllers import backup_aws_ebs_volumes_v2
+
+        return self.base_controller.get_controller(
+            backup_aws_ebs_volumes_v2.BackupAwsEbsVolumesV2AsyncControllerPaginator
+        )
+
+    @property
+    def backup_aws_ebs_volumes_v2(
+        self,
+    ) -> backup_aws_ebs_volumes_v2.BackupAwsEbsVolumesV2AsyncController:
+        from clumioapi.controllers import backup_aws_ebs_volumes_v2
+
+        return self.base_controller.get_controller(
+            backup_aws_ebs_volumes_v2.BackupAwsEbsVolumesV2AsyncController
+        )
+
+    @property
+    def backup_aws_ebs_volumes_v1_paginator(
+        self,
+    ) -> backup_aws_ebs_volumes_v1.BackupAwsEbsVolumesV1AsyncControllerPaginator:
+        from clumioapi.controllers import backup_aws_ebs_volumes_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_ebs_volumes_v1.BackupAwsEbsVolumesV1AsyncControllerPaginator
+        )
+
+    @property
+    def backup_aws_ebs_volumes_v1(
+        self,
+    ) -> backup_aws_ebs_volumes_v1.BackupAwsEbsVolumesV1AsyncController:
+        from clumioapi.controllers import backup_aws_ebs_volumes_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_ebs_volumes_v1.BackupAwsEbsVolumesV1AsyncController
+        )
+
+    @property
+    def backup_aws_ec2_instances_v1_paginator(
+        self,
+    ) -> backup_aws_ec2_instances_v1.BackupAwsEc2InstancesV1AsyncControllerPaginator:
+        from clumioapi.controllers import backup_aws_ec2_instances_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_ec2_instances_v1.BackupAwsEc2InstancesV1AsyncControllerPaginator
+        )
+
+    @property
+    def backup_aws_ec2_instances_v1(
+        self,
+    ) -> backup_aws_ec2_instances_v1.BackupAwsEc2InstancesV1AsyncController:
+        from clumioapi.controllers import backup_aws_ec2_instances_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_ec2_instances_v1.BackupAwsEc2InstancesV1AsyncController
+        )
+
+    @property
+    def backup_ec2_mssql_databases_v1_paginator(
+        self,
+    ) -> backup_ec2_mssql_databases_v1.BackupEc2MssqlDatabasesV1AsyncControllerPaginator:
+        from clumioapi.controllers import backup_ec2_mssql_databases_v1
+
+        return self.base_controller.get_controller(
+            backup_ec2_mssql_databases_v1.BackupEc2MssqlDatabasesV1AsyncControllerPaginator
+        )
+
+    @property
+    def backup_ec2_mssql_databases_v1(
+        self,
+    ) -> backup_ec2_mssql_databases_v1.BackupEc2MssqlDatabasesV1AsyncController:
+        from clumioapi.controllers import backup_ec2_mssql_databases_v1
+
+        return self.base_controller.get_controller(
+            backup_ec2_mssql_databases_v1.BackupEc2MssqlDatabasesV1AsyncController
+        )
+
+    @property
+    def backup_aws_rds_resources_v1_paginator(
+        self,
+    ) -> backup_aws_rds_resources_v1.BackupAwsRdsResourcesV1AsyncControllerPaginator:
+        from clumioapi.controllers import backup_aws_rds_resources_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_rds_resources_v1.BackupAwsRdsResourcesV1AsyncControllerPaginator
+        )
+
+    @property
+    def backup_aws_rds_resources_v1(
+        self,
+    ) -> backup_aws_rds_resources_v1.BackupAwsRdsResourcesV1AsyncController:
+        from clumioapi.controllers import backup_aws_rds_resources_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_rds_resources_v1.BackupAwsRdsResourcesV1AsyncController
+        )
+
+    @property
+    def backup_aws_rds_resource_databases_v1_paginator(
+        self,
+    ) -> (
+        backup_aws_rds_resource_databases_v1.BackupAwsRdsResourceDatabasesV1AsyncControllerPaginator
+    ):
+        from clumioapi.controllers import backup_aws_rds_resource_databases_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_rds_resource_databases_v1.BackupAwsRdsResourceDatabasesV1AsyncControllerPaginator
+        )
+
+    @property
+    def backup_aws_rds_resource_databases_v1(
+        self,
+    ) -> backup_aws_rds_resource_databases_v1.BackupAwsRdsResourceDatabasesV1AsyncController:
+        from clumioapi.controllers import backup_aws_rds_resource_databases_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_rds_resource_databases_v1.BackupAwsRdsResourceDatabasesV1AsyncController
+        )
+
+    @property
+    def backup_aws_rds_resource_database_tables_v1_paginator(
+        self,
+    ) -> (
+        backup_aws_rds_resource_database_tables_v1.BackupAwsRdsResourceDatabaseTablesV1AsyncControllerPaginator
+    ):
+        from clumioapi.controllers import backup_aws_rds_resource_database_tables_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_rds_resource_database_tables_v1.BackupAwsRdsResourceDatabaseTablesV1AsyncControllerPaginator
+        )
+
+    @property
+    def backup_aws_rds_resource_database_tables_v1(
+        self,
+    ) -> (
+        backup_aws_rds_resource_database_tables_v1.BackupAwsRdsResourceDatabaseTablesV1AsyncController
+    ):
+        from clumioapi.controllers import backup_aws_rds_resource_database_tables_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_rds_resource_database_tables_v1.BackupAwsRdsResourceDatabaseTablesV1AsyncController
+        )
+
+    @property
+    def backups_files_v1_paginator(self) -> backups_files_v1.BackupsFilesV1AsyncControllerPaginator:
+        from clumioapi.controllers import backups_files_v1
+
+        return self.base_controller.get_controller(
+            backups_files_v1.BackupsFilesV1AsyncControllerPaginator
+        )
+
+    @property
+    def backups_files_v1(self) -> backups_files_v1.BackupsFilesV1AsyncController:
+        from clumioapi.controllers import backups_files_v1
+
+        return self.base_controller.get_controller(backups_files_v1.BackupsFilesV1AsyncController)
+
+    @property
+    def backup_protection_groups_v1_paginator(
+        self,
+    ) -> backup_protection_groups_v1.BackupProtectionGroupsV1AsyncControllerPaginator:
+        from clumioapi.controllers import backup_protection_groups_v1
+
+        return self.base_controller.get_controller(
+            backup_protection_groups_v1.BackupProtectionGroupsV1AsyncControllerPaginator
+        )
+
+    @property
+    def backup_protection_groups_v1(
+        self,
+    ) -> backup_protection_groups_v1.BackupProtectionGroupsV1AsyncController:
+        from clumioapi.controllers import backup_protection_groups_v1
+
+        return self.base_controller.get_controller(
+            backup_protection_groups_v1.BackupProtectionGroupsV1AsyncController
+        )
+
+    @property
+    def backup_filesystems_v1_paginator(
+        self,
+    ) -> backup_filesystems_v1.BackupFilesystemsV1AsyncControllerPaginator:
+        from clumioapi.controllers import backup_filesystems_v1
+
+        return self.base_controller.get_controller(
+            backup_filesystems_v1.BackupFilesystemsV1AsyncControllerPaginator
+        )
+
+    @property
+    def backup_filesystems_v1(self) -> backup_filesystems_v1.BackupFilesystemsV1AsyncController:
+        from clumioapi.controllers import backup_filesystems_v1
+
+        return self.base_controller.get_controller(
+            backup_filesystems_v1.BackupFilesystemsV1AsyncController
+        )
+
+    @property
+    def backup_filesystem_directories_v1_paginator(
+        self,
+    ) -> backup_filesystem_directories_v1.BackupFilesystemDirectoriesV1AsyncControllerPaginator:
+        from clumioapi.controllers import backup_filesystem_directories_v1
+
+        return self.base_controller.get_controller(
+            backup_filesystem_directories_v1.BackupFilesystemDirectoriesV1AsyncControllerPaginator
+        )
+
+    @property
+    def backup_filesystem_directories_v1(
+        self,
+    ) -> backup_filesystem_directories_v1.BackupFilesystemDirectoriesV1AsyncController:
+        from clumioapi.controllers import backup_filesystem_directories_v1
+
+        return self.base_controller.get_controller(
+            backup_filesystem_directories_v1.BackupFilesystemDirectoriesV1AsyncController
+        )
+
+    @property
+    def aws_connections_v1_paginator(
+        self,
+    ) -> aws_connections_v1.AwsConnectionsV1AsyncControllerPaginator:
+        from clumioapi.controllers import aws_connections_v1
+
+        return self.base_controller.get_controller(
+            aws_connections_v1.AwsConnectionsV1AsyncControllerPaginator
+        )
+
+    @property
+    def aws_connections_v1(self) -> aws_connections_v1.AwsConnectionsV1AsyncController:
+        from clumioapi.controllers import aws_connections_v1
+
+        return self.base_controller.get_controller(
+            aws_connections_v1.AwsConnectionsV1AsyncController
+        )
+
+    @property
+    def aws_connection_groups_v1_paginator(
+        self,
+    ) -> aws_connection_groups_v1.AwsConnectionGroupsV1AsyncControllerPaginator:
+        from clumioapi.controllers import aws_connection_groups_v1
+
+        return self.base_controller.get_controller(
+            aws_connection_groups_v1.AwsConnectionGroupsV1AsyncControllerPaginator
+        )
+
+    @property
+    def aws_connection_groups_v1(
+        self,
+    ) -> aws_connection_groups_v1.AwsConnectionGroupsV1AsyncController:
+        from clumioapi.controllers import aws_connection_groups_v1
+
+        return self.base_controller.get_controller(
+            aws_connection_groups_v1.AwsConnectionGroupsV1AsyncController
+        )
+
+    @property
+    def post_process_aws_connection_v1_paginator(
+        self,
+    ) -> post_process_aws_connection_v1.PostProcessAwsConnectionV1AsyncControllerPaginator:
+        from clumioapi.controllers import post_process_aws_connection_v1
+
+        return self.base_controller.get_controller(
+            post_process_aws_connection_v1.PostProcessAwsConnectionV1AsyncControllerPaginator
+        )
+
+    @property
+    def post_process_aws_connection_v1(
+        self,
+    ) -> post_process_aws_connection_v1.PostProcessAwsConnectionV1AsyncController:
+        from clumioapi.controllers import post_process_aws_connection_v1
+
+        return self.base_controller.get_controller(
+            post_process_aws_connection_v1.PostProcessAwsConnectionV1AsyncController
+        )
+
+    @property
+    def aws_regions_v1_paginator(self) -> aws_regions_v1.AwsRegionsV1AsyncControllerPaginator:
+        from clumioapi.controllers import aws_regions_v1
+
+        return self.base_controller.get_controller(
+            aws_regions_v1.AwsRegionsV1AsyncControllerPaginator
+        )
+
+    @property
+    def aws_regions_v1(self) -> aws_regions_v1.AwsRegionsV1AsyncController:
+        from clumioapi.controllers import aws_regions_v1
+
+        return self.base_controller.get_controller(aws_regions_v1.AwsRegionsV1AsyncController)
+
+    @property
+    def aws_templates_v1_paginator(self) -> aws_templates_v1.AwsTemplatesV1AsyncControllerPaginator:
+        from clumioapi.controllers import aws_templates_v1
+
+        return self.base_controller.get_controller(
+            aws_templates_v1.AwsTemplatesV1AsyncControllerPaginator
+        )
+
+    @property
+    def aws_templates_v1(self) -> aws_templates_v1.AwsTemplatesV1AsyncController:
+        from clumioapi.controllers import aws_templates_v1
+
+        return self.base_controller.get_controller(aws_templates_v1.AwsTemplatesV1AsyncController)
+
+    @property
+    def aws_dynamodb_tables_v1_paginator(
+        self,
+    ) -> aws_dynamodb_tables_v1.AwsDynamodbTablesV1AsyncControllerPaginator:
+        from clumioapi.controllers import aws_dynamodb_tables_v1
+
+        return self.base_controller.get_controller(
+            aws_dynamodb_tables_v1.AwsDynamodbTablesV1AsyncControllerPaginator
+        )
+
+    @property
+    def aws_dynamodb_tables_v1(self) -> aws_dynamodb_tables_v1.AwsDynamodbTablesV1AsyncController:
+        from clumioapi.controllers import aws_dynamodb_tables_v1
+
+        return self.base_controller.get_controller(
+            aws_dynamodb_tables_v1.AwsDynamodbTablesV1AsyncController
+        )
+
+    @property
+    def aws_ebs_volumes_v1_paginator(
+        self,
+    ) -> aws_ebs_volumes_v1.AwsEbsVolumesV1AsyncControllerPaginator:
+        from clumioapi.controllers import aws_ebs_volumes_v1
+
+        return self.base_controller.get_controller(
+            aws_ebs_volumes_v1.AwsEbsVolumesV1AsyncControllerPaginator
+        )
+
+    @property
+    def aws_ebs_volumes_v1(self) -> aws_ebs_volumes_v1.AwsEbsVolumesV1AsyncController:
+        from clumioapi.controllers import aws_ebs_volumes_v1
+
+        return self.base_controller.get_controller(
+            aws_ebs_volumes_v1.AwsEbsVolumesV1AsyncController
+        )
+
+    @property
+    def aws_ec2_instances_v1_paginator(
+        self,
+    ) -> aws_ec2_instances_v1.AwsEc2InstancesV1AsyncControllerPaginator:
+        from clumioapi.controllers import aws_ec2_instances_v1
+
+        return self.base_controller.get_controller(
+            aws_ec2_instances_v1.AwsEc2InstancesV1AsyncControllerPaginator
+        )
+
+    @property
+    def aws_ec2_instances_v1(self) -> aws_ec2_instances_v1.AwsEc2InstancesV1AsyncController:
+        from clumioapi.controllers import aws_ec2_instances_v1
+
+        return self.base_controller.get_controller(
+            aws_ec2_instances_v1.AwsEc2InstancesV1AsyncController
+        )
+
+    @property
+    def ec2_mssql_availability_groups_v1_paginator(
+        self,
+    ) -> ec2_mssql_availability_groups_v1.Ec2MssqlAvailabilityGroupsV1AsyncControllerPaginator:
+        from clumioapi.controllers import ec2_mssql_availability_groups_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_availability_groups_v1.Ec2MssqlAvailabilityGroupsV1AsyncControllerPaginator
+        )
+
+    @property
+    def ec2_mssql_availability_groups_v1(
+        self,
+    ) -> ec2_mssql_availability_groups_v1.Ec2MssqlAvailabilityGroupsV1AsyncController:
+        from clumioapi.controllers import ec2_mssql_availability_groups_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_availability_groups_v1.Ec2MssqlAvailabilityGroupsV1AsyncController
+        )
+
+    @property
+    def ec2_mssql_databases_v1_paginator(
+        self,
+    ) -> ec2_mssql_databases_v1.Ec2MssqlDatabasesV1AsyncControllerPaginator:
+        from clumioapi.controllers import ec2_mssql_databases_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_databases_v1.Ec2MssqlDatabasesV1AsyncControllerPaginator
+        )
+
+    @property
+    def ec2_mssql_databases_v1(self) -> ec2_mssql_databases_v1.Ec2MssqlDatabasesV1AsyncController:
+        from clumioapi.controllers import ec2_mssql_databases_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_databases_v1.Ec2MssqlDatabasesV1AsyncController
+        )
+
+    @property
+    def ec2_mssql_failover_clusters_v1_paginator(
+        self,
+    ) -> ec2_mssql_failover_clusters_v1.Ec2MssqlFailoverClustersV1AsyncControllerPaginator:
+        from clumioapi.controllers import ec2_mssql_failover_clusters_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_failover_clusters_v1.Ec2MssqlFailoverClustersV1AsyncControllerPaginator
+        )
+
+    @property
+    def ec2_mssql_failover_clusters_v1(
+        self,
+    ) -> ec2_mssql_failover_clusters_v1.Ec2MssqlFailoverClustersV1AsyncController:
+        from clumioapi.controllers import ec2_mssql_failover_clusters_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_failover_clusters_v1.Ec2MssqlFailoverClustersV1AsyncController
+        )
+
+    @property
+    def ec2_mssql_failover_cluster_v1_paginator(
+        self,
+    ) -> ec2_mssql_failover_cluster_v1.Ec2MssqlFailoverClusterV1AsyncControllerPaginator:
+        from clumioapi.controllers import ec2_mssql_failover_cluster_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_failover_cluster_v1.Ec2MssqlFailoverClusterV1AsyncControllerPaginator
+        )
+
+    @property
+    def ec2_mssql_failover_cluster_v1(
+        self,
+    ) -> ec2_mssql_failover_cluster_v1.Ec2MssqlFailoverClusterV1AsyncController:
+        from clumioapi.controllers import ec2_mssql_failover_cluster_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_failover_cluster_v1.Ec2MssqlFailoverClusterV1AsyncController
+        )
+
+    @property
+    def ec2_mssql_hosts_v1_paginator(
+        self,
+    ) -> ec2_mssql_hosts_v1.Ec2MssqlHostsV1AsyncControllerPaginator:
+        from clumioapi.controllers import ec2_mssql_hosts_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_hosts_v1.Ec2MssqlHostsV1AsyncControllerPaginator
+        )
+
+    @property
+    def ec2_mssql_hosts_v1(self) -> ec2_mssql_hosts_v1.Ec2MssqlHostsV1AsyncController:
+        from clumioapi.controllers import ec2_mssql_hosts_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_hosts_v1.Ec2MssqlHostsV1AsyncController
+        )
+
+    @property
+    def ec2_mssql_instance_v1_paginator(
+        self,
+    ) -> ec2_mssql_instance_v1.Ec2MssqlInstanceV1AsyncControllerPaginator:
+        from clumioapi.controllers import ec2_mssql_instance_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_instance_v1.Ec2MssqlInstanceV1AsyncControllerPaginator
+        )
+
+    @property
+    def ec2_mssql_instance_v1(self) -> ec2_mssql_instance_v1.Ec2MssqlInstanceV1AsyncController:
+        from clumioapi.controllers import ec2_mssql_instance_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_instance_v1.Ec2MssqlInstanceV1AsyncController
+        )
+
+    @property
+    def aws_environments_v1_paginator(
+        self,
+    ) -> aws_environments_v1.AwsEnvironmentsV1AsyncControllerPaginator:
+        from clumioapi.controllers import aws_environments_v1
+
+        return self.base_controller.get_controller(
+            aws_environments_v1.AwsEnvironmentsV1AsyncControllerPaginator
+        )
+
+    @property
+    def aws_environments_v1(self) -> aws_environments_v1.AwsEnvironmentsV1AsyncController:
+        from clumioapi.controllers import aws_environments_v1
+
+        return self.base_controller.get_controller(
+            aws_environments_v1.AwsEnvironmentsV1AsyncController
+        )
+
+    @property
+    def aws_environment_tags_v1_paginator(
+        self,
+    ) -> aws_environment_tags_v1.AwsEnvironmentTagsV1AsyncControllerPaginator:
+        from clumioapi.controllers import aws_environment_tags_v1
+
+        return self.base_controller.get_controller(
+            aws_environment_tags_v1.AwsEnvironmentTagsV1AsyncControllerPaginator
+        )
+
+    @property
+    def aws_environment_tags_v1(
+        self,
+    ) -> aws_environment_tags_v1.AwsEnvironmentTagsV1AsyncController:
+        from clumioapi.controllers import aws_environment_tags_v1
+
+        return self.base_controller.get_controller(
+            aws_environment_tags_v1.AwsEnvironmentTagsV1AsyncController
+        )
+
+    @property
+    def aws_rds_resources_v1_paginator(
+        self,
+    ) -> aws_rds_resources_v1.AwsRdsResourcesV1AsyncControllerPaginator:
+        from clumioapi.controllers import aws_rds_resources_v1
+
+        return self.base_controller.get_controller(
+            aws_rds_resources_v1.AwsRdsResourcesV1AsyncControllerPaginator
+        )
+
+    @property
+    def aws_rds_resources_v1(self) -> aws_rds_resources_v1.AwsRdsResourcesV1AsyncController:
+        from clumioapi.controllers import aws_rds_resources_v1
+
+        return self.base_controller.get_controller(
+            aws_rds_resources_v1.AwsRdsResourcesV1AsyncController
+        )
+
+    @property
+    def aws_s3_buckets_v1_paginator(
+        self,
+    ) -> aws_s3_buckets_v1.AwsS3BucketsV1AsyncControllerPaginator:
+        from clumioapi.controllers import aws_s3_buckets_v1
+
+        return self.base_controller.get_controller(
+            aws_s3_buckets_v1.AwsS3BucketsV1AsyncControllerPaginator
+        )
+
+    @property
+    def aws_s3_buckets_v1(self) -> aws_s3_buckets_v1.AwsS3BucketsV1AsyncController:
+        from clumioapi.controllers import aws_s3_buckets_v1
+
+        return self.base_controller.get_controller(aws_s3_buckets_v1.AwsS3BucketsV1AsyncController)
+
+    @property
+    def protection_groups_v1_paginator(
+        self,
+    ) -> protection_groups_v1.ProtectionGroupsV1AsyncControllerPaginator:
+        from clumioapi.controllers import protection_groups_v1
+
+        return self.base_controller.get_controller(
+            protection_groups_v1.ProtectionGroupsV1AsyncControllerPaginator
+        )
+
+    @property
+    def protection_groups_v1(self) -> protection_groups_v1.ProtectionGroupsV1AsyncController:
+        from clumioapi.controllers import protection_groups_v1
+
+        return self.base_controller.get_controller(
+            protection_groups_v1.ProtectionGroupsV1AsyncController
+        )
+
+    @property
+    def protection_groups_s3_assets_v1_paginator(
+        self,
+    ) -> protection_groups_s3_assets_v1.ProtectionGroupsS3AssetsV1AsyncControllerPaginator:
+        from clumioapi.controllers import protection_groups_s3_assets_v1
+
+        return self.base_controller.get_controller(
+            protection_groups_s3_assets_v1.ProtectionGroupsS3AssetsV1AsyncControllerPaginator
+        )
+
+    @property
+    def protection_groups_s3_assets_v1(
+        self,
+    ) -> protection_groups_s3_assets_v1.ProtectionGroupsS3AssetsV1AsyncController:
+        from clumioapi.controllers import protection_groups_s3_assets_v1
+
+        return self.base_controller.get_controller(
+            protection_groups_s3_assets_v1.ProtectionGroupsS3AssetsV1AsyncController
+        )
+
+    @property
+    def management_groups_v1_paginator(
+        self,
+    ) -> management_groups_v1.ManagementGroupsV1AsyncControllerPaginator:
+        from clumioapi.controllers import management_groups_v1
+
+        return self.base_controller.get_controller(
+            management_groups_v1.ManagementGroupsV1AsyncControllerPaginator
+        )
+
+    @property
+    def management_groups_v1(self) -> management_groups_v1.ManagementGroupsV1AsyncController:
+        from clumioapi.controllers import management_groups_v1
+
+        return self.base_controller.get_controller(
+            management_groups_v1.ManagementGroupsV1AsyncController
+        )
+
+    @property
+    def organizational_units_v2_paginator(
+        self,
+    ) -> organizational_units_v2.OrganizationalUnitsV2AsyncControllerPaginator:
+        from clumioapi.controllers import organizational_units_v2
+
+        return self.base_controller.get_controller(
+            organizational_units_v2.OrganizationalUnitsV2AsyncControllerPaginator
+        )
+
+    @property
+    def organizational_units_v2(
+        self,
+    ) -> organizational_units_v2.OrganizationalUnitsV2AsyncController:
+        from clumioapi.controllers import organizational_units_v2
+
+        return self.base_controller.get_controller(
+            organizational_units_v2.OrganizationalUnitsV2AsyncController
+        )
+
+    @property
+    def organizational_units_v1_paginator(
+        self,
+    ) -> organizational_units_v1.OrganizationalUnitsV1AsyncControllerPaginator:
+        from clumioapi.controllers import organizational_units_v1
+
+        return self.base_controller.get_controller(
+            organizational_units_v1.OrganizationalUnitsV1AsyncControllerPaginator
+        )
+
+    @property
+    def organizational_units_v1(
+        self,
+    ) -> organizational_units_v1.OrganizationalUnitsV1AsyncController:
+        from clumioapi.controllers import organizational_units_v1
+
+        return self.base_controller.get_controller(
+            organizational_units_v1.OrganizationalUnitsV1AsyncController
+        )
+
+    @property
+    def policy_assignments_v1_paginator(
+        self,
+    ) -> policy_assignments_v1.PolicyAssignmentsV1AsyncControllerPaginator:
+        from clumioapi.controllers import policy_assignments_v1
+
+        return self.base_controller.get_controller(
+            policy_assignments_v1.PolicyAssignmentsV1AsyncControllerPaginator
+        )
+
+    @property
+    def policy_assignments_v1(self) -> policy_assignments_v1.PolicyAssignmentsV1AsyncController:
+        from clumioapi.controllers import policy_assignments_v1
+
+        return self.base_controller.get_controller(
+            policy_assignments_v1.PolicyAssignmentsV1AsyncController
+        )
+
+    @property
+    def policy_definitions_v1_paginator(
+        self,
+    ) -> policy_definitions_v1.PolicyDefinitionsV1AsyncControllerPaginator:
+        from clumioapi.controllers import policy_definitions_v1
+
+        return self.base_controller.get_controller(
+            policy_definitions_v1.PolicyDefinitionsV1AsyncControllerPaginator
+        )
+
+    @property
+    def policy_definitions_v1(self) -> policy_definitions_v1.PolicyDefinitionsV1AsyncController:
+        from clumioapi.controllers import policy_definitions_v1
+
+        return self.base_controller.get_controller(
+            policy_definitions_v1.PolicyDefinitionsV1AsyncController
+        )
+
+    @property
+    def policy_rules_v1_paginator(self) -> policy_rules_v1.PolicyRulesV1AsyncControllerPaginator:
+        from clumioapi.controllers import policy_rules_v1
+
+        return self.base_controller.get_controller(
+            policy_rules_v1.PolicyRulesV1AsyncControllerPaginator
+        )
+
+    @property
+    def policy_rules_v1(self) -> policy_rules_v1.PolicyRulesV1AsyncController:
+        from clumioapi.controllers import policy_rules_v1
+
+        return self.base_controller.get_controller(policy_rules_v1.PolicyRulesV1AsyncController)
+
+    @property
+    def report_compliance_v1_paginator(
+        self,
+    ) -> report_compliance_v1.ReportComplianceV1AsyncControllerPaginator:
+        from clumioapi.controllers import report_compliance_v1
+
+        return self.base_controller.get_controller(
+            report_compliance_v1.ReportComplianceV1AsyncControllerPaginator
+        )
+
+    @property
+    def report_compliance_v1(self) -> report_compliance_v1.ReportComplianceV1AsyncController:
+        from clumioapi.controllers import report_compliance_v1
+
+        return self.base_controller.get_controller(
+            report_compliance_v1.ReportComplianceV1AsyncController
+        )
+
+    @property
+    def report_compliance_runs_v1_paginator(
+        self,
+    ) -> report_compliance_runs_v1.ReportComplianceRunsV1AsyncControllerPaginator:
+        from clumioapi.controllers import report_compliance_runs_v1
+
+        return self.base_controller.get_controller(
+            report_compliance_runs_v1.ReportComplianceRunsV1AsyncControllerPaginator
+        )
+
+    @property
+    def report_compliance_runs_v1(
+        self,
+    ) -> report_compliance_runs_v1.ReportComplianceRunsV1AsyncController:
+        from clumioapi.controllers import report_compliance_runs_v1
+
+        return self.base_controller.get_controller(
+            report_compliance_runs_v1.ReportComplianceRunsV1AsyncController
+        )
+
+    @property
+    def report_downloads_v1_paginator(
+        self,
+    ) -> report_downloads_v1.ReportDownloadsV1AsyncControllerPaginator:
+        from clumioapi.controllers import report_downloads_v1
+
+        return self.base_controller.get_controller(
+            report_downloads_v1.ReportDownloadsV1AsyncControllerPaginator
+        )
+
+    @property
+    def report_downloads_v1(self) -> report_downloads_v1.ReportDownloadsV1AsyncController:
+        from clumioapi.controllers import report_downloads_v1
+
+        return self.base_controller.get_controller(
+            report_downloads_v1.ReportDownloadsV1AsyncController
+        )
+
+    @property
+    def restored_aws_dynamodb_tables_v1_paginator(
+        self,
+    ) -> restored_aws_dynamodb_tables_v1.RestoredAwsDynamodbTablesV1AsyncControllerPaginator:
+        from clumioapi.controllers import restored_aws_dynamodb_tables_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_dynamodb_tables_v1.RestoredAwsDynamodbTablesV1AsyncControllerPaginator
+        )
+
+    @property
+    def restored_aws_dynamodb_tables_v1(
+        self,
+    ) -> restored_aws_dynamodb_tables_v1.RestoredAwsDynamodbTablesV1AsyncController:
+        from clumioapi.controllers import restored_aws_dynamodb_tables_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_dynamodb_tables_v1.RestoredAwsDynamodbTablesV1AsyncController
+        )
+
+    @property
+    def restored_records_aws_dynamodb_tables_v1_paginator(
+        self,
+    ) -> (
+        restored_records_aws_dynamodb_tables_v1.RestoredRecordsAwsDynamodbTablesV1AsyncControllerPaginator
+    ):
+        from clumioapi.controllers import restored_records_aws_dynamodb_tables_v1
+
+        return self.base_controller.get_controller(
+            restored_records_aws_dynamodb_tables_v1.RestoredRecordsAwsDynamodbTablesV1AsyncControllerPaginator
+        )
+
+    @property
+    def restored_records_aws_dynamodb_tables_v1(
+        self,
+    ) -> restored_records_aws_dynamodb_tables_v1.RestoredRecordsAwsDynamodbTablesV1AsyncController:
+        from clumioapi.controllers import restored_records_aws_dynamodb_tables_v1
+
+        return self.base_controller.get_controller(
+            restored_records_aws_dynamodb_tables_v1.RestoredRecordsAwsDynamodbTablesV1AsyncController
+        )
+
+    @property
+    def restored_aws_ebs_volumes_v2_paginator(
+        self,
+    ) -> restored_aws_ebs_volumes_v2.RestoredAwsEbsVolumesV2AsyncControllerPaginator:
+        from clumioapi.controllers import restored_aws_ebs_volumes_v2
+
+        return self.base_controller.get_controller(
+            restored_aws_ebs_volumes_v2.RestoredAwsEbsVolumesV2AsyncControllerPaginator
+        )
+
+    @property
+    def restored_aws_ebs_volumes_v2(
+        self,
+    ) -> restored_aws_ebs_volumes_v2.RestoredAwsEbsVolumesV2AsyncController:
+        from clumioapi.controllers import restored_aws_ebs_volumes_v2
+
+        return self.base_controller.get_controller(
+            restored_aws_ebs_volumes_v2.RestoredAwsEbsVolumesV2AsyncController
+        )
+
+    @property
+    def restored_aws_ebs_volumes_v1_paginator(
+        self,
+    ) -> restored_aws_ebs_volumes_v1.RestoredAwsEbsVolumesV1AsyncControllerPaginator:
+        from clumioapi.controllers import restored_aws_ebs_volumes_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_ebs_volumes_v1.RestoredAwsEbsVolumesV1AsyncControllerPaginator
+        )
+
+    @property
+    def restored_aws_ebs_volumes_v1(
+        self,
+    ) -> restored_aws_ebs_volumes_v1.RestoredAwsEbsVolumesV1AsyncController:
+        from clumioapi.controllers import restored_aws_ebs_volumes_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_ebs_volumes_v1.RestoredAwsEbsVolumesV1AsyncController
+        )
+
+    @property
+    def restored_aws_ec2_instances_v1_paginator(
+        self,
+    ) -> restored_aws_ec2_instances_v1.RestoredAwsEc2InstancesV1AsyncControllerPaginator:
+        from clumioapi.controllers import restored_aws_ec2_instances_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_ec2_instances_v1.RestoredAwsEc2InstancesV1AsyncControllerPaginator
+        )
+
+    @property
+    def restored_aws_ec2_instances_v1(
+        self,
+    ) -> restored_aws_ec2_instances_v1.RestoredAwsEc2InstancesV1AsyncController:
+        from clumioapi.controllers import restored_aws_ec2_instances_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_ec2_instances_v1.RestoredAwsEc2InstancesV1AsyncController
+        )
+
+    @property
+    def restore_ec2_mssql_database_v1_paginator(
+        self,
+    ) -> restore_ec2_mssql_database_v1.RestoreEc2MssqlDatabaseV1AsyncControllerPaginator:
+        from clumioapi.controllers import restore_ec2_mssql_database_v1
+
+        return self.base_controller.get_controller(
+            restore_ec2_mssql_database_v1.RestoreEc2MssqlDatabaseV1AsyncControllerPaginator
+        )
+
+    @property
+    def restore_ec2_mssql_database_v1(
+        self,
+    ) -> restore_ec2_mssql_database_v1.RestoreEc2MssqlDatabaseV1AsyncController:
+        from clumioapi.controllers import restore_ec2_mssql_database_v1
+
+        return self.base_controller.get_controller(
+            restore_ec2_mssql_database_v1.RestoreEc2MssqlDatabaseV1AsyncController
+        )
+
+    @property
+    def restored_aws_rds_resources_v1_paginator(
+        self,
+    ) -> restored_aws_rds_resources_v1.RestoredAwsRdsResourcesV1AsyncControllerPaginator:
+        from clumioapi.controllers import restored_aws_rds_resources_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_rds_resources_v1.RestoredAwsRdsResourcesV1AsyncControllerPaginator
+        )
+
+    @property
+    def restored_aws_rds_resources_v1(
+        self,
+    ) -> restored_aws_rds_resources_v1.RestoredAwsRdsResourcesV1AsyncController:
+        from clumioapi.controllers import restored_aws_rds_resources_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_rds_resources_v1.RestoredAwsRdsResourcesV1AsyncController
+        )
+
+    @property
+    def aws_rds_resource_restored_records_v1_paginator(
+        self,
+    ) -> (
+        aws_rds_resource_restored_records_v1.AwsRdsResourceRestoredRecordsV1AsyncControllerPaginator
+    ):
+        from clumioapi.controllers import aws_rds_resource_restored_records_v1
+
+        return self.base_controller.get_controller(
+            aws_rds_resource_restored_records_v1.AwsRdsResourceRestoredRecordsV1AsyncControllerPaginator
+        )
+
+    @property
+    def aws_rds_resource_restored_records_v1(
+        self,
+    ) -> aws_rds_resource_restored_records_v1.AwsRdsResourceRestoredRecordsV1AsyncController:
+        from clumioapi.controllers import aws_rds_resource_restored_records_v1
+
+        return self.base_controller.get_controller(
+            aws_rds_resource_restored_records_v1.AwsRdsResourceRestoredRecordsV1AsyncController
+        )
+
+    @property
+    def restored_aws_s3_buckets_v1_paginator(
+        self,
+    ) -> restored_aws_s3_buckets_v1.RestoredAwsS3BucketsV1AsyncControllerPaginator:
+        from clumioapi.controllers import restored_aws_s3_buckets_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_s3_buckets_v1.RestoredAwsS3BucketsV1AsyncControllerPaginator
+        )
+
+    @property
+    def restored_aws_s3_buckets_v1(
+        self,
+    ) -> restored_aws_s3_buckets_v1.RestoredAwsS3BucketsV1AsyncController:
+        from clumioapi.controllers import restored_aws_s3_buckets_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_s3_buckets_v1.RestoredAwsS3BucketsV1AsyncController
+        )
+
+    @property
+    def restored_files_v1_paginator(
+        self,
+    ) -> restored_files_v1.RestoredFilesV1AsyncControllerPaginator:
+        from clumioapi.controllers import restored_files_v1
+
+        return self.base_controller.get_controller(
+            restored_files_v1.RestoredFilesV1AsyncControllerPaginator
+        )
+
+    @property
+    def restored_files_v1(self) -> restored_files_v1.RestoredFilesV1AsyncController:
+        from clumioapi.controllers import restored_files_v1
+
+        return self.base_controller.get_controller(restored_files_v1.RestoredFilesV1AsyncController)
+
+    @property
+    def restored_protection_groups_v1_paginator(
+        self,
+    ) -> restored_protection_groups_v1.RestoredProtectionGroupsV1AsyncControllerPaginator:
+        from clumioapi.controllers import restored_protection_groups_v1
+
+        return self.base_controller.get_controller(
+            restored_protection_groups_v1.RestoredProtectionGroupsV1AsyncControllerPaginator
+        )
+
+    @property
+    def restored_protection_groups_v1(
+        self,
+    ) -> restored_protection_groups_v1.RestoredProtectionGroupsV1AsyncController:
+        from clumioapi.controllers import restored_protection_groups_v1
+
+        return self.base_controller.get_controller(
+            restored_protection_groups_v1.RestoredProtectionGroupsV1AsyncController
+        )
+
+    @property
+    def restored_protection_group_instant_access_endpoints_v1_paginator(
+        self,
+    ) -> (
+        restored_protection_group_instant_access_endpoints_v1.RestoredProtectionGroupInstantAccessEndpointsV1AsyncControllerPaginator
+    ):
+        from clumioapi.controllers import restored_protection_group_instant_access_endpoints_v1
+
+        return self.base_controller.get_controller(
+            restored_protection_group_instant_access_endpoints_v1.RestoredProtectionGroupInstantAccessEndpointsV1AsyncControllerPaginator
+        )
+
+    @property
+    def restored_protection_group_instant_access_endpoints_v1(
+        self,
+    ) -> (
+        restored_protection_group_instant_access_endpoints_v1.RestoredProtectionGroupInstantAccessEndpointsV1AsyncController
+    ):
+        from clumioapi.controllers import restored_protection_group_instant_access_endpoints_v1
+
+        return self.base_controller.get_controller(
+            restored_protection_group_instant_access_endpoints_v1.RestoredProtectionGroupInstantAccessEndpointsV1AsyncController
+        )
+
+    @property
+    def restored_protection_group_s3_assets_v1_paginator(
+        self,
+    ) -> (
+        restored_protection_group_s3_assets_v1.RestoredProtectionGroupS3AssetsV1AsyncControllerPaginator
+    ):
+        from clumioapi.controllers import restored_protection_group_s3_assets_v1
+
+        return self.base_controller.get_controller(
+            restored_protection_group_s3_assets_v1.RestoredProtectionGroupS3AssetsV1AsyncControllerPaginator
+        )
+
+    @property
+    def restored_protection_group_s3_assets_v1(
+        self,
+    ) -> restored_protection_group_s3_assets_v1.RestoredProtectionGroupS3AssetsV1AsyncController:
+        from clumioapi.controllers import restored_protection_group_s3_assets_v1
+
+        return self.base_controller.get_controller(
+            restored_protection_group_s3_assets_v1.RestoredProtectionGroupS3AssetsV1AsyncController
+        )
+
+    @property
+    def roles_v1_paginator(self) -> roles_v1.RolesV1AsyncControllerPaginator:
+        from clumioapi.controllers import roles_v1
+
+        return self.base_controller.get_controller(roles_v1.RolesV1AsyncControllerPaginator)
+
+    @property
+    def roles_v1(self) -> roles_v1.RolesV1AsyncController:
+        from clumioapi.controllers import roles_v1
+
+        return self.base_controller.get_controller(roles_v1.RolesV1AsyncController)
+
+    @property
+    def auto_user_provisioning_settings_v1_paginator(
+        self,
+    ) -> auto_user_provisioning_settings_v1.AutoUserProvisioningSettingsV1AsyncControllerPaginator:
+        from clumioapi.controllers import auto_user_provisioning_settings_v1
+
+        return self.base_controller.get_controller(
+            auto_user_provisioning_settings_v1.AutoUserProvisioningSettingsV1AsyncControllerPaginator
+        )
+
+    @property
+    def auto_user_provisioning_settings_v1(
+        self,
+    ) -> auto_user_provisioning_settings_v1.AutoUserProvisioningSettingsV1AsyncController:
+        from clumioapi.controllers import auto_user_provisioning_settings_v1
+
+        return self.base_controller.get_controller(
+            auto_user_provisioning_settings_v1.AutoUserProvisioningSettingsV1AsyncController
+        )
+
+    @property
+    def auto_user_provisioning_rules_v1_paginator(
+        self,
+    ) -> auto_user_provisioning_rules_v1.AutoUserProvisioningRulesV1AsyncControllerPaginator:
+        from clumioapi.controllers import auto_user_provisioning_rules_v1
+
+        return self.base_controller.get_controller(
+            auto_user_provisioning_rules_v1.AutoUserProvisioningRulesV1AsyncControllerPaginator
+        )
+
+    @property
+    def auto_user_provisioning_rules_v1(
+        self,
+    ) -> auto_user_provisioning_rules_v1.AutoUserProvisioningRulesV1AsyncController:
+        from clumioapi.controllers import auto_user_provisioning_rules_v1
+
+        return self.base_controller.get_controller(
+            auto_user_provisioning_rules_v1.AutoUserProvisioningRulesV1AsyncController
+        )
+
+    @property
+    def general_settings_v2_paginator(
+        self,
+    ) -> general_settings_v2.GeneralSettingsV2AsyncControllerPaginator:
+        from clumioapi.controllers import general_settings_v2
+
+        return self.base_controller.get_controller(
+            general_settings_v2.GeneralSettingsV2AsyncControllerPaginator
+        )
+
+    @property
+    def general_settings_v2(self) -> general_settings_v2.GeneralSettingsV2AsyncController:
+        from clumioapi.controllers import general_settings_v2
+
+        return self.base_controller.get_controller(
+            general_settings_v2.GeneralSettingsV2AsyncController
+        )
+
+    @property
+    def tasks_v1_paginator(self) -> tasks_v1.TasksV1AsyncControllerPaginator:
+        from clumioapi.controllers import tasks_v1
+
+        return self.base_controller.get_controller(tasks_v1.TasksV1AsyncControllerPaginator)
+
+    @property
+    def tasks_v1(self) -> tasks_v1.TasksV1AsyncController:
+        from clumioapi.controllers import tasks_v1
+
+        return self.base_controller.get_controller(tasks_v1.TasksV1AsyncController)
+
+    @property
+    def users_v2_paginator(self) -> users_v2.UsersV2AsyncControllerPaginator:
+        from clumioapi.controllers import users_v2
+
+        return self.base_controller.get_controller(users_v2.UsersV2AsyncControllerPaginator)
+
+    @property
+    def users_v2(self) -> users_v2.UsersV2AsyncController:
+        from clumioapi.controllers import users_v2
+
+        return self.base_controller.get_controller(users_v2.UsersV2AsyncController)
+
+    @property
+    def users_v1_paginator(self) -> users_v1.UsersV1AsyncControllerPaginator:
+        from clumioapi.controllers import users_v1
+
+        return self.base_controller.get_controller(users_v1.UsersV1AsyncControllerPaginator)
+
+    @property
+    def users_v1(self) -> users_v1.UsersV1AsyncController:
+        from clumioapi.controllers import users_v1
+
+        return self.base_controller.get_controller(users_v1.UsersV1AsyncController)
+
+    @property
+    def wallets_v1_paginator(self) -> wallets_v1.WalletsV1AsyncControllerPaginator:
+        from clumioapi.controllers import wallets_v1
+
+        return self.base_controller.get_controller(wallets_v1.WalletsV1AsyncControllerPaginator)
+
+    @property
+    def wallets_v1(self) -> wallets_v1.WalletsV1AsyncController:
+        from clumioapi.controllers import wallets_v1
+
+        return self.base_controller.get_controller(wallets_v1.WalletsV1AsyncController)
+
+    @property
+    def post_process_kms_v1_paginator(
+        self,
+    ) -> post_process_kms_v1.PostProcessKmsV1AsyncControllerPaginator:
+        from clumioapi.controllers import post_process_kms_v1
+
+        return self.base_controller.get_controller(
+            post_process_kms_v1.PostProcessKmsV1AsyncControllerPaginator
+        )
+
+    @property
+    def post_process_kms_v1(self) -> post_process_kms_v1.PostProcessKmsV1AsyncController:
+        from clumioapi.controllers import post_process_kms_v1
+
+        return self.base_controller.get_controller(
+            post_process_kms_v1.PostProcessKmsV1AsyncController
+        )
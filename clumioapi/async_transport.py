@@ -0,0 +1,135 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Pooled asynchronous HTTP transport used by the AsyncClumioAPIClient.
+
+The transport is built on httpx, which is an optional dependency of the SDK. It is
+installed by the async extra: `pip install clumioapi[async]`.
+"""
+
+from typing import Any, Mapping
+
+from clumioapi import configuration
+import requests
+from requests import structures
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+
+class AsyncTransport:
+    """Sends the requests of the asynchronous client over a shared connection pool.
+
+    Responses are converted to requests.Response objects so that the controllers and
+    models handle them exactly as the ones returned by the synchronous client.
+
+    Attributes:
+        hostname: Hostname of the API server.
+        max_connections: Maximum number of concurrent connections to the API server.
+        max_keepalive_connections: Maximum number of idle connections kept in the pool.
+        timeout: Timeout in seconds applied to every request unless overridden per call. Defaults
+            to the connect_timeout and read_timeout of the configuration.
+    """
+
+    def __init__(
+        self,
+        config: configuration.Configuration,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: float | None = None,
+    ) -> None:
+        if httpx is None:
+            raise ImportError(
+                'httpx is required for the asynchronous client. '
+                'Install it with `pip install clumioapi[async]`.'
+            )
+        self.hostname = config.hostname
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.timeout = timeout
+        if not config.keep_alive:
+            max_keepalive_connections = 0
+        self._client = httpx.AsyncClient(
+            base_url=f'https://{config.hostname}',
+            headers={
+                'Authorization': f'Bearer {config.api_token}',
+                'Content-Type': 'application/json',
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=(
+                httpx.Timeout(timeout)
+                if timeout is not None
+                else httpx.Timeout(None, connect=config.connect_timeout, read=config.read_timeout)
+            ),
+        )
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, Any] | None = None,
+        json: Any = None,
+        timeout: float | tuple[float | None, float | None] | None = None,
+    ) -> requests.Response:
+        """Sends a request and returns the response without raising on error statuses.
+
+        Args:
+            method: The HTTP verb of the request.
+            endpoint: The path of the endpoint, or an absolute URL.
+            headers: The headers to send along with the default ones.
+            params: The query parameters. Parameters with a None value are dropped.
+            json: The JSON serializable body of the request.
+            timeout: Overrides the timeout of the transport for this request. As with requests,
+                it is either a number of seconds or a (connect, read) tuple.
+        Returns:
+            The response of the API server.
+        Raises:
+            requests.exceptions.RequestException: If no response was received. The httpx
+                errors are mapped to their requests counterparts.
+            TypeError: If given any other argument, such as an option of the HttpClient of the
+                synchronous client that the transport does not support.
+        """
+        request_kwargs: dict[str, Any] = {}
+        if isinstance(timeout, tuple):
+            request_kwargs['timeout'] = httpx.Timeout(None, connect=timeout[0], read=timeout[1])
+        elif timeout is not None:
+            request_kwargs['timeout'] = timeout
+        try:
+            resp = await self._client.request(
+                method.upper(),
+                endpoint,
+                headers={k: v for k, v in (headers or {}).items() if v is not None},
+                params={k: v for k, v in (params or {}).items() if v is not None},
+                json=json,
+                **request_kwargs,
+            )
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(str(e)) from e
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        return _to_requests_response(resp)
+
+    async def aclose(self) -> None:
+        """Closes all the pooled connections."""
+        await self._client.aclose()
+
+
+def _to_requests_response(resp: Any) -> requests.Response:
+    """Converts a httpx.Response to a requests.Response."""
+    response = requests.Response()
+    response.status_code = resp.status_code
+    response.reason = resp.reason_phrase
+    response.headers = structures.CaseInsensitiveDict(resp.headers)
+    response.url = str(resp.url)
+    response.encoding = resp.encoding
+    response._content = resp.content
+    return response
@@ -0,0 +1,154 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Incremental synchronization of the audit trails."""
+
+import datetime
+import json
+import os
+from typing import Callable
+
+from clumioapi import clumioapi_client
+from clumioapi.controllers.types import audit_trails_types
+from clumioapi.models import audit_trails
+from dateutil import parser
+
+
+class AuditTrailSync:
+    """Streams the audit trails created since the previous sync to a sink.
+
+    The sync keeps a high-water mark: the timestamp of the most recent audit trail it has
+    delivered. Each sync only lists the audit trails from the mark on, with a start_timestamp
+    $gte filter, so its cost is proportional to the number of new events rather than to the
+    history. Events are timestamped when the server receives the request, and may be listed
+    after later ones, so the filter starts overlap seconds before the mark and the audit
+    trails of that window that were already delivered are skipped by ID. An audit trail
+    without a timestamp is skipped by ID for an overlap window from the mark of the sync that
+    delivered it.
+
+    The mark and the IDs of the overlap window are saved to state_path after every sync. If
+    the sink raises, the state is not saved and the next sync delivers the same events again.
+
+    Example:
+        ```
+        sync = AuditTrailSync(client, siem.send, state_path='audit_trails.json')
+        while True:
+            sync.sync()
+            time.sleep(300)
+        ```
+
+    Attributes:
+        client: The ClumioAPIClient used to list the audit trails.
+        sink: Called with every new audit trail, in the order they are listed.
+        state_path: Path of the JSON file in which the state is persisted, if any.
+        overlap: Number of seconds before the mark from which audit trails are listed again.
+        filter: Additional criteria applied to the listed audit trails. Its StartTimestamp
+            is replaced by the one of the sync.
+        initial_timestamp: Where the first sync starts. Defaults to the whole history.
+        limit: Number of audit trails fetched per page.
+        high_water_mark: Timestamp of the most recent audit trail delivered, if any.
+    """
+
+    def __init__(
+        self,
+        client: clumioapi_client.ClumioAPIClient,
+        sink: Callable[[audit_trails.AuditTrails], None],
+        state_path: str | None = None,
+        overlap: float = 300.0,
+        filter: audit_trails_types.ListAuditTrailsV1FilterT | None = None,
+        initial_timestamp: datetime.datetime | None = None,
+        limit: int | None = None,
+    ) -> None:
+        self.client = client
+        self.sink = sink
+        self.state_path = state_path
+        self.overlap = overlap
+        self.filter = filter
+        self.initial_timestamp = initial_timestamp
+        self.limit = limit
+        self.high_water_mark: datetime.datetime | None = None
+        # IDs of the delivered audit trails that fall in the overlap window, by timestamp, or
+        # '' for those without one delivered before any mark is known.
+        self._seen: dict[str, str] = {}
+        self._load_state()
+
+    def sync(self) -> int:
+        """Delivers the audit trails created since the previous sync to the sink.
+
+        Returns:
+            The number of audit trails delivered.
+        Raises:
+            ClumioException: If listing the audit trails fails.
+        """
+        since = self.initial_timestamp
+        if self.high_water_mark is not None:
+            since = self.high_water_mark - datetime.timedelta(seconds=self.overlap)
+        query = self.filter or audit_trails_types.ListAuditTrailsV1FilterT()
+        if since is not None:
+            query = query.model_copy(update={'StartTimestamp': {'gte': _format(since)}})
+
+        seen = dict(self._seen)
+        mark = self.high_water_mark
+        delivered = 0
+        pages = self.client.audit_trails_v1_paginator.list_audit_trails(
+            limit=self.limit, filter=query if query.model_fields_set else None
+        )
+        for item in pages.iter_items():
+            if item.Id in seen:
+                continue
+            self.sink(item)
+            delivered += 1
+            if item.Id:
+                seen[item.Id] = item.Timestamp or ''
+            if item.Timestamp:
+                timestamp = _parse(item.Timestamp)
+                if mark is None or timestamp > mark:
+                    mark = timestamp
+
+        self.high_water_mark = mark
+        if mark is not None:
+            window_start = mark - datetime.timedelta(seconds=self.overlap)
+            seen = {id_: ts or _format(mark) for id_, ts in seen.items()}
+            seen = {id_: ts for id_, ts in seen.items() if _parse(ts) >= window_start}
+        self._seen = seen
+        self._save_state()
+        return delivered
+
+    def _load_state(self) -> None:
+        """Restores the mark and the IDs of the overlap window saved by a previous sync."""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        with open(self.state_path, encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('high_water_mark'):
+            self.high_water_mark = _parse(state['high_water_mark'])
+        self._seen = state.get('seen', {})
+
+    def _save_state(self) -> None:
+        """Atomically replaces the persisted state."""
+        if not self.state_path:
+            return
+        state = {
+            'high_water_mark': _format(self.high_water_mark) if self.high_water_mark else None,
+            'seen': self._seen,
+        }
+        tmp_path = f'{self.state_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+
+def _parse(timestamp: str) -> datetime.datetime:
+    """Parses an RFC-3339 timestamp, assuming UTC when it has no offset."""
+    parsed: datetime.datetime = parser.isoparse(timestamp)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
+
+
+def _format(timestamp: datetime.datetime) -> str:
+    """Formats a timestamp in RFC-3339 format, in UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+    return timestamp.astimezone(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
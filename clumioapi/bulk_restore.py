@@ -0,0 +1,304 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Submits many restores with bounded concurrency and tracks their tasks to completion."""
+
+from concurrent import futures
+import dataclasses
+import json
+import os
+import threading
+import time
+from typing import Any, Mapping, Sequence
+
+from clumioapi import clumioapi_client
+from clumioapi import rate_limiter as rate_limiter_
+from clumioapi import task_waiter
+from clumioapi.exceptions import clumio_exception
+from clumioapi.models import restore_aws_dynamodb_table_v1_request
+from clumioapi.models import restore_aws_ebs_volume_v2_request
+from clumioapi.models import restore_aws_ec2_instance_v1_request
+from clumioapi.models import task_with_e_tag
+import requests
+import urllib3
+
+RestoreRequest = (
+    restore_aws_ec2_instance_v1_request.RestoreAwsEc2InstanceV1Request
+    | restore_aws_ebs_volume_v2_request.RestoreAwsEbsVolumeV2Request
+    | restore_aws_dynamodb_table_v1_request.RestoreAwsDynamodbTableV1Request
+)
+
+# Controller property and method submitting each type of restore request.
+_OPERATIONS: Mapping[type, tuple[str, str]] = {
+    restore_aws_ec2_instance_v1_request.RestoreAwsEc2InstanceV1Request: (
+        'restored_aws_ec2_instances_v1',
+        'restore_aws_ec2_instance',
+    ),
+    restore_aws_ebs_volume_v2_request.RestoreAwsEbsVolumeV2Request: (
+        'restored_aws_ebs_volumes_v2',
+        'restore_aws_ebs_volume',
+    ),
+    restore_aws_dynamodb_table_v1_request.RestoreAwsDynamodbTableV1Request: (
+        'restored_aws_dynamodb_tables_v1',
+        'restore_aws_dynamodb_table',
+    ),
+}
+
+SUBMITTING = 'submitting'
+SUBMITTED = 'submitted'
+SUBMIT_FAILED = 'submit_failed'
+UNKNOWN = 'unknown'
+
+
+@dataclasses.dataclass(slots=True)
+class RestoreResult:
+    """Outcome of a restore of a bulk run.
+
+    Attributes:
+        key: The key of the restore request.
+        status: 'submitted' while the task runs, 'submit_failed' if the restore was rejected
+            or could not be sent, 'unknown' if its submission was interrupted or failed after
+            the request may have reached the server, else the final status of the task:
+            'completed', 'failed' or 'aborted'.
+        task_id: The ID of the restore task, if the restore was accepted.
+        error: The error message of a rejected or unknown restore.
+    """
+
+    key: str
+    status: str
+    task_id: str | None = None
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the restore task completed."""
+        return self.status == 'completed'
+
+
+@dataclasses.dataclass(slots=True)
+class BulkRestoreReport:
+    """Outcome of a bulk run.
+
+    Attributes:
+        results: The result of every restore request, keyed by request key.
+        elapsed: Duration of the run in seconds.
+        resumed: Number of restores taken over from the checkpoint instead of submitted.
+    """
+
+    results: dict[str, RestoreResult]
+    elapsed: float
+    resumed: int = 0
+
+    @property
+    def succeeded(self) -> list[RestoreResult]:
+        """The restores whose task completed."""
+        return [result for result in self.results.values() if result.succeeded]
+
+    @property
+    def failed(self) -> list[RestoreResult]:
+        """The restores that were rejected, are unknown, or whose task failed or was aborted."""
+        return [
+            result
+            for result in self.results.values()
+            if not result.succeeded and result.status != SUBMITTED
+        ]
+
+    @property
+    def throughput(self) -> float:
+        """Number of restores finished per second over the run."""
+        finished = sum(1 for result in self.results.values() if result.status != SUBMITTED)
+        return finished / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def unknown(self) -> list[RestoreResult]:
+        """The restores that may or may not have been created."""
+        return [result for result in self.results.values() if result.status == UNKNOWN]
+
+
+class BulkRestore:
+    """Submits restores of EC2 instances, EBS volumes and DynamoDB tables in bulk.
+
+    The restores are submitted by a pool of max_concurrency threads, each request waiting for
+    the rate limiter, then their tasks are tracked with a TaskWaiter until they finish. The
+    client session must allow max_concurrency connections, see
+    Configuration.max_connections_per_host.
+
+    When a checkpoint path is given, every restore is saved to it as being submitted before
+    it is sent, and its result as soon as it is known. Running again with the same requests
+    and checkpoint skips the restores already submitted, so a drill interrupted mid-run
+    resumes without submitting anything twice. A restore that was being submitted when the
+    run was interrupted, or whose request failed after it may have reached the server (a
+    read timeout or a 5xx response, for example), may or may not have been created: it is
+    reported as 'unknown' rather than submitted again. Check its tasks, and remove it from the checkpoint to
+    submit it again.
+
+    Example:
+        ```
+        engine = BulkRestore(client, max_concurrency=20, checkpoint_path='drill.json')
+        report = engine.run({volume_id: build_request(volume_id) for volume_id in volume_ids})
+        for result in report.failed:
+            print(result.key, result.status, result.error)
+        ```
+
+    Attributes:
+        client: The ClumioAPIClient submitting the restores.
+        max_concurrency: Maximum number of restores submitted at the same time.
+        rate_limiter: Limits the rate of the submissions. Defaults to the rate limiter of the
+            configuration of the client.
+        checkpoint_path: Path of the JSON file in which the results are saved, if any.
+        waiter: The TaskWaiter tracking the restore tasks.
+    """
+
+    def __init__(
+        self,
+        client: clumioapi_client.ClumioAPIClient,
+        max_concurrency: int = 10,
+        rate_limiter: rate_limiter_.RateLimiter | None = None,
+        checkpoint_path: str | None = None,
+        waiter: task_waiter.TaskWaiter | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1.')
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self.checkpoint_path = checkpoint_path
+        self.waiter = waiter or task_waiter.TaskWaiter(client)
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        restores: Mapping[str, RestoreRequest] | Sequence[RestoreRequest],
+        timeout: float | None = None,
+    ) -> BulkRestoreReport:
+        """Submits the restores and waits for their tasks to finish.
+
+        Restores found in the checkpoint are not submitted again, except for those rejected
+        or not sent. Their tasks are tracked along with the new ones. If the submissions are
+        interrupted, those not started yet are cancelled and the running ones are saved to the
+        checkpoint before the exception propagates.
+
+        Args:
+            restores: The restore requests, keyed by a unique key identifying them in the
+                report and in the checkpoint. The keys of a sequence are the indexes.
+            timeout: Maximum number of seconds to wait for the tasks, or None to wait
+                indefinitely.
+        Returns:
+            The result of every restore request.
+        Raises:
+            TimeoutError: If the tasks did not all finish within the timeout. The results
+                known so far are saved in the checkpoint.
+            ValueError: If a request is of an unsupported type.
+        """
+        if not isinstance(restores, Mapping):
+            restores = {str(i): request for i, request in enumerate(restores)}
+        for request in restores.values():
+            if type(request) not in _OPERATIONS:
+                raise ValueError(f'Unsupported restore request: {type(request).__name__}.')
+
+        start = time.monotonic()
+        checkpoint = self._load_checkpoint()
+        results = {
+            key: checkpoint[key]
+            for key in restores
+            if key in checkpoint and checkpoint[key].status != SUBMIT_FAILED
+        }
+        for result in results.values():
+            if result.status == SUBMITTING:
+                result.status = UNKNOWN
+                result.error = 'The run was interrupted while the restore was submitted.'
+        resumed = len(results)
+
+        with futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            submissions = [
+                executor.submit(self._submit, results, key, request)
+                for key, request in restores.items()
+                if key not in results
+            ]
+            try:
+                for submission in futures.as_completed(submissions):
+                    submission.result()
+            except BaseException:
+                # The running submissions save their result before the executor shuts down.
+                for submission in submissions:
+                    submission.cancel()
+                raise
+
+        tasks = {
+            result.task_id: result
+            for result in results.values()
+            if result.status == SUBMITTED and result.task_id
+        }
+
+        def on_done(task: task_with_e_tag.TaskWithETag) -> None:
+            tasks[task.Id].status = task.Status  # type: ignore
+            self._save_checkpoint(results)
+
+        self.waiter.wait_for_all(tasks, timeout=timeout, on_done=on_done)
+        return BulkRestoreReport(results, time.monotonic() - start, resumed)
+
+    def _submit(self, results: dict[str, RestoreResult], key: str, request: RestoreRequest) -> None:
+        """Submits a restore, saving it to the results and the checkpoint before and after."""
+        controller_name, method_name = _OPERATIONS[type(request)]
+        method = getattr(getattr(self.client, controller_name), method_name)
+        kwargs: dict[str, Any] = {}
+        if self.rate_limiter is not None:
+            kwargs['rate_limiter'] = self.rate_limiter
+        self._record(results, RestoreResult(key, SUBMITTING))
+        try:
+            response = method(body=request, **kwargs)
+        except Exception as e:
+            if _not_submitted(e):
+                result = RestoreResult(key, SUBMIT_FAILED, error=str(e))
+            else:
+                # The restore may have been created before the error.
+                result = RestoreResult(key, UNKNOWN, error=f'{type(e).__name__}: {e}')
+        else:
+            result = RestoreResult(key, SUBMITTED, task_id=response.TaskId)
+        self._record(results, result)
+
+    def _record(self, results: dict[str, RestoreResult], result: RestoreResult) -> None:
+        """Saves a result to the results and the checkpoint."""
+        with self._lock:
+            results[result.key] = result
+            self._save_checkpoint(results)
+
+    def _load_checkpoint(self) -> dict[str, RestoreResult]:
+        """Returns the results saved in the checkpoint, if any."""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return {}
+        with open(self.checkpoint_path, encoding='utf-8') as f:
+            saved = json.load(f)
+        return {key: RestoreResult(key, **fields) for key, fields in saved.items()}
+
+    def _save_checkpoint(self, results: Mapping[str, RestoreResult]) -> None:
+        """Atomically replaces the checkpoint with the given results."""
+        if not self.checkpoint_path:
+            return
+        saved = {
+            key: {'status': result.status, 'task_id': result.task_id, 'error': result.error}
+            for key, result in results.items()
+        }
+        tmp_path = f'{self.checkpoint_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(saved, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+
+def _not_submitted(error: Exception) -> bool:
+    """Returns whether a restore request failed without reaching the server, or was rejected.
+
+    Only a 4xx response, or a connection that could not be established, proves the restore
+    was not created. After a read timeout, a reset connection or a 5xx response, the server
+    may have accepted the request.
+    """
+    if isinstance(error, clumio_exception.ClumioException):
+        return error.resp is not None and 400 <= error.resp.status_code < 500
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        # requests wraps the MaxRetryError of urllib3, whose reason is the original error.
+        reason = getattr(error.args[0], 'reason', None)
+        return isinstance(reason, urllib3.exceptions.NewConnectionError)
+    return False
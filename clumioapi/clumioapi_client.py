@@ -1,204 +1,315 @@
 #
 # Copyright 2023. Clumio, A Commvault Company.
 #
+from __future__ import annotations
+
 import functools
+from typing import Any, Callable, TYPE_CHECKING, TypeVar
 
 from clumioapi import configuration
-from clumioapi.controllers import audit_trails_v1
-from clumioapi.controllers import auto_user_provisioning_rules_v1
-from clumioapi.controllers import auto_user_provisioning_settings_v1
-from clumioapi.controllers import aws_connection_groups_v1
-from clumioapi.controllers import aws_connections_v1
-from clumioapi.controllers import aws_dynamodb_tables_v1
-from clumioapi.controllers import aws_ebs_volumes_v1
-from clumioapi.controllers import aws_ec2_instances_v1
-from clumioapi.controllers import aws_environment_tags_v1
-from clumioapi.controllers import aws_environments_v1
-from clumioapi.controllers import aws_rds_resource_restored_records_v1
-from clumioapi.controllers import aws_rds_resources_v1
-from clumioapi.controllers import aws_regions_v1
-from clumioapi.controllers import aws_s3_buckets_v1
-from clumioapi.controllers import aws_templates_v1
-from clumioapi.controllers import backup_aws_dynamodb_tables_v1
-from clumioapi.controllers import backup_aws_ebs_volumes_v1
-from clumioapi.controllers import backup_aws_ebs_volumes_v2
-from clumioapi.controllers import backup_aws_ec2_instances_v1
-from clumioapi.controllers import backup_aws_rds_resource_database_tables_v1
-from clumioapi.controllers import backup_aws_rds_resource_databases_v1
-from clumioapi.controllers import backup_aws_rds_resources_v1
-from clumioapi.controllers import backup_ec2_mssql_databases_v1
-from clumioapi.controllers import backup_filesystem_directories_v1
-from clumioapi.controllers import backup_filesystems_v1
-from clumioapi.controllers import backup_protection_groups_v1
-from clumioapi.controllers import backups_files_v1
 from clumioapi.controllers import base_controller
-from clumioapi.controllers import consolidated_alerts_v1
-from clumioapi.controllers import ec2_mssql_availability_groups_v1
-from clumioapi.controllers import ec2_mssql_databases_v1
-from clumioapi.controllers import ec2_mssql_failover_cluster_v1
-from clumioapi.controllers import ec2_mssql_failover_clusters_v1
-from clumioapi.controllers import ec2_mssql_hosts_v1
-from clumioapi.controllers import ec2_mssql_instance_v1
-from clumioapi.controllers import general_settings_v2
-from clumioapi.controllers import individual_alerts_v1
-from clumioapi.controllers import management_groups_v1
-from clumioapi.controllers import organizational_units_v1
-from clumioapi.controllers import organizational_units_v2
-from clumioapi.controllers import policy_assignments_v1
-from clumioapi.controllers import policy_definitions_v1
-from clumioapi.controllers import policy_rules_v1
-from clumioapi.controllers import post_process_aws_connection_v1
-from clumioapi.controllers import post_process_kms_v1
-from clumioapi.controllers import protection_groups_s3_assets_v1
-from clumioapi.controllers import protection_groups_v1
-from clumioapi.controllers import report_compliance_runs_v1
-from clumioapi.controllers import report_compliance_v1
-from clumioapi.controllers import report_downloads_v1
-from clumioapi.controllers import restore_ec2_mssql_database_v1
-from clumioapi.controllers import restored_aws_dynamodb_tables_v1
-from clumioapi.controllers import restored_aws_ebs_volumes_v1
-from clumioapi.controllers import restored_aws_ebs_volumes_v2
-from clumioapi.controllers import restored_aws_ec2_instances_v1
-from clumioapi.controllers import restored_aws_rds_resources_v1
-from clumioapi.controllers import restored_aws_s3_buckets_v1
-from clumioapi.controllers import restored_files_v1
-from clumioapi.controllers import restored_protection_group_instant_access_endpoints_v1
-from clumioapi.controllers import restored_protection_group_s3_assets_v1
-from clumioapi.controllers import restored_protection_groups_v1
-from clumioapi.controllers import restored_records_aws_dynamodb_tables_v1
-from clumioapi.controllers import roles_v1
-from clumioapi.controllers import tasks_v1
-from clumioapi.controllers import users_v1
-from clumioapi.controllers import users_v2
-from clumioapi.controllers import wallets_v1
+
+if TYPE_CHECKING:
+    from clumioapi.controllers import audit_trails_v1
+    from clumioapi.controllers import auto_user_provisioning_rules_v1
+    from clumioapi.controllers import auto_user_provisioning_settings_v1
+    from clumioapi.controllers import aws_connection_groups_v1
+    from clumioapi.controllers import aws_connections_v1
+    from clumioapi.controllers import aws_dynamodb_tables_v1
+    from clumioapi.controllers import aws_ebs_volumes_v1
+    from clumioapi.controllers import aws_ec2_instances_v1
+    from clumioapi.controllers import aws_environment_tags_v1
+    from clumioapi.controllers import aws_environments_v1
+    from clumioapi.controllers import aws_rds_resource_restored_records_v1
+    from clumioapi.controllers import aws_rds_resources_v1
+    from clumioapi.controllers import aws_regions_v1
+    from clumioapi.controllers import aws_s3_buckets_v1
+    from clumioapi.controllers import aws_templates_v1
+    from clumioapi.controllers import backup_aws_dynamodb_tables_v1
+    from clumioapi.controllers import backup_aws_ebs_volumes_v1
+    from clumioapi.controllers import backup_aws_ebs_volumes_v2
+    from clumioapi.controllers import backup_aws_ec2_instances_v1
+    from clumioapi.controllers import backup_aws_rds_resource_database_tables_v1
+    from clumioapi.controllers import backup_aws_rds_resource_databases_v1
+    from clumioapi.controllers import backup_aws_rds_resources_v1
+    from clumioapi.controllers import backup_ec2_mssql_databases_v1
+    from clumioapi.controllers import backup_filesystem_directories_v1
+    from clumioapi.controllers import backup_filesystems_v1
+    from clumioapi.controllers import backup_protection_groups_v1
+    from clumioapi.controllers import backups_files_v1
+    from clumioapi.controllers import consolidated_alerts_v1
+    from clumioapi.controllers import ec2_mssql_availability_groups_v1
+    from clumioapi.controllers import ec2_mssql_databases_v1
+    from clumioapi.controllers import ec2_mssql_failover_cluster_v1
+    from clumioapi.controllers import ec2_mssql_failover_clusters_v1
+    from clumioapi.controllers import ec2_mssql_hosts_v1
+    from clumioapi.controllers import ec2_mssql_instance_v1
+    from clumioapi.controllers import general_settings_v2
+    from clumioapi.controllers import individual_alerts_v1
+    from clumioapi.controllers import management_groups_v1
+    from clumioapi.controllers import organizational_units_v1
+    from clumioapi.controllers import organizational_units_v2
+    from clumioapi.controllers import policy_assignments_v1
+    from clumioapi.controllers import policy_definitions_v1
+    from clumioapi.controllers import policy_rules_v1
+    from clumioapi.controllers import post_process_aws_connection_v1
+    from clumioapi.controllers import post_process_kms_v1
+    from clumioapi.controllers import protection_groups_s3_assets_v1
+    from clumioapi.controllers import protection_groups_v1
+    from clumioapi.controllers import report_compliance_runs_v1
+    from clumioapi.controllers import report_compliance_v1
+    from clumioapi.controllers import report_downloads_v1
+    from clumioapi.controllers import restore_ec2_mssql_database_v1
+    from clumioapi.controllers import restored_aws_dynamodb_tables_v1
+    from clumioapi.controllers import restored_aws_ebs_volumes_v1
+    from clumioapi.controllers import restored_aws_ebs_volumes_v2
+    from clumioapi.controllers import restored_aws_ec2_instances_v1
+    from clumioapi.controllers import restored_aws_rds_resources_v1
+    from clumioapi.controllers import restored_aws_s3_buckets_v1
+    from clumioapi.controllers import restored_files_v1
+    from clumioapi.controllers import restored_protection_group_instant_access_endpoints_v1
+    from clumioapi.controllers import restored_protection_group_s3_assets_v1
+    from clumioapi.controllers import restored_protection_groups_v1
+    from clumioapi.controllers import restored_records_aws_dynamodb_tables_v1
+    from clumioapi.controllers import roles_v1
+    from clumioapi.controllers import tasks_v1
+    from clumioapi.controllers import users_v1
+    from clumioapi.controllers import users_v2
+    from clumioapi.controllers import wallets_v1
+
+T = TypeVar('T')
+
+
+def _memoized(fget: Callable[['ClumioAPIClient'], T]) -> Callable[['ClumioAPIClient'], T]:
+    """Caches the controller built by fget until the configuration of the client changes."""
+
+    @functools.wraps(fget)
+    def wrapper(self: 'ClumioAPIClient') -> T:
+        revision = self.base_controller.config.revision
+        if self._config_revision != revision:
+            # The base controller rebuilds its own controllers on the revision change.
+            self._config_revision, self._controllers = revision, {}
+        try:
+            return self._controllers[fget.__name__]
+        except KeyError:
+            return self._controllers.setdefault(fget.__name__, fget(self))
+
+    return wrapper
 
 
 class ClumioAPIClient:
-    """Client for the Clumio APIs."""
+    """Client for the Clumio APIs.
+
+    Controllers and paginators are built once per client and reused across accesses. They
+    are rebuilt after organizational_unit_context or custom_headers is assigned on the
+    configuration, or after an explicit call to invalidate_controllers. Paginators fetch
+    their pages with the same controllers.
+    """
 
     def __init__(self, config: configuration.Configuration) -> None:
         self.base_controller = base_controller.BaseController(config)
+        self._controllers: dict[str, Any] = {}
+        self._config_revision = config.revision
+
+    def invalidate_controllers(self) -> None:
+        """Discards the cached controllers so that they are rebuilt on their next access.
+
+        This must be called after mutating the custom_headers mapping of the configuration in
+        place, as such changes cannot be detected.
+        """
+        self._config_revision = self.base_controller.config.revision
+        self._controllers = {}
+        self.base_controller.invalidate_controllers()
 
     @property
+    @_memoized
     def consolidated_alerts_v1_paginator(
         self,
     ) -> consolidated_alerts_v1.ConsolidatedAlertsV1ControllerPaginator:
+        from clumioapi.controllers import consolidated_alerts_v1
+
         return consolidated_alerts_v1.ConsolidatedAlertsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def consolidated_alerts_v1(self) -> consolidated_alerts_v1.ConsolidatedAlertsV1Controller:
-        return consolidated_alerts_v1.ConsolidatedAlertsV1Controller(self.base_controller)
+        from clumioapi.controllers import consolidated_alerts_v1
+
+        return self.base_controller.get_controller(
+            consolidated_alerts_v1.ConsolidatedAlertsV1Controller
+        )
 
     @property
+    @_memoized
     def individual_alerts_v1_paginator(
         self,
     ) -> individual_alerts_v1.IndividualAlertsV1ControllerPaginator:
+        from clumioapi.controllers import individual_alerts_v1
+
         return individual_alerts_v1.IndividualAlertsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def individual_alerts_v1(self) -> individual_alerts_v1.IndividualAlertsV1Controller:
-        return individual_alerts_v1.IndividualAlertsV1Controller(self.base_controller)
+        from clumioapi.controllers import individual_alerts_v1
+
+        return self.base_controller.get_controller(
+            individual_alerts_v1.IndividualAlertsV1Controller
+        )
 
     @property
+    @_memoized
     def audit_trails_v1_paginator(self) -> audit_trails_v1.AuditTrailsV1ControllerPaginator:
+        from clumioapi.controllers import audit_trails_v1
+
         return audit_trails_v1.AuditTrailsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def audit_trails_v1(self) -> audit_trails_v1.AuditTrailsV1Controller:
-        return audit_trails_v1.AuditTrailsV1Controller(self.base_controller)
+        from clumioapi.controllers import audit_trails_v1
+
+        return self.base_controller.get_controller(audit_trails_v1.AuditTrailsV1Controller)
 
     @property
+    @_memoized
     def backup_aws_dynamodb_tables_v1_paginator(
         self,
     ) -> backup_aws_dynamodb_tables_v1.BackupAwsDynamodbTablesV1ControllerPaginator:
+        from clumioapi.controllers import backup_aws_dynamodb_tables_v1
+
         return backup_aws_dynamodb_tables_v1.BackupAwsDynamodbTablesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def backup_aws_dynamodb_tables_v1(
         self,
     ) -> backup_aws_dynamodb_tables_v1.BackupAwsDynamodbTablesV1Controller:
-        return backup_aws_dynamodb_tables_v1.BackupAwsDynamodbTablesV1Controller(
-            self.base_controller
+        from clumioapi.controllers import backup_aws_dynamodb_tables_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_dynamodb_tables_v1.BackupAwsDynamodbTablesV1Controller
         )
 
     @property
+    @_memoized
     def backup_aws_ebs_volumes_v2_paginator(
         self,
     ) -> backup_aws_ebs_volumes_v2.BackupAwsEbsVolumesV2ControllerPaginator:
+        from clumioapi.controllers import backup_aws_ebs_volumes_v2
+
         return backup_aws_ebs_volumes_v2.BackupAwsEbsVolumesV2ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def backup_aws_ebs_volumes_v2(
         self,
     ) -> backup_aws_ebs_volumes_v2.BackupAwsEbsVolumesV2Controller:
-        return backup_aws_ebs_volumes_v2.BackupAwsEbsVolumesV2Controller(self.base_controller)
+        from clumioapi.controllers import backup_aws_ebs_volumes_v2
+
+        return self.base_controller.get_controller(
+            backup_aws_ebs_volumes_v2.BackupAwsEbsVolumesV2Controller
+        )
 
     @property
+    @_memoized
     def backup_aws_ebs_volumes_v1_paginator(
         self,
     ) -> backup_aws_ebs_volumes_v1.BackupAwsEbsVolumesV1ControllerPaginator:
+        from clumioapi.controllers import backup_aws_ebs_volumes_v1
+
         return backup_aws_ebs_volumes_v1.BackupAwsEbsVolumesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def backup_aws_ebs_volumes_v1(
         self,
     ) -> backup_aws_ebs_volumes_v1.BackupAwsEbsVolumesV1Controller:
-        return backup_aws_ebs_volumes_v1.BackupAwsEbsVolumesV1Controller(self.base_controller)
+        from clumioapi.controllers import backup_aws_ebs_volumes_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_ebs_volumes_v1.BackupAwsEbsVolumesV1Controller
+        )
 
     @property
+    @_memoized
     def backup_aws_ec2_instances_v1_paginator(
         self,
     ) -> backup_aws_ec2_instances_v1.BackupAwsEc2InstancesV1ControllerPaginator:
+        from clumioapi.controllers import backup_aws_ec2_instances_v1
+
         return backup_aws_ec2_instances_v1.BackupAwsEc2InstancesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def backup_aws_ec2_instances_v1(
         self,
     ) -> backup_aws_ec2_instances_v1.BackupAwsEc2InstancesV1Controller:
-        return backup_aws_ec2_instances_v1.BackupAwsEc2InstancesV1Controller(self.base_controller)
+        from clumioapi.controllers import backup_aws_ec2_instances_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_ec2_instances_v1.BackupAwsEc2InstancesV1Controller
+        )
 
     @property
+    @_memoized
     def backup_ec2_mssql_databases_v1_paginator(
         self,
     ) -> backup_ec2_mssql_databases_v1.BackupEc2MssqlDatabasesV1ControllerPaginator:
+        from clumioapi.controllers import backup_ec2_mssql_databases_v1
+
         return backup_ec2_mssql_databases_v1.BackupEc2MssqlDatabasesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def backup_ec2_mssql_databases_v1(
         self,
     ) -> backup_ec2_mssql_databases_v1.BackupEc2MssqlDatabasesV1Controller:
-        return backup_ec2_mssql_databases_v1.BackupEc2MssqlDatabasesV1Controller(
-            self.base_controller
+        from clumioapi.controllers import backup_ec2_mssql_databases_v1
+
+        return self.base_controller.get_controller(
+            backup_ec2_mssql_databases_v1.BackupEc2MssqlDatabasesV1Controller
         )
 
     @property
+    @_memoized
     def backup_aws_rds_resources_v1_paginator(
         self,
     ) -> backup_aws_rds_resources_v1.BackupAwsRdsResourcesV1ControllerPaginator:
+        from clumioapi.controllers import backup_aws_rds_resources_v1
+
         return backup_aws_rds_resources_v1.BackupAwsRdsResourcesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def backup_aws_rds_resources_v1(
         self,
     ) -> backup_aws_rds_resources_v1.BackupAwsRdsResourcesV1Controller:
-        return backup_aws_rds_resources_v1.BackupAwsRdsResourcesV1Controller(self.base_controller)
+        from clumioapi.controllers import backup_aws_rds_resources_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_rds_resources_v1.BackupAwsRdsResourcesV1Controller
+        )
 
     @property
+    @_memoized
     def backup_aws_rds_resource_databases_v1_paginator(
         self,
     ) -> backup_aws_rds_resource_databases_v1.BackupAwsRdsResourceDatabasesV1ControllerPaginator:
+        from clumioapi.controllers import backup_aws_rds_resource_databases_v1
+
         return (
             backup_aws_rds_resource_databases_v1.BackupAwsRdsResourceDatabasesV1ControllerPaginator(
                 self.base_controller
@@ -206,511 +317,797 @@ class ClumioAPIClient:
         )
 
     @property
+    @_memoized
     def backup_aws_rds_resource_databases_v1(
         self,
     ) -> backup_aws_rds_resource_databases_v1.BackupAwsRdsResourceDatabasesV1Controller:
-        return backup_aws_rds_resource_databases_v1.BackupAwsRdsResourceDatabasesV1Controller(
-            self.base_controller
+        from clumioapi.controllers import backup_aws_rds_resource_databases_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_rds_resource_databases_v1.BackupAwsRdsResourceDatabasesV1Controller
         )
 
     @property
+    @_memoized
     def backup_aws_rds_resource_database_tables_v1_paginator(
         self,
     ) -> (
         backup_aws_rds_resource_database_tables_v1.BackupAwsRdsResourceDatabaseTablesV1ControllerPaginator
     ):
+        from clumioapi.controllers import backup_aws_rds_resource_database_tables_v1
+
         return backup_aws_rds_resource_database_tables_v1.BackupAwsRdsResourceDatabaseTablesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def backup_aws_rds_resource_database_tables_v1(
         self,
     ) -> backup_aws_rds_resource_database_tables_v1.BackupAwsRdsResourceDatabaseTablesV1Controller:
-        return backup_aws_rds_resource_database_tables_v1.BackupAwsRdsResourceDatabaseTablesV1Controller(
-            self.base_controller
+        from clumioapi.controllers import backup_aws_rds_resource_database_tables_v1
+
+        return self.base_controller.get_controller(
+            backup_aws_rds_resource_database_tables_v1.BackupAwsRdsResourceDatabaseTablesV1Controller
         )
 
     @property
+    @_memoized
     def backups_files_v1_paginator(self) -> backups_files_v1.BackupsFilesV1ControllerPaginator:
+        from clumioapi.controllers import backups_files_v1
+
         return backups_files_v1.BackupsFilesV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def backups_files_v1(self) -> backups_files_v1.BackupsFilesV1Controller:
-        return backups_files_v1.BackupsFilesV1Controller(self.base_controller)
+        from clumioapi.controllers import backups_files_v1
+
+        return self.base_controller.get_controller(backups_files_v1.BackupsFilesV1Controller)
 
     @property
+    @_memoized
     def backup_protection_groups_v1_paginator(
         self,
     ) -> backup_protection_groups_v1.BackupProtectionGroupsV1ControllerPaginator:
+        from clumioapi.controllers import backup_protection_groups_v1
+
         return backup_protection_groups_v1.BackupProtectionGroupsV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def backup_protection_groups_v1(
         self,
     ) -> backup_protection_groups_v1.BackupProtectionGroupsV1Controller:
-        return backup_protection_groups_v1.BackupProtectionGroupsV1Controller(self.base_controller)
+        from clumioapi.controllers import backup_protection_groups_v1
+
+        return self.base_controller.get_controller(
+            backup_protection_groups_v1.BackupProtectionGroupsV1Controller
+        )
 
     @property
+    @_memoized
     def backup_filesystems_v1_paginator(
         self,
     ) -> backup_filesystems_v1.BackupFilesystemsV1ControllerPaginator:
+        from clumioapi.controllers import backup_filesystems_v1
+
         return backup_filesystems_v1.BackupFilesystemsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def backup_filesystems_v1(self) -> backup_filesystems_v1.BackupFilesystemsV1Controller:
-        return backup_filesystems_v1.BackupFilesystemsV1Controller(self.base_controller)
+        from clumioapi.controllers import backup_filesystems_v1
+
+        return self.base_controller.get_controller(
+            backup_filesystems_v1.BackupFilesystemsV1Controller
+        )
 
     @property
+    @_memoized
     def backup_filesystem_directories_v1_paginator(
         self,
     ) -> backup_filesystem_directories_v1.BackupFilesystemDirectoriesV1ControllerPaginator:
+        from clumioapi.controllers import backup_filesystem_directories_v1
+
         return backup_filesystem_directories_v1.BackupFilesystemDirectoriesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def backup_filesystem_directories_v1(
         self,
     ) -> backup_filesystem_directories_v1.BackupFilesystemDirectoriesV1Controller:
-        return backup_filesystem_directories_v1.BackupFilesystemDirectoriesV1Controller(
-            self.base_controller
+        from clumioapi.controllers import backup_filesystem_directories_v1
+
+        return self.base_controller.get_controller(
+            backup_filesystem_directories_v1.BackupFilesystemDirectoriesV1Controller
         )
 
     @property
+    @_memoized
     def aws_connections_v1_paginator(
         self,
     ) -> aws_connections_v1.AwsConnectionsV1ControllerPaginator:
+        from clumioapi.controllers import aws_connections_v1
+
         return aws_connections_v1.AwsConnectionsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def aws_connections_v1(self) -> aws_connections_v1.AwsConnectionsV1Controller:
-        return aws_connections_v1.AwsConnectionsV1Controller(self.base_controller)
+        from clumioapi.controllers import aws_connections_v1
+
+        return self.base_controller.get_controller(aws_connections_v1.AwsConnectionsV1Controller)
 
     @property
+    @_memoized
     def aws_connection_groups_v1_paginator(
         self,
     ) -> aws_connection_groups_v1.AwsConnectionGroupsV1ControllerPaginator:
+        from clumioapi.controllers import aws_connection_groups_v1
+
         return aws_connection_groups_v1.AwsConnectionGroupsV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def aws_connection_groups_v1(self) -> aws_connection_groups_v1.AwsConnectionGroupsV1Controller:
-        return aws_connection_groups_v1.AwsConnectionGroupsV1Controller(self.base_controller)
+        from clumioapi.controllers import aws_connection_groups_v1
+
+        return self.base_controller.get_controller(
+            aws_connection_groups_v1.AwsConnectionGroupsV1Controller
+        )
 
     @property
+    @_memoized
     def post_process_aws_connection_v1_paginator(
         self,
     ) -> post_process_aws_connection_v1.PostProcessAwsConnectionV1ControllerPaginator:
+        from clumioapi.controllers import post_process_aws_connection_v1
+
         return post_process_aws_connection_v1.PostProcessAwsConnectionV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def post_process_aws_connection_v1(
         self,
     ) -> post_process_aws_connection_v1.PostProcessAwsConnectionV1Controller:
-        return post_process_aws_connection_v1.PostProcessAwsConnectionV1Controller(
-            self.base_controller
+        from clumioapi.controllers import post_process_aws_connection_v1
+
+        return self.base_controller.get_controller(
+            post_process_aws_connection_v1.PostProcessAwsConnectionV1Controller
         )
 
     @property
+    @_memoized
     def aws_regions_v1_paginator(self) -> aws_regions_v1.AwsRegionsV1ControllerPaginator:
+        from clumioapi.controllers import aws_regions_v1
+
         return aws_regions_v1.AwsRegionsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def aws_regions_v1(self) -> aws_regions_v1.AwsRegionsV1Controller:
-        return aws_regions_v1.AwsRegionsV1Controller(self.base_controller)
+        from clumioapi.controllers import aws_regions_v1
+
+        return self.base_controller.get_controller(aws_regions_v1.AwsRegionsV1Controller)
 
     @property
+    @_memoized
     def aws_templates_v1_paginator(self) -> aws_templates_v1.AwsTemplatesV1ControllerPaginator:
+        from clumioapi.controllers import aws_templates_v1
+
         return aws_templates_v1.AwsTemplatesV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def aws_templates_v1(self) -> aws_templates_v1.AwsTemplatesV1Controller:
-        return aws_templates_v1.AwsTemplatesV1Controller(self.base_controller)
+        from clumioapi.controllers import aws_templates_v1
+
+        return self.base_controller.get_controller(aws_templates_v1.AwsTemplatesV1Controller)
 
     @property
+    @_memoized
     def aws_dynamodb_tables_v1_paginator(
         self,
     ) -> aws_dynamodb_tables_v1.AwsDynamodbTablesV1ControllerPaginator:
+        from clumioapi.controllers import aws_dynamodb_tables_v1
+
         return aws_dynamodb_tables_v1.AwsDynamodbTablesV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def aws_dynamodb_tables_v1(self) -> aws_dynamodb_tables_v1.AwsDynamodbTablesV1Controller:
-        return aws_dynamodb_tables_v1.AwsDynamodbTablesV1Controller(self.base_controller)
+        from clumioapi.controllers import aws_dynamodb_tables_v1
+
+        return self.base_controller.get_controller(
+            aws_dynamodb_tables_v1.AwsDynamodbTablesV1Controller
+        )
 
     @property
+    @_memoized
     def aws_ebs_volumes_v1_paginator(self) -> aws_ebs_volumes_v1.AwsEbsVolumesV1ControllerPaginator:
+        from clumioapi.controllers import aws_ebs_volumes_v1
+
         return aws_ebs_volumes_v1.AwsEbsVolumesV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def aws_ebs_volumes_v1(self) -> aws_ebs_volumes_v1.AwsEbsVolumesV1Controller:
-        return aws_ebs_volumes_v1.AwsEbsVolumesV1Controller(self.base_controller)
+        from clumioapi.controllers import aws_ebs_volumes_v1
+
+        return self.base_controller.get_controller(aws_ebs_volumes_v1.AwsEbsVolumesV1Controller)
 
     @property
+    @_memoized
     def aws_ec2_instances_v1_paginator(
         self,
     ) -> aws_ec2_instances_v1.AwsEc2InstancesV1ControllerPaginator:
+        from clumioapi.controllers import aws_ec2_instances_v1
+
         return aws_ec2_instances_v1.AwsEc2InstancesV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def aws_ec2_instances_v1(self) -> aws_ec2_instances_v1.AwsEc2InstancesV1Controller:
-        return aws_ec2_instances_v1.AwsEc2InstancesV1Controller(self.base_controller)
+        from clumioapi.controllers import aws_ec2_instances_v1
+
+        return self.base_controller.get_controller(aws_ec2_instances_v1.AwsEc2InstancesV1Controller)
 
     @property
+    @_memoized
     def ec2_mssql_availability_groups_v1_paginator(
         self,
     ) -> ec2_mssql_availability_groups_v1.Ec2MssqlAvailabilityGroupsV1ControllerPaginator:
+        from clumioapi.controllers import ec2_mssql_availability_groups_v1
+
         return ec2_mssql_availability_groups_v1.Ec2MssqlAvailabilityGroupsV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def ec2_mssql_availability_groups_v1(
         self,
     ) -> ec2_mssql_availability_groups_v1.Ec2MssqlAvailabilityGroupsV1Controller:
-        return ec2_mssql_availability_groups_v1.Ec2MssqlAvailabilityGroupsV1Controller(
-            self.base_controller
+        from clumioapi.controllers import ec2_mssql_availability_groups_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_availability_groups_v1.Ec2MssqlAvailabilityGroupsV1Controller
         )
 
     @property
+    @_memoized
     def ec2_mssql_databases_v1_paginator(
         self,
     ) -> ec2_mssql_databases_v1.Ec2MssqlDatabasesV1ControllerPaginator:
+        from clumioapi.controllers import ec2_mssql_databases_v1
+
         return ec2_mssql_databases_v1.Ec2MssqlDatabasesV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def ec2_mssql_databases_v1(self) -> ec2_mssql_databases_v1.Ec2MssqlDatabasesV1Controller:
-        return ec2_mssql_databases_v1.Ec2MssqlDatabasesV1Controller(self.base_controller)
+        from clumioapi.controllers import ec2_mssql_databases_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_databases_v1.Ec2MssqlDatabasesV1Controller
+        )
 
     @property
+    @_memoized
     def ec2_mssql_failover_clusters_v1_paginator(
         self,
     ) -> ec2_mssql_failover_clusters_v1.Ec2MssqlFailoverClustersV1ControllerPaginator:
+        from clumioapi.controllers import ec2_mssql_failover_clusters_v1
+
         return ec2_mssql_failover_clusters_v1.Ec2MssqlFailoverClustersV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def ec2_mssql_failover_clusters_v1(
         self,
     ) -> ec2_mssql_failover_clusters_v1.Ec2MssqlFailoverClustersV1Controller:
-        return ec2_mssql_failover_clusters_v1.Ec2MssqlFailoverClustersV1Controller(
-            self.base_controller
+        from clumioapi.controllers import ec2_mssql_failover_clusters_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_failover_clusters_v1.Ec2MssqlFailoverClustersV1Controller
         )
 
     @property
+    @_memoized
     def ec2_mssql_failover_cluster_v1_paginator(
         self,
     ) -> ec2_mssql_failover_cluster_v1.Ec2MssqlFailoverClusterV1ControllerPaginator:
+        from clumioapi.controllers import ec2_mssql_failover_cluster_v1
+
         return ec2_mssql_failover_cluster_v1.Ec2MssqlFailoverClusterV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def ec2_mssql_failover_cluster_v1(
         self,
     ) -> ec2_mssql_failover_cluster_v1.Ec2MssqlFailoverClusterV1Controller:
-        return ec2_mssql_failover_cluster_v1.Ec2MssqlFailoverClusterV1Controller(
-            self.base_controller
+        from clumioapi.controllers import ec2_mssql_failover_cluster_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_failover_cluster_v1.Ec2MssqlFailoverClusterV1Controller
         )
 
     @property
+    @_memoized
     def ec2_mssql_hosts_v1_paginator(self) -> ec2_mssql_hosts_v1.Ec2MssqlHostsV1ControllerPaginator:
+        from clumioapi.controllers import ec2_mssql_hosts_v1
+
         return ec2_mssql_hosts_v1.Ec2MssqlHostsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def ec2_mssql_hosts_v1(self) -> ec2_mssql_hosts_v1.Ec2MssqlHostsV1Controller:
-        return ec2_mssql_hosts_v1.Ec2MssqlHostsV1Controller(self.base_controller)
+        from clumioapi.controllers import ec2_mssql_hosts_v1
+
+        return self.base_controller.get_controller(ec2_mssql_hosts_v1.Ec2MssqlHostsV1Controller)
 
     @property
+    @_memoized
     def ec2_mssql_instance_v1_paginator(
         self,
     ) -> ec2_mssql_instance_v1.Ec2MssqlInstanceV1ControllerPaginator:
+        from clumioapi.controllers import ec2_mssql_instance_v1
+
         return ec2_mssql_instance_v1.Ec2MssqlInstanceV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def ec2_mssql_instance_v1(self) -> ec2_mssql_instance_v1.Ec2MssqlInstanceV1Controller:
-        return ec2_mssql_instance_v1.Ec2MssqlInstanceV1Controller(self.base_controller)
+        from clumioapi.controllers import ec2_mssql_instance_v1
+
+        return self.base_controller.get_controller(
+            ec2_mssql_instance_v1.Ec2MssqlInstanceV1Controller
+        )
 
     @property
+    @_memoized
     def aws_environments_v1_paginator(
         self,
     ) -> aws_environments_v1.AwsEnvironmentsV1ControllerPaginator:
+        from clumioapi.controllers import aws_environments_v1
+
         return aws_environments_v1.AwsEnvironmentsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def aws_environments_v1(self) -> aws_environments_v1.AwsEnvironmentsV1Controller:
-        return aws_environments_v1.AwsEnvironmentsV1Controller(self.base_controller)
+        from clumioapi.controllers import aws_environments_v1
+
+        return self.base_controller.get_controller(aws_environments_v1.AwsEnvironmentsV1Controller)
 
     @property
+    @_memoized
     def aws_environment_tags_v1_paginator(
         self,
     ) -> aws_environment_tags_v1.AwsEnvironmentTagsV1ControllerPaginator:
+        from clumioapi.controllers import aws_environment_tags_v1
+
         return aws_environment_tags_v1.AwsEnvironmentTagsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def aws_environment_tags_v1(self) -> aws_environment_tags_v1.AwsEnvironmentTagsV1Controller:
-        return aws_environment_tags_v1.AwsEnvironmentTagsV1Controller(self.base_controller)
+        from clumioapi.controllers import aws_environment_tags_v1
+
+        return self.base_controller.get_controller(
+            aws_environment_tags_v1.AwsEnvironmentTagsV1Controller
+        )
 
     @property
+    @_memoized
     def aws_rds_resources_v1_paginator(
         self,
     ) -> aws_rds_resources_v1.AwsRdsResourcesV1ControllerPaginator:
+        from clumioapi.controllers import aws_rds_resources_v1
+
         return aws_rds_resources_v1.AwsRdsResourcesV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def aws_rds_resources_v1(self) -> aws_rds_resources_v1.AwsRdsResourcesV1Controller:
-        return aws_rds_resources_v1.AwsRdsResourcesV1Controller(self.base_controller)
+        from clumioapi.controllers import aws_rds_resources_v1
+
+        return self.base_controller.get_controller(aws_rds_resources_v1.AwsRdsResourcesV1Controller)
 
     @property
+    @_memoized
     def aws_s3_buckets_v1_paginator(self) -> aws_s3_buckets_v1.AwsS3BucketsV1ControllerPaginator:
+        from clumioapi.controllers import aws_s3_buckets_v1
+
         return aws_s3_buckets_v1.AwsS3BucketsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def aws_s3_buckets_v1(self) -> aws_s3_buckets_v1.AwsS3BucketsV1Controller:
-        return aws_s3_buckets_v1.AwsS3BucketsV1Controller(self.base_controller)
+        from clumioapi.controllers import aws_s3_buckets_v1
+
+        return self.base_controller.get_controller(aws_s3_buckets_v1.AwsS3BucketsV1Controller)
 
     @property
+    @_memoized
     def protection_groups_v1_paginator(
         self,
     ) -> protection_groups_v1.ProtectionGroupsV1ControllerPaginator:
+        from clumioapi.controllers import protection_groups_v1
+
         return protection_groups_v1.ProtectionGroupsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def protection_groups_v1(self) -> protection_groups_v1.ProtectionGroupsV1Controller:
-        return protection_groups_v1.ProtectionGroupsV1Controller(self.base_controller)
+        from clumioapi.controllers import protection_groups_v1
+
+        return self.base_controller.get_controller(
+            protection_groups_v1.ProtectionGroupsV1Controller
+        )
 
     @property
+    @_memoized
     def protection_groups_s3_assets_v1_paginator(
         self,
     ) -> protection_groups_s3_assets_v1.ProtectionGroupsS3AssetsV1ControllerPaginator:
+        from clumioapi.controllers import protection_groups_s3_assets_v1
+
         return protection_groups_s3_assets_v1.ProtectionGroupsS3AssetsV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def protection_groups_s3_assets_v1(
         self,
     ) -> protection_groups_s3_assets_v1.ProtectionGroupsS3AssetsV1Controller:
-        return protection_groups_s3_assets_v1.ProtectionGroupsS3AssetsV1Controller(
-            self.base_controller
+        from clumioapi.controllers import protection_groups_s3_assets_v1
+
+        return self.base_controller.get_controller(
+            protection_groups_s3_assets_v1.ProtectionGroupsS3AssetsV1Controller
         )
 
     @property
+    @_memoized
     def management_groups_v1_paginator(
         self,
     ) -> management_groups_v1.ManagementGroupsV1ControllerPaginator:
+        from clumioapi.controllers import management_groups_v1
+
         return management_groups_v1.ManagementGroupsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def management_groups_v1(self) -> management_groups_v1.ManagementGroupsV1Controller:
-        return management_groups_v1.ManagementGroupsV1Controller(self.base_controller)
+        from clumioapi.controllers import management_groups_v1
+
+        return self.base_controller.get_controller(
+            management_groups_v1.ManagementGroupsV1Controller
+        )
 
     @property
+    @_memoized
     def organizational_units_v2_paginator(
         self,
     ) -> organizational_units_v2.OrganizationalUnitsV2ControllerPaginator:
+        from clumioapi.controllers import organizational_units_v2
+
         return organizational_units_v2.OrganizationalUnitsV2ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def organizational_units_v2(self) -> organizational_units_v2.OrganizationalUnitsV2Controller:
-        return organizational_units_v2.OrganizationalUnitsV2Controller(self.base_controller)
+        from clumioapi.controllers import organizational_units_v2
+
+        return self.base_controller.get_controller(
+            organizational_units_v2.OrganizationalUnitsV2Controller
+        )
 
     @property
+    @_memoized
     def organizational_units_v1_paginator(
         self,
     ) -> organizational_units_v1.OrganizationalUnitsV1ControllerPaginator:
+        from clumioapi.controllers import organizational_units_v1
+
         return organizational_units_v1.OrganizationalUnitsV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def organizational_units_v1(self) -> organizational_units_v1.OrganizationalUnitsV1Controller:
-        return organizational_units_v1.OrganizationalUnitsV1Controller(self.base_controller)
+        from clumioapi.controllers import organizational_units_v1
+
+        return self.base_controller.get_controller(
+            organizational_units_v1.OrganizationalUnitsV1Controller
+        )
 
     @property
+    @_memoized
     def policy_assignments_v1_paginator(
         self,
     ) -> policy_assignments_v1.PolicyAssignmentsV1ControllerPaginator:
+        from clumioapi.controllers import policy_assignments_v1
+
         return policy_assignments_v1.PolicyAssignmentsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def policy_assignments_v1(self) -> policy_assignments_v1.PolicyAssignmentsV1Controller:
-        return policy_assignments_v1.PolicyAssignmentsV1Controller(self.base_controller)
+        from clumioapi.controllers import policy_assignments_v1
+
+        return self.base_controller.get_controller(
+            policy_assignments_v1.PolicyAssignmentsV1Controller
+        )
 
     @property
+    @_memoized
     def policy_definitions_v1_paginator(
         self,
     ) -> policy_definitions_v1.PolicyDefinitionsV1ControllerPaginator:
+        from clumioapi.controllers import policy_definitions_v1
+
         return policy_definitions_v1.PolicyDefinitionsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def policy_definitions_v1(self) -> policy_definitions_v1.PolicyDefinitionsV1Controller:
-        return policy_definitions_v1.PolicyDefinitionsV1Controller(self.base_controller)
+        from clumioapi.controllers import policy_definitions_v1
+
+        return self.base_controller.get_controller(
+            policy_definitions_v1.PolicyDefinitionsV1Controller
+        )
 
     @property
+    @_memoized
     def policy_rules_v1_paginator(self) -> policy_rules_v1.PolicyRulesV1ControllerPaginator:
+        from clumioapi.controllers import policy_rules_v1
+
         return policy_rules_v1.PolicyRulesV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def policy_rules_v1(self) -> policy_rules_v1.PolicyRulesV1Controller:
-        return policy_rules_v1.PolicyRulesV1Controller(self.base_controller)
+        from clumioapi.controllers import policy_rules_v1
+
+        return self.base_controller.get_controller(policy_rules_v1.PolicyRulesV1Controller)
 
     @property
+    @_memoized
     def report_compliance_v1_paginator(
         self,
     ) -> report_compliance_v1.ReportComplianceV1ControllerPaginator:
+        from clumioapi.controllers import report_compliance_v1
+
         return report_compliance_v1.ReportComplianceV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def report_compliance_v1(self) -> report_compliance_v1.ReportComplianceV1Controller:
-        return report_compliance_v1.ReportComplianceV1Controller(self.base_controller)
+        from clumioapi.controllers import report_compliance_v1
+
+        return self.base_controller.get_controller(
+            report_compliance_v1.ReportComplianceV1Controller
+        )
 
     @property
+    @_memoized
     def report_compliance_runs_v1_paginator(
         self,
     ) -> report_compliance_runs_v1.ReportComplianceRunsV1ControllerPaginator:
+        from clumioapi.controllers import report_compliance_runs_v1
+
         return report_compliance_runs_v1.ReportComplianceRunsV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def report_compliance_runs_v1(
         self,
     ) -> report_compliance_runs_v1.ReportComplianceRunsV1Controller:
-        return report_compliance_runs_v1.ReportComplianceRunsV1Controller(self.base_controller)
+        from clumioapi.controllers import report_compliance_runs_v1
+
+        return self.base_controller.get_controller(
+            report_compliance_runs_v1.ReportComplianceRunsV1Controller
+        )
 
     @property
+    @_memoized
     def report_downloads_v1_paginator(
         self,
     ) -> report_downloads_v1.ReportDownloadsV1ControllerPaginator:
+        from clumioapi.controllers import report_downloads_v1
+
         return report_downloads_v1.ReportDownloadsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def report_downloads_v1(self) -> report_downloads_v1.ReportDownloadsV1Controller:
-        return report_downloads_v1.ReportDownloadsV1Controller(self.base_controller)
+        from clumioapi.controllers import report_downloads_v1
+
+        return self.base_controller.get_controller(report_downloads_v1.ReportDownloadsV1Controller)
 
     @property
+    @_memoized
     def restored_aws_dynamodb_tables_v1_paginator(
         self,
     ) -> restored_aws_dynamodb_tables_v1.RestoredAwsDynamodbTablesV1ControllerPaginator:
+        from clumioapi.controllers import restored_aws_dynamodb_tables_v1
+
         return restored_aws_dynamodb_tables_v1.RestoredAwsDynamodbTablesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def restored_aws_dynamodb_tables_v1(
         self,
     ) -> restored_aws_dynamodb_tables_v1.RestoredAwsDynamodbTablesV1Controller:
-        return restored_aws_dynamodb_tables_v1.RestoredAwsDynamodbTablesV1Controller(
-            self.base_controller
+        from clumioapi.controllers import restored_aws_dynamodb_tables_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_dynamodb_tables_v1.RestoredAwsDynamodbTablesV1Controller
         )
 
     @property
+    @_memoized
     def restored_records_aws_dynamodb_tables_v1_paginator(
         self,
     ) -> (
         restored_records_aws_dynamodb_tables_v1.RestoredRecordsAwsDynamodbTablesV1ControllerPaginator
     ):
+        from clumioapi.controllers import restored_records_aws_dynamodb_tables_v1
+
         return restored_records_aws_dynamodb_tables_v1.RestoredRecordsAwsDynamodbTablesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def restored_records_aws_dynamodb_tables_v1(
         self,
     ) -> restored_records_aws_dynamodb_tables_v1.RestoredRecordsAwsDynamodbTablesV1Controller:
-        return restored_records_aws_dynamodb_tables_v1.RestoredRecordsAwsDynamodbTablesV1Controller(
-            self.base_controller
+        from clumioapi.controllers import restored_records_aws_dynamodb_tables_v1
+
+        return self.base_controller.get_controller(
+            restored_records_aws_dynamodb_tables_v1.RestoredRecordsAwsDynamodbTablesV1Controller
         )
 
     @property
+    @_memoized
     def restored_aws_ebs_volumes_v2_paginator(
         self,
     ) -> restored_aws_ebs_volumes_v2.RestoredAwsEbsVolumesV2ControllerPaginator:
+        from clumioapi.controllers import restored_aws_ebs_volumes_v2
+
         return restored_aws_ebs_volumes_v2.RestoredAwsEbsVolumesV2ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def restored_aws_ebs_volumes_v2(
         self,
     ) -> restored_aws_ebs_volumes_v2.RestoredAwsEbsVolumesV2Controller:
-        return restored_aws_ebs_volumes_v2.RestoredAwsEbsVolumesV2Controller(self.base_controller)
+        from clumioapi.controllers import restored_aws_ebs_volumes_v2
+
+        return self.base_controller.get_controller(
+            restored_aws_ebs_volumes_v2.RestoredAwsEbsVolumesV2Controller
+        )
 
     @property
+    @_memoized
     def restored_aws_ebs_volumes_v1_paginator(
         self,
     ) -> restored_aws_ebs_volumes_v1.RestoredAwsEbsVolumesV1ControllerPaginator:
+        from clumioapi.controllers import restored_aws_ebs_volumes_v1
+
         return restored_aws_ebs_volumes_v1.RestoredAwsEbsVolumesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def restored_aws_ebs_volumes_v1(
         self,
     ) -> restored_aws_ebs_volumes_v1.RestoredAwsEbsVolumesV1Controller:
-        return restored_aws_ebs_volumes_v1.RestoredAwsEbsVolumesV1Controller(self.base_controller)
+        from clumioapi.controllers import restored_aws_ebs_volumes_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_ebs_volumes_v1.RestoredAwsEbsVolumesV1Controller
+        )
 
     @property
+    @_memoized
     def restored_aws_ec2_instances_v1_paginator(
         self,
     ) -> restored_aws_ec2_instances_v1.RestoredAwsEc2InstancesV1ControllerPaginator:
+        from clumioapi.controllers import restored_aws_ec2_instances_v1
+
         return restored_aws_ec2_instances_v1.RestoredAwsEc2InstancesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def restored_aws_ec2_instances_v1(
         self,
     ) -> restored_aws_ec2_instances_v1.RestoredAwsEc2InstancesV1Controller:
-        return restored_aws_ec2_instances_v1.RestoredAwsEc2InstancesV1Controller(
-            self.base_controller
+        from clumioapi.controllers import restored_aws_ec2_instances_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_ec2_instances_v1.RestoredAwsEc2InstancesV1Controller
         )
 
     @property
+    @_memoized
     def restore_ec2_mssql_database_v1_paginator(
         self,
     ) -> restore_ec2_mssql_database_v1.RestoreEc2MssqlDatabaseV1ControllerPaginator:
+        from clumioapi.controllers import restore_ec2_mssql_database_v1
+
         return restore_ec2_mssql_database_v1.RestoreEc2MssqlDatabaseV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def restore_ec2_mssql_database_v1(
         self,
     ) -> restore_ec2_mssql_database_v1.RestoreEc2MssqlDatabaseV1Controller:
-        return restore_ec2_mssql_database_v1.RestoreEc2MssqlDatabaseV1Controller(
-            self.base_controller
+        from clumioapi.controllers import restore_ec2_mssql_database_v1
+
+        return self.base_controller.get_controller(
+            restore_ec2_mssql_database_v1.RestoreEc2MssqlDatabaseV1Controller
         )
 
     @property
+    @_memoized
     def restored_aws_rds_resources_v1_paginator(
         self,
     ) -> restored_aws_rds_resources_v1.RestoredAwsRdsResourcesV1ControllerPaginator:
+        from clumioapi.controllers import restored_aws_rds_resources_v1
+
         return restored_aws_rds_resources_v1.RestoredAwsRdsResourcesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def restored_aws_rds_resources_v1(
         self,
     ) -> restored_aws_rds_resources_v1.RestoredAwsRdsResourcesV1Controller:
-        return restored_aws_rds_resources_v1.RestoredAwsRdsResourcesV1Controller(
-            self.base_controller
+        from clumioapi.controllers import restored_aws_rds_resources_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_rds_resources_v1.RestoredAwsRdsResourcesV1Controller
         )
 
     @property
+    @_memoized
     def aws_rds_resource_restored_records_v1_paginator(
         self,
     ) -> aws_rds_resource_restored_records_v1.AwsRdsResourceRestoredRecordsV1ControllerPaginator:
+        from clumioapi.controllers import aws_rds_resource_restored_records_v1
+
         return (
             aws_rds_resource_restored_records_v1.AwsRdsResourceRestoredRecordsV1ControllerPaginator(
                 self.base_controller
@@ -718,177 +1115,266 @@ class ClumioAPIClient:
         )
 
     @property
+    @_memoized
     def aws_rds_resource_restored_records_v1(
         self,
     ) -> aws_rds_resource_restored_records_v1.AwsRdsResourceRestoredRecordsV1Controller:
-        return aws_rds_resource_restored_records_v1.AwsRdsResourceRestoredRecordsV1Controller(
-            self.base_controller
+        from clumioapi.controllers import aws_rds_resource_restored_records_v1
+
+        return self.base_controller.get_controller(
+            aws_rds_resource_restored_records_v1.AwsRdsResourceRestoredRecordsV1Controller
         )
 
     @property
+    @_memoized
     def restored_aws_s3_buckets_v1_paginator(
         self,
     ) -> restored_aws_s3_buckets_v1.RestoredAwsS3BucketsV1ControllerPaginator:
+        from clumioapi.controllers import restored_aws_s3_buckets_v1
+
         return restored_aws_s3_buckets_v1.RestoredAwsS3BucketsV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def restored_aws_s3_buckets_v1(
         self,
     ) -> restored_aws_s3_buckets_v1.RestoredAwsS3BucketsV1Controller:
-        return restored_aws_s3_buckets_v1.RestoredAwsS3BucketsV1Controller(self.base_controller)
+        from clumioapi.controllers import restored_aws_s3_buckets_v1
+
+        return self.base_controller.get_controller(
+            restored_aws_s3_buckets_v1.RestoredAwsS3BucketsV1Controller
+        )
 
     @property
+    @_memoized
     def restored_files_v1_paginator(self) -> restored_files_v1.RestoredFilesV1ControllerPaginator:
+        from clumioapi.controllers import restored_files_v1
+
         return restored_files_v1.RestoredFilesV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def restored_files_v1(self) -> restored_files_v1.RestoredFilesV1Controller:
-        return restored_files_v1.RestoredFilesV1Controller(self.base_controller)
+        from clumioapi.controllers import restored_files_v1
+
+        return self.base_controller.get_controller(restored_files_v1.RestoredFilesV1Controller)
 
     @property
+    @_memoized
     def restored_protection_groups_v1_paginator(
         self,
     ) -> restored_protection_groups_v1.RestoredProtectionGroupsV1ControllerPaginator:
+        from clumioapi.controllers import restored_protection_groups_v1
+
         return restored_protection_groups_v1.RestoredProtectionGroupsV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def restored_protection_groups_v1(
         self,
     ) -> restored_protection_groups_v1.RestoredProtectionGroupsV1Controller:
-        return restored_protection_groups_v1.RestoredProtectionGroupsV1Controller(
-            self.base_controller
+        from clumioapi.controllers import restored_protection_groups_v1
+
+        return self.base_controller.get_controller(
+            restored_protection_groups_v1.RestoredProtectionGroupsV1Controller
         )
 
     @property
+    @_memoized
     def restored_protection_group_instant_access_endpoints_v1_paginator(
         self,
     ) -> (
         restored_protection_group_instant_access_endpoints_v1.RestoredProtectionGroupInstantAccessEndpointsV1ControllerPaginator
     ):
+        from clumioapi.controllers import restored_protection_group_instant_access_endpoints_v1
+
         return restored_protection_group_instant_access_endpoints_v1.RestoredProtectionGroupInstantAccessEndpointsV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def restored_protection_group_instant_access_endpoints_v1(
         self,
     ) -> (
         restored_protection_group_instant_access_endpoints_v1.RestoredProtectionGroupInstantAccessEndpointsV1Controller
     ):
-        return restored_protection_group_instant_access_endpoints_v1.RestoredProtectionGroupInstantAccessEndpointsV1Controller(
-            self.base_controller
+        from clumioapi.controllers import restored_protection_group_instant_access_endpoints_v1
+
+        return self.base_controller.get_controller(
+            restored_protection_group_instant_access_endpoints_v1.RestoredProtectionGroupInstantAccessEndpointsV1Controller
         )
 
     @property
+    @_memoized
     def restored_protection_group_s3_assets_v1_paginator(
         self,
     ) -> (
         restored_protection_group_s3_assets_v1.RestoredProtectionGroupS3AssetsV1ControllerPaginator
     ):
+        from clumioapi.controllers import restored_protection_group_s3_assets_v1
+
         return restored_protection_group_s3_assets_v1.RestoredProtectionGroupS3AssetsV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def restored_protection_group_s3_assets_v1(
         self,
     ) -> restored_protection_group_s3_assets_v1.RestoredProtectionGroupS3AssetsV1Controller:
-        return restored_protection_group_s3_assets_v1.RestoredProtectionGroupS3AssetsV1Controller(
-            self.base_controller
+        from clumioapi.controllers import restored_protection_group_s3_assets_v1
+
+        return self.base_controller.get_controller(
+            restored_protection_group_s3_assets_v1.RestoredProtectionGroupS3AssetsV1Controller
         )
 
     @property
+    @_memoized
     def roles_v1_paginator(self) -> roles_v1.RolesV1ControllerPaginator:
+        from clumioapi.controllers import roles_v1
+
         return roles_v1.RolesV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def roles_v1(self) -> roles_v1.RolesV1Controller:
-        return roles_v1.RolesV1Controller(self.base_controller)
+        from clumioapi.controllers import roles_v1
+
+        return self.base_controller.get_controller(roles_v1.RolesV1Controller)
 
     @property
+    @_memoized
     def auto_user_provisioning_settings_v1_paginator(
         self,
     ) -> auto_user_provisioning_settings_v1.AutoUserProvisioningSettingsV1ControllerPaginator:
+        from clumioapi.controllers import auto_user_provisioning_settings_v1
+
         return auto_user_provisioning_settings_v1.AutoUserProvisioningSettingsV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def auto_user_provisioning_settings_v1(
         self,
     ) -> auto_user_provisioning_settings_v1.AutoUserProvisioningSettingsV1Controller:
-        return auto_user_provisioning_settings_v1.AutoUserProvisioningSettingsV1Controller(
-            self.base_controller
+        from clumioapi.controllers import auto_user_provisioning_settings_v1
+
+        return self.base_controller.get_controller(
+            auto_user_provisioning_settings_v1.AutoUserProvisioningSettingsV1Controller
         )
 
     @property
+    @_memoized
     def auto_user_provisioning_rules_v1_paginator(
         self,
     ) -> auto_user_provisioning_rules_v1.AutoUserProvisioningRulesV1ControllerPaginator:
+        from clumioapi.controllers import auto_user_provisioning_rules_v1
+
         return auto_user_provisioning_rules_v1.AutoUserProvisioningRulesV1ControllerPaginator(
             self.base_controller
         )
 
     @property
+    @_memoized
     def auto_user_provisioning_rules_v1(
         self,
     ) -> auto_user_provisioning_rules_v1.AutoUserProvisioningRulesV1Controller:
-        return auto_user_provisioning_rules_v1.AutoUserProvisioningRulesV1Controller(
-            self.base_controller
+        from clumioapi.controllers import auto_user_provisioning_rules_v1
+
+        return self.base_controller.get_controller(
+            auto_user_provisioning_rules_v1.AutoUserProvisioningRulesV1Controller
         )
 
     @property
+    @_memoized
     def general_settings_v2_paginator(
         self,
     ) -> general_settings_v2.GeneralSettingsV2ControllerPaginator:
+        from clumioapi.controllers import general_settings_v2
+
         return general_settings_v2.GeneralSettingsV2ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def general_settings_v2(self) -> general_settings_v2.GeneralSettingsV2Controller:
-        return general_settings_v2.GeneralSettingsV2Controller(self.base_controller)
+        from clumioapi.controllers import general_settings_v2
+
+        return self.base_controller.get_controller(general_settings_v2.GeneralSettingsV2Controller)
 
     @property
+    @_memoized
     def tasks_v1_paginator(self) -> tasks_v1.TasksV1ControllerPaginator:
+        from clumioapi.controllers import tasks_v1
+
         return tasks_v1.TasksV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def tasks_v1(self) -> tasks_v1.TasksV1Controller:
-        return tasks_v1.TasksV1Controller(self.base_controller)
+        from clumioapi.controllers import tasks_v1
+
+        return self.base_controller.get_controller(tasks_v1.TasksV1Controller)
 
     @property
+    @_memoized
     def users_v2_paginator(self) -> users_v2.UsersV2ControllerPaginator:
+        from clumioapi.controllers import users_v2
+
         return users_v2.UsersV2ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def users_v2(self) -> users_v2.UsersV2Controller:
-        return users_v2.UsersV2Controller(self.base_controller)
+        from clumioapi.controllers import users_v2
+
+        return self.base_controller.get_controller(users_v2.UsersV2Controller)
 
     @property
+    @_memoized
     def users_v1_paginator(self) -> users_v1.UsersV1ControllerPaginator:
+        from clumioapi.controllers import users_v1
+
         return users_v1.UsersV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def users_v1(self) -> users_v1.UsersV1Controller:
-        return users_v1.UsersV1Controller(self.base_controller)
+        from clumioapi.controllers import users_v1
+
+        return self.base_controller.get_controller(users_v1.UsersV1Controller)
 
     @property
+    @_memoized
     def wallets_v1_paginator(self) -> wallets_v1.WalletsV1ControllerPaginator:
+        from clumioapi.controllers import wallets_v1
+
         return wallets_v1.WalletsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def wallets_v1(self) -> wallets_v1.WalletsV1Controller:
-        return wallets_v1.WalletsV1Controller(self.base_controller)
+        from clumioapi.controllers import wallets_v1
+
+        return self.base_controller.get_controller(wallets_v1.WalletsV1Controller)
 
     @property
+    @_memoized
     def post_process_kms_v1_paginator(
         self,
     ) -> post_process_kms_v1.PostProcessKmsV1ControllerPaginator:
+        from clumioapi.controllers import post_process_kms_v1
+
         return post_process_kms_v1.PostProcessKmsV1ControllerPaginator(self.base_controller)
 
     @property
+    @_memoized
     def post_process_kms_v1(self) -> post_process_kms_v1.PostProcessKmsV1Controller:
-        return post_process_kms_v1.PostProcessKmsV1Controller(self.base_controller)
+        from clumioapi.controllers import post_process_kms_v1
+
+        return self.base_controller.get_controller(post_process_kms_v1.PostProcessKmsV1Controller)
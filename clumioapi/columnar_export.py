@@ -0,0 +1,432 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Columnar export of list responses to Arrow record batches, Parquet and CSV.
+
+The export works on the decoded JSON of the pages, obtained by calling a paginator method
+with raw_json=True, so no model is ever built for the items. Each page is converted to a
+record batch by Arrow itself and nested objects are flattened into columns named after
+their path, such as 'primary_entity.id'.
+
+Arrow is an optional dependency of the SDK and must be installed separately with
+`pip install pyarrow`.
+
+The page iterators returned by the paginator methods expose the export as their to_arrow,
+write_parquet and write_csv methods.
+
+Example:
+    ```
+    pages = client.tasks_v1_paginator.list_tasks(limit=1000, raw_json=True)
+    pages.write_parquet('tasks.parquet')
+    ```
+"""
+
+import contextlib
+import json
+import os
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+from clumioapi.controllers import pagination
+
+try:
+    import pyarrow
+    from pyarrow import csv
+    from pyarrow import parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+# Columns left out of the export unless requested: the HATEOAS links of every item.
+DEFAULT_EXCLUDE: tuple[str, ...] = ('_links',)
+
+# Number of rows the writers buffer to infer the schema of a file before writing it.
+DEFAULT_BUFFER_ROWS = 10000
+
+
+def record_batches(
+    pages: Iterable[Mapping[str, Any]],
+    columns: Sequence[str] | None = None,
+    schema: Any = None,
+    exclude: Sequence[str] = DEFAULT_EXCLUDE,
+) -> Iterator[Any]:
+    """Yields a record batch with the items of every non-empty page.
+
+    Unless a schema is given, it is inferred from the items: the schema of every page is
+    merged into the one of the previous pages, adding the new columns and widening the types
+    that a value does not fit, such as int64 to double. Each batch is cast to the merged
+    schema, so it has the columns of the previous batches with types at least as wide. The
+    columns missing from a page are filled with nulls, and the columns holding only nulls so
+    far are typed as strings. When a schema or columns are given, every batch has exactly
+    these columns.
+
+    Args:
+        pages: The decoded JSON of the pages, such as the pages of a paginator method called
+            with raw_json=True.
+        columns: The columns to export, in order. Defaults to all the columns.
+        schema: A pyarrow.Schema the batches are cast to, overriding the inferred one.
+        exclude: Top-level fields of the items left out of the export.
+    Returns:
+        An iterator over pyarrow.RecordBatch objects.
+    Raises:
+        TypeError: If the pages are models instead of decoded JSON.
+        ValueError: If the values of a column have types that cannot be merged, such as
+            numbers and strings, or do not fit the given schema.
+    """
+    _require_pyarrow()
+    inferred = batch_schema = None
+    for page in pages:
+        if not isinstance(page, Mapping):
+            raise TypeError(
+                'The pages must be decoded JSON. Call the paginator method with raw_json=True.'
+            )
+        items = pagination.page_items(page)
+        del page
+        if not items:
+            continue
+        batch = _flatten(pyarrow.RecordBatch.from_struct_array(pyarrow.array(items)), exclude)
+        del items
+        if schema is not None:
+            yield _conform(batch, schema)
+            continue
+        if inferred is None:
+            merged = batch.schema
+        else:
+            try:
+                merged = pyarrow.unify_schemas(
+                    [inferred, batch.schema], promote_options='permissive'
+                )
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+                raise ValueError(
+                    f'The items of a page do not fit the schema of the previous pages: {e}'
+                ) from e
+        if batch_schema is None or not merged.equals(inferred):
+            inferred, batch_schema = merged, _batch_schema(merged, columns)
+        yield _conform(batch, batch_schema)
+
+
+def to_table(
+    pages: Iterable[Mapping[str, Any]],
+    columns: Sequence[str] | None = None,
+    schema: Any = None,
+    exclude: Sequence[str] = DEFAULT_EXCLUDE,
+) -> Any:
+    """Returns a table with the items of all the pages.
+
+    The batches of record_batches are cast to the schema of the last one, which holds the
+    columns of all the pages with their widest types.
+
+    Args:
+        pages: The decoded JSON of the pages, as for record_batches.
+        columns: The columns to export, in order. Defaults to all the columns.
+        schema: A pyarrow.Schema the batches are cast to, overriding the inferred one.
+        exclude: Top-level fields of the items left out of the export.
+    Returns:
+        A pyarrow.Table, without columns if there are no items and no schema is given.
+    Raises:
+        TypeError: If the pages are models instead of decoded JSON.
+        ValueError: If the values of a column have types that cannot be merged, or do not fit
+            the given schema.
+    """
+    _require_pyarrow()
+    batches = list(record_batches(pages, columns, schema, exclude))
+    if not batches:
+        return (schema or pyarrow.schema([])).empty_table()
+    final = batches[-1].schema
+    return pyarrow.Table.from_batches([_conform(batch, final) for batch in batches], final)
+
+
+def write_parquet(
+    pages: Iterable[Mapping[str, Any]],
+    where: Any,
+    columns: Sequence[str] | None = None,
+    schema: Any = None,
+    exclude: Sequence[str] = DEFAULT_EXCLUDE,
+    buffer_rows: int = DEFAULT_BUFFER_ROWS,
+    **options: Any,
+) -> int:
+    """Streams the items of the pages to a Parquet file, one row group per page.
+
+    A file given by its path is written under a temporary name and renamed once complete,
+    so an export that fails leaves no partial file behind. No file is written if there are
+    no items and no schema is given.
+
+    Args:
+        pages: The decoded JSON of the pages, as for record_batches.
+        where: Path or writable binary file object of the Parquet file.
+        columns: The columns to export, in order. Defaults to all the columns.
+        schema: A pyarrow.Schema the batches are cast to, overriding the inferred one.
+        exclude: Top-level fields of the items left out of the export.
+        buffer_rows: Number of rows read before the schema of the file is set, so that it
+            has the columns of all these rows. Ignored when a schema is given.
+        options: Passed on to pyarrow.parquet.ParquetWriter, such as compression.
+    Returns:
+        The number of rows written.
+    Raises:
+        ValueError: If a page after the buffered ones has values that the schema of the file
+            cannot hold, such as a new column or a wider type.
+    """
+    _require_pyarrow()
+    writer = None
+    rows = 0
+    with _output(where) as target:
+        try:
+            batches = record_batches(pages, columns, schema, exclude)
+            for batch in _file_batches(batches, 0 if schema is not None else buffer_rows):
+                if writer is None:
+                    writer = parquet.ParquetWriter(target, batch.schema, **options)
+                writer.write_batch(_fit(batch, writer.schema))
+                rows += batch.num_rows
+            if writer is None and schema is not None:
+                writer = parquet.ParquetWriter(target, schema, **options)
+        finally:
+            if writer is not None:
+                writer.close()
+    return rows
+
+
+def write_csv(
+    pages: Iterable[Mapping[str, Any]],
+    where: Any,
+    columns: Sequence[str] | None = None,
+    schema: Any = None,
+    exclude: Sequence[str] = DEFAULT_EXCLUDE,
+    buffer_rows: int = DEFAULT_BUFFER_ROWS,
+) -> int:
+    """Streams the items of the pages to a CSV file with a header row.
+
+    CSV has no nested values, so list columns are written as JSON arrays. A file given by
+    its path is written under a temporary name and renamed once complete, so an export that
+    fails leaves no partial file behind. No file is written if there are no items and no
+    schema is given.
+
+    Args:
+        pages: The decoded JSON of the pages, as for record_batches.
+        where: Path or writable binary file object of the CSV file.
+        columns: The columns to export, in order. Defaults to all the columns.
+        schema: A pyarrow.Schema the batches are cast to, overriding the inferred one.
+        exclude: Top-level fields of the items left out of the export.
+        buffer_rows: Number of rows read before the schema of the file is set, so that it
+            has the columns of all these rows. Ignored when a schema is given.
+    Returns:
+        The number of rows written.
+    Raises:
+        ValueError: If a page after the buffered ones has values that the schema of the file
+            cannot hold, such as a new column or a wider type.
+    """
+    _require_pyarrow()
+    writer = None
+    file_schema = None
+    rows = 0
+    with _output(where) as target:
+        try:
+            batches = record_batches(pages, columns, schema, exclude)
+            for batch in _file_batches(batches, 0 if schema is not None else buffer_rows):
+                if file_schema is None:
+                    file_schema = batch.schema
+                batch = _lists_to_json(_fit(batch, file_schema))
+                if writer is None:
+                    writer = csv.CSVWriter(target, batch.schema)
+                writer.write_batch(batch)
+                rows += batch.num_rows
+            if writer is None and schema is not None:
+                writer = csv.CSVWriter(target, _lists_to_json(schema.empty_table()).schema)
+        finally:
+            if writer is not None:
+                writer.close()
+    return rows
+
+
+def _require_pyarrow() -> None:
+    if pyarrow is None:
+        raise ImportError(
+            'pyarrow is required for the columnar export. Install it with `pip install pyarrow`.'
+        )
+
+
+@contextlib.contextmanager
+def _output(where: Any) -> Iterator[Any]:
+    """Yields where, or a temporary path renamed to where on success if it is a path."""
+    if not isinstance(where, (str, os.PathLike)):
+        yield where
+        return
+    path = os.fspath(where)
+    tmp_path = f'{path}.tmp'
+    try:
+        yield tmp_path
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    if os.path.exists(tmp_path):
+        os.replace(tmp_path, path)
+
+
+def _file_batches(batches: Iterator[Any], buffer_rows: int) -> Iterator[Any]:
+    """Yields the batches written to a file, the first ones cast to a common schema.
+
+    The schema of a file is set by its first batch, so the batches are buffered until they
+    hold buffer_rows rows, and those are cast to the schema of the last of them, which has
+    the columns of all of them with their widest types. The fields that only appear later
+    must fit the schema of the file, see _fit.
+    """
+    buffered: list[Any] = []
+    rows = 0
+    for batch in batches:
+        buffered.append(batch)
+        rows += batch.num_rows
+        if rows >= buffer_rows:
+            break
+    if buffered:
+        schema = buffered[-1].schema
+        for batch in buffered:
+            yield _conform(batch, schema)
+        del buffered
+    yield from batches
+
+
+def _flatten(batch: Any, exclude: Sequence[str]) -> Any:
+    """Replaces the struct columns of a batch by their fields, recursively."""
+    names: list[str] = []
+    arrays: list[Any] = []
+
+    def add(name: str, array: Any) -> None:
+        if pyarrow.types.is_struct(array.type):
+            for field, child in zip(array.type, array.flatten()):
+                add(f'{name}.{field.name}', child)
+        else:
+            names.append(name)
+            arrays.append(array)
+
+    for name, array in zip(batch.schema.names, batch.columns):
+        if name not in exclude:
+            add(name, array)
+    return pyarrow.RecordBatch.from_arrays(arrays, names=names)
+
+
+def _batch_schema(inferred: Any, columns: Sequence[str] | None) -> Any:
+    """Returns the schema of the batches for the merged schema of the pages.
+
+    The columns holding only nulls are typed as strings. Those that are the parent of other
+    columns, such as an object that was null on the first pages, are left out unless
+    requested.
+    """
+    fields = {
+        field.name: (
+            pyarrow.field(field.name, pyarrow.string())
+            if pyarrow.types.is_null(field.type)
+            else field
+        )
+        for field in inferred
+    }
+    if columns is None:
+        parents = {name.rsplit('.', 1)[0] for name in fields if '.' in name}
+        columns = [
+            name
+            for name in fields
+            if not (name in parents and pyarrow.types.is_null(inferred.field(name).type))
+        ]
+    return pyarrow.schema(
+        fields.get(name) or pyarrow.field(name, pyarrow.string()) for name in columns
+    )
+
+
+def _conform(batch: Any, schema: Any) -> Any:
+    """Casts a batch to the schema, adding the missing columns and dropping the others.
+
+    Raises:
+        ValueError: If the values of a column do not fit its type in the schema.
+    """
+    arrays = []
+    for field in schema:
+        index = batch.schema.get_field_index(field.name)
+        if index < 0:
+            arrays.append(pyarrow.nulls(batch.num_rows, field.type))
+            continue
+        array = batch.column(index)
+        if array.type != field.type:
+            try:
+                array = array.cast(field.type)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError) as e:
+                raise ValueError(
+                    f'The values of column {field.name} do not fit its type {field.type}: {e}'
+                ) from e
+        arrays.append(array)
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _fit(batch: Any, schema: Any) -> Any:
+    """Casts a batch to the schema of the file it is written to, without losing values.
+
+    The schema of the batches grows when a page has new columns or wider types, but that of
+    a file is set by its first rows. An object that was null in all of them has a string
+    column in the file, so its fields found later are written there as a JSON object.
+
+    Raises:
+        ValueError: If a value of the batch cannot be written with the schema.
+    """
+    if batch.schema.equals(schema):
+        return batch
+    hint = 'Pass the schema of the export, or a larger buffer_rows, to write all the pages.'
+    objects: dict[str, list[tuple[str, Any]]] = {}
+    for name, array in zip(batch.schema.names, batch.columns):
+        if schema.get_field_index(name) >= 0 or array.null_count == len(array):
+            continue
+        parent = _string_parent(name, schema)
+        if parent is None:
+            raise ValueError(f'Column {name} is not in the schema set by the first rows. {hint}')
+        objects.setdefault(parent, []).append((name[len(parent) + 1 :], array))
+    if objects:
+        batch = _objects_to_json(batch, objects)
+    try:
+        return _conform(batch, schema)
+    except ValueError as e:
+        raise ValueError(f'{e}. {hint}') from e
+
+
+def _string_parent(name: str, schema: Any) -> str | None:
+    """Returns the closest parent of a column if it is a string column of the schema."""
+    while '.' in name:
+        name = name.rsplit('.', 1)[0]
+        index = schema.get_field_index(name)
+        if index >= 0:
+            return name if pyarrow.types.is_string(schema.field(index).type) else None
+    return None
+
+
+def _objects_to_json(batch: Any, objects: Mapping[str, list[tuple[str, Any]]]) -> Any:
+    """Sets the columns of objects to the JSON representation of their field columns.
+
+    Args:
+        batch: The batch holding the field columns.
+        objects: The name and array of the field columns, relative to the name of the
+            column of their object, keyed by the latter.
+    """
+    columns = dict(zip(batch.schema.names, batch.columns))
+    for name, fields in objects.items():
+        values: list[dict[str, Any] | None] = [None] * batch.num_rows
+        for path, array in fields:
+            *parents, key = path.split('.')
+            for row, value in enumerate(array.to_pylist()):
+                if value is None:
+                    continue
+                obj = values[row] = values[row] or {}
+                for parent in parents:
+                    obj = obj.setdefault(parent, {})
+                obj[key] = value
+        columns[name] = pyarrow.array(
+            [None if value is None else json.dumps(value) for value in values], pyarrow.string()
+        )
+    return pyarrow.RecordBatch.from_arrays(list(columns.values()), names=list(columns))
+
+
+def _lists_to_json(batch: Any) -> Any:
+    """Replaces the list columns of a batch or table by their JSON representation."""
+    arrays = []
+    for array in batch.columns:
+        if pyarrow.types.is_list(array.type) or pyarrow.types.is_large_list(array.type):
+            array = pyarrow.array(
+                [None if value is None else json.dumps(value) for value in array.to_pylist()],
+                pyarrow.string(),
+            )
+        arrays.append(array)
+    return type(batch).from_arrays(arrays, names=batch.schema.names)
@@ -3,8 +3,12 @@
 #
 
 import os
-from typing import Mapping
+from typing import Mapping, Sequence
 
+from clumioapi import http_cache
+from clumioapi import instrumentation
+from clumioapi import rate_limiter as rate_limiter_
+from clumioapi import retry_policy as retry_policy_
 from clumioapi.exceptions import clumio_exception
 import rest3client
 
@@ -19,6 +23,45 @@ class Configuration:
         hostname: Hostname of the API server.
         client: If passed, it will be used as the client to make REST API calls. Otherwise a default
             client will be used.
+        organizational_unit_context: ID of the organizational unit the API calls are made in.
+        custom_headers: Additional headers sent along with every API call.
+        revision: Incremented every time organizational_unit_context or custom_headers is
+            assigned, so that clients can rebuild the controllers whose headers depend on them.
+        page_prefetch_concurrency: Maximum number of pages a paginator fetches concurrently for
+            the page-number based collections listed in pagination.PAGE_NUMBER_OPERATIONS. A value
+            of 1 walks every collection serially.
+        max_filter_length: Maximum length of the URL-encoded filter query parameter of a
+            paginator call. Filters with longer $in lists are split into several filters, each
+            with a chunk of the lists, whose results are merged. See
+            BaseControllerFilterTypes.split.
+        filter_chunk_concurrency: Maximum number of the chunks of a split filter whose pages
+            are fetched concurrently.
+        pool_size: Number of per-host connection pools kept by the default client.
+        max_connections_per_host: Maximum number of connections kept open to a host by the
+            default client. It should be at least the number of threads sharing the client.
+        pool_block: Whether a request waits for a free connection when max_connections_per_host
+            connections are in use, instead of opening a connection that is discarded after use.
+        keep_alive: Whether connections are reused across requests.
+        connect_timeout: Timeout in seconds for establishing a connection, None to wait forever.
+        read_timeout: Timeout in seconds for receiving a response, None to wait forever.
+        retry_policy: Decides which failed requests are retried and how long to wait before.
+            It can be overridden per call with the retry_policy keyword argument.
+        rate_limiter: If set, limits the rate of the requests made by all the controllers sharing
+            this configuration. It can be overridden per call with the rate_limiter keyword
+            argument.
+        response_cache: If set, the responses to GET requests are cached and revalidated as
+            configured in it, and writes invalidate the cached responses of their path. It can
+            be overridden per call with the response_cache keyword argument, for example None
+            to bypass it.
+        retain_raw_response: Whether the models returned by the controllers keep the
+            requests.Response they were created from in their raw_response attribute. It can
+            be overridden per call with the retain_raw_response keyword argument.
+        lazy_models: Whether the models returned by the controllers are built lazily, each
+            field being converted from the decoded JSON when first read. See lazy_model. It
+            can be overridden per call with the lazy_models keyword argument.
+        hooks: Notified of the requests of all the controllers sharing this configuration,
+            their retries, responses and errors. See instrumentation. They can be overridden
+            per call with the hooks keyword argument.
     """
 
     # The base Uri for API calls
@@ -31,6 +74,21 @@ class Configuration:
         hostname: str = '',
         organizational_unit_context: str = '',
         custom_headers: Mapping[str, str] | None = None,
+        page_prefetch_concurrency: int = 1,
+        max_filter_length: int = 4096,
+        filter_chunk_concurrency: int = 4,
+        retain_raw_response: bool = True,
+        pool_size: int = 10,
+        max_connections_per_host: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        retry_policy: retry_policy_.RetryPolicy | None = None,
+        rate_limiter: rate_limiter_.RateLimiter | None = None,
+        response_cache: http_cache.ResponseCache | None = None,
+        lazy_models: bool = False,
+        hooks: Sequence[instrumentation.RequestHooks] | None = None,
     ) -> None:
         api_token = api_token or os.getenv('API_TOKEN') or ''
         if not api_token:
@@ -51,5 +109,52 @@ class Configuration:
                 'API_TOKEN must be set.'
             )
         self.client = client
+        self.revision = 0
         self.organizational_unit_context = organizational_unit_context
         self.custom_headers = custom_headers
+        if page_prefetch_concurrency < 1:
+            raise ValueError('page_prefetch_concurrency must be at least 1.')
+        self.page_prefetch_concurrency = page_prefetch_concurrency
+        if max_filter_length < 1 or filter_chunk_concurrency < 1:
+            raise ValueError('max_filter_length and filter_chunk_concurrency must be at least 1.')
+        self.max_filter_length = max_filter_length
+        self.filter_chunk_concurrency = filter_chunk_concurrency
+        self.retain_raw_response = retain_raw_response
+        if pool_size < 1 or max_connections_per_host < 1:
+            raise ValueError('pool_size and max_connections_per_host must be at least 1.')
+        self.pool_size = pool_size
+        self.max_connections_per_host = max_connections_per_host
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retry_policy = retry_policy or retry_policy_.RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.lazy_models = lazy_models
+        self.hooks = tuple(hooks or ())
+
+    @property
+    def timeout(self) -> tuple[float | None, float | None] | None:
+        """The timeout passed to requests, or None if no timeout is configured."""
+        if self.connect_timeout is None and self.read_timeout is None:
+            return None
+        return (self.connect_timeout, self.read_timeout)
+
+    @property
+    def organizational_unit_context(self) -> str:
+        return self._organizational_unit_context
+
+    @organizational_unit_context.setter
+    def organizational_unit_context(self, value: str) -> None:
+        self._organizational_unit_context = value
+        self.revision += 1
+
+    @property
+    def custom_headers(self) -> Mapping[str, str] | None:
+        return self._custom_headers
+
+    @custom_headers.setter
+    def custom_headers(self, value: Mapping[str, str] | None) -> None:
+        self._custom_headers = value
+        self.revision += 1
@@ -2,6 +2,9 @@
 # Copyright 2023. Clumio, A Commvault Company.
 #
 
+import importlib
+from typing import Any
+
 __all__ = [
     'audit_trails_v1',
     'auto_user_provisioning_rules_v1',
@@ -70,3 +73,10 @@ __all__ = [
     'users_v2',
     'wallets_v1',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the submodules listed in __all__ on first access."""
+    if name in __all__:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
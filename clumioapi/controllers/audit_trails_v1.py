@@ -3,20 +3,17 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import audit_trails_types
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_audit_trails_response
 import requests
-import retrying
 
 
 class AuditTrailsV1Controller:
@@ -254,23 +251,16 @@ class AuditTrailsV1Controller:
 
         resp_instance: list_audit_trails_response.ListAuditTrailsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_audit_trails for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_audit_trails',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/audit-trails',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -281,18 +271,13 @@ class AuditTrailsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_audit_trails(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: audit_trails_types.ListAuditTrailsV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_audit_trails_response.ListAuditTrailsResponse]:
+    ) -> pagination.PageIterator[list_audit_trails_response.ListAuditTrailsResponse]:
         """Returns a list of audit trails.
 
         Args:
@@ -490,19 +475,73 @@ class AuditTrailsV1ControllerPaginator:
                 +------------------------+------------------+----------------------------------+
 
         """
-        controller = AuditTrailsV1Controller(self.controller)
-        while True:
-            response = controller.list_audit_trails(
-                limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(AuditTrailsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: audit_trails_types.ListAuditTrailsV1FilterT | None = filter,
+        ) -> list_audit_trails_response.ListAuditTrailsResponse:
+            return controller.list_audit_trails(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='audit_trails_v1.list_audit_trails',
+        )
+
+
+class AuditTrailsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for audit-trails resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_audit_trails(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: audit_trails_types.ListAuditTrailsV1FilterT | None = None,
+        **kwargs,
+    ) -> list_audit_trails_response.ListAuditTrailsResponse:
+        """Asynchronous counterpart of AuditTrailsV1Controller.list_audit_trails."""
+        controller = self.controller.get_controller(AuditTrailsV1Controller)
+        return await self.controller.call(
+            controller.list_audit_trails, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+
+class AuditTrailsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for audit-trails resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_audit_trails(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: audit_trails_types.ListAuditTrailsV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_audit_trails_response.ListAuditTrailsResponse]:
+        """Asynchronous counterpart of AuditTrailsV1ControllerPaginator.list_audit_trails."""
+        controller = self.controller.get_controller(AuditTrailsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: audit_trails_types.ListAuditTrailsV1FilterT | None = filter,
+        ) -> list_audit_trails_response.ListAuditTrailsResponse:
+            return await controller.list_audit_trails(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='audit_trails_v1.list_audit_trails',
+        )
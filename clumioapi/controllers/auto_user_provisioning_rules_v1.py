@@ -3,17 +3,15 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import auto_user_provisioning_rules_types
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_auto_user_provisioning_rule_response
 from clumioapi.models import create_auto_user_provisioning_rule_v1_request
 from clumioapi.models import list_auto_user_provisioning_rules_response
@@ -21,7 +19,6 @@ from clumioapi.models import read_auto_user_provisioning_rule_response
 from clumioapi.models import update_auto_user_provisioning_rule_response
 from clumioapi.models import update_auto_user_provisioning_rule_v1_request
 import requests
-import retrying
 
 
 class AutoUserProvisioningRulesV1Controller:
@@ -99,23 +96,16 @@ class AutoUserProvisioningRulesV1Controller:
             list_auto_user_provisioning_rules_response.ListAutoUserProvisioningRulesResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_auto_user_provisioning_rules for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_auto_user_provisioning_rules',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/settings/auto-user-provisioning/rules',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -150,24 +140,17 @@ class AutoUserProvisioningRulesV1Controller:
             create_auto_user_provisioning_rule_response.CreateAutoUserProvisioningRuleResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'create_auto_user_provisioning_rule for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_auto_user_provisioning_rule',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/settings/auto-user-provisioning/rules',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -196,25 +179,16 @@ class AutoUserProvisioningRulesV1Controller:
             read_auto_user_provisioning_rule_response.ReadAutoUserProvisioningRuleResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'read_auto_user_provisioning_rule for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_auto_user_provisioning_rule',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/settings/auto-user-provisioning/rules/{rule_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -251,24 +225,17 @@ class AutoUserProvisioningRulesV1Controller:
             update_auto_user_provisioning_rule_response.UpdateAutoUserProvisioningRuleResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.put(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_auto_user_provisioning_rule for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_auto_user_provisioning_rule',
+            'put',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/settings/auto-user-provisioning/rules/{rule_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -291,23 +258,16 @@ class AutoUserProvisioningRulesV1Controller:
 
         resp_instance: object
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'delete_auto_user_provisioning_rule for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_auto_user_provisioning_rule',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/settings/auto-user-provisioning/rules/{rule_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -318,11 +278,6 @@ class AutoUserProvisioningRulesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_auto_user_provisioning_rules(
         self,
         limit: int | None = None,
@@ -331,7 +286,9 @@ class AutoUserProvisioningRulesV1ControllerPaginator:
             auto_user_provisioning_rules_types.ListAutoUserProvisioningRulesV1FilterT | None
         ) = None,
         **kwargs,
-    ) -> Iterator[list_auto_user_provisioning_rules_response.ListAutoUserProvisioningRulesResponse]:
+    ) -> pagination.PageIterator[
+        list_auto_user_provisioning_rules_response.ListAutoUserProvisioningRulesResponse
+    ]:
         """Returns a list of auto user provisioning rules.
 
         Args:
@@ -361,19 +318,134 @@ class AutoUserProvisioningRulesV1ControllerPaginator:
                 +------------------------+------------------+----------------------------------+
 
         """
-        controller = AutoUserProvisioningRulesV1Controller(self.controller)
-        while True:
-            response = controller.list_auto_user_provisioning_rules(
-                limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(AutoUserProvisioningRulesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                auto_user_provisioning_rules_types.ListAutoUserProvisioningRulesV1FilterT | None
+            ) = filter,
+        ) -> list_auto_user_provisioning_rules_response.ListAutoUserProvisioningRulesResponse:
+            return controller.list_auto_user_provisioning_rules(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='auto_user_provisioning_rules_v1.list_auto_user_provisioning_rules',
+        )
+
+
+class AutoUserProvisioningRulesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for auto-user-provisioning-rules resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_auto_user_provisioning_rules(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            auto_user_provisioning_rules_types.ListAutoUserProvisioningRulesV1FilterT | None
+        ) = None,
+        **kwargs,
+    ) -> list_auto_user_provisioning_rules_response.ListAutoUserProvisioningRulesResponse:
+        """Asynchronous counterpart of AutoUserProvisioningRulesV1Controller.list_auto_user_provisioning_rules."""
+        controller = self.controller.get_controller(AutoUserProvisioningRulesV1Controller)
+        return await self.controller.call(
+            controller.list_auto_user_provisioning_rules,
+            limit=limit,
+            start=start,
+            filter=filter,
+            **kwargs,
+        )
+
+    async def create_auto_user_provisioning_rule(
+        self,
+        body: (
+            create_auto_user_provisioning_rule_v1_request.CreateAutoUserProvisioningRuleV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> create_auto_user_provisioning_rule_response.CreateAutoUserProvisioningRuleResponse:
+        """Asynchronous counterpart of AutoUserProvisioningRulesV1Controller.create_auto_user_provisioning_rule."""
+        controller = self.controller.get_controller(AutoUserProvisioningRulesV1Controller)
+        return await self.controller.call(
+            controller.create_auto_user_provisioning_rule, body=body, **kwargs
+        )
+
+    async def read_auto_user_provisioning_rule(
+        self, rule_id: str | None = None, **kwargs
+    ) -> read_auto_user_provisioning_rule_response.ReadAutoUserProvisioningRuleResponse:
+        """Asynchronous counterpart of AutoUserProvisioningRulesV1Controller.read_auto_user_provisioning_rule."""
+        controller = self.controller.get_controller(AutoUserProvisioningRulesV1Controller)
+        return await self.controller.call(
+            controller.read_auto_user_provisioning_rule, rule_id=rule_id, **kwargs
+        )
+
+    async def update_auto_user_provisioning_rule(
+        self,
+        rule_id: str | None = None,
+        body: (
+            update_auto_user_provisioning_rule_v1_request.UpdateAutoUserProvisioningRuleV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> update_auto_user_provisioning_rule_response.UpdateAutoUserProvisioningRuleResponse:
+        """Asynchronous counterpart of AutoUserProvisioningRulesV1Controller.update_auto_user_provisioning_rule."""
+        controller = self.controller.get_controller(AutoUserProvisioningRulesV1Controller)
+        return await self.controller.call(
+            controller.update_auto_user_provisioning_rule, rule_id=rule_id, body=body, **kwargs
+        )
+
+    async def delete_auto_user_provisioning_rule(
+        self, rule_id: str | None = None, **kwargs
+    ) -> object:
+        """Asynchronous counterpart of AutoUserProvisioningRulesV1Controller.delete_auto_user_provisioning_rule."""
+        controller = self.controller.get_controller(AutoUserProvisioningRulesV1Controller)
+        return await self.controller.call(
+            controller.delete_auto_user_provisioning_rule, rule_id=rule_id, **kwargs
+        )
+
+
+class AutoUserProvisioningRulesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for auto-user-provisioning-rules resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_auto_user_provisioning_rules(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            auto_user_provisioning_rules_types.ListAutoUserProvisioningRulesV1FilterT | None
+        ) = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_auto_user_provisioning_rules_response.ListAutoUserProvisioningRulesResponse
+    ]:
+        """Asynchronous counterpart of AutoUserProvisioningRulesV1ControllerPaginator.list_auto_user_provisioning_rules."""
+        controller = self.controller.get_controller(AutoUserProvisioningRulesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                auto_user_provisioning_rules_types.ListAutoUserProvisioningRulesV1FilterT | None
+            ) = filter,
+        ) -> list_auto_user_provisioning_rules_response.ListAutoUserProvisioningRulesResponse:
+            return await controller.list_auto_user_provisioning_rules(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='auto_user_provisioning_rules_v1.list_auto_user_provisioning_rules',
+        )
@@ -3,21 +3,17 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import read_auto_user_provisioning_setting_response
 from clumioapi.models import update_auto_user_provisioning_setting_response
 from clumioapi.models import update_auto_user_provisioning_setting_v1_request
 import requests
-import retrying
 
 
 class AutoUserProvisioningSettingsV1Controller:
@@ -52,23 +48,16 @@ class AutoUserProvisioningSettingsV1Controller:
             read_auto_user_provisioning_setting_response.ReadAutoUserProvisioningSettingResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_auto_user_provisioning_setting for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_auto_user_provisioning_setting',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/settings/auto-user-provisioning',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -101,24 +90,17 @@ class AutoUserProvisioningSettingsV1Controller:
             update_auto_user_provisioning_setting_response.UpdateAutoUserProvisioningSettingResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.put(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_auto_user_provisioning_setting for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_auto_user_provisioning_setting',
+            'put',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/settings/auto-user-provisioning',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -128,3 +110,36 @@ class AutoUserProvisioningSettingsV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class AutoUserProvisioningSettingsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for auto-user-provisioning-settings resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def read_auto_user_provisioning_setting(self, **kwargs):
+        """Asynchronous counterpart of AutoUserProvisioningSettingsV1Controller.read_auto_user_provisioning_setting."""
+        controller = self.controller.get_controller(AutoUserProvisioningSettingsV1Controller)
+        return await self.controller.call(controller.read_auto_user_provisioning_setting, **kwargs)
+
+    async def update_auto_user_provisioning_setting(
+        self,
+        body: (
+            update_auto_user_provisioning_setting_v1_request.UpdateAutoUserProvisioningSettingV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> update_auto_user_provisioning_setting_response.UpdateAutoUserProvisioningSettingResponse:
+        """Asynchronous counterpart of AutoUserProvisioningSettingsV1Controller.update_auto_user_provisioning_setting."""
+        controller = self.controller.get_controller(AutoUserProvisioningSettingsV1Controller)
+        return await self.controller.call(
+            controller.update_auto_user_provisioning_setting, body=body, **kwargs
+        )
+
+
+class AutoUserProvisioningSettingsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for auto-user-provisioning-settings resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
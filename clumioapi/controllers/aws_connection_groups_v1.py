@@ -3,17 +3,15 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_connection_groups_types
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_aws_connection_group_v1_request
 from clumioapi.models import create_connection_group_response
 from clumioapi.models import list_connection_groups_response
@@ -21,7 +19,6 @@ from clumioapi.models import read_connection_group_response
 from clumioapi.models import update_aws_connection_group_v1_request
 from clumioapi.models import update_connection_group_response
 import requests
-import retrying
 
 
 class AwsConnectionGroupsV1Controller:
@@ -132,25 +129,16 @@ class AwsConnectionGroupsV1Controller:
 
         resp_instance: list_connection_groups_response.ListConnectionGroupsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_aws_connection_groups for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_aws_connection_groups',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws/connection-groups',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -189,26 +177,17 @@ class AwsConnectionGroupsV1Controller:
 
         resp_instance: create_connection_group_response.CreateConnectionGroupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'create_aws_connection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_aws_connection_group',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws/connection-groups',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -258,25 +237,16 @@ class AwsConnectionGroupsV1Controller:
 
         resp_instance: read_connection_group_response.ReadConnectionGroupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'read_aws_connection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_aws_connection_group',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws/connection-groups/{connection_group_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -321,26 +291,17 @@ class AwsConnectionGroupsV1Controller:
 
         resp_instance: update_connection_group_response.UpdateConnectionGroupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.put(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'update_aws_connection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_aws_connection_group',
+            'put',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws/connection-groups/{connection_group_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -351,18 +312,13 @@ class AwsConnectionGroupsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_aws_connection_groups(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: aws_connection_groups_types.ListAwsConnectionGroupsV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_connection_groups_response.ListConnectionGroupsResponse]:
+    ) -> pagination.PageIterator[list_connection_groups_response.ListConnectionGroupsResponse]:
         """Returns a list of active connection groups that are managing AWS account
         connections.
 
@@ -431,19 +387,124 @@ class AwsConnectionGroupsV1ControllerPaginator:
                 +------------------------+------------------+----------------------------------+
 
         """
-        controller = AwsConnectionGroupsV1Controller(self.controller)
-        while True:
-            response = controller.list_aws_connection_groups(
-                limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(AwsConnectionGroupsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                aws_connection_groups_types.ListAwsConnectionGroupsV1FilterT | None
+            ) = filter,
+        ) -> list_connection_groups_response.ListConnectionGroupsResponse:
+            return controller.list_aws_connection_groups(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_connection_groups_v1.list_aws_connection_groups',
+        )
+
+
+class AwsConnectionGroupsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for aws-connection-groups resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_aws_connection_groups(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_connection_groups_types.ListAwsConnectionGroupsV1FilterT | None = None,
+        **kwargs,
+    ) -> list_connection_groups_response.ListConnectionGroupsResponse:
+        """Asynchronous counterpart of AwsConnectionGroupsV1Controller.list_aws_connection_groups."""
+        controller = self.controller.get_controller(AwsConnectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.list_aws_connection_groups, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+    async def create_aws_connection_group(
+        self,
+        body: (
+            create_aws_connection_group_v1_request.CreateAwsConnectionGroupV1Request | None
+        ) = None,
+        **kwargs,
+    ) -> create_connection_group_response.CreateConnectionGroupResponse:
+        """Asynchronous counterpart of AwsConnectionGroupsV1Controller.create_aws_connection_group."""
+        controller = self.controller.get_controller(AwsConnectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.create_aws_connection_group, body=body, **kwargs
+        )
+
+    async def read_aws_connection_group(
+        self,
+        connection_group_id: str | None = None,
+        embed: str | None = None,
+        return_external_id: bool | None = None,
+        **kwargs,
+    ) -> read_connection_group_response.ReadConnectionGroupResponse:
+        """Asynchronous counterpart of AwsConnectionGroupsV1Controller.read_aws_connection_group."""
+        controller = self.controller.get_controller(AwsConnectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.read_aws_connection_group,
+            connection_group_id=connection_group_id,
+            embed=embed,
+            return_external_id=return_external_id,
+            **kwargs,
+        )
+
+    async def update_aws_connection_group(
+        self,
+        connection_group_id: str | None = None,
+        body: (
+            update_aws_connection_group_v1_request.UpdateAwsConnectionGroupV1Request | None
+        ) = None,
+        **kwargs,
+    ) -> update_connection_group_response.UpdateConnectionGroupResponse:
+        """Asynchronous counterpart of AwsConnectionGroupsV1Controller.update_aws_connection_group."""
+        controller = self.controller.get_controller(AwsConnectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.update_aws_connection_group,
+            connection_group_id=connection_group_id,
+            body=body,
+            **kwargs,
+        )
+
+
+class AwsConnectionGroupsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for aws-connection-groups resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_aws_connection_groups(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_connection_groups_types.ListAwsConnectionGroupsV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_connection_groups_response.ListConnectionGroupsResponse]:
+        """Asynchronous counterpart of AwsConnectionGroupsV1ControllerPaginator.list_aws_connection_groups."""
+        controller = self.controller.get_controller(AwsConnectionGroupsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                aws_connection_groups_types.ListAwsConnectionGroupsV1FilterT | None
+            ) = filter,
+        ) -> list_connection_groups_response.ListConnectionGroupsResponse:
+            return await controller.list_aws_connection_groups(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_connection_groups_v1.list_aws_connection_groups',
+        )
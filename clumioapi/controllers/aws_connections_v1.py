@@ -3,17 +3,15 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_connections_types
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_aws_connection_response
 from clumioapi.models import create_aws_connection_v1_request
 from clumioapi.models import list_aws_connections_response
@@ -21,7 +19,6 @@ from clumioapi.models import read_aws_connection_response
 from clumioapi.models import update_aws_connection_response
 from clumioapi.models import update_aws_connection_v1_request
 import requests
-import retrying
 
 
 class AwsConnectionsV1Controller:
@@ -156,23 +153,16 @@ class AwsConnectionsV1Controller:
 
         resp_instance: list_aws_connections_response.ListAWSConnectionsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_aws_connections for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_aws_connections',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -198,24 +188,17 @@ class AwsConnectionsV1Controller:
 
         resp_instance: create_aws_connection_response.CreateAWSConnectionResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'create_aws_connection for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_aws_connection',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -247,23 +230,16 @@ class AwsConnectionsV1Controller:
 
         resp_instance: read_aws_connection_response.ReadAWSConnectionResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_aws_connection for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_aws_connection',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws/{connection_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -288,23 +264,16 @@ class AwsConnectionsV1Controller:
 
         resp_instance: object
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'delete_aws_connection for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_aws_connection',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws/{connection_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -336,24 +305,17 @@ class AwsConnectionsV1Controller:
 
         resp_instance: update_aws_connection_response.UpdateAWSConnectionResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.patch(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_aws_connection for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_aws_connection',
+            'patch',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws/{connection_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -364,18 +326,13 @@ class AwsConnectionsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_aws_connections(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: aws_connections_types.ListAwsConnectionsV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_aws_connections_response.ListAWSConnectionsResponse]:
+    ) -> pagination.PageIterator[list_aws_connections_response.ListAWSConnectionsResponse]:
         """Returns a list of AWS Connections
 
         Args:
@@ -468,19 +425,113 @@ class AwsConnectionsV1ControllerPaginator:
                 +------------------------+-------------------+---------------------------------+
 
         """
-        controller = AwsConnectionsV1Controller(self.controller)
-        while True:
-            response = controller.list_aws_connections(
-                limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(AwsConnectionsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: aws_connections_types.ListAwsConnectionsV1FilterT | None = filter,
+        ) -> list_aws_connections_response.ListAWSConnectionsResponse:
+            return controller.list_aws_connections(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_connections_v1.list_aws_connections',
+        )
+
+
+class AwsConnectionsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for aws-connections resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_aws_connections(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_connections_types.ListAwsConnectionsV1FilterT | None = None,
+        **kwargs,
+    ) -> list_aws_connections_response.ListAWSConnectionsResponse:
+        """Asynchronous counterpart of AwsConnectionsV1Controller.list_aws_connections."""
+        controller = self.controller.get_controller(AwsConnectionsV1Controller)
+        return await self.controller.call(
+            controller.list_aws_connections, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+    async def create_aws_connection(
+        self,
+        body: create_aws_connection_v1_request.CreateAwsConnectionV1Request | None = None,
+        **kwargs,
+    ) -> create_aws_connection_response.CreateAWSConnectionResponse:
+        """Asynchronous counterpart of AwsConnectionsV1Controller.create_aws_connection."""
+        controller = self.controller.get_controller(AwsConnectionsV1Controller)
+        return await self.controller.call(controller.create_aws_connection, body=body, **kwargs)
+
+    async def read_aws_connection(
+        self, connection_id: str | None = None, return_external_id: str | None = None, **kwargs
+    ) -> read_aws_connection_response.ReadAWSConnectionResponse:
+        """Asynchronous counterpart of AwsConnectionsV1Controller.read_aws_connection."""
+        controller = self.controller.get_controller(AwsConnectionsV1Controller)
+        return await self.controller.call(
+            controller.read_aws_connection,
+            connection_id=connection_id,
+            return_external_id=return_external_id,
+            **kwargs,
+        )
+
+    async def delete_aws_connection(self, connection_id: str | None = None, **kwargs) -> object:
+        """Asynchronous counterpart of AwsConnectionsV1Controller.delete_aws_connection."""
+        controller = self.controller.get_controller(AwsConnectionsV1Controller)
+        return await self.controller.call(
+            controller.delete_aws_connection, connection_id=connection_id, **kwargs
+        )
+
+    async def update_aws_connection(
+        self,
+        connection_id: str | None = None,
+        body: update_aws_connection_v1_request.UpdateAwsConnectionV1Request | None = None,
+        **kwargs,
+    ) -> update_aws_connection_response.UpdateAWSConnectionResponse:
+        """Asynchronous counterpart of AwsConnectionsV1Controller.update_aws_connection."""
+        controller = self.controller.get_controller(AwsConnectionsV1Controller)
+        return await self.controller.call(
+            controller.update_aws_connection, connection_id=connection_id, body=body, **kwargs
+        )
+
+
+class AwsConnectionsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for aws-connections resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_aws_connections(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_connections_types.ListAwsConnectionsV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_aws_connections_response.ListAWSConnectionsResponse]:
+        """Asynchronous counterpart of AwsConnectionsV1ControllerPaginator.list_aws_connections."""
+        controller = self.controller.get_controller(AwsConnectionsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: aws_connections_types.ListAwsConnectionsV1FilterT | None = filter,
+        ) -> list_aws_connections_response.ListAWSConnectionsResponse:
+            return await controller.list_aws_connections(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_connections_v1.list_aws_connections',
+        )
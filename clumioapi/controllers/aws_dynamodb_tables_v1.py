@@ -3,21 +3,18 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_dynamodb_tables_types
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_dynamo_db_table_response
 from clumioapi.models import read_dynamo_db_table_response
 import requests
-import retrying
 
 
 class AwsDynamodbTablesV1Controller:
@@ -181,23 +178,16 @@ class AwsDynamodbTablesV1Controller:
 
         resp_instance: list_dynamo_db_table_response.ListDynamoDBTableResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_aws_dynamodb_tables for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_aws_dynamodb_tables',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/dynamodb-tables',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -247,23 +237,16 @@ class AwsDynamodbTablesV1Controller:
 
         resp_instance: read_dynamo_db_table_response.ReadDynamoDBTableResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_aws_dynamodb_table for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_aws_dynamodb_table',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/dynamodb-tables/{table_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -274,11 +257,6 @@ class AwsDynamodbTablesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_aws_dynamodb_tables(
         self,
         limit: int | None = None,
@@ -287,7 +265,7 @@ class AwsDynamodbTablesV1ControllerPaginator:
         embed: str | None = None,
         lookback_days: int | None = None,
         **kwargs,
-    ) -> Iterator[list_dynamo_db_table_response.ListDynamoDBTableResponse]:
+    ) -> pagination.PageIterator[list_dynamo_db_table_response.ListDynamoDBTableResponse]:
         """Retrieve a list of DynamoDB tables.
 
         Args:
@@ -407,24 +385,110 @@ class AwsDynamodbTablesV1ControllerPaginator:
             lookback_days:
                 Calculate backup status for the last `lookback_days` days.
         """
-        controller = AwsDynamodbTablesV1Controller(self.controller)
-        while True:
-            response = controller.list_aws_dynamodb_tables(
+        controller = self.controller.get_controller(AwsDynamodbTablesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: aws_dynamodb_tables_types.ListAwsDynamodbTablesV1FilterT | None = filter,
+        ) -> list_dynamo_db_table_response.ListDynamoDBTableResponse:
+            return controller.list_aws_dynamodb_tables(
                 limit=limit,
-                start=start,
-                filter=filter,
+                start=page_start,
+                filter=page_filter,
                 embed=embed,
                 lookback_days=lookback_days,
                 **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_dynamodb_tables_v1.list_aws_dynamodb_tables',
+        )
+
+
+class AwsDynamodbTablesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for aws-dynamodb-tables resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_aws_dynamodb_tables(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_dynamodb_tables_types.ListAwsDynamodbTablesV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> list_dynamo_db_table_response.ListDynamoDBTableResponse:
+        """Asynchronous counterpart of AwsDynamodbTablesV1Controller.list_aws_dynamodb_tables."""
+        controller = self.controller.get_controller(AwsDynamodbTablesV1Controller)
+        return await self.controller.call(
+            controller.list_aws_dynamodb_tables,
+            limit=limit,
+            start=start,
+            filter=filter,
+            embed=embed,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def read_aws_dynamodb_table(
+        self,
+        table_id: str | None = None,
+        lookback_days: int | None = None,
+        embed: str | None = None,
+        **kwargs,
+    ) -> read_dynamo_db_table_response.ReadDynamoDBTableResponse:
+        """Asynchronous counterpart of AwsDynamodbTablesV1Controller.read_aws_dynamodb_table."""
+        controller = self.controller.get_controller(AwsDynamodbTablesV1Controller)
+        return await self.controller.call(
+            controller.read_aws_dynamodb_table,
+            table_id=table_id,
+            lookback_days=lookback_days,
+            embed=embed,
+            **kwargs,
+        )
+
+
+class AwsDynamodbTablesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for aws-dynamodb-tables resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_aws_dynamodb_tables(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_dynamodb_tables_types.ListAwsDynamodbTablesV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_dynamo_db_table_response.ListDynamoDBTableResponse]:
+        """Asynchronous counterpart of AwsDynamodbTablesV1ControllerPaginator.list_aws_dynamodb_tables."""
+        controller = self.controller.get_controller(AwsDynamodbTablesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: aws_dynamodb_tables_types.ListAwsDynamodbTablesV1FilterT | None = filter,
+        ) -> list_dynamo_db_table_response.ListDynamoDBTableResponse:
+            return await controller.list_aws_dynamodb_tables(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                embed=embed,
+                lookback_days=lookback_days,
+                **kwargs,
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_dynamodb_tables_v1.list_aws_dynamodb_tables',
+        )
@@ -3,21 +3,18 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_ebs_volumes_types
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_ebs_volumes_response
 from clumioapi.models import read_ebs_volume_response
 import requests
-import retrying
 
 
 class AwsEbsVolumesV1Controller:
@@ -178,23 +175,16 @@ class AwsEbsVolumesV1Controller:
 
         resp_instance: list_ebs_volumes_response.ListEbsVolumesResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_aws_ebs_volumes for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_aws_ebs_volumes',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ebs-volumes',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -244,23 +234,16 @@ class AwsEbsVolumesV1Controller:
 
         resp_instance: read_ebs_volume_response.ReadEbsVolumeResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_aws_ebs_volume for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_aws_ebs_volume',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ebs-volumes/{volume_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -271,11 +254,6 @@ class AwsEbsVolumesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_aws_ebs_volumes(
         self,
         limit: int | None = None,
@@ -284,7 +262,7 @@ class AwsEbsVolumesV1ControllerPaginator:
         embed: str | None = None,
         lookback_days: int | None = None,
         **kwargs,
-    ) -> Iterator[list_ebs_volumes_response.ListEbsVolumesResponse]:
+    ) -> pagination.PageIterator[list_ebs_volumes_response.ListEbsVolumesResponse]:
         """Returns a list of EBS volumes.
 
         Args:
@@ -401,24 +379,110 @@ class AwsEbsVolumesV1ControllerPaginator:
             lookback_days:
                 Calculate backup status for the last `lookback_days` days.
         """
-        controller = AwsEbsVolumesV1Controller(self.controller)
-        while True:
-            response = controller.list_aws_ebs_volumes(
+        controller = self.controller.get_controller(AwsEbsVolumesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: aws_ebs_volumes_types.ListAwsEbsVolumesV1FilterT | None = filter,
+        ) -> list_ebs_volumes_response.ListEbsVolumesResponse:
+            return controller.list_aws_ebs_volumes(
                 limit=limit,
-                start=start,
-                filter=filter,
+                start=page_start,
+                filter=page_filter,
                 embed=embed,
                 lookback_days=lookback_days,
                 **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_ebs_volumes_v1.list_aws_ebs_volumes',
+        )
+
+
+class AwsEbsVolumesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for aws-ebs-volumes resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_aws_ebs_volumes(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_ebs_volumes_types.ListAwsEbsVolumesV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> list_ebs_volumes_response.ListEbsVolumesResponse:
+        """Asynchronous counterpart of AwsEbsVolumesV1Controller.list_aws_ebs_volumes."""
+        controller = self.controller.get_controller(AwsEbsVolumesV1Controller)
+        return await self.controller.call(
+            controller.list_aws_ebs_volumes,
+            limit=limit,
+            start=start,
+            filter=filter,
+            embed=embed,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def read_aws_ebs_volume(
+        self,
+        volume_id: str | None = None,
+        lookback_days: int | None = None,
+        embed: str | None = None,
+        **kwargs,
+    ) -> read_ebs_volume_response.ReadEbsVolumeResponse:
+        """Asynchronous counterpart of AwsEbsVolumesV1Controller.read_aws_ebs_volume."""
+        controller = self.controller.get_controller(AwsEbsVolumesV1Controller)
+        return await self.controller.call(
+            controller.read_aws_ebs_volume,
+            volume_id=volume_id,
+            lookback_days=lookback_days,
+            embed=embed,
+            **kwargs,
+        )
+
+
+class AwsEbsVolumesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for aws-ebs-volumes resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_aws_ebs_volumes(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_ebs_volumes_types.ListAwsEbsVolumesV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_ebs_volumes_response.ListEbsVolumesResponse]:
+        """Asynchronous counterpart of AwsEbsVolumesV1ControllerPaginator.list_aws_ebs_volumes."""
+        controller = self.controller.get_controller(AwsEbsVolumesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: aws_ebs_volumes_types.ListAwsEbsVolumesV1FilterT | None = filter,
+        ) -> list_ebs_volumes_response.ListEbsVolumesResponse:
+            return await controller.list_aws_ebs_volumes(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                embed=embed,
+                lookback_days=lookback_days,
+                **kwargs,
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_ebs_volumes_v1.list_aws_ebs_volumes',
+        )
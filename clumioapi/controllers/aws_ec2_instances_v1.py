@@ -3,21 +3,18 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_ec2_instances_types
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_ec2_instances_response
 from clumioapi.models import read_ec2_instance_response
 import requests
-import retrying
 
 
 class AwsEc2InstancesV1Controller:
@@ -189,23 +186,16 @@ class AwsEc2InstancesV1Controller:
 
         resp_instance: list_ec2_instances_response.ListEc2InstancesResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_aws_ec2_instances for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_aws_ec2_instances',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ec2-instances',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -255,23 +245,16 @@ class AwsEc2InstancesV1Controller:
 
         resp_instance: read_ec2_instance_response.ReadEc2InstanceResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_aws_ec2_instance for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_aws_ec2_instance',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ec2-instances/{instance_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -282,11 +265,6 @@ class AwsEc2InstancesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_aws_ec2_instances(
         self,
         limit: int | None = None,
@@ -295,7 +273,7 @@ class AwsEc2InstancesV1ControllerPaginator:
         embed: str | None = None,
         lookback_days: int | None = None,
         **kwargs,
-    ) -> Iterator[list_ec2_instances_response.ListEc2InstancesResponse]:
+    ) -> pagination.PageIterator[list_ec2_instances_response.ListEc2InstancesResponse]:
         """Returns a list of EC2 instances.
 
         Args:
@@ -423,24 +401,110 @@ class AwsEc2InstancesV1ControllerPaginator:
             lookback_days:
                 Calculate backup status for the last `lookback_days` days.
         """
-        controller = AwsEc2InstancesV1Controller(self.controller)
-        while True:
-            response = controller.list_aws_ec2_instances(
+        controller = self.controller.get_controller(AwsEc2InstancesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: aws_ec2_instances_types.ListAwsEc2InstancesV1FilterT | None = filter,
+        ) -> list_ec2_instances_response.ListEc2InstancesResponse:
+            return controller.list_aws_ec2_instances(
                 limit=limit,
-                start=start,
-                filter=filter,
+                start=page_start,
+                filter=page_filter,
                 embed=embed,
                 lookback_days=lookback_days,
                 **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_ec2_instances_v1.list_aws_ec2_instances',
+        )
+
+
+class AwsEc2InstancesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for aws-ec2-instances resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_aws_ec2_instances(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_ec2_instances_types.ListAwsEc2InstancesV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> list_ec2_instances_response.ListEc2InstancesResponse:
+        """Asynchronous counterpart of AwsEc2InstancesV1Controller.list_aws_ec2_instances."""
+        controller = self.controller.get_controller(AwsEc2InstancesV1Controller)
+        return await self.controller.call(
+            controller.list_aws_ec2_instances,
+            limit=limit,
+            start=start,
+            filter=filter,
+            embed=embed,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def read_aws_ec2_instance(
+        self,
+        instance_id: str | None = None,
+        lookback_days: int | None = None,
+        embed: str | None = None,
+        **kwargs,
+    ) -> read_ec2_instance_response.ReadEc2InstanceResponse:
+        """Asynchronous counterpart of AwsEc2InstancesV1Controller.read_aws_ec2_instance."""
+        controller = self.controller.get_controller(AwsEc2InstancesV1Controller)
+        return await self.controller.call(
+            controller.read_aws_ec2_instance,
+            instance_id=instance_id,
+            lookback_days=lookback_days,
+            embed=embed,
+            **kwargs,
+        )
+
+
+class AwsEc2InstancesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for aws-ec2-instances resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_aws_ec2_instances(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_ec2_instances_types.ListAwsEc2InstancesV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_ec2_instances_response.ListEc2InstancesResponse]:
+        """Asynchronous counterpart of AwsEc2InstancesV1ControllerPaginator.list_aws_ec2_instances."""
+        controller = self.controller.get_controller(AwsEc2InstancesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: aws_ec2_instances_types.ListAwsEc2InstancesV1FilterT | None = filter,
+        ) -> list_ec2_instances_response.ListEc2InstancesResponse:
+            return await controller.list_aws_ec2_instances(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                embed=embed,
+                lookback_days=lookback_days,
+                **kwargs,
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_ec2_instances_v1.list_aws_ec2_instances',
+        )
@@ -3,21 +3,18 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_environment_tags_types
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_aws_tags_response
 from clumioapi.models import read_aws_tag_response
 import requests
-import retrying
 
 
 class AwsEnvironmentTagsV1Controller:
@@ -185,25 +182,16 @@ class AwsEnvironmentTagsV1Controller:
 
         resp_instance: list_aws_tags_response.ListAwsTagsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_aws_environment_tags for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_aws_environment_tags',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/environments/{environment_id}/tags',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -293,23 +281,16 @@ class AwsEnvironmentTagsV1Controller:
 
         resp_instance: read_aws_tag_response.ReadAwsTagResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_aws_environment_tag for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_aws_environment_tag',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/environments/{environment_id}/tags/{tag_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -320,11 +301,6 @@ class AwsEnvironmentTagsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_aws_environment_tags(
         self,
         environment_id: str | None = None,
@@ -337,7 +313,7 @@ class AwsEnvironmentTagsV1ControllerPaginator:
         embed: str | None = None,
         lookback_days: int | None = None,
         **kwargs,
-    ) -> Iterator[list_aws_tags_response.ListAwsTagsResponse]:
+    ) -> pagination.PageIterator[list_aws_tags_response.ListAwsTagsResponse]:
         """Returns a list of AWS tags in the specified environment.
 
         Args:
@@ -451,28 +427,132 @@ class AwsEnvironmentTagsV1ControllerPaginator:
             lookback_days:
                 Calculate backup status for the last `lookback_days` days.
         """
-        controller = AwsEnvironmentTagsV1Controller(self.controller)
-        while True:
-            response = controller.list_aws_environment_tags(
+        controller = self.controller.get_controller(AwsEnvironmentTagsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: aws_environment_tags_types.ListAwsEnvironmentTagsV1FilterT | None = filter,
+        ) -> list_aws_tags_response.ListAwsTagsResponse:
+            return controller.list_aws_environment_tags(
                 environment_id=environment_id,
                 current_count=current_count,
                 limit=limit,
                 total_count=total_count,
                 total_pages_count=total_pages_count,
-                start=start,
-                filter=filter,
+                start=page_start,
+                filter=page_filter,
                 embed=embed,
                 lookback_days=lookback_days,
                 **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_environment_tags_v1.list_aws_environment_tags',
+        )
+
+
+class AwsEnvironmentTagsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for aws-environment-tags resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_aws_environment_tags(
+        self,
+        environment_id: str | None = None,
+        current_count: int | None = None,
+        limit: int | None = None,
+        total_count: int | None = None,
+        total_pages_count: int | None = None,
+        start: str | None = None,
+        filter: aws_environment_tags_types.ListAwsEnvironmentTagsV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> list_aws_tags_response.ListAwsTagsResponse:
+        """Asynchronous counterpart of AwsEnvironmentTagsV1Controller.list_aws_environment_tags."""
+        controller = self.controller.get_controller(AwsEnvironmentTagsV1Controller)
+        return await self.controller.call(
+            controller.list_aws_environment_tags,
+            environment_id=environment_id,
+            current_count=current_count,
+            limit=limit,
+            total_count=total_count,
+            total_pages_count=total_pages_count,
+            start=start,
+            filter=filter,
+            embed=embed,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def read_aws_environment_tag(
+        self,
+        environment_id: str | None = None,
+        tag_id: str | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> read_aws_tag_response.ReadAwsTagResponse:
+        """Asynchronous counterpart of AwsEnvironmentTagsV1Controller.read_aws_environment_tag."""
+        controller = self.controller.get_controller(AwsEnvironmentTagsV1Controller)
+        return await self.controller.call(
+            controller.read_aws_environment_tag,
+            environment_id=environment_id,
+            tag_id=tag_id,
+            embed=embed,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+
+class AwsEnvironmentTagsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for aws-environment-tags resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_aws_environment_tags(
+        self,
+        environment_id: str | None = None,
+        current_count: int | None = None,
+        limit: int | None = None,
+        total_count: int | None = None,
+        total_pages_count: int | None = None,
+        start: str | None = None,
+        filter: aws_environment_tags_types.ListAwsEnvironmentTagsV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_aws_tags_response.ListAwsTagsResponse]:
+        """Asynchronous counterpart of AwsEnvironmentTagsV1ControllerPaginator.list_aws_environment_tags."""
+        controller = self.controller.get_controller(AwsEnvironmentTagsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: aws_environment_tags_types.ListAwsEnvironmentTagsV1FilterT | None = filter,
+        ) -> list_aws_tags_response.ListAwsTagsResponse:
+            return await controller.list_aws_environment_tags(
+                environment_id=environment_id,
+                current_count=current_count,
+                limit=limit,
+                total_count=total_count,
+                total_pages_count=total_pages_count,
+                start=page_start,
+                filter=page_filter,
+                embed=embed,
+                lookback_days=lookback_days,
+                **kwargs,
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_environment_tags_v1.list_aws_environment_tags',
+        )
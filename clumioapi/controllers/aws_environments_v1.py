@@ -3,21 +3,18 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_environments_types
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_aws_environments_response
 from clumioapi.models import read_aws_environment_response
 import requests
-import retrying
 
 
 class AwsEnvironmentsV1Controller:
@@ -161,23 +158,16 @@ class AwsEnvironmentsV1Controller:
 
         resp_instance: list_aws_environments_response.ListAWSEnvironmentsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_aws_environments for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_aws_environments',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/environments',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -264,23 +254,16 @@ class AwsEnvironmentsV1Controller:
 
         resp_instance: read_aws_environment_response.ReadAWSEnvironmentResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_aws_environment for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_aws_environment',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/environments/{environment_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -291,11 +274,6 @@ class AwsEnvironmentsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_aws_environments(
         self,
         limit: int | None = None,
@@ -304,7 +282,7 @@ class AwsEnvironmentsV1ControllerPaginator:
         embed: str | None = None,
         lookback_days: int | None = None,
         **kwargs,
-    ) -> Iterator[list_aws_environments_response.ListAWSEnvironmentsResponse]:
+    ) -> pagination.PageIterator[list_aws_environments_response.ListAWSEnvironmentsResponse]:
         """Returns a list of AWS environments.
 
         Args:
@@ -402,24 +380,110 @@ class AwsEnvironmentsV1ControllerPaginator:
             lookback_days:
                 Calculate backup status for the last `lookback_days` days.
         """
-        controller = AwsEnvironmentsV1Controller(self.controller)
-        while True:
-            response = controller.list_aws_environments(
+        controller = self.controller.get_controller(AwsEnvironmentsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: aws_environments_types.ListAwsEnvironmentsV1FilterT | None = filter,
+        ) -> list_aws_environments_response.ListAWSEnvironmentsResponse:
+            return controller.list_aws_environments(
                 limit=limit,
-                start=start,
-                filter=filter,
+                start=page_start,
+                filter=page_filter,
                 embed=embed,
                 lookback_days=lookback_days,
                 **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_environments_v1.list_aws_environments',
+        )
+
+
+class AwsEnvironmentsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for aws-environments resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_aws_environments(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_environments_types.ListAwsEnvironmentsV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> list_aws_environments_response.ListAWSEnvironmentsResponse:
+        """Asynchronous counterpart of AwsEnvironmentsV1Controller.list_aws_environments."""
+        controller = self.controller.get_controller(AwsEnvironmentsV1Controller)
+        return await self.controller.call(
+            controller.list_aws_environments,
+            limit=limit,
+            start=start,
+            filter=filter,
+            embed=embed,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def read_aws_environment(
+        self,
+        environment_id: str | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> read_aws_environment_response.ReadAWSEnvironmentResponse:
+        """Asynchronous counterpart of AwsEnvironmentsV1Controller.read_aws_environment."""
+        controller = self.controller.get_controller(AwsEnvironmentsV1Controller)
+        return await self.controller.call(
+            controller.read_aws_environment,
+            environment_id=environment_id,
+            embed=embed,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+
+class AwsEnvironmentsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for aws-environments resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_aws_environments(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_environments_types.ListAwsEnvironmentsV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_aws_environments_response.ListAWSEnvironmentsResponse]:
+        """Asynchronous counterpart of AwsEnvironmentsV1ControllerPaginator.list_aws_environments."""
+        controller = self.controller.get_controller(AwsEnvironmentsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: aws_environments_types.ListAwsEnvironmentsV1FilterT | None = filter,
+        ) -> list_aws_environments_response.ListAWSEnvironmentsResponse:
+            return await controller.list_aws_environments(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                embed=embed,
+                lookback_days=lookback_days,
+                **kwargs,
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_environments_v1.list_aws_environments',
+        )
@@ -3,14 +3,13 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_rds_resource_restored_records_types
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.exceptions import clumio_exception
@@ -19,7 +18,6 @@ from clumioapi.models import restore_rds_record_v1_request
 from clumioapi.models import restore_record_preview_response
 from clumioapi.models import restore_record_response
 import requests
-import retrying
 
 
 class AwsRdsResourceRestoredRecordsV1Controller:
@@ -83,25 +81,16 @@ class AwsRdsResourceRestoredRecordsV1Controller:
 
         resp_instance: list_restored_records_response.ListRestoredRecordsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_rds_restored_records for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_rds_restored_records',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/aws/rds-resources/records',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -167,24 +156,17 @@ class AwsRdsResourceRestoredRecordsV1Controller:
             restore_record_response.RestoreRecordResponse,
         ]
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'restore_rds_record for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'restore_rds_record',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/aws/rds-resources/records',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -195,11 +177,6 @@ class AwsRdsResourceRestoredRecordsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_rds_restored_records(
         self,
         limit: int | None = None,
@@ -208,7 +185,7 @@ class AwsRdsResourceRestoredRecordsV1ControllerPaginator:
             aws_rds_resource_restored_records_types.ListRdsRestoredRecordsV1FilterT | None
         ) = None,
         **kwargs,
-    ) -> Iterator[list_restored_records_response.ListRestoredRecordsResponse]:
+    ) -> pagination.PageIterator[list_restored_records_response.ListRestoredRecordsResponse]:
         """Returns a list of RDS database restored-records.
 
         Args:
@@ -230,19 +207,96 @@ class AwsRdsResourceRestoredRecordsV1ControllerPaginator:
                 +----------+-----+--------------------------------------+
 
         """
-        controller = AwsRdsResourceRestoredRecordsV1Controller(self.controller)
-        while True:
-            response = controller.list_rds_restored_records(
-                limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(AwsRdsResourceRestoredRecordsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                aws_rds_resource_restored_records_types.ListRdsRestoredRecordsV1FilterT | None
+            ) = filter,
+        ) -> list_restored_records_response.ListRestoredRecordsResponse:
+            return controller.list_rds_restored_records(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_rds_resource_restored_records_v1.list_rds_restored_records',
+        )
+
+
+class AwsRdsResourceRestoredRecordsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for aws-rds-resource-restored-records resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_rds_restored_records(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            aws_rds_resource_restored_records_types.ListRdsRestoredRecordsV1FilterT | None
+        ) = None,
+        **kwargs,
+    ) -> list_restored_records_response.ListRestoredRecordsResponse:
+        """Asynchronous counterpart of AwsRdsResourceRestoredRecordsV1Controller.list_rds_restored_records."""
+        controller = self.controller.get_controller(AwsRdsResourceRestoredRecordsV1Controller)
+        return await self.controller.call(
+            controller.list_rds_restored_records, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+    async def restore_rds_record(
+        self,
+        embed: str | None = None,
+        body: restore_rds_record_v1_request.RestoreRdsRecordV1Request | None = None,
+        **kwargs,
+    ) -> Union[
+        restore_record_preview_response.RestoreRecordPreviewResponse,
+        restore_record_response.RestoreRecordResponse,
+    ]:
+        """Asynchronous counterpart of AwsRdsResourceRestoredRecordsV1Controller.restore_rds_record."""
+        controller = self.controller.get_controller(AwsRdsResourceRestoredRecordsV1Controller)
+        return await self.controller.call(
+            controller.restore_rds_record, embed=embed, body=body, **kwargs
+        )
+
+
+class AwsRdsResourceRestoredRecordsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for aws-rds-resource-restored-records resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_rds_restored_records(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            aws_rds_resource_restored_records_types.ListRdsRestoredRecordsV1FilterT | None
+        ) = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_restored_records_response.ListRestoredRecordsResponse]:
+        """Asynchronous counterpart of AwsRdsResourceRestoredRecordsV1ControllerPaginator.list_rds_restored_records."""
+        controller = self.controller.get_controller(AwsRdsResourceRestoredRecordsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                aws_rds_resource_restored_records_types.ListRdsRestoredRecordsV1FilterT | None
+            ) = filter,
+        ) -> list_restored_records_response.ListRestoredRecordsResponse:
+            return await controller.list_rds_restored_records(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_rds_resource_restored_records_v1.list_rds_restored_records',
+        )
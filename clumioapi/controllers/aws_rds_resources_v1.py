@@ -3,21 +3,18 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_rds_resources_types
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_rds_resources_response
 from clumioapi.models import read_rds_resource_response
 import requests
-import retrying
 
 
 class AwsRdsResourcesV1Controller:
@@ -186,23 +183,16 @@ class AwsRdsResourcesV1Controller:
 
         resp_instance: list_rds_resources_response.ListRdsResourcesResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_aws_rds_resources for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_aws_rds_resources',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/rds-resources',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -251,23 +241,16 @@ class AwsRdsResourcesV1Controller:
 
         resp_instance: read_rds_resource_response.ReadRdsResourceResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_aws_rds_resource for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_aws_rds_resource',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/rds-resources/{resource_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -278,11 +261,6 @@ class AwsRdsResourcesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_aws_rds_resources(
         self,
         limit: int | None = None,
@@ -291,7 +269,7 @@ class AwsRdsResourcesV1ControllerPaginator:
         embed: str | None = None,
         lookback_days: int | None = None,
         **kwargs,
-    ) -> Iterator[list_rds_resources_response.ListRdsResourcesResponse]:
+    ) -> pagination.PageIterator[list_rds_resources_response.ListRdsResourcesResponse]:
         """Retrieve a list of RDS resources.
 
         Args:
@@ -416,24 +394,110 @@ class AwsRdsResourcesV1ControllerPaginator:
             lookback_days:
                 Calculate backup status for the last `lookback_days` days.
         """
-        controller = AwsRdsResourcesV1Controller(self.controller)
-        while True:
-            response = controller.list_aws_rds_resources(
+        controller = self.controller.get_controller(AwsRdsResourcesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: aws_rds_resources_types.ListAwsRdsResourcesV1FilterT | None = filter,
+        ) -> list_rds_resources_response.ListRdsResourcesResponse:
+            return controller.list_aws_rds_resources(
                 limit=limit,
-                start=start,
-                filter=filter,
+                start=page_start,
+                filter=page_filter,
                 embed=embed,
                 lookback_days=lookback_days,
                 **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_rds_resources_v1.list_aws_rds_resources',
+        )
+
+
+class AwsRdsResourcesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for aws-rds-resources resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_aws_rds_resources(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_rds_resources_types.ListAwsRdsResourcesV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> list_rds_resources_response.ListRdsResourcesResponse:
+        """Asynchronous counterpart of AwsRdsResourcesV1Controller.list_aws_rds_resources."""
+        controller = self.controller.get_controller(AwsRdsResourcesV1Controller)
+        return await self.controller.call(
+            controller.list_aws_rds_resources,
+            limit=limit,
+            start=start,
+            filter=filter,
+            embed=embed,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def read_aws_rds_resource(
+        self,
+        resource_id: str | None = None,
+        lookback_days: int | None = None,
+        embed: str | None = None,
+        **kwargs,
+    ) -> read_rds_resource_response.ReadRdsResourceResponse:
+        """Asynchronous counterpart of AwsRdsResourcesV1Controller.read_aws_rds_resource."""
+        controller = self.controller.get_controller(AwsRdsResourcesV1Controller)
+        return await self.controller.call(
+            controller.read_aws_rds_resource,
+            resource_id=resource_id,
+            lookback_days=lookback_days,
+            embed=embed,
+            **kwargs,
+        )
+
+
+class AwsRdsResourcesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for aws-rds-resources resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_aws_rds_resources(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_rds_resources_types.ListAwsRdsResourcesV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_rds_resources_response.ListRdsResourcesResponse]:
+        """Asynchronous counterpart of AwsRdsResourcesV1ControllerPaginator.list_aws_rds_resources."""
+        controller = self.controller.get_controller(AwsRdsResourcesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: aws_rds_resources_types.ListAwsRdsResourcesV1FilterT | None = filter,
+        ) -> list_rds_resources_response.ListRdsResourcesResponse:
+            return await controller.list_aws_rds_resources(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                embed=embed,
+                lookback_days=lookback_days,
+                **kwargs,
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_rds_resources_v1.list_aws_rds_resources',
+        )
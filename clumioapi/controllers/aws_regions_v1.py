@@ -3,19 +3,16 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_aws_regions_response
 import requests
-import retrying
 
 
 class AwsRegionsV1Controller:
@@ -63,25 +60,16 @@ class AwsRegionsV1Controller:
 
         resp_instance: list_aws_regions_response.ListAWSRegionsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_connection_aws_regions for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_connection_aws_regions',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws/regions',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -92,14 +80,9 @@ class AwsRegionsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_connection_aws_regions(
         self, limit: int | None = None, start: str | None = None, **kwargs
-    ) -> Iterator[list_aws_regions_response.ListAWSRegionsResponse]:
+    ) -> pagination.PageIterator[list_aws_regions_response.ListAWSRegionsResponse]:
         """Returns a list of valid regions for creating AWS connections
 
         Args:
@@ -110,17 +93,57 @@ class AwsRegionsV1ControllerPaginator:
                 get the first page.
                 Other pages can be traversed using HATEOAS links.
         """
-        controller = AwsRegionsV1Controller(self.controller)
-        while True:
-            response = controller.list_connection_aws_regions(limit=limit, start=start, **kwargs)
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+        controller = self.controller.get_controller(AwsRegionsV1Controller)
+
+        def fetch_page(page_start: str | None) -> list_aws_regions_response.ListAWSRegionsResponse:
+            return controller.list_connection_aws_regions(limit=limit, start=page_start, **kwargs)
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            operation='aws_regions_v1.list_connection_aws_regions',
+        )
+
+
+class AwsRegionsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for aws-regions resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_connection_aws_regions(
+        self, limit: int | None = None, start: str | None = None, **kwargs
+    ) -> list_aws_regions_response.ListAWSRegionsResponse:
+        """Asynchronous counterpart of AwsRegionsV1Controller.list_connection_aws_regions."""
+        controller = self.controller.get_controller(AwsRegionsV1Controller)
+        return await self.controller.call(
+            controller.list_connection_aws_regions, limit=limit, start=start, **kwargs
+        )
+
+
+class AwsRegionsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for aws-regions resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_connection_aws_regions(
+        self, limit: int | None = None, start: str | None = None, **kwargs
+    ) -> pagination.AsyncPageIterator[list_aws_regions_response.ListAWSRegionsResponse]:
+        """Asynchronous counterpart of AwsRegionsV1ControllerPaginator.list_connection_aws_regions."""
+        controller = self.controller.get_controller(AwsRegionsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+        ) -> list_aws_regions_response.ListAWSRegionsResponse:
+            return await controller.list_connection_aws_regions(
+                limit=limit, start=page_start, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            operation='aws_regions_v1.list_connection_aws_regions',
+        )
@@ -3,23 +3,20 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_types
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_buckets_response
 from clumioapi.models import read_bucket_response
 from clumioapi.models import set_bucket_properties_response
 from clumioapi.models import set_bucket_properties_v1_request
 import requests
-import retrying
 
 
 class AwsS3BucketsV1Controller:
@@ -389,23 +386,16 @@ class AwsS3BucketsV1Controller:
 
         resp_instance: list_buckets_response.ListBucketsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_aws_s3_buckets for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_aws_s3_buckets',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/s3-buckets',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -432,23 +422,16 @@ class AwsS3BucketsV1Controller:
 
         resp_instance: read_bucket_response.ReadBucketResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_aws_s3_bucket for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_aws_s3_bucket',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/s3-buckets/{bucket_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -481,24 +464,17 @@ class AwsS3BucketsV1Controller:
 
         resp_instance: set_bucket_properties_response.SetBucketPropertiesResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.patch(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'set_bucket_properties for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'set_bucket_properties',
+            'patch',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/s3-buckets/{bucket_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -509,11 +485,6 @@ class AwsS3BucketsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_aws_s3_buckets(
         self,
         limit: int | None = None,
@@ -523,7 +494,7 @@ class AwsS3BucketsV1ControllerPaginator:
             aws_s3_buckets_v1_bucket_matcher_types.ListAwsS3BucketsV1BucketMatcherT | None
         ) = None,
         **kwargs,
-    ) -> Iterator[list_buckets_response.ListBucketsResponse]:
+    ) -> pagination.PageIterator[list_buckets_response.ListBucketsResponse]:
         """Returns a list of S3 buckets.
 
         Args:
@@ -849,19 +820,113 @@ class AwsS3BucketsV1ControllerPaginator:
                 |                          |                         |                         |
                 +--------------------------+-------------------------+-------------------------+
         """
-        controller = AwsS3BucketsV1Controller(self.controller)
-        while True:
-            response = controller.list_aws_s3_buckets(
-                limit=limit, start=start, filter=filter, bucket_matcher=bucket_matcher, **kwargs
+        controller = self.controller.get_controller(AwsS3BucketsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: aws_s3_buckets_types.ListAwsS3BucketsV1FilterT | None = filter,
+        ) -> list_buckets_response.ListBucketsResponse:
+            return controller.list_aws_s3_buckets(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                bucket_matcher=bucket_matcher,
+                **kwargs,
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_s3_buckets_v1.list_aws_s3_buckets',
+        )
+
+
+class AwsS3BucketsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for aws-s3-buckets resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_aws_s3_buckets(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_s3_buckets_types.ListAwsS3BucketsV1FilterT | None = None,
+        bucket_matcher: (
+            aws_s3_buckets_v1_bucket_matcher_types.ListAwsS3BucketsV1BucketMatcherT | None
+        ) = None,
+        **kwargs,
+    ) -> list_buckets_response.ListBucketsResponse:
+        """Asynchronous counterpart of AwsS3BucketsV1Controller.list_aws_s3_buckets."""
+        controller = self.controller.get_controller(AwsS3BucketsV1Controller)
+        return await self.controller.call(
+            controller.list_aws_s3_buckets,
+            limit=limit,
+            start=start,
+            filter=filter,
+            bucket_matcher=bucket_matcher,
+            **kwargs,
+        )
+
+    async def read_aws_s3_bucket(
+        self, bucket_id: str | None = None, **kwargs
+    ) -> read_bucket_response.ReadBucketResponse:
+        """Asynchronous counterpart of AwsS3BucketsV1Controller.read_aws_s3_bucket."""
+        controller = self.controller.get_controller(AwsS3BucketsV1Controller)
+        return await self.controller.call(
+            controller.read_aws_s3_bucket, bucket_id=bucket_id, **kwargs
+        )
+
+    async def set_bucket_properties(
+        self,
+        bucket_id: str | None = None,
+        body: set_bucket_properties_v1_request.SetBucketPropertiesV1Request | None = None,
+        **kwargs,
+    ) -> set_bucket_properties_response.SetBucketPropertiesResponse:
+        """Asynchronous counterpart of AwsS3BucketsV1Controller.set_bucket_properties."""
+        controller = self.controller.get_controller(AwsS3BucketsV1Controller)
+        return await self.controller.call(
+            controller.set_bucket_properties, bucket_id=bucket_id, body=body, **kwargs
+        )
+
+
+class AwsS3BucketsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for aws-s3-buckets resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_aws_s3_buckets(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: aws_s3_buckets_types.ListAwsS3BucketsV1FilterT | None = None,
+        bucket_matcher: (
+            aws_s3_buckets_v1_bucket_matcher_types.ListAwsS3BucketsV1BucketMatcherT | None
+        ) = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_buckets_response.ListBucketsResponse]:
+        """Asynchronous counterpart of AwsS3BucketsV1ControllerPaginator.list_aws_s3_buckets."""
+        controller = self.controller.get_controller(AwsS3BucketsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: aws_s3_buckets_types.ListAwsS3BucketsV1FilterT | None = filter,
+        ) -> list_buckets_response.ListBucketsResponse:
+            return await controller.list_aws_s3_buckets(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                bucket_matcher=bucket_matcher,
+                **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='aws_s3_buckets_v1.list_aws_s3_buckets',
+        )
@@ -3,21 +3,17 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_aws_template_v2_response
 from clumioapi.models import create_connection_template_v1_request
 from clumioapi.models import read_aws_templates_v2_response
 import requests
-import retrying
 
 
 class AwsTemplatesV1Controller:
@@ -51,25 +47,16 @@ class AwsTemplatesV1Controller:
 
         resp_instance: read_aws_templates_v2_response.ReadAWSTemplatesV2Response
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'read_connection_templates for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_connection_templates',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws/templates',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -102,26 +89,17 @@ class AwsTemplatesV1Controller:
 
         resp_instance: create_aws_template_v2_response.CreateAWSTemplateV2Response
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'create_connection_template for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_connection_template',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws/templates',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -131,3 +109,37 @@ class AwsTemplatesV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class AwsTemplatesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for aws-templates resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def read_connection_templates(self, **kwargs):
+        """Asynchronous counterpart of AwsTemplatesV1Controller.read_connection_templates."""
+        controller = self.controller.get_controller(AwsTemplatesV1Controller)
+        return await self.controller.call(controller.read_connection_templates, **kwargs)
+
+    async def create_connection_template(
+        self,
+        return_group_token: bool | None = None,
+        body: create_connection_template_v1_request.CreateConnectionTemplateV1Request | None = None,
+        **kwargs,
+    ) -> create_aws_template_v2_response.CreateAWSTemplateV2Response:
+        """Asynchronous counterpart of AwsTemplatesV1Controller.create_connection_template."""
+        controller = self.controller.get_controller(AwsTemplatesV1Controller)
+        return await self.controller.call(
+            controller.create_connection_template,
+            return_group_token=return_group_token,
+            body=body,
+            **kwargs,
+        )
+
+
+class AwsTemplatesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for aws-templates resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
@@ -3,23 +3,20 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import backup_aws_dynamodb_tables_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_backup_aws_dynamodb_table_v1_request
 from clumioapi.models import list_dynamo_db_table_backups_response
 from clumioapi.models import on_demand_dynamo_db_backup_response
 from clumioapi.models import read_dynamo_db_table_backup_response
 import requests
-import retrying
 
 
 class BackupAwsDynamodbTablesV1Controller:
@@ -124,25 +121,16 @@ class BackupAwsDynamodbTablesV1Controller:
 
         resp_instance: list_dynamo_db_table_backups_response.ListDynamoDBTableBackupsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_backup_aws_dynamodb_tables for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_backup_aws_dynamodb_tables',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/dynamodb-tables',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -190,26 +178,17 @@ class BackupAwsDynamodbTablesV1Controller:
 
         resp_instance: on_demand_dynamo_db_backup_response.OnDemandDynamoDBBackupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'create_backup_aws_dynamodb_table for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_backup_aws_dynamodb_table',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/dynamodb-tables',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -240,25 +219,16 @@ class BackupAwsDynamodbTablesV1Controller:
 
         resp_instance: read_dynamo_db_table_backup_response.ReadDynamoDBTableBackupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'read_backup_aws_dynamodb_table for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_backup_aws_dynamodb_table',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/dynamodb-tables/{backup_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -269,11 +239,6 @@ class BackupAwsDynamodbTablesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_backup_aws_dynamodb_tables(
         self,
         limit: int | None = None,
@@ -281,7 +246,9 @@ class BackupAwsDynamodbTablesV1ControllerPaginator:
         sort: str | None = None,
         filter: backup_aws_dynamodb_tables_types.ListBackupAwsDynamodbTablesV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_dynamo_db_table_backups_response.ListDynamoDBTableBackupsResponse]:
+    ) -> pagination.PageIterator[
+        list_dynamo_db_table_backups_response.ListDynamoDBTableBackupsResponse
+    ]:
         """Retrieves a list of DynamoDB table backups.
 
         Args:
@@ -342,19 +309,109 @@ class BackupAwsDynamodbTablesV1ControllerPaginator:
                 +-----------------+------------------+-----------------------------------------+
 
         """
-        controller = BackupAwsDynamodbTablesV1Controller(self.controller)
-        while True:
-            response = controller.list_backup_aws_dynamodb_tables(
-                limit=limit, start=start, sort=sort, filter=filter, **kwargs
+        controller = self.controller.get_controller(BackupAwsDynamodbTablesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_dynamodb_tables_types.ListBackupAwsDynamodbTablesV1FilterT | None
+            ) = filter,
+        ) -> list_dynamo_db_table_backups_response.ListDynamoDBTableBackupsResponse:
+            return controller.list_backup_aws_dynamodb_tables(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_dynamodb_tables_v1.list_backup_aws_dynamodb_tables',
+        )
+
+
+class BackupAwsDynamodbTablesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for backup-aws-dynamodb-tables resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_backup_aws_dynamodb_tables(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: backup_aws_dynamodb_tables_types.ListBackupAwsDynamodbTablesV1FilterT | None = None,
+        **kwargs,
+    ) -> list_dynamo_db_table_backups_response.ListDynamoDBTableBackupsResponse:
+        """Asynchronous counterpart of BackupAwsDynamodbTablesV1Controller.list_backup_aws_dynamodb_tables."""
+        controller = self.controller.get_controller(BackupAwsDynamodbTablesV1Controller)
+        return await self.controller.call(
+            controller.list_backup_aws_dynamodb_tables,
+            limit=limit,
+            start=start,
+            sort=sort,
+            filter=filter,
+            **kwargs,
+        )
+
+    async def create_backup_aws_dynamodb_table(
+        self,
+        embed: str | None = None,
+        body: (
+            create_backup_aws_dynamodb_table_v1_request.CreateBackupAwsDynamodbTableV1Request | None
+        ) = None,
+        **kwargs,
+    ) -> on_demand_dynamo_db_backup_response.OnDemandDynamoDBBackupResponse:
+        """Asynchronous counterpart of BackupAwsDynamodbTablesV1Controller.create_backup_aws_dynamodb_table."""
+        controller = self.controller.get_controller(BackupAwsDynamodbTablesV1Controller)
+        return await self.controller.call(
+            controller.create_backup_aws_dynamodb_table, embed=embed, body=body, **kwargs
+        )
+
+    async def read_backup_aws_dynamodb_table(
+        self, backup_id: str | None = None, **kwargs
+    ) -> read_dynamo_db_table_backup_response.ReadDynamoDBTableBackupResponse:
+        """Asynchronous counterpart of BackupAwsDynamodbTablesV1Controller.read_backup_aws_dynamodb_table."""
+        controller = self.controller.get_controller(BackupAwsDynamodbTablesV1Controller)
+        return await self.controller.call(
+            controller.read_backup_aws_dynamodb_table, backup_id=backup_id, **kwargs
+        )
+
+
+class BackupAwsDynamodbTablesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for backup-aws-dynamodb-tables resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_backup_aws_dynamodb_tables(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: backup_aws_dynamodb_tables_types.ListBackupAwsDynamodbTablesV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_dynamo_db_table_backups_response.ListDynamoDBTableBackupsResponse
+    ]:
+        """Asynchronous counterpart of BackupAwsDynamodbTablesV1ControllerPaginator.list_backup_aws_dynamodb_tables."""
+        controller = self.controller.get_controller(BackupAwsDynamodbTablesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_dynamodb_tables_types.ListBackupAwsDynamodbTablesV1FilterT | None
+            ) = filter,
+        ) -> list_dynamo_db_table_backups_response.ListDynamoDBTableBackupsResponse:
+            return await controller.list_backup_aws_dynamodb_tables(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_dynamodb_tables_v1.list_backup_aws_dynamodb_tables',
+        )
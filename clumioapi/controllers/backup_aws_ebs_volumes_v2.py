@@ -3,23 +3,20 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import backup_aws_ebs_volumes_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_backup_aws_ebs_volume_v2_request
 from clumioapi.models import list_ebs_backups_response
 from clumioapi.models import on_demand_ebs_backup_response
 from clumioapi.models import read_ebs_backup_response
 import requests
-import retrying
 
 
 class BackupAwsEbsVolumesV2Controller:
@@ -111,25 +108,16 @@ class BackupAwsEbsVolumesV2Controller:
 
         resp_instance: list_ebs_backups_response.ListEBSBackupsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_backup_aws_ebs_volumes for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_backup_aws_ebs_volumes',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/ebs-volumes',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -175,26 +163,17 @@ class BackupAwsEbsVolumesV2Controller:
 
         resp_instance: on_demand_ebs_backup_response.OnDemandEBSBackupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'create_backup_aws_ebs_volume for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_backup_aws_ebs_volume',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/ebs-volumes',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -221,25 +200,16 @@ class BackupAwsEbsVolumesV2Controller:
 
         resp_instance: read_ebs_backup_response.ReadEBSBackupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'read_backup_aws_ebs_volume for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_backup_aws_ebs_volume',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/ebs-volumes/{backup_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -250,11 +220,6 @@ class BackupAwsEbsVolumesV2ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_backup_aws_ebs_volumes(
         self,
         limit: int | None = None,
@@ -262,7 +227,7 @@ class BackupAwsEbsVolumesV2ControllerPaginator:
         sort: str | None = None,
         filter: backup_aws_ebs_volumes_types.ListBackupAwsEbsVolumesV2FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_ebs_backups_response.ListEBSBackupsResponse]:
+    ) -> pagination.PageIterator[list_ebs_backups_response.ListEBSBackupsResponse]:
         """Returns a list of EBS volumes that have been backed up by Clumio. EBS volume
         backups can be restored through the [POST /restores/aws/ebs-
         volumes](#operation/restore-aws-ebs-volume) endpoint.
@@ -312,19 +277,107 @@ class BackupAwsEbsVolumesV2ControllerPaginator:
                 +-----------------+------------------+-----------------------------------------+
 
         """
-        controller = BackupAwsEbsVolumesV2Controller(self.controller)
-        while True:
-            response = controller.list_backup_aws_ebs_volumes(
-                limit=limit, start=start, sort=sort, filter=filter, **kwargs
+        controller = self.controller.get_controller(BackupAwsEbsVolumesV2Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_ebs_volumes_types.ListBackupAwsEbsVolumesV2FilterT | None
+            ) = filter,
+        ) -> list_ebs_backups_response.ListEBSBackupsResponse:
+            return controller.list_backup_aws_ebs_volumes(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_ebs_volumes_v2.list_backup_aws_ebs_volumes',
+        )
+
+
+class BackupAwsEbsVolumesV2AsyncController:
+    """An asynchronous Controller to access Endpoints for backup-aws-ebs-volumes resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_backup_aws_ebs_volumes(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: backup_aws_ebs_volumes_types.ListBackupAwsEbsVolumesV2FilterT | None = None,
+        **kwargs,
+    ) -> list_ebs_backups_response.ListEBSBackupsResponse:
+        """Asynchronous counterpart of BackupAwsEbsVolumesV2Controller.list_backup_aws_ebs_volumes."""
+        controller = self.controller.get_controller(BackupAwsEbsVolumesV2Controller)
+        return await self.controller.call(
+            controller.list_backup_aws_ebs_volumes,
+            limit=limit,
+            start=start,
+            sort=sort,
+            filter=filter,
+            **kwargs,
+        )
+
+    async def create_backup_aws_ebs_volume(
+        self,
+        embed: str | None = None,
+        body: (
+            create_backup_aws_ebs_volume_v2_request.CreateBackupAwsEbsVolumeV2Request | None
+        ) = None,
+        **kwargs,
+    ) -> on_demand_ebs_backup_response.OnDemandEBSBackupResponse:
+        """Asynchronous counterpart of BackupAwsEbsVolumesV2Controller.create_backup_aws_ebs_volume."""
+        controller = self.controller.get_controller(BackupAwsEbsVolumesV2Controller)
+        return await self.controller.call(
+            controller.create_backup_aws_ebs_volume, embed=embed, body=body, **kwargs
+        )
+
+    async def read_backup_aws_ebs_volume(
+        self, backup_id: str | None = None, **kwargs
+    ) -> read_ebs_backup_response.ReadEBSBackupResponse:
+        """Asynchronous counterpart of BackupAwsEbsVolumesV2Controller.read_backup_aws_ebs_volume."""
+        controller = self.controller.get_controller(BackupAwsEbsVolumesV2Controller)
+        return await self.controller.call(
+            controller.read_backup_aws_ebs_volume, backup_id=backup_id, **kwargs
+        )
+
+
+class BackupAwsEbsVolumesV2AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for backup-aws-ebs-volumes resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_backup_aws_ebs_volumes(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: backup_aws_ebs_volumes_types.ListBackupAwsEbsVolumesV2FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_ebs_backups_response.ListEBSBackupsResponse]:
+        """Asynchronous counterpart of BackupAwsEbsVolumesV2ControllerPaginator.list_backup_aws_ebs_volumes."""
+        controller = self.controller.get_controller(BackupAwsEbsVolumesV2AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_ebs_volumes_types.ListBackupAwsEbsVolumesV2FilterT | None
+            ) = filter,
+        ) -> list_ebs_backups_response.ListEBSBackupsResponse:
+            return await controller.list_backup_aws_ebs_volumes(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_ebs_volumes_v2.list_backup_aws_ebs_volumes',
+        )
@@ -3,23 +3,20 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import backup_aws_ec2_instances_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_backup_aws_ec2_instance_v1_request
 from clumioapi.models import list_ec2_backups_response
 from clumioapi.models import on_demand_ec2_backup_response
 from clumioapi.models import read_ec2_backup_response
 import requests
-import retrying
 
 
 class BackupAwsEc2InstancesV1Controller:
@@ -111,25 +108,16 @@ class BackupAwsEc2InstancesV1Controller:
 
         resp_instance: list_ec2_backups_response.ListEC2BackupsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_backup_aws_ec2_instances for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_backup_aws_ec2_instances',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/ec2-instances',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -175,26 +163,17 @@ class BackupAwsEc2InstancesV1Controller:
 
         resp_instance: on_demand_ec2_backup_response.OnDemandEC2BackupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'create_backup_aws_ec2_instance for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_backup_aws_ec2_instance',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/ec2-instances',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -221,25 +200,16 @@ class BackupAwsEc2InstancesV1Controller:
 
         resp_instance: read_ec2_backup_response.ReadEC2BackupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'read_backup_aws_ec2_instance for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_backup_aws_ec2_instance',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/ec2-instances/{backup_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -250,11 +220,6 @@ class BackupAwsEc2InstancesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_backup_aws_ec2_instances(
         self,
         limit: int | None = None,
@@ -262,7 +227,7 @@ class BackupAwsEc2InstancesV1ControllerPaginator:
         sort: str | None = None,
         filter: backup_aws_ec2_instances_types.ListBackupAwsEc2InstancesV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_ec2_backups_response.ListEC2BackupsResponse]:
+    ) -> pagination.PageIterator[list_ec2_backups_response.ListEC2BackupsResponse]:
         """Returns a list of EC2 instances that have been backed up by Clumio. EC2 instance
         backups can be restored through the [POST
         /restores/aws/ec2-instances](#operation/restore-aws-ec2-instance) endpoint.
@@ -312,19 +277,107 @@ class BackupAwsEc2InstancesV1ControllerPaginator:
                 +-----------------+------------------+-----------------------------------------+
 
         """
-        controller = BackupAwsEc2InstancesV1Controller(self.controller)
-        while True:
-            response = controller.list_backup_aws_ec2_instances(
-                limit=limit, start=start, sort=sort, filter=filter, **kwargs
+        controller = self.controller.get_controller(BackupAwsEc2InstancesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_ec2_instances_types.ListBackupAwsEc2InstancesV1FilterT | None
+            ) = filter,
+        ) -> list_ec2_backups_response.ListEC2BackupsResponse:
+            return controller.list_backup_aws_ec2_instances(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_ec2_instances_v1.list_backup_aws_ec2_instances',
+        )
+
+
+class BackupAwsEc2InstancesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for backup-aws-ec2-instances resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_backup_aws_ec2_instances(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: backup_aws_ec2_instances_types.ListBackupAwsEc2InstancesV1FilterT | None = None,
+        **kwargs,
+    ) -> list_ec2_backups_response.ListEC2BackupsResponse:
+        """Asynchronous counterpart of BackupAwsEc2InstancesV1Controller.list_backup_aws_ec2_instances."""
+        controller = self.controller.get_controller(BackupAwsEc2InstancesV1Controller)
+        return await self.controller.call(
+            controller.list_backup_aws_ec2_instances,
+            limit=limit,
+            start=start,
+            sort=sort,
+            filter=filter,
+            **kwargs,
+        )
+
+    async def create_backup_aws_ec2_instance(
+        self,
+        embed: str | None = None,
+        body: (
+            create_backup_aws_ec2_instance_v1_request.CreateBackupAwsEc2InstanceV1Request | None
+        ) = None,
+        **kwargs,
+    ) -> on_demand_ec2_backup_response.OnDemandEC2BackupResponse:
+        """Asynchronous counterpart of BackupAwsEc2InstancesV1Controller.create_backup_aws_ec2_instance."""
+        controller = self.controller.get_controller(BackupAwsEc2InstancesV1Controller)
+        return await self.controller.call(
+            controller.create_backup_aws_ec2_instance, embed=embed, body=body, **kwargs
+        )
+
+    async def read_backup_aws_ec2_instance(
+        self, backup_id: str | None = None, **kwargs
+    ) -> read_ec2_backup_response.ReadEC2BackupResponse:
+        """Asynchronous counterpart of BackupAwsEc2InstancesV1Controller.read_backup_aws_ec2_instance."""
+        controller = self.controller.get_controller(BackupAwsEc2InstancesV1Controller)
+        return await self.controller.call(
+            controller.read_backup_aws_ec2_instance, backup_id=backup_id, **kwargs
+        )
+
+
+class BackupAwsEc2InstancesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for backup-aws-ec2-instances resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_backup_aws_ec2_instances(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: backup_aws_ec2_instances_types.ListBackupAwsEc2InstancesV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_ec2_backups_response.ListEC2BackupsResponse]:
+        """Asynchronous counterpart of BackupAwsEc2InstancesV1ControllerPaginator.list_backup_aws_ec2_instances."""
+        controller = self.controller.get_controller(BackupAwsEc2InstancesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_ec2_instances_types.ListBackupAwsEc2InstancesV1FilterT | None
+            ) = filter,
+        ) -> list_ec2_backups_response.ListEC2BackupsResponse:
+            return await controller.list_backup_aws_ec2_instances(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_ec2_instances_v1.list_backup_aws_ec2_instances',
+        )
@@ -3,22 +3,19 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import backup_aws_rds_resource_database_tables_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_rds_database_tables_response
 from clumioapi.models import read_rds_database_table_columns_response
 from clumioapi.models import read_rds_database_table_response
 import requests
-import retrying
 
 
 class BackupAwsRdsResourceDatabaseTablesV1Controller:
@@ -99,23 +96,16 @@ class BackupAwsRdsResourceDatabaseTablesV1Controller:
 
         resp_instance: list_rds_database_tables_response.ListRDSDatabaseTablesResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_backup_aws_rds_resource_database_tables for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_backup_aws_rds_resource_database_tables',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/rds-resources/{backup_id}/databases/{database_name}/tables',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -171,23 +161,16 @@ class BackupAwsRdsResourceDatabaseTablesV1Controller:
 
         resp_instance: read_rds_database_table_response.ReadRDSDatabaseTableResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_backup_aws_rds_resource_database_table for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_backup_aws_rds_resource_database_table',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/rds-resources/{backup_id}/databases/{database_name}/tables/{table_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -225,23 +208,16 @@ class BackupAwsRdsResourceDatabaseTablesV1Controller:
 
         resp_instance: read_rds_database_table_columns_response.ReadRDSDatabaseTableColumnsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_backup_aws_rds_resource_database_table_columns for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_backup_aws_rds_resource_database_table_columns',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/rds-resources/{backup_id}/databases/{database_name}/tables/{table_id}/columns',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -252,11 +228,6 @@ class BackupAwsRdsResourceDatabaseTablesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_backup_aws_rds_resource_database_tables(
         self,
         backup_id: str | None = None,
@@ -269,7 +240,7 @@ class BackupAwsRdsResourceDatabaseTablesV1ControllerPaginator:
             | None
         ) = None,
         **kwargs,
-    ) -> Iterator[list_rds_database_tables_response.ListRDSDatabaseTablesResponse]:
+    ) -> pagination.PageIterator[list_rds_database_tables_response.ListRDSDatabaseTablesResponse]:
         """Returns a list of RDS tables from the specified RDS backup.
 
         Args:
@@ -296,25 +267,150 @@ class BackupAwsRdsResourceDatabaseTablesV1ControllerPaginator:
                 +-------+------------------+---------------------------+
 
         """
-        controller = BackupAwsRdsResourceDatabaseTablesV1Controller(self.controller)
-        while True:
-            response = controller.list_backup_aws_rds_resource_database_tables(
+        controller = self.controller.get_controller(BackupAwsRdsResourceDatabaseTablesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_rds_resource_database_tables_types.ListBackupAwsRdsResourceDatabaseTablesV1FilterT
+                | None
+            ) = filter,
+        ) -> list_rds_database_tables_response.ListRDSDatabaseTablesResponse:
+            return controller.list_backup_aws_rds_resource_database_tables(
+                backup_id=backup_id,
+                database_name=database_name,
+                current_count=current_count,
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                **kwargs,
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_rds_resource_database_tables_v1.list_backup_aws_rds_resource_database_tables',
+        )
+
+
+class BackupAwsRdsResourceDatabaseTablesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for backup-aws-rds-resource-database-tables resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_backup_aws_rds_resource_database_tables(
+        self,
+        backup_id: str | None = None,
+        database_name: str | None = None,
+        current_count: int | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            backup_aws_rds_resource_database_tables_types.ListBackupAwsRdsResourceDatabaseTablesV1FilterT
+            | None
+        ) = None,
+        **kwargs,
+    ) -> list_rds_database_tables_response.ListRDSDatabaseTablesResponse:
+        """Asynchronous counterpart of BackupAwsRdsResourceDatabaseTablesV1Controller.list_backup_aws_rds_resource_database_tables."""
+        controller = self.controller.get_controller(BackupAwsRdsResourceDatabaseTablesV1Controller)
+        return await self.controller.call(
+            controller.list_backup_aws_rds_resource_database_tables,
+            backup_id=backup_id,
+            database_name=database_name,
+            current_count=current_count,
+            limit=limit,
+            start=start,
+            filter=filter,
+            **kwargs,
+        )
+
+    async def read_backup_aws_rds_resource_database_table(
+        self,
+        backup_id: str | None = None,
+        database_name: str | None = None,
+        table_id: str | None = None,
+        embed: str | None = None,
+        **kwargs,
+    ) -> read_rds_database_table_response.ReadRDSDatabaseTableResponse:
+        """Asynchronous counterpart of BackupAwsRdsResourceDatabaseTablesV1Controller.read_backup_aws_rds_resource_database_table."""
+        controller = self.controller.get_controller(BackupAwsRdsResourceDatabaseTablesV1Controller)
+        return await self.controller.call(
+            controller.read_backup_aws_rds_resource_database_table,
+            backup_id=backup_id,
+            database_name=database_name,
+            table_id=table_id,
+            embed=embed,
+            **kwargs,
+        )
+
+    async def read_backup_aws_rds_resource_database_table_columns(
+        self,
+        backup_id: str | None = None,
+        database_name: str | None = None,
+        table_id: str | None = None,
+        **kwargs,
+    ) -> read_rds_database_table_columns_response.ReadRDSDatabaseTableColumnsResponse:
+        """Asynchronous counterpart of BackupAwsRdsResourceDatabaseTablesV1Controller.read_backup_aws_rds_resource_database_table_columns."""
+        controller = self.controller.get_controller(BackupAwsRdsResourceDatabaseTablesV1Controller)
+        return await self.controller.call(
+            controller.read_backup_aws_rds_resource_database_table_columns,
+            backup_id=backup_id,
+            database_name=database_name,
+            table_id=table_id,
+            **kwargs,
+        )
+
+
+class BackupAwsRdsResourceDatabaseTablesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for backup-aws-rds-resource-database-tables resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_backup_aws_rds_resource_database_tables(
+        self,
+        backup_id: str | None = None,
+        database_name: str | None = None,
+        current_count: int | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            backup_aws_rds_resource_database_tables_types.ListBackupAwsRdsResourceDatabaseTablesV1FilterT
+            | None
+        ) = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_rds_database_tables_response.ListRDSDatabaseTablesResponse
+    ]:
+        """Asynchronous counterpart of BackupAwsRdsResourceDatabaseTablesV1ControllerPaginator.list_backup_aws_rds_resource_database_tables."""
+        controller = self.controller.get_controller(
+            BackupAwsRdsResourceDatabaseTablesV1AsyncController
+        )
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_rds_resource_database_tables_types.ListBackupAwsRdsResourceDatabaseTablesV1FilterT
+                | None
+            ) = filter,
+        ) -> list_rds_database_tables_response.ListRDSDatabaseTablesResponse:
+            return await controller.list_backup_aws_rds_resource_database_tables(
                 backup_id=backup_id,
                 database_name=database_name,
                 current_count=current_count,
                 limit=limit,
-                start=start,
-                filter=filter,
+                start=page_start,
+                filter=page_filter,
                 **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_rds_resource_database_tables_v1.list_backup_aws_rds_resource_database_tables',
+        )
@@ -3,20 +3,17 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import backup_aws_rds_resource_databases_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_rds_backup_databases_response
 import requests
-import retrying
 
 
 class BackupAwsRdsResourceDatabasesV1Controller:
@@ -89,23 +86,16 @@ class BackupAwsRdsResourceDatabasesV1Controller:
 
         resp_instance: list_rds_backup_databases_response.ListRDSBackupDatabasesResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_backup_aws_rds_resource_databases for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_backup_aws_rds_resource_databases',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/rds-resources/{backup_id}/databases',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -116,11 +106,6 @@ class BackupAwsRdsResourceDatabasesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_backup_aws_rds_resource_databases(
         self,
         backup_id: str | None = None,
@@ -131,7 +116,7 @@ class BackupAwsRdsResourceDatabasesV1ControllerPaginator:
             | None
         ) = None,
         **kwargs,
-    ) -> Iterator[list_rds_backup_databases_response.ListRDSBackupDatabasesResponse]:
+    ) -> pagination.PageIterator[list_rds_backup_databases_response.ListRDSBackupDatabasesResponse]:
         """Retrieves a list of RDS databases from an RDS backup.
 
         Args:
@@ -155,19 +140,94 @@ class BackupAwsRdsResourceDatabasesV1ControllerPaginator:
                 +-------+------------------+---------------------------------+
 
         """
-        controller = BackupAwsRdsResourceDatabasesV1Controller(self.controller)
-        while True:
-            response = controller.list_backup_aws_rds_resource_databases(
-                backup_id=backup_id, limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(BackupAwsRdsResourceDatabasesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_rds_resource_databases_types.ListBackupAwsRdsResourceDatabasesV1FilterT
+                | None
+            ) = filter,
+        ) -> list_rds_backup_databases_response.ListRDSBackupDatabasesResponse:
+            return controller.list_backup_aws_rds_resource_databases(
+                backup_id=backup_id, limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_rds_resource_databases_v1.list_backup_aws_rds_resource_databases',
+        )
+
+
+class BackupAwsRdsResourceDatabasesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for backup-aws-rds-resource-databases resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_backup_aws_rds_resource_databases(
+        self,
+        backup_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            backup_aws_rds_resource_databases_types.ListBackupAwsRdsResourceDatabasesV1FilterT
+            | None
+        ) = None,
+        **kwargs,
+    ) -> list_rds_backup_databases_response.ListRDSBackupDatabasesResponse:
+        """Asynchronous counterpart of BackupAwsRdsResourceDatabasesV1Controller.list_backup_aws_rds_resource_databases."""
+        controller = self.controller.get_controller(BackupAwsRdsResourceDatabasesV1Controller)
+        return await self.controller.call(
+            controller.list_backup_aws_rds_resource_databases,
+            backup_id=backup_id,
+            limit=limit,
+            start=start,
+            filter=filter,
+            **kwargs,
+        )
+
+
+class BackupAwsRdsResourceDatabasesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for backup-aws-rds-resource-databases resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_backup_aws_rds_resource_databases(
+        self,
+        backup_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            backup_aws_rds_resource_databases_types.ListBackupAwsRdsResourceDatabasesV1FilterT
+            | None
+        ) = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_rds_backup_databases_response.ListRDSBackupDatabasesResponse
+    ]:
+        """Asynchronous counterpart of BackupAwsRdsResourceDatabasesV1ControllerPaginator.list_backup_aws_rds_resource_databases."""
+        controller = self.controller.get_controller(BackupAwsRdsResourceDatabasesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_rds_resource_databases_types.ListBackupAwsRdsResourceDatabasesV1FilterT
+                | None
+            ) = filter,
+        ) -> list_rds_backup_databases_response.ListRDSBackupDatabasesResponse:
+            return await controller.list_backup_aws_rds_resource_databases(
+                backup_id=backup_id, limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_rds_resource_databases_v1.list_backup_aws_rds_resource_databases',
+        )
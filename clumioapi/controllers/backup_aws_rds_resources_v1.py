@@ -3,22 +3,19 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import backup_aws_rds_resources_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_rds_database_backups_response
 from clumioapi.models import list_rds_option_groups_response
 from clumioapi.models import read_rds_database_backup_response
 import requests
-import retrying
 
 
 class BackupAwsRdsResourcesV1Controller:
@@ -112,25 +109,16 @@ class BackupAwsRdsResourcesV1Controller:
 
         resp_instance: list_rds_database_backups_response.ListRdsDatabaseBackupsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_backup_aws_rds_resources for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_backup_aws_rds_resources',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/rds-resources',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -159,25 +147,16 @@ class BackupAwsRdsResourcesV1Controller:
 
         resp_instance: read_rds_database_backup_response.ReadRdsDatabaseBackupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'read_backup_aws_rds_resource for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_backup_aws_rds_resource',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/rds-resources/{backup_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -239,23 +218,16 @@ class BackupAwsRdsResourcesV1Controller:
 
         resp_instance: list_rds_option_groups_response.ListRdsOptionGroupsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_aws_rds_resources_option_groups for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_aws_rds_resources_option_groups',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/rds-resources/{backup_id}/option-groups',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -266,11 +238,6 @@ class BackupAwsRdsResourcesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_backup_aws_rds_resources(
         self,
         limit: int | None = None,
@@ -278,7 +245,7 @@ class BackupAwsRdsResourcesV1ControllerPaginator:
         sort: str | None = None,
         filter: backup_aws_rds_resources_types.ListBackupAwsRdsResourcesV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_rds_database_backups_response.ListRdsDatabaseBackupsResponse]:
+    ) -> pagination.PageIterator[list_rds_database_backups_response.ListRdsDatabaseBackupsResponse]:
         """Retrieves a list of RDS database backups.
 
         Args:
@@ -328,28 +295,26 @@ class BackupAwsRdsResourcesV1ControllerPaginator:
                 +-----------------+------------------+-----------------------------------------+
 
         """
-        controller = BackupAwsRdsResourcesV1Controller(self.controller)
-        while True:
-            response = controller.list_backup_aws_rds_resources(
-                limit=limit, start=start, sort=sort, filter=filter, **kwargs
+        controller = self.controller.get_controller(BackupAwsRdsResourcesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_rds_resources_types.ListBackupAwsRdsResourcesV1FilterT | None
+            ) = filter,
+        ) -> list_rds_database_backups_response.ListRdsDatabaseBackupsResponse:
+            return controller.list_backup_aws_rds_resources(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
-
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_rds_resources_v1.list_backup_aws_rds_resources',
+        )
+
     def list_aws_rds_resources_option_groups(
         self,
         backup_id: str | None = None,
@@ -359,7 +324,7 @@ class BackupAwsRdsResourcesV1ControllerPaginator:
             backup_aws_rds_resources_types.ListAwsRdsResourcesOptionGroupsV1FilterT | None
         ) = None,
         **kwargs,
-    ) -> Iterator[list_rds_option_groups_response.ListRdsOptionGroupsResponse]:
+    ) -> pagination.PageIterator[list_rds_option_groups_response.ListRdsOptionGroupsResponse]:
         """Retrieves a list of RDS option groups which are superset of persistent and
         permanent
         options present in the backup snapshot for a given environment.
@@ -387,19 +352,147 @@ class BackupAwsRdsResourcesV1ControllerPaginator:
                 +----------------+------------------+------------------------------------------+
 
         """
-        controller = BackupAwsRdsResourcesV1Controller(self.controller)
-        while True:
-            response = controller.list_aws_rds_resources_option_groups(
-                backup_id=backup_id, limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(BackupAwsRdsResourcesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_rds_resources_types.ListAwsRdsResourcesOptionGroupsV1FilterT | None
+            ) = filter,
+        ) -> list_rds_option_groups_response.ListRdsOptionGroupsResponse:
+            return controller.list_aws_rds_resources_option_groups(
+                backup_id=backup_id, limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_rds_resources_v1.list_aws_rds_resources_option_groups',
+        )
+
+
+class BackupAwsRdsResourcesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for backup-aws-rds-resources resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_backup_aws_rds_resources(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: backup_aws_rds_resources_types.ListBackupAwsRdsResourcesV1FilterT | None = None,
+        **kwargs,
+    ) -> list_rds_database_backups_response.ListRdsDatabaseBackupsResponse:
+        """Asynchronous counterpart of BackupAwsRdsResourcesV1Controller.list_backup_aws_rds_resources."""
+        controller = self.controller.get_controller(BackupAwsRdsResourcesV1Controller)
+        return await self.controller.call(
+            controller.list_backup_aws_rds_resources,
+            limit=limit,
+            start=start,
+            sort=sort,
+            filter=filter,
+            **kwargs,
+        )
+
+    async def read_backup_aws_rds_resource(
+        self, backup_id: str | None = None, **kwargs
+    ) -> read_rds_database_backup_response.ReadRdsDatabaseBackupResponse:
+        """Asynchronous counterpart of BackupAwsRdsResourcesV1Controller.read_backup_aws_rds_resource."""
+        controller = self.controller.get_controller(BackupAwsRdsResourcesV1Controller)
+        return await self.controller.call(
+            controller.read_backup_aws_rds_resource, backup_id=backup_id, **kwargs
+        )
+
+    async def list_aws_rds_resources_option_groups(
+        self,
+        backup_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            backup_aws_rds_resources_types.ListAwsRdsResourcesOptionGroupsV1FilterT | None
+        ) = None,
+        **kwargs,
+    ) -> list_rds_option_groups_response.ListRdsOptionGroupsResponse:
+        """Asynchronous counterpart of BackupAwsRdsResourcesV1Controller.list_aws_rds_resources_option_groups."""
+        controller = self.controller.get_controller(BackupAwsRdsResourcesV1Controller)
+        return await self.controller.call(
+            controller.list_aws_rds_resources_option_groups,
+            backup_id=backup_id,
+            limit=limit,
+            start=start,
+            filter=filter,
+            **kwargs,
+        )
+
+
+class BackupAwsRdsResourcesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for backup-aws-rds-resources resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_backup_aws_rds_resources(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: backup_aws_rds_resources_types.ListBackupAwsRdsResourcesV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_rds_database_backups_response.ListRdsDatabaseBackupsResponse
+    ]:
+        """Asynchronous counterpart of BackupAwsRdsResourcesV1ControllerPaginator.list_backup_aws_rds_resources."""
+        controller = self.controller.get_controller(BackupAwsRdsResourcesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_rds_resources_types.ListBackupAwsRdsResourcesV1FilterT | None
+            ) = filter,
+        ) -> list_rds_database_backups_response.ListRdsDatabaseBackupsResponse:
+            return await controller.list_backup_aws_rds_resources(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_rds_resources_v1.list_backup_aws_rds_resources',
+        )
+
+    def list_aws_rds_resources_option_groups(
+        self,
+        backup_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            backup_aws_rds_resources_types.ListAwsRdsResourcesOptionGroupsV1FilterT | None
+        ) = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_rds_option_groups_response.ListRdsOptionGroupsResponse]:
+        """Asynchronous counterpart of BackupAwsRdsResourcesV1ControllerPaginator.list_aws_rds_resources_option_groups."""
+        controller = self.controller.get_controller(BackupAwsRdsResourcesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_aws_rds_resources_types.ListAwsRdsResourcesOptionGroupsV1FilterT | None
+            ) = filter,
+        ) -> list_rds_option_groups_response.ListRdsOptionGroupsResponse:
+            return await controller.list_aws_rds_resources_option_groups(
+                backup_id=backup_id, limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_aws_rds_resources_v1.list_aws_rds_resources_option_groups',
+        )
@@ -3,23 +3,20 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import backup_ec2_mssql_databases_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_backup_ec2_mssql_database_v1_request
 from clumioapi.models import list_ec2_mssql_database_backups_response
 from clumioapi.models import on_demand_ec2_mssql_database_backup_response
 from clumioapi.models import read_ec2_mssql_database_backup_response
 import requests
-import retrying
 
 
 class BackupEc2MssqlDatabasesV1Controller:
@@ -129,25 +126,16 @@ class BackupEc2MssqlDatabasesV1Controller:
 
         resp_instance: list_ec2_mssql_database_backups_response.ListEC2MSSQLDatabaseBackupsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_backup_ec2_mssql_databases for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_backup_ec2_mssql_databases',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/ec2-mssql/databases',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -195,26 +183,17 @@ class BackupEc2MssqlDatabasesV1Controller:
             on_demand_ec2_mssql_database_backup_response.OnDemandEC2MSSQLDatabaseBackupResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'create_backup_ec2_mssql_database for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_backup_ec2_mssql_database',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/ec2-mssql/databases',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -246,25 +225,16 @@ class BackupEc2MssqlDatabasesV1Controller:
 
         resp_instance: read_ec2_mssql_database_backup_response.ReadEC2MSSQLDatabaseBackupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'read_backup_ec2_mssql_database for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_backup_ec2_mssql_database',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/aws/ec2-mssql/databases/{backup_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -275,11 +245,6 @@ class BackupEc2MssqlDatabasesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_backup_ec2_mssql_databases(
         self,
         limit: int | None = None,
@@ -288,7 +253,9 @@ class BackupEc2MssqlDatabasesV1ControllerPaginator:
         filter: backup_ec2_mssql_databases_types.ListBackupEc2MssqlDatabasesV1FilterT | None = None,
         embed: str | None = None,
         **kwargs,
-    ) -> Iterator[list_ec2_mssql_database_backups_response.ListEC2MSSQLDatabaseBackupsResponse]:
+    ) -> pagination.PageIterator[
+        list_ec2_mssql_database_backups_response.ListEC2MSSQLDatabaseBackupsResponse
+    ]:
         """Retrieve a list of EC2 MSSQL database backups.
 
         Args:
@@ -352,19 +319,112 @@ class BackupEc2MssqlDatabasesV1ControllerPaginator:
                 +----------------------+-------------------------------------------------------+
 
         """
-        controller = BackupEc2MssqlDatabasesV1Controller(self.controller)
-        while True:
-            response = controller.list_backup_ec2_mssql_databases(
-                limit=limit, start=start, sort=sort, filter=filter, embed=embed, **kwargs
+        controller = self.controller.get_controller(BackupEc2MssqlDatabasesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_ec2_mssql_databases_types.ListBackupEc2MssqlDatabasesV1FilterT | None
+            ) = filter,
+        ) -> list_ec2_mssql_database_backups_response.ListEC2MSSQLDatabaseBackupsResponse:
+            return controller.list_backup_ec2_mssql_databases(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, embed=embed, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_ec2_mssql_databases_v1.list_backup_ec2_mssql_databases',
+        )
+
+
+class BackupEc2MssqlDatabasesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for backup-ec2-mssql-databases resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_backup_ec2_mssql_databases(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: backup_ec2_mssql_databases_types.ListBackupEc2MssqlDatabasesV1FilterT | None = None,
+        embed: str | None = None,
+        **kwargs,
+    ) -> list_ec2_mssql_database_backups_response.ListEC2MSSQLDatabaseBackupsResponse:
+        """Asynchronous counterpart of BackupEc2MssqlDatabasesV1Controller.list_backup_ec2_mssql_databases."""
+        controller = self.controller.get_controller(BackupEc2MssqlDatabasesV1Controller)
+        return await self.controller.call(
+            controller.list_backup_ec2_mssql_databases,
+            limit=limit,
+            start=start,
+            sort=sort,
+            filter=filter,
+            embed=embed,
+            **kwargs,
+        )
+
+    async def create_backup_ec2_mssql_database(
+        self,
+        embed: str | None = None,
+        body: (
+            create_backup_ec2_mssql_database_v1_request.CreateBackupEc2MssqlDatabaseV1Request | None
+        ) = None,
+        **kwargs,
+    ) -> on_demand_ec2_mssql_database_backup_response.OnDemandEC2MSSQLDatabaseBackupResponse:
+        """Asynchronous counterpart of BackupEc2MssqlDatabasesV1Controller.create_backup_ec2_mssql_database."""
+        controller = self.controller.get_controller(BackupEc2MssqlDatabasesV1Controller)
+        return await self.controller.call(
+            controller.create_backup_ec2_mssql_database, embed=embed, body=body, **kwargs
+        )
+
+    async def read_backup_ec2_mssql_database(
+        self, backup_id: str | None = None, **kwargs
+    ) -> read_ec2_mssql_database_backup_response.ReadEC2MSSQLDatabaseBackupResponse:
+        """Asynchronous counterpart of BackupEc2MssqlDatabasesV1Controller.read_backup_ec2_mssql_database."""
+        controller = self.controller.get_controller(BackupEc2MssqlDatabasesV1Controller)
+        return await self.controller.call(
+            controller.read_backup_ec2_mssql_database, backup_id=backup_id, **kwargs
+        )
+
+
+class BackupEc2MssqlDatabasesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for backup-ec2-mssql-databases resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_backup_ec2_mssql_databases(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: backup_ec2_mssql_databases_types.ListBackupEc2MssqlDatabasesV1FilterT | None = None,
+        embed: str | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_ec2_mssql_database_backups_response.ListEC2MSSQLDatabaseBackupsResponse
+    ]:
+        """Asynchronous counterpart of BackupEc2MssqlDatabasesV1ControllerPaginator.list_backup_ec2_mssql_databases."""
+        controller = self.controller.get_controller(BackupEc2MssqlDatabasesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_ec2_mssql_databases_types.ListBackupEc2MssqlDatabasesV1FilterT | None
+            ) = filter,
+        ) -> list_ec2_mssql_database_backups_response.ListEC2MSSQLDatabaseBackupsResponse:
+            return await controller.list_backup_ec2_mssql_databases(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, embed=embed, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_ec2_mssql_databases_v1.list_backup_ec2_mssql_databases',
+        )
@@ -3,19 +3,16 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import read_directory_response
 import requests
-import retrying
 
 
 class BackupFilesystemDirectoriesV1Controller:
@@ -81,25 +78,16 @@ class BackupFilesystemDirectoriesV1Controller:
 
         resp_instance: read_directory_response.ReadDirectoryResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'read_backup_filesystem_directory for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_backup_filesystem_directory',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/{backup_id}/filesystems/{filesystem_id}/directories/{directory_id}/browse',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -110,11 +98,6 @@ class BackupFilesystemDirectoriesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def read_backup_filesystem_directory(
         self,
         backup_id: str | None = None,
@@ -123,7 +106,7 @@ class BackupFilesystemDirectoriesV1ControllerPaginator:
         limit: int | None = None,
         start: str | None = None,
         **kwargs,
-    ) -> Iterator[read_directory_response.ReadDirectoryResponse]:
+    ) -> pagination.PageIterator[read_directory_response.ReadDirectoryResponse]:
         """Browse files in the directory with the specified ID.
 
         Args:
@@ -140,24 +123,87 @@ class BackupFilesystemDirectoriesV1ControllerPaginator:
                 get the first page.
                 Other pages can be traversed using HATEOAS links.
         """
-        controller = BackupFilesystemDirectoriesV1Controller(self.controller)
-        while True:
-            response = controller.read_backup_filesystem_directory(
+        controller = self.controller.get_controller(BackupFilesystemDirectoriesV1Controller)
+
+        def fetch_page(page_start: str | None) -> read_directory_response.ReadDirectoryResponse:
+            return controller.read_backup_filesystem_directory(
                 backup_id=backup_id,
                 filesystem_id=filesystem_id,
                 directory_id=directory_id,
                 limit=limit,
-                start=start,
+                start=page_start,
                 **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            operation='backup_filesystem_directories_v1.read_backup_filesystem_directory',
+        )
+
+
+class BackupFilesystemDirectoriesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for backup-filesystem-directories resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def read_backup_filesystem_directory(
+        self,
+        backup_id: str | None = None,
+        filesystem_id: str | None = None,
+        directory_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        **kwargs,
+    ) -> read_directory_response.ReadDirectoryResponse:
+        """Asynchronous counterpart of BackupFilesystemDirectoriesV1Controller.read_backup_filesystem_directory."""
+        controller = self.controller.get_controller(BackupFilesystemDirectoriesV1Controller)
+        return await self.controller.call(
+            controller.read_backup_filesystem_directory,
+            backup_id=backup_id,
+            filesystem_id=filesystem_id,
+            directory_id=directory_id,
+            limit=limit,
+            start=start,
+            **kwargs,
+        )
+
+
+class BackupFilesystemDirectoriesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for backup-filesystem-directories resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def read_backup_filesystem_directory(
+        self,
+        backup_id: str | None = None,
+        filesystem_id: str | None = None,
+        directory_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[read_directory_response.ReadDirectoryResponse]:
+        """Asynchronous counterpart of BackupFilesystemDirectoriesV1ControllerPaginator.read_backup_filesystem_directory."""
+        controller = self.controller.get_controller(BackupFilesystemDirectoriesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+        ) -> read_directory_response.ReadDirectoryResponse:
+            return await controller.read_backup_filesystem_directory(
+                backup_id=backup_id,
+                filesystem_id=filesystem_id,
+                directory_id=directory_id,
+                limit=limit,
+                start=page_start,
+                **kwargs,
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            operation='backup_filesystem_directories_v1.read_backup_filesystem_directory',
+        )
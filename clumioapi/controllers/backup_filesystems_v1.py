@@ -3,20 +3,17 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_file_systems_response
 from clumioapi.models import read_file_system_response
 import requests
-import retrying
 
 
 class BackupFilesystemsV1Controller:
@@ -70,23 +67,16 @@ class BackupFilesystemsV1Controller:
 
         resp_instance: list_file_systems_response.ListFileSystemsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_backup_filesystems for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_backup_filesystems',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/{backup_id}/filesystems',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -115,23 +105,16 @@ class BackupFilesystemsV1Controller:
 
         resp_instance: read_file_system_response.ReadFileSystemResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_filesystem for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_filesystem',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/{backup_id}/filesystems/{filesystem_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -142,18 +125,13 @@ class BackupFilesystemsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_backup_filesystems(
         self,
         backup_id: str | None = None,
         limit: int | None = None,
         start: str | None = None,
         **kwargs,
-    ) -> Iterator[list_file_systems_response.ListFileSystemsResponse]:
+    ) -> pagination.PageIterator[list_file_systems_response.ListFileSystemsResponse]:
         """Returns a list of filesystems.
 
         Args:
@@ -165,19 +143,82 @@ class BackupFilesystemsV1ControllerPaginator:
                 Sets the page number used to browse the collection.
                 Pages are indexed starting from 1 (i.e., `start=1`).
         """
-        controller = BackupFilesystemsV1Controller(self.controller)
-        while True:
-            response = controller.list_backup_filesystems(
-                backup_id=backup_id, limit=limit, start=start, **kwargs
+        controller = self.controller.get_controller(BackupFilesystemsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+        ) -> list_file_systems_response.ListFileSystemsResponse:
+            return controller.list_backup_filesystems(
+                backup_id=backup_id, limit=limit, start=page_start, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            operation='backup_filesystems_v1.list_backup_filesystems',
+        )
+
+
+class BackupFilesystemsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for backup-filesystems resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_backup_filesystems(
+        self,
+        backup_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        **kwargs,
+    ) -> list_file_systems_response.ListFileSystemsResponse:
+        """Asynchronous counterpart of BackupFilesystemsV1Controller.list_backup_filesystems."""
+        controller = self.controller.get_controller(BackupFilesystemsV1Controller)
+        return await self.controller.call(
+            controller.list_backup_filesystems,
+            backup_id=backup_id,
+            limit=limit,
+            start=start,
+            **kwargs,
+        )
+
+    async def read_filesystem(
+        self, filesystem_id: str | None = None, backup_id: str | None = None, **kwargs
+    ) -> read_file_system_response.ReadFileSystemResponse:
+        """Asynchronous counterpart of BackupFilesystemsV1Controller.read_filesystem."""
+        controller = self.controller.get_controller(BackupFilesystemsV1Controller)
+        return await self.controller.call(
+            controller.read_filesystem, filesystem_id=filesystem_id, backup_id=backup_id, **kwargs
+        )
+
+
+class BackupFilesystemsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for backup-filesystems resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_backup_filesystems(
+        self,
+        backup_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_file_systems_response.ListFileSystemsResponse]:
+        """Asynchronous counterpart of BackupFilesystemsV1ControllerPaginator.list_backup_filesystems."""
+        controller = self.controller.get_controller(BackupFilesystemsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+        ) -> list_file_systems_response.ListFileSystemsResponse:
+            return await controller.list_backup_filesystems(
+                backup_id=backup_id, limit=limit, start=page_start, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            operation='backup_filesystems_v1.list_backup_filesystems',
+        )
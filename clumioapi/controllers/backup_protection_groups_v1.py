@@ -3,23 +3,20 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import backup_protection_groups_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_protection_group_backups_response
 from clumioapi.models import list_protection_group_s3_asset_backups_response
 from clumioapi.models import read_protection_group_backup_response
 from clumioapi.models import read_protection_group_s3_asset_backup_response
 import requests
-import retrying
 
 
 class BackupProtectionGroupsV1Controller:
@@ -110,25 +107,16 @@ class BackupProtectionGroupsV1Controller:
 
         resp_instance: list_protection_group_backups_response.ListProtectionGroupBackupsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_backup_protection_groups for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_backup_protection_groups',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/protection-groups',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -224,23 +212,16 @@ class BackupProtectionGroupsV1Controller:
             list_protection_group_s3_asset_backups_response.ListProtectionGroupS3AssetBackupsResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_backup_protection_group_s3_assets for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_backup_protection_group_s3_assets',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/protection-groups/s3-assets',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -271,23 +252,16 @@ class BackupProtectionGroupsV1Controller:
             read_protection_group_s3_asset_backup_response.ReadProtectionGroupS3AssetBackupResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_backup_protection_group_s3_asset for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_backup_protection_group_s3_asset',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/protection-groups/s3-assets/{backup_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -316,25 +290,16 @@ class BackupProtectionGroupsV1Controller:
 
         resp_instance: read_protection_group_backup_response.ReadProtectionGroupBackupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'read_backup_protection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_backup_protection_group',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/protection-groups/{backup_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -345,11 +310,6 @@ class BackupProtectionGroupsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_backup_protection_groups(
         self,
         limit: int | None = None,
@@ -357,7 +317,9 @@ class BackupProtectionGroupsV1ControllerPaginator:
         sort: str | None = None,
         filter: backup_protection_groups_types.ListBackupProtectionGroupsV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_protection_group_backups_response.ListProtectionGroupBackupsResponse]:
+    ) -> pagination.PageIterator[
+        list_protection_group_backups_response.ListProtectionGroupBackupsResponse
+    ]:
         """Retrieves a list of protection group backups.
 
         Args:
@@ -404,28 +366,26 @@ class BackupProtectionGroupsV1ControllerPaginator:
                 +---------------------+-----------+--------------------------------------------+
 
         """
-        controller = BackupProtectionGroupsV1Controller(self.controller)
-        while True:
-            response = controller.list_backup_protection_groups(
-                limit=limit, start=start, sort=sort, filter=filter, **kwargs
+        controller = self.controller.get_controller(BackupProtectionGroupsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_protection_groups_types.ListBackupProtectionGroupsV1FilterT | None
+            ) = filter,
+        ) -> list_protection_group_backups_response.ListProtectionGroupBackupsResponse:
+            return controller.list_backup_protection_groups(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
-
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_protection_groups_v1.list_backup_protection_groups',
+        )
+
     def list_backup_protection_group_s3_assets(
         self,
         limit: int | None = None,
@@ -435,7 +395,7 @@ class BackupProtectionGroupsV1ControllerPaginator:
             backup_protection_groups_types.ListBackupProtectionGroupS3AssetsV1FilterT | None
         ) = None,
         **kwargs,
-    ) -> Iterator[
+    ) -> pagination.PageIterator[
         list_protection_group_s3_asset_backups_response.ListProtectionGroupS3AssetBackupsResponse
     ]:
         """Retrieves a list of protection group S3 asset backups.
@@ -499,19 +459,162 @@ class BackupProtectionGroupsV1ControllerPaginator:
                 +---------------------------------+-----------+--------------------------------+
 
         """
-        controller = BackupProtectionGroupsV1Controller(self.controller)
-        while True:
-            response = controller.list_backup_protection_group_s3_assets(
-                limit=limit, start=start, sort=sort, filter=filter, **kwargs
+        controller = self.controller.get_controller(BackupProtectionGroupsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_protection_groups_types.ListBackupProtectionGroupS3AssetsV1FilterT | None
+            ) = filter,
+        ) -> (
+            list_protection_group_s3_asset_backups_response.ListProtectionGroupS3AssetBackupsResponse
+        ):
+            return controller.list_backup_protection_group_s3_assets(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_protection_groups_v1.list_backup_protection_group_s3_assets',
+        )
+
+
+class BackupProtectionGroupsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for backup-protection-groups resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_backup_protection_groups(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: backup_protection_groups_types.ListBackupProtectionGroupsV1FilterT | None = None,
+        **kwargs,
+    ) -> list_protection_group_backups_response.ListProtectionGroupBackupsResponse:
+        """Asynchronous counterpart of BackupProtectionGroupsV1Controller.list_backup_protection_groups."""
+        controller = self.controller.get_controller(BackupProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.list_backup_protection_groups,
+            limit=limit,
+            start=start,
+            sort=sort,
+            filter=filter,
+            **kwargs,
+        )
+
+    async def list_backup_protection_group_s3_assets(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: (
+            backup_protection_groups_types.ListBackupProtectionGroupS3AssetsV1FilterT | None
+        ) = None,
+        **kwargs,
+    ) -> list_protection_group_s3_asset_backups_response.ListProtectionGroupS3AssetBackupsResponse:
+        """Asynchronous counterpart of BackupProtectionGroupsV1Controller.list_backup_protection_group_s3_assets."""
+        controller = self.controller.get_controller(BackupProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.list_backup_protection_group_s3_assets,
+            limit=limit,
+            start=start,
+            sort=sort,
+            filter=filter,
+            **kwargs,
+        )
+
+    async def read_backup_protection_group_s3_asset(
+        self, backup_id: str | None = None, **kwargs
+    ) -> read_protection_group_s3_asset_backup_response.ReadProtectionGroupS3AssetBackupResponse:
+        """Asynchronous counterpart of BackupProtectionGroupsV1Controller.read_backup_protection_group_s3_asset."""
+        controller = self.controller.get_controller(BackupProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.read_backup_protection_group_s3_asset, backup_id=backup_id, **kwargs
+        )
+
+    async def read_backup_protection_group(
+        self, backup_id: str | None = None, **kwargs
+    ) -> read_protection_group_backup_response.ReadProtectionGroupBackupResponse:
+        """Asynchronous counterpart of BackupProtectionGroupsV1Controller.read_backup_protection_group."""
+        controller = self.controller.get_controller(BackupProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.read_backup_protection_group, backup_id=backup_id, **kwargs
+        )
+
+
+class BackupProtectionGroupsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for backup-protection-groups resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_backup_protection_groups(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: backup_protection_groups_types.ListBackupProtectionGroupsV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_protection_group_backups_response.ListProtectionGroupBackupsResponse
+    ]:
+        """Asynchronous counterpart of BackupProtectionGroupsV1ControllerPaginator.list_backup_protection_groups."""
+        controller = self.controller.get_controller(BackupProtectionGroupsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_protection_groups_types.ListBackupProtectionGroupsV1FilterT | None
+            ) = filter,
+        ) -> list_protection_group_backups_response.ListProtectionGroupBackupsResponse:
+            return await controller.list_backup_protection_groups(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_protection_groups_v1.list_backup_protection_groups',
+        )
+
+    def list_backup_protection_group_s3_assets(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: (
+            backup_protection_groups_types.ListBackupProtectionGroupS3AssetsV1FilterT | None
+        ) = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_protection_group_s3_asset_backups_response.ListProtectionGroupS3AssetBackupsResponse
+    ]:
+        """Asynchronous counterpart of BackupProtectionGroupsV1ControllerPaginator.list_backup_protection_group_s3_assets."""
+        controller = self.controller.get_controller(BackupProtectionGroupsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                backup_protection_groups_types.ListBackupProtectionGroupS3AssetsV1FilterT | None
+            ) = filter,
+        ) -> (
+            list_protection_group_s3_asset_backups_response.ListProtectionGroupS3AssetBackupsResponse
+        ):
+            return await controller.list_backup_protection_group_s3_assets(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backup_protection_groups_v1.list_backup_protection_group_s3_assets',
+        )
@@ -3,21 +3,18 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import backups_files_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import file_list_response
 from clumioapi.models import file_search_response
 import requests
-import retrying
 
 
 class BackupsFilesV1Controller:
@@ -93,23 +90,16 @@ class BackupsFilesV1Controller:
 
         resp_instance: file_search_response.FileSearchResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_files for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_files',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/files/search',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -152,23 +142,16 @@ class BackupsFilesV1Controller:
 
         resp_instance: file_list_response.FileListResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_file_versions for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_file_versions',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/backups/files/search/{search_result_id}/versions',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -179,18 +162,13 @@ class BackupsFilesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_files(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: backups_files_types.ListFilesV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[file_search_response.FileSearchResponse]:
+    ) -> pagination.PageIterator[file_search_response.FileSearchResponse]:
         """Retrieve the list of files whose name matches a given regex pattern.
 
         Args:
@@ -224,33 +202,31 @@ class BackupsFilesV1ControllerPaginator:
                 +------------+------------------+----------------------------------------------+
 
         """
-        controller = BackupsFilesV1Controller(self.controller)
-        while True:
-            response = controller.list_files(limit=limit, start=start, filter=filter, **kwargs)
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
-
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
+        controller = self.controller.get_controller(BackupsFilesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: backups_files_types.ListFilesV1FilterT | None = filter,
+        ) -> file_search_response.FileSearchResponse:
+            return controller.list_files(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backups_files_v1.list_files',
+        )
+
     def list_file_versions(
         self,
         search_result_id: str | None = None,
         limit: int | None = None,
         start: str | None = None,
         **kwargs,
-    ) -> Iterator[file_list_response.FileListResponse]:
+    ) -> pagination.PageIterator[file_list_response.FileListResponse]:
         """Retrieve the list of versions of the file.
 
         Args:
@@ -263,19 +239,108 @@ class BackupsFilesV1ControllerPaginator:
                 get the first page.
                 Other pages can be traversed using HATEOAS links.
         """
-        controller = BackupsFilesV1Controller(self.controller)
-        while True:
-            response = controller.list_file_versions(
-                search_result_id=search_result_id, limit=limit, start=start, **kwargs
+        controller = self.controller.get_controller(BackupsFilesV1Controller)
+
+        def fetch_page(page_start: str | None) -> file_list_response.FileListResponse:
+            return controller.list_file_versions(
+                search_result_id=search_result_id, limit=limit, start=page_start, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            operation='backups_files_v1.list_file_versions',
+        )
+
+
+class BackupsFilesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for backups-files resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_files(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: backups_files_types.ListFilesV1FilterT | None = None,
+        **kwargs,
+    ) -> file_search_response.FileSearchResponse:
+        """Asynchronous counterpart of BackupsFilesV1Controller.list_files."""
+        controller = self.controller.get_controller(BackupsFilesV1Controller)
+        return await self.controller.call(
+            controller.list_files, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+    async def list_file_versions(
+        self,
+        search_result_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        **kwargs,
+    ) -> file_list_response.FileListResponse:
+        """Asynchronous counterpart of BackupsFilesV1Controller.list_file_versions."""
+        controller = self.controller.get_controller(BackupsFilesV1Controller)
+        return await self.controller.call(
+            controller.list_file_versions,
+            search_result_id=search_result_id,
+            limit=limit,
+            start=start,
+            **kwargs,
+        )
+
+
+class BackupsFilesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for backups-files resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_files(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: backups_files_types.ListFilesV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[file_search_response.FileSearchResponse]:
+        """Asynchronous counterpart of BackupsFilesV1ControllerPaginator.list_files."""
+        controller = self.controller.get_controller(BackupsFilesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: backups_files_types.ListFilesV1FilterT | None = filter,
+        ) -> file_search_response.FileSearchResponse:
+            return await controller.list_files(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='backups_files_v1.list_files',
+        )
+
+    def list_file_versions(
+        self,
+        search_result_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[file_list_response.FileListResponse]:
+        """Asynchronous counterpart of BackupsFilesV1ControllerPaginator.list_file_versions."""
+        controller = self.controller.get_controller(BackupsFilesV1AsyncController)
+
+        async def fetch_page(page_start: str | None) -> file_list_response.FileListResponse:
+            return await controller.list_file_versions(
+                search_result_id=search_result_id, limit=limit, start=page_start, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            operation='backups_files_v1.list_file_versions',
+        )
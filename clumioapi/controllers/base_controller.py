@@ -2,14 +2,42 @@
 # Copyright 2023. Clumio, A Commvault Company.
 #
 
+import asyncio
 import contextlib
-from typing import Any, Mapping, Optional
+import dataclasses
+import time
+from typing import Any, Awaitable, Callable, cast, Mapping, Optional, Sequence, TypeVar
+import urllib.parse
 
 from clumioapi import api_helper
+from clumioapi import async_transport
 from clumioapi import configuration
+from clumioapi import http_cache
+from clumioapi import instrumentation
+from clumioapi import lazy_model
+from clumioapi import rate_limiter
+from clumioapi import retry_policy
+from clumioapi.exceptions import clumio_exception
 import requests
+from requests import adapters
 import rest3client
 
+T = TypeVar('T')
+B = TypeVar('B', bound='BaseController')
+
+
+@dataclasses.dataclass(slots=True)
+class _RequestOptions:
+    """The options of a call, given to request or taken from the configuration."""
+
+    retain_raw_response: bool
+    raw_json: bool
+    lazy_models: bool
+    policy: retry_policy.RetryPolicy
+    limiter: rate_limiter.RateLimiter | None
+    cache: http_cache.ResponseCache | None
+    hooks: Sequence[instrumentation.RequestHooks]
+
 
 class BaseController:
     """All controllers inherit from this base class.
@@ -30,5 +58,355 @@ class BaseController:
             self.client: rest3client.RESTclient = rest3client.RESTclient(
                 hostname=config.hostname,
                 bearer_token=config.api_token,
-                retry=[{'stop_max_attempt_number': 5, 'wait_fixed': 1000}],
             )
+            # All the controllers of a client share this session. Its connection pool is
+            # thread-safe, so it must be sized for the number of threads using the client.
+            self.client.session.mount(
+                'https://',
+                adapters.HTTPAdapter(
+                    pool_connections=config.pool_size,
+                    pool_maxsize=config.max_connections_per_host,
+                    pool_block=config.pool_block,
+                ),
+            )
+            if not config.keep_alive:
+                self.client.session.headers['Connection'] = 'close'
+        self._controllers: dict[Callable[..., Any], Any] = {}
+        self._config_revision = config.revision
+
+    def get_controller(self: B, controller_class: Callable[[B], T]) -> T:
+        """Returns the controller of the given class built on this one.
+
+        The controller is built once and reused until organizational_unit_context or
+        custom_headers is assigned on the configuration, or invalidate_controllers is called.
+        """
+        if self._config_revision != self.config.revision:
+            self.invalidate_controllers()
+        try:
+            return self._controllers[controller_class]
+        except KeyError:
+            return self._controllers.setdefault(controller_class, controller_class(self))
+
+    def invalidate_controllers(self) -> None:
+        """Discards the controllers built by get_controller."""
+        self._config_revision = self.config.revision
+        self._controllers = {}
+
+    def request(
+        self,
+        operation: str,
+        method: str,
+        url_path: str,
+        parse: Callable[[requests.Response], T],
+        headers: Mapping[str, str],
+        params: Mapping[str, Any],
+        url_template: str | None = None,
+        **kwargs,
+    ) -> T:
+        """Sends a request on behalf of a controller method and parses its response.
+
+        The hooks of the call are notified of the request, its retries, its response and the
+        error it raises, if any. See instrumentation.
+
+        Args:
+            operation: Name of the controller method, used in error messages and by the hooks.
+            method: The HTTP verb of the request.
+            url_path: The path of the endpoint, with the template parameters replaced.
+            parse: Function creating the returned object from the response.
+            headers: The headers of the request.
+            params: The query parameters of the request.
+            url_template: The path template of the endpoint, reported to the hooks. Defaults
+                to url_path.
+            kwargs: Passed on to the HttpClient. retain_raw_response, retry_policy,
+                rate_limiter, response_cache, lazy_models and hooks, if given, override the
+                Configuration attributes of the same name for this call. If raw_json is
+                True, the decoded JSON body is returned instead of the parsed model.
+        Returns:
+            The object created by parse, or the decoded JSON body if raw_json is True.
+        Raises:
+            ClumioException: If the API server responds with an error.
+        """
+        options = self._options(kwargs)
+        info = _request_info(operation, method, url_path, headers, params, url_template)
+        for hook in options.hooks:
+            hook.pre_request(info)
+        try:
+            token = instrumentation.set_current_request(info)
+            try:
+                resp = self._fetch(
+                    options.cache,
+                    options.policy,
+                    options.limiter,
+                    options.hooks,
+                    info,
+                    headers=headers,
+                    params=params,
+                    **kwargs,
+                )
+            finally:
+                instrumentation.reset_current_request(token)
+            return self._parse_response(operation, info, resp, parse, options)
+        except Exception as e:
+            for hook in options.hooks:
+                hook.on_error(info, e)
+            raise
+
+    def _options(self, kwargs: dict[str, Any]) -> _RequestOptions:
+        """Pops the options of a call from the keyword arguments of request."""
+        if (timeout := self.config.timeout) is not None:
+            kwargs.setdefault('timeout', timeout)
+        return _RequestOptions(
+            retain_raw_response=kwargs.pop('retain_raw_response', self.config.retain_raw_response),
+            raw_json=kwargs.pop('raw_json', False),
+            lazy_models=kwargs.pop('lazy_models', self.config.lazy_models),
+            policy=kwargs.pop('retry_policy', None) or self.config.retry_policy,
+            limiter=kwargs.pop('rate_limiter', self.config.rate_limiter),
+            cache=kwargs.pop('response_cache', self.config.response_cache),
+            hooks=kwargs.pop('hooks', self.config.hooks),
+        )
+
+    def _parse_response(
+        self,
+        operation: str,
+        info: instrumentation.RequestInfo,
+        resp: requests.Response,
+        parse: Callable[[requests.Response], T],
+        options: _RequestOptions,
+    ) -> T:
+        """Notifies the hooks of the response and returns the object created from it."""
+        info.status_code = resp.status_code
+        for hook in options.hooks:
+            hook.post_response(info, resp)
+        if not resp.ok:
+            error_str = f'{operation} for url {urllib.parse.unquote(resp.url)} failed.'
+            raise clumio_exception.ClumioException(error_str, resp=resp)
+
+        if options.raw_json:
+            return api_helper.decode_json(resp.content) if resp.content else None  # type: ignore
+        with lazy_model.enabled(options.lazy_models):
+            resp_instance = parse(resp)
+        if (
+            not options.retain_raw_response
+            and getattr(resp_instance, 'raw_response', None) is not None
+        ):
+            resp_instance.raw_response = None  # type: ignore
+        return resp_instance
+
+    def _fetch(
+        self,
+        cache: http_cache.ResponseCache | None,
+        policy: retry_policy.RetryPolicy,
+        limiter: rate_limiter.RateLimiter | None,
+        hooks: Sequence[instrumentation.RequestHooks],
+        info: instrumentation.RequestInfo,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any],
+        **kwargs,
+    ) -> requests.Response:
+        """Returns the response to a request, from the response cache if possible."""
+        method, url_path = info.method, info.url_path
+        if cache is not None and method == 'get':
+            return cache.fetch(
+                url_path,
+                headers,
+                params,
+                lambda cache_headers: self._send(
+                    policy,
+                    limiter,
+                    hooks,
+                    info,
+                    headers=cache_headers,
+                    params=params,
+                    **kwargs,
+                ),
+                http_cache.cache_namespace(self.config.hostname, self.config.api_token),
+            )
+        resp = self._send(policy, limiter, hooks, info, headers=headers, params=params, **kwargs)
+        if cache is not None and resp.ok:
+            cache.invalidate(url_path)
+        return resp
+
+    def _send(
+        self,
+        policy: retry_policy.RetryPolicy,
+        limiter: rate_limiter.RateLimiter | None,
+        hooks: Sequence[instrumentation.RequestHooks],
+        info: instrumentation.RequestInfo,
+        headers: Mapping[str, str],
+        **kwargs,
+    ) -> requests.Response:
+        """Sends a request, retrying it as allowed by the retry policy.
+
+        Every attempt waits for the rate limiter, if any. info.attempt is kept up to date.
+        The HttpClient is given a copy of the headers, as it adds its own to the dict it is
+        given, and the headers of a controller are shared by all the threads using it.
+        """
+        method, url_path = info.method, info.url_path
+        attempt = 1
+        while True:
+            info.attempt = attempt
+            if limiter is not None:
+                limiter.acquire(url_path)
+            resp: requests.Response
+            try:
+                resp = getattr(self.client, method)(
+                    url_path, raw_response=True, headers=dict(headers), **kwargs
+                )
+            except requests.exceptions.HTTPError as e:
+                if e.response is None:
+                    raise
+                resp = e.response
+            except requests.exceptions.RequestException as e:
+                if not policy.should_retry(method, attempt, error=e):
+                    raise
+                delay = policy.delay(attempt)
+                for hook in hooks:
+                    hook.on_retry(info, delay, None, e)
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if resp.ok or not policy.should_retry(method, attempt, response=resp):
+                return resp
+            delay = policy.delay(attempt, resp)
+            for hook in hooks:
+                hook.on_retry(info, delay, resp, None)
+            time.sleep(delay)
+            attempt += 1
+
+
+class AsyncBaseController(BaseController):
+    """Base controller of the asynchronous controllers of the AsyncClumioAPIClient.
+
+    The asynchronous controllers call the methods of the synchronous controllers built on this
+    one. Their requests are made by the request method of this controller, which returns a
+    coroutine sending the request over the transport, so a controller method builds its
+    request only once and its response is parsed once received.
+
+    Attributes:
+        transport: The AsyncTransport sending the requests.
+    """
+
+    def __init__(
+        self, config: configuration.Configuration, transport: async_transport.AsyncTransport
+    ) -> None:
+        super().__init__(config)
+        self.transport = transport
+
+    async def call(self, method: Callable[..., T], /, **kwargs) -> T:
+        """Calls a method of a synchronous controller built on this one and awaits its result."""
+        return await cast(Awaitable[T], method(**kwargs))
+
+    def request(
+        self,
+        operation: str,
+        method: str,
+        url_path: str,
+        parse: Callable[[requests.Response], T],
+        headers: Mapping[str, str],
+        params: Mapping[str, Any],
+        url_template: str | None = None,
+        **kwargs,
+    ) -> Any:
+        """Returns a coroutine sending a request and parsing its response.
+
+        The arguments are the same as those of BaseController.request. The response cache is
+        not read, but the successful requests other than GET invalidate it as usual.
+
+        Raises:
+            TypeError: If the call is given an argument the transport does not support.
+        """
+        return self._request(
+            operation, method, url_path, parse, headers, params, url_template, kwargs
+        )
+
+    async def _request(
+        self,
+        operation: str,
+        method: str,
+        url_path: str,
+        parse: Callable[[requests.Response], T],
+        headers: Mapping[str, str],
+        params: Mapping[str, Any],
+        url_template: str | None,
+        kwargs: dict[str, Any],
+    ) -> T:
+        options = self._options(kwargs)
+        info = _request_info(operation, method, url_path, headers, params, url_template)
+        for hook in options.hooks:
+            hook.pre_request(info)
+        try:
+            token = instrumentation.set_current_request(info)
+            try:
+                resp = await self._send_async(
+                    options.policy,
+                    options.limiter,
+                    options.hooks,
+                    info,
+                    headers=headers,
+                    params=params,
+                    **kwargs,
+                )
+            finally:
+                instrumentation.reset_current_request(token)
+            if options.cache is not None and method != 'get' and resp.ok:
+                options.cache.invalidate(url_path)
+            return self._parse_response(operation, info, resp, parse, options)
+        except Exception as e:
+            for hook in options.hooks:
+                hook.on_error(info, e)
+            raise
+
+    async def _send_async(
+        self,
+        policy: retry_policy.RetryPolicy,
+        limiter: rate_limiter.RateLimiter | None,
+        hooks: Sequence[instrumentation.RequestHooks],
+        info: instrumentation.RequestInfo,
+        **kwargs,
+    ) -> requests.Response:
+        """Asynchronous counterpart of _send, sending the request over the transport."""
+        method, url_path = info.method, info.url_path
+        attempt = 1
+        while True:
+            info.attempt = attempt
+            if limiter is not None:
+                await limiter.acquire_async(url_path)
+            try:
+                resp = await self.transport.request(method, url_path, **kwargs)
+            except requests.exceptions.RequestException as e:
+                if not policy.should_retry(method, attempt, error=e):
+                    raise
+                delay = policy.delay(attempt)
+                for hook in hooks:
+                    hook.on_retry(info, delay, None, e)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            if resp.ok or not policy.should_retry(method, attempt, response=resp):
+                return resp
+            delay = policy.delay(attempt, resp)
+            for hook in hooks:
+                hook.on_retry(info, delay, resp, None)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def _request_info(
+    operation: str,
+    method: str,
+    url_path: str,
+    headers: Mapping[str, str],
+    params: Mapping[str, Any],
+    url_template: str | None,
+) -> instrumentation.RequestInfo:
+    """Describes a request to the hooks."""
+    return instrumentation.RequestInfo(
+        operation,
+        method,
+        url_template or url_path,
+        url_path,
+        headers.get('x-clumio-organizationalunit-context') or '',
+        params,
+    )
@@ -3,23 +3,20 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import consolidated_alerts_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_consolidated_alerts_response
 from clumioapi.models import read_consolidated_alert_response
 from clumioapi.models import update_consolidated_alert_response
 from clumioapi.models import update_consolidated_alert_v1_request
 import requests
-import retrying
 
 
 class ConsolidatedAlertsV1Controller:
@@ -120,23 +117,16 @@ class ConsolidatedAlertsV1Controller:
 
         resp_instance: list_consolidated_alerts_response.ListConsolidatedAlertsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_consolidated_alerts for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_consolidated_alerts',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/alerts/consolidated',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -163,23 +153,16 @@ class ConsolidatedAlertsV1Controller:
 
         resp_instance: read_consolidated_alert_response.ReadConsolidatedAlertResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_consolidated_alert for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_consolidated_alert',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/alerts/consolidated/{id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -212,26 +195,17 @@ class ConsolidatedAlertsV1Controller:
 
         resp_instance: update_consolidated_alert_response.UpdateConsolidatedAlertResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.patch(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'update_consolidated_alert for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_consolidated_alert',
+            'patch',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/alerts/consolidated/{id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -242,18 +216,13 @@ class ConsolidatedAlertsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_consolidated_alerts(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: consolidated_alerts_types.ListConsolidatedAlertsV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_consolidated_alerts_response.ListConsolidatedAlertsResponse]:
+    ) -> pagination.PageIterator[list_consolidated_alerts_response.ListConsolidatedAlertsResponse]:
         """Returns a list of consolidated alerts.
 
         Args:
@@ -312,19 +281,94 @@ class ConsolidatedAlertsV1ControllerPaginator:
                 +-----------------------------+------------------+-----------------------------+
 
         """
-        controller = ConsolidatedAlertsV1Controller(self.controller)
-        while True:
-            response = controller.list_consolidated_alerts(
-                limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(ConsolidatedAlertsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: consolidated_alerts_types.ListConsolidatedAlertsV1FilterT | None = filter,
+        ) -> list_consolidated_alerts_response.ListConsolidatedAlertsResponse:
+            return controller.list_consolidated_alerts(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='consolidated_alerts_v1.list_consolidated_alerts',
+        )
+
+
+class ConsolidatedAlertsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for consolidated-alerts resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_consolidated_alerts(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: consolidated_alerts_types.ListConsolidatedAlertsV1FilterT | None = None,
+        **kwargs,
+    ) -> list_consolidated_alerts_response.ListConsolidatedAlertsResponse:
+        """Asynchronous counterpart of ConsolidatedAlertsV1Controller.list_consolidated_alerts."""
+        controller = self.controller.get_controller(ConsolidatedAlertsV1Controller)
+        return await self.controller.call(
+            controller.list_consolidated_alerts, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+    async def read_consolidated_alert(
+        self, id: str | None = None, **kwargs
+    ) -> read_consolidated_alert_response.ReadConsolidatedAlertResponse:
+        """Asynchronous counterpart of ConsolidatedAlertsV1Controller.read_consolidated_alert."""
+        controller = self.controller.get_controller(ConsolidatedAlertsV1Controller)
+        return await self.controller.call(controller.read_consolidated_alert, id=id, **kwargs)
+
+    async def update_consolidated_alert(
+        self,
+        id: str | None = None,
+        body: update_consolidated_alert_v1_request.UpdateConsolidatedAlertV1Request | None = None,
+        **kwargs,
+    ) -> update_consolidated_alert_response.UpdateConsolidatedAlertResponse:
+        """Asynchronous counterpart of ConsolidatedAlertsV1Controller.update_consolidated_alert."""
+        controller = self.controller.get_controller(ConsolidatedAlertsV1Controller)
+        return await self.controller.call(
+            controller.update_consolidated_alert, id=id, body=body, **kwargs
+        )
+
+
+class ConsolidatedAlertsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for consolidated-alerts resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_consolidated_alerts(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: consolidated_alerts_types.ListConsolidatedAlertsV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_consolidated_alerts_response.ListConsolidatedAlertsResponse
+    ]:
+        """Asynchronous counterpart of ConsolidatedAlertsV1ControllerPaginator.list_consolidated_alerts."""
+        controller = self.controller.get_controller(ConsolidatedAlertsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: consolidated_alerts_types.ListConsolidatedAlertsV1FilterT | None = filter,
+        ) -> list_consolidated_alerts_response.ListConsolidatedAlertsResponse:
+            return await controller.list_consolidated_alerts(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='consolidated_alerts_v1.list_consolidated_alerts',
+        )
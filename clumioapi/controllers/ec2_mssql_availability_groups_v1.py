@@ -3,21 +3,18 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import ec2_mssql_availability_groups_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_ec2_mssql_a_gs_response
 from clumioapi.models import read_ec2_mssql_ag_response
 import requests
-import retrying
 
 
 class Ec2MssqlAvailabilityGroupsV1Controller:
@@ -130,23 +127,16 @@ class Ec2MssqlAvailabilityGroupsV1Controller:
 
         resp_instance: list_ec2_mssql_a_gs_response.ListEC2MssqlAGsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_ec2_mssql_availability_groups for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_ec2_mssql_availability_groups',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ec2-mssql/availability-groups',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -202,23 +192,16 @@ class Ec2MssqlAvailabilityGroupsV1Controller:
 
         resp_instance: read_ec2_mssql_ag_response.ReadEC2MssqlAGResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_ec2_mssql_availability_group for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_ec2_mssql_availability_group',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ec2-mssql/availability-groups/{availability_group_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -229,11 +212,6 @@ class Ec2MssqlAvailabilityGroupsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_ec2_mssql_availability_groups(
         self,
         limit: int | None = None,
@@ -244,7 +222,7 @@ class Ec2MssqlAvailabilityGroupsV1ControllerPaginator:
         embed: str | None = None,
         lookback_days: int | None = None,
         **kwargs,
-    ) -> Iterator[list_ec2_mssql_a_gs_response.ListEC2MssqlAGsResponse]:
+    ) -> pagination.PageIterator[list_ec2_mssql_a_gs_response.ListEC2MssqlAGsResponse]:
         """Returns a list of Availability Groups.
 
         Args:
@@ -311,24 +289,118 @@ class Ec2MssqlAvailabilityGroupsV1ControllerPaginator:
             lookback_days:
                 Calculate backup status for the last `lookback_days` days.
         """
-        controller = Ec2MssqlAvailabilityGroupsV1Controller(self.controller)
-        while True:
-            response = controller.list_ec2_mssql_availability_groups(
+        controller = self.controller.get_controller(Ec2MssqlAvailabilityGroupsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                ec2_mssql_availability_groups_types.ListEc2MssqlAvailabilityGroupsV1FilterT | None
+            ) = filter,
+        ) -> list_ec2_mssql_a_gs_response.ListEC2MssqlAGsResponse:
+            return controller.list_ec2_mssql_availability_groups(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                embed=embed,
+                lookback_days=lookback_days,
+                **kwargs,
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='ec2_mssql_availability_groups_v1.list_ec2_mssql_availability_groups',
+        )
+
+
+class Ec2MssqlAvailabilityGroupsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for ec2-mssql-availability-groups resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_ec2_mssql_availability_groups(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            ec2_mssql_availability_groups_types.ListEc2MssqlAvailabilityGroupsV1FilterT | None
+        ) = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> list_ec2_mssql_a_gs_response.ListEC2MssqlAGsResponse:
+        """Asynchronous counterpart of Ec2MssqlAvailabilityGroupsV1Controller.list_ec2_mssql_availability_groups."""
+        controller = self.controller.get_controller(Ec2MssqlAvailabilityGroupsV1Controller)
+        return await self.controller.call(
+            controller.list_ec2_mssql_availability_groups,
+            limit=limit,
+            start=start,
+            filter=filter,
+            embed=embed,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def read_ec2_mssql_availability_group(
+        self,
+        availability_group_id: str | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> read_ec2_mssql_ag_response.ReadEC2MssqlAGResponse:
+        """Asynchronous counterpart of Ec2MssqlAvailabilityGroupsV1Controller.read_ec2_mssql_availability_group."""
+        controller = self.controller.get_controller(Ec2MssqlAvailabilityGroupsV1Controller)
+        return await self.controller.call(
+            controller.read_ec2_mssql_availability_group,
+            availability_group_id=availability_group_id,
+            embed=embed,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+
+class Ec2MssqlAvailabilityGroupsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for ec2-mssql-availability-groups resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_ec2_mssql_availability_groups(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            ec2_mssql_availability_groups_types.ListEc2MssqlAvailabilityGroupsV1FilterT | None
+        ) = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_ec2_mssql_a_gs_response.ListEC2MssqlAGsResponse]:
+        """Asynchronous counterpart of Ec2MssqlAvailabilityGroupsV1ControllerPaginator.list_ec2_mssql_availability_groups."""
+        controller = self.controller.get_controller(Ec2MssqlAvailabilityGroupsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                ec2_mssql_availability_groups_types.ListEc2MssqlAvailabilityGroupsV1FilterT | None
+            ) = filter,
+        ) -> list_ec2_mssql_a_gs_response.ListEC2MssqlAGsResponse:
+            return await controller.list_ec2_mssql_availability_groups(
                 limit=limit,
-                start=start,
-                filter=filter,
+                start=page_start,
+                filter=page_filter,
                 embed=embed,
                 lookback_days=lookback_days,
                 **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='ec2_mssql_availability_groups_v1.list_ec2_mssql_availability_groups',
+        )
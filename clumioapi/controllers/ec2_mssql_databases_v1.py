@@ -3,22 +3,19 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import ec2_mssql_databases_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_ec2_mssql_database_pitr_intervals_response
 from clumioapi.models import list_ec2_mssql_databases_response
 from clumioapi.models import read_ec2_mssql_database_response
 import requests
-import retrying
 
 
 class Ec2MssqlDatabasesV1Controller:
@@ -162,23 +159,16 @@ class Ec2MssqlDatabasesV1Controller:
 
         resp_instance: list_ec2_mssql_databases_response.ListEC2MSSQLDatabasesResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_ec2_mssql_databases for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_ec2_mssql_databases',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ec2-mssql/databases',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -210,23 +200,16 @@ class Ec2MssqlDatabasesV1Controller:
 
         resp_instance: read_ec2_mssql_database_response.ReadEC2MSSQLDatabaseResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_ec2_mssql_database for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_ec2_mssql_database',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ec2-mssql/databases/{database_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -290,23 +273,16 @@ class Ec2MssqlDatabasesV1Controller:
             list_ec2_mssql_database_pitr_intervals_response.ListEC2MssqlDatabasePitrIntervalsResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_ec2_mssql_database_pitr_intervals for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_ec2_mssql_database_pitr_intervals',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ec2-mssql/databases/{database_id}/pitr-intervals',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -317,11 +293,6 @@ class Ec2MssqlDatabasesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_ec2_mssql_databases(
         self,
         limit: int | None = None,
@@ -330,7 +301,7 @@ class Ec2MssqlDatabasesV1ControllerPaginator:
         embed: str | None = None,
         lookback_days: int | None = None,
         **kwargs,
-    ) -> Iterator[list_ec2_mssql_databases_response.ListEC2MSSQLDatabasesResponse]:
+    ) -> pagination.PageIterator[list_ec2_mssql_databases_response.ListEC2MSSQLDatabasesResponse]:
         """Returns a list of Databases
 
         Args:
@@ -428,33 +399,29 @@ class Ec2MssqlDatabasesV1ControllerPaginator:
             lookback_days:
                 Calculate backup status for the last `lookback_days` days.
         """
-        controller = Ec2MssqlDatabasesV1Controller(self.controller)
-        while True:
-            response = controller.list_ec2_mssql_databases(
+        controller = self.controller.get_controller(Ec2MssqlDatabasesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: ec2_mssql_databases_types.ListEc2MssqlDatabasesV1FilterT | None = filter,
+        ) -> list_ec2_mssql_databases_response.ListEC2MSSQLDatabasesResponse:
+            return controller.list_ec2_mssql_databases(
                 limit=limit,
-                start=start,
-                filter=filter,
+                start=page_start,
+                filter=page_filter,
                 embed=embed,
                 lookback_days=lookback_days,
                 **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
-
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='ec2_mssql_databases_v1.list_ec2_mssql_databases',
+        )
+
     def list_ec2_mssql_database_pitr_intervals(
         self,
         database_id: str | None = None,
@@ -462,7 +429,7 @@ class Ec2MssqlDatabasesV1ControllerPaginator:
         start: str | None = None,
         filter: ec2_mssql_databases_types.ListEc2MssqlDatabasePitrIntervalsV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[
+    ) -> pagination.PageIterator[
         list_ec2_mssql_database_pitr_intervals_response.ListEC2MssqlDatabasePitrIntervalsResponse
     ]:
         """Returns a list of time intervals (start timestamp and end timestamp) in which
@@ -492,19 +459,158 @@ class Ec2MssqlDatabasesV1ControllerPaginator:
                 +-----------+------------------+-----------------------------------------------+
 
         """
-        controller = Ec2MssqlDatabasesV1Controller(self.controller)
-        while True:
-            response = controller.list_ec2_mssql_database_pitr_intervals(
-                database_id=database_id, limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(Ec2MssqlDatabasesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                ec2_mssql_databases_types.ListEc2MssqlDatabasePitrIntervalsV1FilterT | None
+            ) = filter,
+        ) -> (
+            list_ec2_mssql_database_pitr_intervals_response.ListEC2MssqlDatabasePitrIntervalsResponse
+        ):
+            return controller.list_ec2_mssql_database_pitr_intervals(
+                database_id=database_id, limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='ec2_mssql_databases_v1.list_ec2_mssql_database_pitr_intervals',
+        )
+
+
+class Ec2MssqlDatabasesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for ec2-mssql-databases resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_ec2_mssql_databases(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: ec2_mssql_databases_types.ListEc2MssqlDatabasesV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> list_ec2_mssql_databases_response.ListEC2MSSQLDatabasesResponse:
+        """Asynchronous counterpart of Ec2MssqlDatabasesV1Controller.list_ec2_mssql_databases."""
+        controller = self.controller.get_controller(Ec2MssqlDatabasesV1Controller)
+        return await self.controller.call(
+            controller.list_ec2_mssql_databases,
+            limit=limit,
+            start=start,
+            filter=filter,
+            embed=embed,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def read_ec2_mssql_database(
+        self, database_id: str | None = None, lookback_days: int | None = None, **kwargs
+    ) -> read_ec2_mssql_database_response.ReadEC2MSSQLDatabaseResponse:
+        """Asynchronous counterpart of Ec2MssqlDatabasesV1Controller.read_ec2_mssql_database."""
+        controller = self.controller.get_controller(Ec2MssqlDatabasesV1Controller)
+        return await self.controller.call(
+            controller.read_ec2_mssql_database,
+            database_id=database_id,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def list_ec2_mssql_database_pitr_intervals(
+        self,
+        database_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: ec2_mssql_databases_types.ListEc2MssqlDatabasePitrIntervalsV1FilterT | None = None,
+        **kwargs,
+    ) -> list_ec2_mssql_database_pitr_intervals_response.ListEC2MssqlDatabasePitrIntervalsResponse:
+        """Asynchronous counterpart of Ec2MssqlDatabasesV1Controller.list_ec2_mssql_database_pitr_intervals."""
+        controller = self.controller.get_controller(Ec2MssqlDatabasesV1Controller)
+        return await self.controller.call(
+            controller.list_ec2_mssql_database_pitr_intervals,
+            database_id=database_id,
+            limit=limit,
+            start=start,
+            filter=filter,
+            **kwargs,
+        )
+
+
+class Ec2MssqlDatabasesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for ec2-mssql-databases resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_ec2_mssql_databases(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: ec2_mssql_databases_types.ListEc2MssqlDatabasesV1FilterT | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_ec2_mssql_databases_response.ListEC2MSSQLDatabasesResponse
+    ]:
+        """Asynchronous counterpart of Ec2MssqlDatabasesV1ControllerPaginator.list_ec2_mssql_databases."""
+        controller = self.controller.get_controller(Ec2MssqlDatabasesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: ec2_mssql_databases_types.ListEc2MssqlDatabasesV1FilterT | None = filter,
+        ) -> list_ec2_mssql_databases_response.ListEC2MSSQLDatabasesResponse:
+            return await controller.list_ec2_mssql_databases(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                embed=embed,
+                lookback_days=lookback_days,
+                **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='ec2_mssql_databases_v1.list_ec2_mssql_databases',
+        )
+
+    def list_ec2_mssql_database_pitr_intervals(
+        self,
+        database_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: ec2_mssql_databases_types.ListEc2MssqlDatabasePitrIntervalsV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_ec2_mssql_database_pitr_intervals_response.ListEC2MssqlDatabasePitrIntervalsResponse
+    ]:
+        """Asynchronous counterpart of Ec2MssqlDatabasesV1ControllerPaginator.list_ec2_mssql_database_pitr_intervals."""
+        controller = self.controller.get_controller(Ec2MssqlDatabasesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                ec2_mssql_databases_types.ListEc2MssqlDatabasePitrIntervalsV1FilterT | None
+            ) = filter,
+        ) -> (
+            list_ec2_mssql_database_pitr_intervals_response.ListEC2MssqlDatabasePitrIntervalsResponse
+        ):
+            return await controller.list_ec2_mssql_database_pitr_intervals(
+                database_id=database_id, limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='ec2_mssql_databases_v1.list_ec2_mssql_database_pitr_intervals',
+        )
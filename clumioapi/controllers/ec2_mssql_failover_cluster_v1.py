@@ -3,19 +3,15 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import read_ec2_mssqlfci_response
 import requests
-import retrying
 
 
 class Ec2MssqlFailoverClusterV1Controller:
@@ -97,25 +93,16 @@ class Ec2MssqlFailoverClusterV1Controller:
 
         resp_instance: read_ec2_mssqlfci_response.ReadEC2MSSQLFCIResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'read_ec2_mssql_failover_cluster for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_ec2_mssql_failover_cluster',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ec2-mssql/failover-clusters/{failover_cluster_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -125,3 +112,34 @@ class Ec2MssqlFailoverClusterV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class Ec2MssqlFailoverClusterV1AsyncController:
+    """An asynchronous Controller to access Endpoints for ec2-mssql-failover-cluster resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def read_ec2_mssql_failover_cluster(
+        self,
+        failover_cluster_id: str | None = None,
+        embed: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> read_ec2_mssqlfci_response.ReadEC2MSSQLFCIResponse:
+        """Asynchronous counterpart of Ec2MssqlFailoverClusterV1Controller.read_ec2_mssql_failover_cluster."""
+        controller = self.controller.get_controller(Ec2MssqlFailoverClusterV1Controller)
+        return await self.controller.call(
+            controller.read_ec2_mssql_failover_cluster,
+            failover_cluster_id=failover_cluster_id,
+            embed=embed,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+
+class Ec2MssqlFailoverClusterV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for ec2-mssql-failover-cluster resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
@@ -3,21 +3,18 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import ec2_mssql_hosts_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_ec2_mssql_inv_hosts_response
 from clumioapi.models import read_ec2_mssql_inv_host_response
 import requests
-import retrying
 
 
 class Ec2MssqlHostsV1Controller:
@@ -113,23 +110,16 @@ class Ec2MssqlHostsV1Controller:
 
         resp_instance: list_ec2_mssql_inv_hosts_response.ListEC2MSSQLInvHostsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_ec2_mssql_hosts for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_ec2_mssql_hosts',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ec2-mssql/hosts',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -154,23 +144,16 @@ class Ec2MssqlHostsV1Controller:
 
         resp_instance: read_ec2_mssql_inv_host_response.ReadEC2MSSQLInvHostResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_ec2_mssql_host for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_ec2_mssql_host',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ec2-mssql/hosts/{host_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -181,11 +164,6 @@ class Ec2MssqlHostsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_ec2_mssql_hosts(
         self,
         limit: int | None = None,
@@ -193,7 +171,7 @@ class Ec2MssqlHostsV1ControllerPaginator:
         filter: ec2_mssql_hosts_types.ListEc2MssqlHostsV1FilterT | None = None,
         embed: str | None = None,
         **kwargs,
-    ) -> Iterator[list_ec2_mssql_inv_hosts_response.ListEC2MSSQLInvHostsResponse]:
+    ) -> pagination.PageIterator[list_ec2_mssql_inv_hosts_response.ListEC2MSSQLInvHostsResponse]:
         """Returns a list of EC2 MSSQL hosts
 
         Args:
@@ -245,19 +223,89 @@ class Ec2MssqlHostsV1ControllerPaginator:
                 For more information about embedded links, refer to the
                 Embedding Referenced Resources section of this guide.
         """
-        controller = Ec2MssqlHostsV1Controller(self.controller)
-        while True:
-            response = controller.list_ec2_mssql_hosts(
-                limit=limit, start=start, filter=filter, embed=embed, **kwargs
+        controller = self.controller.get_controller(Ec2MssqlHostsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: ec2_mssql_hosts_types.ListEc2MssqlHostsV1FilterT | None = filter,
+        ) -> list_ec2_mssql_inv_hosts_response.ListEC2MSSQLInvHostsResponse:
+            return controller.list_ec2_mssql_hosts(
+                limit=limit, start=page_start, filter=page_filter, embed=embed, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='ec2_mssql_hosts_v1.list_ec2_mssql_hosts',
+        )
+
+
+class Ec2MssqlHostsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for ec2-mssql-hosts resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_ec2_mssql_hosts(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: ec2_mssql_hosts_types.ListEc2MssqlHostsV1FilterT | None = None,
+        embed: str | None = None,
+        **kwargs,
+    ) -> list_ec2_mssql_inv_hosts_response.ListEC2MSSQLInvHostsResponse:
+        """Asynchronous counterpart of Ec2MssqlHostsV1Controller.list_ec2_mssql_hosts."""
+        controller = self.controller.get_controller(Ec2MssqlHostsV1Controller)
+        return await self.controller.call(
+            controller.list_ec2_mssql_hosts,
+            limit=limit,
+            start=start,
+            filter=filter,
+            embed=embed,
+            **kwargs,
+        )
+
+    async def read_ec2_mssql_host(
+        self, host_id: str | None = None, **kwargs
+    ) -> read_ec2_mssql_inv_host_response.ReadEC2MSSQLInvHostResponse:
+        """Asynchronous counterpart of Ec2MssqlHostsV1Controller.read_ec2_mssql_host."""
+        controller = self.controller.get_controller(Ec2MssqlHostsV1Controller)
+        return await self.controller.call(controller.read_ec2_mssql_host, host_id=host_id, **kwargs)
+
+
+class Ec2MssqlHostsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for ec2-mssql-hosts resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_ec2_mssql_hosts(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: ec2_mssql_hosts_types.ListEc2MssqlHostsV1FilterT | None = None,
+        embed: str | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_ec2_mssql_inv_hosts_response.ListEC2MSSQLInvHostsResponse
+    ]:
+        """Asynchronous counterpart of Ec2MssqlHostsV1ControllerPaginator.list_ec2_mssql_hosts."""
+        controller = self.controller.get_controller(Ec2MssqlHostsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: ec2_mssql_hosts_types.ListEc2MssqlHostsV1FilterT | None = filter,
+        ) -> list_ec2_mssql_inv_hosts_response.ListEC2MSSQLInvHostsResponse:
+            return await controller.list_ec2_mssql_hosts(
+                limit=limit, start=page_start, filter=page_filter, embed=embed, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='ec2_mssql_hosts_v1.list_ec2_mssql_hosts',
+        )
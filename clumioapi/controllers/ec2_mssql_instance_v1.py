@@ -3,21 +3,18 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import ec2_mssql_instance_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_ec2_mssql_instances_response
 from clumioapi.models import read_ec2_mssql_instance_response
 import requests
-import retrying
 
 
 class Ec2MssqlInstanceV1Controller:
@@ -101,23 +98,16 @@ class Ec2MssqlInstanceV1Controller:
 
         resp_instance: list_ec2_mssql_instances_response.ListEC2MSSQLInstancesResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_ec2_mssql_instances for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_ec2_mssql_instances',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ec2-mssql/instances',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -144,23 +134,16 @@ class Ec2MssqlInstanceV1Controller:
 
         resp_instance: read_ec2_mssql_instance_response.ReadEC2MSSQLInstanceResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_ec2_mssql_instance for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_ec2_mssql_instance',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/aws/ec2-mssql/instances/{instance_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -171,18 +154,13 @@ class Ec2MssqlInstanceV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_ec2_mssql_instances(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: ec2_mssql_instance_types.ListEc2MssqlInstancesV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_ec2_mssql_instances_response.ListEC2MSSQLInstancesResponse]:
+    ) -> pagination.PageIterator[list_ec2_mssql_instances_response.ListEC2MSSQLInstancesResponse]:
         """Returns a list of Instances
 
         Args:
@@ -224,19 +202,84 @@ class Ec2MssqlInstanceV1ControllerPaginator:
                 +---------------------------+------------------+-------------------------------+
 
         """
-        controller = Ec2MssqlInstanceV1Controller(self.controller)
-        while True:
-            response = controller.list_ec2_mssql_instances(
-                limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(Ec2MssqlInstanceV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: ec2_mssql_instance_types.ListEc2MssqlInstancesV1FilterT | None = filter,
+        ) -> list_ec2_mssql_instances_response.ListEC2MSSQLInstancesResponse:
+            return controller.list_ec2_mssql_instances(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='ec2_mssql_instance_v1.list_ec2_mssql_instances',
+        )
+
+
+class Ec2MssqlInstanceV1AsyncController:
+    """An asynchronous Controller to access Endpoints for ec2-mssql-instance resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_ec2_mssql_instances(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: ec2_mssql_instance_types.ListEc2MssqlInstancesV1FilterT | None = None,
+        **kwargs,
+    ) -> list_ec2_mssql_instances_response.ListEC2MSSQLInstancesResponse:
+        """Asynchronous counterpart of Ec2MssqlInstanceV1Controller.list_ec2_mssql_instances."""
+        controller = self.controller.get_controller(Ec2MssqlInstanceV1Controller)
+        return await self.controller.call(
+            controller.list_ec2_mssql_instances, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+    async def read_ec2_mssql_instance(
+        self, instance_id: str | None = None, **kwargs
+    ) -> read_ec2_mssql_instance_response.ReadEC2MSSQLInstanceResponse:
+        """Asynchronous counterpart of Ec2MssqlInstanceV1Controller.read_ec2_mssql_instance."""
+        controller = self.controller.get_controller(Ec2MssqlInstanceV1Controller)
+        return await self.controller.call(
+            controller.read_ec2_mssql_instance, instance_id=instance_id, **kwargs
+        )
+
+
+class Ec2MssqlInstanceV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for ec2-mssql-instance resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_ec2_mssql_instances(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: ec2_mssql_instance_types.ListEc2MssqlInstancesV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_ec2_mssql_instances_response.ListEC2MSSQLInstancesResponse
+    ]:
+        """Asynchronous counterpart of Ec2MssqlInstanceV1ControllerPaginator.list_ec2_mssql_instances."""
+        controller = self.controller.get_controller(Ec2MssqlInstanceV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: ec2_mssql_instance_types.ListEc2MssqlInstancesV1FilterT | None = filter,
+        ) -> list_ec2_mssql_instances_response.ListEC2MSSQLInstancesResponse:
+            return await controller.list_ec2_mssql_instances(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='ec2_mssql_instance_v1.list_ec2_mssql_instances',
+        )
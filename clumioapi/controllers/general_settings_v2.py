@@ -3,21 +3,17 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import patch_general_settings_response_v2
 from clumioapi.models import read_general_settings_response_v2
 from clumioapi.models import update_general_settings_v2_request
 import requests
-import retrying
 
 
 class GeneralSettingsV2Controller:
@@ -52,23 +48,16 @@ class GeneralSettingsV2Controller:
 
         resp_instance: read_general_settings_response_v2.ReadGeneralSettingsResponseV2
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_general_settings for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_general_settings',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/settings/general',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -96,24 +85,17 @@ class GeneralSettingsV2Controller:
 
         resp_instance: patch_general_settings_response_v2.PatchGeneralSettingsResponseV2
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.patch(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_general_settings for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_general_settings',
+            'patch',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/settings/general',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -123,3 +105,31 @@ class GeneralSettingsV2ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class GeneralSettingsV2AsyncController:
+    """An asynchronous Controller to access Endpoints for general-settings resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def read_general_settings(self, **kwargs):
+        """Asynchronous counterpart of GeneralSettingsV2Controller.read_general_settings."""
+        controller = self.controller.get_controller(GeneralSettingsV2Controller)
+        return await self.controller.call(controller.read_general_settings, **kwargs)
+
+    async def update_general_settings(
+        self,
+        body: update_general_settings_v2_request.UpdateGeneralSettingsV2Request | None = None,
+        **kwargs,
+    ) -> patch_general_settings_response_v2.PatchGeneralSettingsResponseV2:
+        """Asynchronous counterpart of GeneralSettingsV2Controller.update_general_settings."""
+        controller = self.controller.get_controller(GeneralSettingsV2Controller)
+        return await self.controller.call(controller.update_general_settings, body=body, **kwargs)
+
+
+class GeneralSettingsV2AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for general-settings resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
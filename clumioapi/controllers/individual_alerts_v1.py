@@ -3,23 +3,20 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import individual_alerts_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_alerts_response
 from clumioapi.models import read_alert_response
 from clumioapi.models import update_alert_response
 from clumioapi.models import update_individual_alert_v1_request
 import requests
-import retrying
 
 
 class IndividualAlertsV1Controller:
@@ -252,23 +249,16 @@ class IndividualAlertsV1Controller:
 
         resp_instance: list_alerts_response.ListAlertsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_individual_alerts for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_individual_alerts',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/alerts/individual',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -311,23 +301,16 @@ class IndividualAlertsV1Controller:
 
         resp_instance: read_alert_response.ReadAlertResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_individual_alert for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_individual_alert',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/alerts/individual/{individual_alert_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -377,24 +360,17 @@ class IndividualAlertsV1Controller:
 
         resp_instance: update_alert_response.UpdateAlertResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.patch(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_individual_alert for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_individual_alert',
+            'patch',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/alerts/individual/{individual_alert_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -405,11 +381,6 @@ class IndividualAlertsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_individual_alerts(
         self,
         limit: int | None = None,
@@ -418,7 +389,7 @@ class IndividualAlertsV1ControllerPaginator:
         filter: individual_alerts_types.ListIndividualAlertsV1FilterT | None = None,
         embed: str | None = None,
         **kwargs,
-    ) -> Iterator[list_alerts_response.ListAlertsResponse]:
+    ) -> pagination.PageIterator[list_alerts_response.ListAlertsResponse]:
         """Returns a list of individual alerts.
 
         Each alert is associated with a cause, which represents the issue that generated
@@ -607,19 +578,112 @@ class IndividualAlertsV1ControllerPaginator:
                 +-------------------------+----------------------------------------------------+
 
         """
-        controller = IndividualAlertsV1Controller(self.controller)
-        while True:
-            response = controller.list_individual_alerts(
-                limit=limit, start=start, sort=sort, filter=filter, embed=embed, **kwargs
+        controller = self.controller.get_controller(IndividualAlertsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: individual_alerts_types.ListIndividualAlertsV1FilterT | None = filter,
+        ) -> list_alerts_response.ListAlertsResponse:
+            return controller.list_individual_alerts(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, embed=embed, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='individual_alerts_v1.list_individual_alerts',
+        )
+
+
+class IndividualAlertsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for individual-alerts resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_individual_alerts(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: individual_alerts_types.ListIndividualAlertsV1FilterT | None = None,
+        embed: str | None = None,
+        **kwargs,
+    ) -> list_alerts_response.ListAlertsResponse:
+        """Asynchronous counterpart of IndividualAlertsV1Controller.list_individual_alerts."""
+        controller = self.controller.get_controller(IndividualAlertsV1Controller)
+        return await self.controller.call(
+            controller.list_individual_alerts,
+            limit=limit,
+            start=start,
+            sort=sort,
+            filter=filter,
+            embed=embed,
+            **kwargs,
+        )
+
+    async def read_individual_alert(
+        self, individual_alert_id: str | None = None, embed: str | None = None, **kwargs
+    ) -> read_alert_response.ReadAlertResponse:
+        """Asynchronous counterpart of IndividualAlertsV1Controller.read_individual_alert."""
+        controller = self.controller.get_controller(IndividualAlertsV1Controller)
+        return await self.controller.call(
+            controller.read_individual_alert,
+            individual_alert_id=individual_alert_id,
+            embed=embed,
+            **kwargs,
+        )
+
+    async def update_individual_alert(
+        self,
+        individual_alert_id: str | None = None,
+        embed: str | None = None,
+        body: update_individual_alert_v1_request.UpdateIndividualAlertV1Request | None = None,
+        **kwargs,
+    ) -> update_alert_response.UpdateAlertResponse:
+        """Asynchronous counterpart of IndividualAlertsV1Controller.update_individual_alert."""
+        controller = self.controller.get_controller(IndividualAlertsV1Controller)
+        return await self.controller.call(
+            controller.update_individual_alert,
+            individual_alert_id=individual_alert_id,
+            embed=embed,
+            body=body,
+            **kwargs,
+        )
+
+
+class IndividualAlertsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for individual-alerts resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_individual_alerts(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        sort: str | None = None,
+        filter: individual_alerts_types.ListIndividualAlertsV1FilterT | None = None,
+        embed: str | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_alerts_response.ListAlertsResponse]:
+        """Asynchronous counterpart of IndividualAlertsV1ControllerPaginator.list_individual_alerts."""
+        controller = self.controller.get_controller(IndividualAlertsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: individual_alerts_types.ListIndividualAlertsV1FilterT | None = filter,
+        ) -> list_alerts_response.ListAlertsResponse:
+            return await controller.list_individual_alerts(
+                limit=limit, start=page_start, sort=sort, filter=page_filter, embed=embed, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='individual_alerts_v1.list_individual_alerts',
+        )
@@ -3,22 +3,19 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_management_groups_response
 from clumioapi.models import read_management_group_response
 from clumioapi.models import update_management_group_response
 from clumioapi.models import update_management_group_v1_request
 import requests
-import retrying
 
 
 class ManagementGroupsV1Controller:
@@ -66,23 +63,16 @@ class ManagementGroupsV1Controller:
 
         resp_instance: list_management_groups_response.ListManagementGroupsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_management_groups for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_management_groups',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/management-groups',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -113,23 +103,16 @@ class ManagementGroupsV1Controller:
 
         resp_instance: read_management_group_response.ReadManagementGroupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_management_group for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_management_group',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/management-groups/{group_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -163,24 +146,17 @@ class ManagementGroupsV1Controller:
 
         resp_instance: update_management_group_response.UpdateManagementGroupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.put(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_management_group for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_management_group',
+            'put',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/management-groups/{group_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -191,14 +167,9 @@ class ManagementGroupsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_management_groups(
         self, limit: int | None = None, start: str | None = None, **kwargs
-    ) -> Iterator[list_management_groups_response.ListManagementGroupsResponse]:
+    ) -> pagination.PageIterator[list_management_groups_response.ListManagementGroupsResponse]:
         """Returns a list of management groups.
 
         Args:
@@ -209,17 +180,78 @@ class ManagementGroupsV1ControllerPaginator:
                 get the first page.
                 Other pages can be traversed using HATEOAS links.
         """
-        controller = ManagementGroupsV1Controller(self.controller)
-        while True:
-            response = controller.list_management_groups(limit=limit, start=start, **kwargs)
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+        controller = self.controller.get_controller(ManagementGroupsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+        ) -> list_management_groups_response.ListManagementGroupsResponse:
+            return controller.list_management_groups(limit=limit, start=page_start, **kwargs)
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            operation='management_groups_v1.list_management_groups',
+        )
+
+
+class ManagementGroupsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for management-groups resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_management_groups(
+        self, limit: int | None = None, start: str | None = None, **kwargs
+    ) -> list_management_groups_response.ListManagementGroupsResponse:
+        """Asynchronous counterpart of ManagementGroupsV1Controller.list_management_groups."""
+        controller = self.controller.get_controller(ManagementGroupsV1Controller)
+        return await self.controller.call(
+            controller.list_management_groups, limit=limit, start=start, **kwargs
+        )
+
+    async def read_management_group(
+        self, group_id: str | None = None, **kwargs
+    ) -> read_management_group_response.ReadManagementGroupResponse:
+        """Asynchronous counterpart of ManagementGroupsV1Controller.read_management_group."""
+        controller = self.controller.get_controller(ManagementGroupsV1Controller)
+        return await self.controller.call(
+            controller.read_management_group, group_id=group_id, **kwargs
+        )
+
+    async def update_management_group(
+        self,
+        group_id: str | None = None,
+        body: update_management_group_v1_request.UpdateManagementGroupV1Request | None = None,
+        **kwargs,
+    ) -> update_management_group_response.UpdateManagementGroupResponse:
+        """Asynchronous counterpart of ManagementGroupsV1Controller.update_management_group."""
+        controller = self.controller.get_controller(ManagementGroupsV1Controller)
+        return await self.controller.call(
+            controller.update_management_group, group_id=group_id, body=body, **kwargs
+        )
+
+
+class ManagementGroupsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for management-groups resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_management_groups(
+        self, limit: int | None = None, start: str | None = None, **kwargs
+    ) -> pagination.AsyncPageIterator[list_management_groups_response.ListManagementGroupsResponse]:
+        """Asynchronous counterpart of ManagementGroupsV1ControllerPaginator.list_management_groups."""
+        controller = self.controller.get_controller(ManagementGroupsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+        ) -> list_management_groups_response.ListManagementGroupsResponse:
+            return await controller.list_management_groups(limit=limit, start=page_start, **kwargs)
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            operation='management_groups_v1.list_management_groups',
+        )
@@ -3,14 +3,13 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import organizational_units_types
 from clumioapi.exceptions import clumio_exception
@@ -24,7 +23,6 @@ from clumioapi.models import patch_organizational_unit_response_v1
 from clumioapi.models import patch_organizational_unit_v1_request
 from clumioapi.models import read_organizational_unit_response_v1
 import requests
-import retrying
 
 
 class OrganizationalUnitsV1Controller:
@@ -95,25 +93,16 @@ class OrganizationalUnitsV1Controller:
 
         resp_instance: list_organizational_units_response_v1.ListOrganizationalUnitsResponseV1
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_organizational_units for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_organizational_units',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/organizational-units',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -182,26 +171,17 @@ class OrganizationalUnitsV1Controller:
             create_organizational_unit_response_v1.CreateOrganizationalUnitResponseV1,
         ]
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'create_organizational_unit for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_organizational_unit',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/organizational-units',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -245,23 +225,16 @@ class OrganizationalUnitsV1Controller:
 
         resp_instance: read_organizational_unit_response_v1.ReadOrganizationalUnitResponseV1
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_organizational_unit for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_organizational_unit',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/organizational-units/{id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -305,25 +278,16 @@ class OrganizationalUnitsV1Controller:
 
         resp_instance: delete_organizational_unit_response.DeleteOrganizationalUnitResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'delete_organizational_unit for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_organizational_unit',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/organizational-units/{id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -399,26 +363,17 @@ class OrganizationalUnitsV1Controller:
             patch_organizational_unit_response_v1.PatchOrganizationalUnitResponseV1,
         ]
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.patch(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'patch_organizational_unit for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'patch_organizational_unit',
+            'patch',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/organizational-units/{id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -429,18 +384,15 @@ class OrganizationalUnitsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_organizational_units(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: organizational_units_types.ListOrganizationalUnitsV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_organizational_units_response_v1.ListOrganizationalUnitsResponseV1]:
+    ) -> pagination.PageIterator[
+        list_organizational_units_response_v1.ListOrganizationalUnitsResponseV1
+    ]:
         """Returns a list of organizational units.
 
         Args:
@@ -469,19 +421,128 @@ class OrganizationalUnitsV1ControllerPaginator:
                 +-----------+------------------+-----------------------------------------------+
 
         """
-        controller = OrganizationalUnitsV1Controller(self.controller)
-        while True:
-            response = controller.list_organizational_units(
-                limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(OrganizationalUnitsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                organizational_units_types.ListOrganizationalUnitsV1FilterT | None
+            ) = filter,
+        ) -> list_organizational_units_response_v1.ListOrganizationalUnitsResponseV1:
+            return controller.list_organizational_units(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='organizational_units_v1.list_organizational_units',
+        )
+
+
+class OrganizationalUnitsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for organizational-units resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_organizational_units(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: organizational_units_types.ListOrganizationalUnitsV1FilterT | None = None,
+        **kwargs,
+    ) -> list_organizational_units_response_v1.ListOrganizationalUnitsResponseV1:
+        """Asynchronous counterpart of OrganizationalUnitsV1Controller.list_organizational_units."""
+        controller = self.controller.get_controller(OrganizationalUnitsV1Controller)
+        return await self.controller.call(
+            controller.list_organizational_units, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+    async def create_organizational_unit(
+        self,
+        embed: str | None = None,
+        body: create_organizational_unit_v1_request.CreateOrganizationalUnitV1Request | None = None,
+        **kwargs,
+    ) -> Union[
+        create_organizational_unit_no_task_response_v1.CreateOrganizationalUnitNoTaskResponseV1,
+        create_organizational_unit_response_v1.CreateOrganizationalUnitResponseV1,
+    ]:
+        """Asynchronous counterpart of OrganizationalUnitsV1Controller.create_organizational_unit."""
+        controller = self.controller.get_controller(OrganizationalUnitsV1Controller)
+        return await self.controller.call(
+            controller.create_organizational_unit, embed=embed, body=body, **kwargs
+        )
+
+    async def read_organizational_unit(
+        self, id: str | None = None, embed: str | None = None, **kwargs
+    ) -> read_organizational_unit_response_v1.ReadOrganizationalUnitResponseV1:
+        """Asynchronous counterpart of OrganizationalUnitsV1Controller.read_organizational_unit."""
+        controller = self.controller.get_controller(OrganizationalUnitsV1Controller)
+        return await self.controller.call(
+            controller.read_organizational_unit, id=id, embed=embed, **kwargs
+        )
+
+    async def delete_organizational_unit(
+        self, id: str | None = None, embed: str | None = None, **kwargs
+    ) -> delete_organizational_unit_response.DeleteOrganizationalUnitResponse:
+        """Asynchronous counterpart of OrganizationalUnitsV1Controller.delete_organizational_unit."""
+        controller = self.controller.get_controller(OrganizationalUnitsV1Controller)
+        return await self.controller.call(
+            controller.delete_organizational_unit, id=id, embed=embed, **kwargs
+        )
+
+    async def patch_organizational_unit(
+        self,
+        id: str | None = None,
+        embed: str | None = None,
+        body: patch_organizational_unit_v1_request.PatchOrganizationalUnitV1Request | None = None,
+        **kwargs,
+    ) -> Union[
+        patch_organizational_unit_no_task_response_v1.PatchOrganizationalUnitNoTaskResponseV1,
+        patch_organizational_unit_response_v1.PatchOrganizationalUnitResponseV1,
+    ]:
+        """Asynchronous counterpart of OrganizationalUnitsV1Controller.patch_organizational_unit."""
+        controller = self.controller.get_controller(OrganizationalUnitsV1Controller)
+        return await self.controller.call(
+            controller.patch_organizational_unit, id=id, embed=embed, body=body, **kwargs
+        )
+
+
+class OrganizationalUnitsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for organizational-units resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_organizational_units(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: organizational_units_types.ListOrganizationalUnitsV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_organizational_units_response_v1.ListOrganizationalUnitsResponseV1
+    ]:
+        """Asynchronous counterpart of OrganizationalUnitsV1ControllerPaginator.list_organizational_units."""
+        controller = self.controller.get_controller(OrganizationalUnitsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                organizational_units_types.ListOrganizationalUnitsV1FilterT | None
+            ) = filter,
+        ) -> list_organizational_units_response_v1.ListOrganizationalUnitsResponseV1:
+            return await controller.list_organizational_units(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='organizational_units_v1.list_organizational_units',
+        )
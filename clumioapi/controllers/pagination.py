@@ -0,0 +1,517 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Helpers shared by the *ControllerPaginator classes to walk paged collections."""
+
+import asyncio
+import collections
+from concurrent import futures
+import queue
+import re
+import threading
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Generic,
+    Iterator,
+    Mapping,
+    Sequence,
+    TypeVar,
+)
+
+from clumioapi import configuration
+from clumioapi.exceptions import clumio_exception
+
+T = TypeVar('T')
+
+_START_PATTERN = re.compile(r'start=([^&]+)')
+
+# Marks the end of the walk of a part of a split filter.
+_DONE = object()
+
+# The paginator methods of page-number based collections, named <module>.<method> after their
+# controller module: their start tokens are the page numbers 1, 2, 3, ... and their pages
+# carry TotalPagesCount. Only these are prefetched, as the other collections have opaque
+# start tokens, even when they happen to be numbers.
+PAGE_NUMBER_OPERATIONS: frozenset[str] = frozenset(
+    {
+        'audit_trails_v1.list_audit_trails',
+        'aws_dynamodb_tables_v1.list_aws_dynamodb_tables',
+        'aws_ebs_volumes_v1.list_aws_ebs_volumes',
+        'aws_ec2_instances_v1.list_aws_ec2_instances',
+        'aws_environment_tags_v1.list_aws_environment_tags',
+        'aws_rds_resource_restored_records_v1.list_rds_restored_records',
+        'aws_rds_resources_v1.list_aws_rds_resources',
+        'aws_s3_buckets_v1.list_aws_s3_buckets',
+        'backup_aws_dynamodb_tables_v1.list_backup_aws_dynamodb_tables',
+        'backup_aws_ebs_volumes_v1.list_backup_aws_ebs_volumes',
+        'backup_aws_ebs_volumes_v2.list_backup_aws_ebs_volumes',
+        'backup_aws_ec2_instances_v1.list_backup_aws_ec2_instances',
+        'backup_aws_rds_resource_databases_v1.list_backup_aws_rds_resource_databases',
+        'backup_aws_rds_resources_v1.list_backup_aws_rds_resources',
+        'backup_ec2_mssql_databases_v1.list_backup_ec2_mssql_databases',
+        'backup_filesystems_v1.list_backup_filesystems',
+        'backup_protection_groups_v1.list_backup_protection_group_s3_assets',
+        'backup_protection_groups_v1.list_backup_protection_groups',
+        'consolidated_alerts_v1.list_consolidated_alerts',
+        'ec2_mssql_availability_groups_v1.list_ec2_mssql_availability_groups',
+        'ec2_mssql_databases_v1.list_ec2_mssql_databases',
+        'ec2_mssql_failover_clusters_v1.list_ec2_mssql_failover_clusters',
+        'ec2_mssql_hosts_v1.list_ec2_mssql_hosts',
+        'ec2_mssql_instance_v1.list_ec2_mssql_instances',
+        'individual_alerts_v1.list_individual_alerts',
+        'organizational_units_v1.list_organizational_units',
+        'organizational_units_v2.list_organizational_units',
+        'protection_groups_s3_assets_v1.list_protection_group_s3_assets',
+        'protection_groups_v1.list_protection_groups',
+        'report_downloads_v1.list_report_downloads',
+        'restored_protection_group_instant_access_endpoints_v1.list_protection_group_instant_access_endpoints',
+        'tasks_v1.list_tasks',
+        'users_v1.list_users',
+        'users_v2.list_users',
+    }
+)
+
+
+def next_start(response: Any) -> str | None:
+    """Returns the start token of the page following the given list response.
+
+    Args:
+        response: A List*Response model returned by a controller list method, or its decoded
+            JSON if the method was called with raw_json=True.
+    Returns:
+        The value of the start query parameter in the Next link, or None if the given
+        response is the last page.
+    Raises:
+        ClumioException: If the Next link does not carry a start query parameter.
+    """
+    if isinstance(response, Mapping):
+        next_link = (response.get('_links') or {}).get('_next')
+        href = next_link.get('href') if next_link else None
+    else:
+        next_link = response.Links.Next if response.Links else None
+        href = next_link.Href if next_link else None
+    if not next_link:
+        return None
+    if match := _START_PATTERN.search(href or ''):
+        return match.group(1)
+    raise clumio_exception.ClumioException('Next link is malformed. Please contact clumio support.')
+
+
+def page_items(page: Any) -> list[Any]:
+    """Returns the Embedded.Items of a List*Response model, or an empty list.
+
+    For the decoded JSON of a page, the items are the decoded JSON objects.
+    """
+    if isinstance(page, Mapping):
+        return (page.get('_embedded') or {}).get('items') or []
+    embedded = getattr(page, 'Embedded', None)
+    return (embedded.Items if embedded else None) or []
+
+
+def total_pages(page: Any) -> int | None:
+    """Returns the TotalPagesCount of a List*Response model or of its decoded JSON."""
+    if isinstance(page, Mapping):
+        return page.get('total_pages_count')
+    return getattr(page, 'TotalPagesCount', None)
+
+
+def item_id(item: Any) -> Any:
+    """Returns the ID of an item of a list response, or None if it has none."""
+    if isinstance(item, Mapping):
+        return item.get('id')
+    return getattr(item, 'Id', None)
+
+
+def split_filter(filter: Any, config: configuration.Configuration) -> list[Any]:
+    """Returns the filters to query instead of the given one to fit config.max_filter_length.
+
+    Args:
+        filter: The filter of a paginator call, a BaseControllerFilterTypes or None.
+        config: The configuration of the client making the calls.
+    Returns:
+        [filter] if the filter fits or is None, else its parts as split by
+        BaseControllerFilterTypes.split.
+    Raises:
+        ValueError: If the filter is too long and cannot be split.
+    """
+    if filter is None:
+        return [filter]
+    return filter.split(config.max_filter_length)
+
+
+def remove_seen_items(page: T, seen: set[Any]) -> T:
+    """Removes from a page the items whose ID is in seen, and adds the IDs of the others."""
+    items = page_items(page)
+    kept = []
+    for item in items:
+        id_ = item_id(item)
+        if id_ is None:
+            kept.append(item)
+        elif id_ not in seen:
+            seen.add(id_)
+            kept.append(item)
+    if len(kept) < len(items):
+        if isinstance(page, Mapping):
+            page['_embedded']['items'] = kept  # type: ignore
+        else:
+            page.Embedded.Items = kept  # type: ignore
+    return page
+
+
+class PageIterator(Generic[T]):
+    """Iterator over the pages of a collection, as returned by the paginator methods.
+
+    Iterating yields the List*Response pages. iter_items yields the elements of their
+    Embedded.Items instead.
+
+    When the filter of the call is too long for a URL, see split_filter, the pages of every
+    part of the filter are yielded instead, with the items already yielded removed.
+    fetch_page is then called with the part of the filter as second argument.
+
+    The pages of the operations in PAGE_NUMBER_OPERATIONS are prefetched as configured by
+    page_prefetch_concurrency, see paginate.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[..., T],
+        start: str | None,
+        config: configuration.Configuration,
+        filter: Any = None,
+        operation: str | None = None,
+    ) -> None:
+        prefetch = operation in PAGE_NUMBER_OPERATIONS
+        filters = split_filter(filter, config)
+        if len(filters) > 1:
+            self._pages = paginate_filters(fetch_page, start, config, filters, prefetch)
+        else:
+            self._pages = paginate(fetch_page, start, config, prefetch)
+
+    def __iter__(self) -> 'PageIterator[T]':
+        return self
+
+    def __next__(self) -> T:
+        return next(self._pages)
+
+    def close(self) -> None:
+        """Stops the iteration, cancelling any page being prefetched."""
+        self._pages.close()
+
+    def iter_items(self) -> Iterator[Any]:
+        """Yields the items of the remaining pages one by one.
+
+        Each page, including its raw_response, is released as soon as its items have been
+        extracted, so walking a collection of any size keeps only the current page of items
+        in memory (plus the prefetched pages, if page_prefetch_concurrency is set).
+        """
+        for page in self._pages:
+            items = page_items(page)
+            del page
+            yield from items
+
+    def to_arrow(self, **kwargs: Any) -> Any:
+        """Returns a pyarrow.Table with the items of the remaining pages.
+
+        The paginator method must have been called with raw_json=True.
+
+        Args:
+            kwargs: Passed on to columnar_export.to_table, such as columns or schema.
+        """
+        from clumioapi import columnar_export
+
+        return columnar_export.to_table(self, **kwargs)  # type: ignore[arg-type]
+
+    def write_parquet(self, where: Any, **kwargs: Any) -> int:
+        """Streams the items of the remaining pages to a Parquet file and returns their count.
+
+        The paginator method must have been called with raw_json=True.
+
+        Args:
+            where: Path or writable binary file object of the Parquet file.
+            kwargs: Passed on to columnar_export.write_parquet, such as columns or compression.
+        """
+        from clumioapi import columnar_export
+
+        return columnar_export.write_parquet(self, where, **kwargs)  # type: ignore[arg-type]
+
+    def write_csv(self, where: Any, **kwargs: Any) -> int:
+        """Streams the items of the remaining pages to a CSV file and returns their count.
+
+        The paginator method must have been called with raw_json=True.
+
+        Args:
+            where: Path or writable binary file object of the CSV file.
+            kwargs: Passed on to columnar_export.write_csv, such as columns.
+        """
+        from clumioapi import columnar_export
+
+        return columnar_export.write_csv(self, where, **kwargs)  # type: ignore[arg-type]
+
+
+def paginate(
+    fetch_page: Callable[[str | None], T],
+    start: str | None,
+    config: configuration.Configuration,
+    prefetch: bool = False,
+) -> Generator[T, None, None]:
+    """Yields the pages of a collection in order, starting from the given start token.
+
+    When prefetch is True and config.page_prefetch_concurrency is greater than one, the
+    TotalPagesCount of the first page is used to fetch the remaining pages concurrently. At
+    most page_prefetch_concurrency pages are in flight or buffered at any time, so a slow
+    consumer does not cause the whole collection to be loaded into memory. Otherwise the
+    collection is walked serially.
+
+    Args:
+        fetch_page: Callable returning the page for the given start token.
+        start: The start token of the first page to fetch.
+        config: The configuration of the client making the calls.
+        prefetch: Whether the collection is page-number based, its start tokens being the
+            page numbers 1, 2, 3, ... See PAGE_NUMBER_OPERATIONS.
+    """
+    # The references to a page are dropped before fetching the next one, so that a consumer
+    # discarding the pages keeps at most one of them in memory.
+    response = fetch_page(start)
+    yield response
+    next_page_start = next_start(response)
+    last_page = total_pages(response)
+    del response
+    if next_page_start is None:
+        return
+
+    concurrency = config.page_prefetch_concurrency
+    if prefetch and concurrency > 1 and last_page and next_page_start.isdigit():
+        yield from _prefetch_pages(fetch_page, int(next_page_start), last_page, concurrency)
+        return
+
+    while next_page_start is not None:
+        response = fetch_page(next_page_start)
+        yield response
+        next_page_start = next_start(response)
+        del response
+
+
+def paginate_filters(
+    fetch_page: Callable[[str | None, Any], T],
+    start: str | None,
+    config: configuration.Configuration,
+    filters: Sequence[Any],
+    prefetch: bool = False,
+) -> Generator[T, None, None]:
+    """Yields the pages of a collection for each of the parts of a split filter.
+
+    The parts are walked concurrently, at most config.filter_chunk_concurrency at a time,
+    and their pages yielded as they arrive. An item matching several parts is only yielded
+    with the first page containing it. At most filter_chunk_concurrency pages are buffered,
+    so a slow consumer does not cause the whole collection to be loaded into memory.
+
+    Args:
+        fetch_page: Callable returning the page for the given start token and filter.
+        start: The start token of the first page to fetch, for every part.
+        config: The configuration of the client making the calls.
+        filters: The parts of the filter.
+        prefetch: Whether the pages of every part are prefetched, see paginate.
+    """
+    concurrency = min(config.filter_chunk_concurrency, len(filters))
+    # Pages, exceptions raised by the walks, and a _DONE marker at the end of every walk.
+    pages: queue.Queue[Any] = queue.Queue(maxsize=concurrency)
+    stopped = threading.Event()
+
+    def put(value: Any) -> bool:
+        """Queues a value, unless the iteration stopped. Returns whether it was queued."""
+        while not stopped.is_set():
+            try:
+                pages.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def walk(part: Any) -> None:
+        def fetch_part_page(page_start: str | None) -> T:
+            return fetch_page(page_start, part)
+
+        try:
+            for page in paginate(fetch_part_page, start, config, prefetch):
+                if not put(page):
+                    return
+                del page
+        except Exception as e:
+            put(e)
+        else:
+            put(_DONE)
+
+    seen: set[Any] = set()
+    with futures.ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix='clumioapi-filter-chunk'
+    ) as executor:
+        walks = [executor.submit(walk, part) for part in filters]
+        try:
+            remaining = len(walks)
+            while remaining:
+                page = pages.get()
+                if page is _DONE:
+                    remaining -= 1
+                    continue
+                if isinstance(page, BaseException):
+                    raise page
+                yield remove_seen_items(page, seen)
+                del page
+        finally:
+            stopped.set()
+            for walk_future in walks:
+                walk_future.cancel()
+
+
+def _prefetch_pages(
+    fetch_page: Callable[[str | None], T], first_page: int, last_page: int, concurrency: int
+) -> Generator[T, None, None]:
+    """Fetches the pages first_page..last_page over a bounded thread pool, yielding in order."""
+    with futures.ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix='clumioapi-paginator'
+    ) as executor:
+        pending: collections.deque[futures.Future[T]] = collections.deque()
+        page = first_page
+        try:
+            while pending or page <= last_page:
+                while page <= last_page and len(pending) < concurrency:
+                    pending.append(executor.submit(fetch_page, str(page)))
+                    page += 1
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class AsyncPageIterator(Generic[T]):
+    """Asynchronous counterpart of PageIterator, as returned by the asynchronous paginators."""
+
+    def __init__(
+        self,
+        fetch_page: Callable[..., Awaitable[T]],
+        start: str | None,
+        config: configuration.Configuration,
+        filter: Any = None,
+        operation: str | None = None,
+    ) -> None:
+        prefetch = operation in PAGE_NUMBER_OPERATIONS
+        filters = split_filter(filter, config)
+        if len(filters) > 1:
+            self._pages = async_paginate_filters(fetch_page, start, config, filters, prefetch)
+        else:
+            self._pages = async_paginate(fetch_page, start, config, prefetch)
+
+    def __aiter__(self) -> 'AsyncPageIterator[T]':
+        return self
+
+    async def __anext__(self) -> T:
+        return await anext(self._pages)
+
+    async def aclose(self) -> None:
+        """Stops the iteration, cancelling any page being prefetched."""
+        await self._pages.aclose()
+
+    async def iter_items(self) -> AsyncIterator[Any]:
+        """Yields the items of the remaining pages one by one, releasing each page."""
+        async for page in self._pages:
+            items = page_items(page)
+            del page
+            for item in items:
+                yield item
+
+
+async def async_paginate(
+    fetch_page: Callable[[str | None], Awaitable[T]],
+    start: str | None,
+    config: configuration.Configuration,
+    prefetch: bool = False,
+) -> AsyncGenerator[T, None]:
+    """Asynchronous counterpart of paginate, for use with coroutine page fetchers.
+
+    When prefetch is True, the pages are prefetched with at most
+    config.page_prefetch_concurrency pages in flight, as in paginate.
+
+    Args:
+        fetch_page: Coroutine function returning the page for the given start token.
+        start: The start token of the first page to fetch.
+        config: The configuration of the client making the calls.
+        prefetch: Whether the collection is page-number based, see paginate.
+    """
+    response = await fetch_page(start)
+    yield response
+    next_page_start = next_start(response)
+    last_page = total_pages(response)
+    del response
+    if next_page_start is None:
+        return
+
+    concurrency = config.page_prefetch_concurrency
+    if prefetch and concurrency > 1 and last_page and next_page_start.isdigit():
+        pending: collections.deque[asyncio.Task[T]] = collections.deque()
+        page = int(next_page_start)
+        try:
+            while pending or page <= last_page:
+                while page <= last_page and len(pending) < concurrency:
+                    pending.append(asyncio.ensure_future(fetch_page(str(page))))
+                    page += 1
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+        return
+
+    while next_page_start is not None:
+        response = await fetch_page(next_page_start)
+        yield response
+        next_page_start = next_start(response)
+        del response
+
+
+async def async_paginate_filters(
+    fetch_page: Callable[[str | None, Any], Awaitable[T]],
+    start: str | None,
+    config: configuration.Configuration,
+    filters: Sequence[Any],
+    prefetch: bool = False,
+) -> AsyncGenerator[T, None]:
+    """Asynchronous counterpart of paginate_filters, for use with coroutine page fetchers."""
+    concurrency = min(config.filter_chunk_concurrency, len(filters))
+    pages: asyncio.Queue[Any] = asyncio.Queue(maxsize=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def walk(part: Any) -> None:
+        async def fetch_part_page(page_start: str | None) -> T:
+            return await fetch_page(page_start, part)
+
+        try:
+            async with semaphore:
+                async for page in async_paginate(fetch_part_page, start, config, prefetch):
+                    await pages.put(page)
+                    del page
+        except Exception as e:
+            await pages.put(e)
+        else:
+            await pages.put(_DONE)
+
+    seen: set[Any] = set()
+    walks = [asyncio.ensure_future(walk(part)) for part in filters]
+    try:
+        remaining = len(walks)
+        while remaining:
+            page = await pages.get()
+            if page is _DONE:
+                remaining -= 1
+                continue
+            if isinstance(page, BaseException):
+                raise page
+            yield remove_seen_items(page, seen)
+            del page
+    finally:
+        for task in walks:
+            task.cancel()
@@ -3,20 +3,16 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import set_assignments_response
 from clumioapi.models import set_policy_assignments_v1_request
 import requests
-import retrying
 
 
 class PolicyAssignmentsV1Controller:
@@ -60,24 +56,17 @@ class PolicyAssignmentsV1Controller:
 
         resp_instance: set_assignments_response.SetAssignmentsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'set_policy_assignments for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'set_policy_assignments',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/policies/assignments',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -87,3 +76,26 @@ class PolicyAssignmentsV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class PolicyAssignmentsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for policy-assignments resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def set_policy_assignments(
+        self,
+        body: set_policy_assignments_v1_request.SetPolicyAssignmentsV1Request | None = None,
+        **kwargs,
+    ) -> set_assignments_response.SetAssignmentsResponse:
+        """Asynchronous counterpart of PolicyAssignmentsV1Controller.set_policy_assignments."""
+        controller = self.controller.get_controller(PolicyAssignmentsV1Controller)
+        return await self.controller.call(controller.set_policy_assignments, body=body, **kwargs)
+
+
+class PolicyAssignmentsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for policy-assignments resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
@@ -3,9 +3,7 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
@@ -13,7 +11,6 @@ from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import policy_definitions_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_policy_definition_v1_request
 from clumioapi.models import create_policy_response
 from clumioapi.models import delete_policy_response
@@ -22,7 +19,6 @@ from clumioapi.models import read_policy_response
 from clumioapi.models import update_policy_definition_v1_request
 from clumioapi.models import update_policy_response
 import requests
-import retrying
 
 
 class PolicyDefinitionsV1Controller:
@@ -194,23 +190,16 @@ class PolicyDefinitionsV1Controller:
 
         resp_instance: list_policies_response.ListPoliciesResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_policy_definitions for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_policy_definitions',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/policies/definitions',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -237,24 +226,17 @@ class PolicyDefinitionsV1Controller:
 
         resp_instance: create_policy_response.CreatePolicyResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'create_policy_definition for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_policy_definition',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/policies/definitions',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -328,23 +310,16 @@ class PolicyDefinitionsV1Controller:
 
         resp_instance: read_policy_response.ReadPolicyResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_policy_definition for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_policy_definition',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/policies/definitions/{policy_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -428,24 +403,17 @@ class PolicyDefinitionsV1Controller:
 
         resp_instance: update_policy_response.UpdatePolicyResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.put(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_policy_definition for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_policy_definition',
+            'put',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/policies/definitions/{policy_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -472,23 +440,16 @@ class PolicyDefinitionsV1Controller:
 
         resp_instance: delete_policy_response.DeletePolicyResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'delete_policy_definition for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_policy_definition',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/policies/definitions/{policy_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -498,3 +459,73 @@ class PolicyDefinitionsV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class PolicyDefinitionsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for policy-definitions resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_policy_definitions(
+        self,
+        filter: policy_definitions_types.ListPolicyDefinitionsV1FilterT | None = None,
+        embed: str | None = None,
+        **kwargs,
+    ) -> list_policies_response.ListPoliciesResponse:
+        """Asynchronous counterpart of PolicyDefinitionsV1Controller.list_policy_definitions."""
+        controller = self.controller.get_controller(PolicyDefinitionsV1Controller)
+        return await self.controller.call(
+            controller.list_policy_definitions, filter=filter, embed=embed, **kwargs
+        )
+
+    async def create_policy_definition(
+        self,
+        body: create_policy_definition_v1_request.CreatePolicyDefinitionV1Request | None = None,
+        **kwargs,
+    ) -> create_policy_response.CreatePolicyResponse:
+        """Asynchronous counterpart of PolicyDefinitionsV1Controller.create_policy_definition."""
+        controller = self.controller.get_controller(PolicyDefinitionsV1Controller)
+        return await self.controller.call(controller.create_policy_definition, body=body, **kwargs)
+
+    async def read_policy_definition(
+        self, policy_id: str | None = None, embed: str | None = None, **kwargs
+    ) -> read_policy_response.ReadPolicyResponse:
+        """Asynchronous counterpart of PolicyDefinitionsV1Controller.read_policy_definition."""
+        controller = self.controller.get_controller(PolicyDefinitionsV1Controller)
+        return await self.controller.call(
+            controller.read_policy_definition, policy_id=policy_id, embed=embed, **kwargs
+        )
+
+    async def update_policy_definition(
+        self,
+        policy_id: str | None = None,
+        embed: str | None = None,
+        body: update_policy_definition_v1_request.UpdatePolicyDefinitionV1Request | None = None,
+        **kwargs,
+    ) -> update_policy_response.UpdatePolicyResponse:
+        """Asynchronous counterpart of PolicyDefinitionsV1Controller.update_policy_definition."""
+        controller = self.controller.get_controller(PolicyDefinitionsV1Controller)
+        return await self.controller.call(
+            controller.update_policy_definition,
+            policy_id=policy_id,
+            embed=embed,
+            body=body,
+            **kwargs,
+        )
+
+    async def delete_policy_definition(
+        self, policy_id: str | None = None, **kwargs
+    ) -> delete_policy_response.DeletePolicyResponse:
+        """Asynchronous counterpart of PolicyDefinitionsV1Controller.delete_policy_definition."""
+        controller = self.controller.get_controller(PolicyDefinitionsV1Controller)
+        return await self.controller.call(
+            controller.delete_policy_definition, policy_id=policy_id, **kwargs
+        )
+
+
+class PolicyDefinitionsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for policy-definitions resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
@@ -3,17 +3,15 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import policy_rules_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_policy_rule_v1_request
 from clumioapi.models import create_rule_response
 from clumioapi.models import delete_rule_response
@@ -22,7 +20,6 @@ from clumioapi.models import read_rule_response
 from clumioapi.models import update_policy_rule_v1_request
 from clumioapi.models import update_rule_response
 import requests
-import retrying
 
 
 class PolicyRulesV1Controller:
@@ -119,23 +116,16 @@ class PolicyRulesV1Controller:
 
         resp_instance: list_rules_response.ListRulesResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_policy_rules for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_policy_rules',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/policies/rules',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -163,24 +153,17 @@ class PolicyRulesV1Controller:
 
         resp_instance: create_rule_response.CreateRuleResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'create_policy_rule for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_policy_rule',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/policies/rules',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -205,23 +188,16 @@ class PolicyRulesV1Controller:
 
         resp_instance: read_rule_response.ReadRuleResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_policy_rule for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_policy_rule',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/policies/rules/{rule_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -251,24 +227,17 @@ class PolicyRulesV1Controller:
 
         resp_instance: update_rule_response.UpdateRuleResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.put(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_policy_rule for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_policy_rule',
+            'put',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/policies/rules/{rule_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -295,23 +264,16 @@ class PolicyRulesV1Controller:
 
         resp_instance: delete_rule_response.DeleteRuleResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'delete_policy_rule for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_policy_rule',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/policies/rules/{rule_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -322,11 +284,6 @@ class PolicyRulesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_policy_rules(
         self,
         limit: int | None = None,
@@ -335,7 +292,7 @@ class PolicyRulesV1ControllerPaginator:
         sort: str | None = None,
         filter: policy_rules_types.ListPolicyRulesV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_rules_response.ListRulesResponse]:
+    ) -> pagination.PageIterator[list_rules_response.ListRulesResponse]:
         """Returns a list of policy rules.
 
         Args:
@@ -386,24 +343,128 @@ class PolicyRulesV1ControllerPaginator:
                 +-------+------------------+---------------------------------------------------+
 
         """
-        controller = PolicyRulesV1Controller(self.controller)
-        while True:
-            response = controller.list_policy_rules(
+        controller = self.controller.get_controller(PolicyRulesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: policy_rules_types.ListPolicyRulesV1FilterT | None = filter,
+        ) -> list_rules_response.ListRulesResponse:
+            return controller.list_policy_rules(
+                limit=limit,
+                start=page_start,
+                organizational_unit_id=organizational_unit_id,
+                sort=sort,
+                filter=page_filter,
+                **kwargs,
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='policy_rules_v1.list_policy_rules',
+        )
+
+
+class PolicyRulesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for policy-rules resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_policy_rules(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        organizational_unit_id: str | None = None,
+        sort: str | None = None,
+        filter: policy_rules_types.ListPolicyRulesV1FilterT | None = None,
+        **kwargs,
+    ) -> list_rules_response.ListRulesResponse:
+        """Asynchronous counterpart of PolicyRulesV1Controller.list_policy_rules."""
+        controller = self.controller.get_controller(PolicyRulesV1Controller)
+        return await self.controller.call(
+            controller.list_policy_rules,
+            limit=limit,
+            start=start,
+            organizational_unit_id=organizational_unit_id,
+            sort=sort,
+            filter=filter,
+            **kwargs,
+        )
+
+    async def create_policy_rule(
+        self, body: create_policy_rule_v1_request.CreatePolicyRuleV1Request | None = None, **kwargs
+    ) -> create_rule_response.CreateRuleResponse:
+        """Asynchronous counterpart of PolicyRulesV1Controller.create_policy_rule."""
+        controller = self.controller.get_controller(PolicyRulesV1Controller)
+        return await self.controller.call(controller.create_policy_rule, body=body, **kwargs)
+
+    async def read_policy_rule(
+        self, rule_id: str | None = None, **kwargs
+    ) -> read_rule_response.ReadRuleResponse:
+        """Asynchronous counterpart of PolicyRulesV1Controller.read_policy_rule."""
+        controller = self.controller.get_controller(PolicyRulesV1Controller)
+        return await self.controller.call(controller.read_policy_rule, rule_id=rule_id, **kwargs)
+
+    async def update_policy_rule(
+        self,
+        rule_id: str | None = None,
+        body: update_policy_rule_v1_request.UpdatePolicyRuleV1Request | None = None,
+        **kwargs,
+    ) -> update_rule_response.UpdateRuleResponse:
+        """Asynchronous counterpart of PolicyRulesV1Controller.update_policy_rule."""
+        controller = self.controller.get_controller(PolicyRulesV1Controller)
+        return await self.controller.call(
+            controller.update_policy_rule, rule_id=rule_id, body=body, **kwargs
+        )
+
+    async def delete_policy_rule(
+        self, rule_id: str | None = None, body: object | None = None, **kwargs
+    ) -> delete_rule_response.DeleteRuleResponse:
+        """Asynchronous counterpart of PolicyRulesV1Controller.delete_policy_rule."""
+        controller = self.controller.get_controller(PolicyRulesV1Controller)
+        return await self.controller.call(
+            controller.delete_policy_rule, rule_id=rule_id, body=body, **kwargs
+        )
+
+
+class PolicyRulesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for policy-rules resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_policy_rules(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        organizational_unit_id: str | None = None,
+        sort: str | None = None,
+        filter: policy_rules_types.ListPolicyRulesV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_rules_response.ListRulesResponse]:
+        """Asynchronous counterpart of PolicyRulesV1ControllerPaginator.list_policy_rules."""
+        controller = self.controller.get_controller(PolicyRulesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: policy_rules_types.ListPolicyRulesV1FilterT | None = filter,
+        ) -> list_rules_response.ListRulesResponse:
+            return await controller.list_policy_rules(
                 limit=limit,
-                start=start,
+                start=page_start,
                 organizational_unit_id=organizational_unit_id,
                 sort=sort,
-                filter=filter,
+                filter=page_filter,
                 **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='policy_rules_v1.list_policy_rules',
+        )
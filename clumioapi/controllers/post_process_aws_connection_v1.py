@@ -3,19 +3,15 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import post_process_aws_connection_v1_request
 import requests
-import retrying
 
 
 class PostProcessAwsConnectionV1Controller:
@@ -59,26 +55,17 @@ class PostProcessAwsConnectionV1Controller:
 
         resp_instance: object
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'post_process_aws_connection for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'post_process_aws_connection',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/connections/aws/post-process',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -88,3 +75,30 @@ class PostProcessAwsConnectionV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class PostProcessAwsConnectionV1AsyncController:
+    """An asynchronous Controller to access Endpoints for post-process-aws-connection resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def post_process_aws_connection(
+        self,
+        body: (
+            post_process_aws_connection_v1_request.PostProcessAwsConnectionV1Request | None
+        ) = None,
+        **kwargs,
+    ) -> object:
+        """Asynchronous counterpart of PostProcessAwsConnectionV1Controller.post_process_aws_connection."""
+        controller = self.controller.get_controller(PostProcessAwsConnectionV1Controller)
+        return await self.controller.call(
+            controller.post_process_aws_connection, body=body, **kwargs
+        )
+
+
+class PostProcessAwsConnectionV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for post-process-aws-connection resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
@@ -3,19 +3,15 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import post_process_kms_v1_request
 import requests
-import retrying
 
 
 class PostProcessKmsV1Controller:
@@ -55,24 +51,17 @@ class PostProcessKmsV1Controller:
 
         resp_instance: object
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'post_process_kms for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'post_process_kms',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/wallets/_post-process',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -82,3 +71,24 @@ class PostProcessKmsV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class PostProcessKmsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for post-process-kms resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def post_process_kms(
+        self, body: post_process_kms_v1_request.PostProcessKmsV1Request | None = None, **kwargs
+    ) -> object:
+        """Asynchronous counterpart of PostProcessKmsV1Controller.post_process_kms."""
+        controller = self.controller.get_controller(PostProcessKmsV1Controller)
+        return await self.controller.call(controller.post_process_kms, body=body, **kwargs)
+
+
+class PostProcessKmsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for post-process-kms resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
@@ -3,23 +3,20 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import protection_groups_s3_assets_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_protection_group_s3_asset_pitr_intervals_response
 from clumioapi.models import list_protection_group_s3_assets_response
 from clumioapi.models import read_protection_group_s3_asset_continuous_backup_stats_response
 from clumioapi.models import read_protection_group_s3_asset_response
 import requests
-import retrying
 
 
 class ProtectionGroupsS3AssetsV1Controller:
@@ -171,25 +168,16 @@ class ProtectionGroupsS3AssetsV1Controller:
 
         resp_instance: list_protection_group_s3_assets_response.ListProtectionGroupS3AssetsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_protection_group_s3_assets for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_protection_group_s3_assets',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/protection-groups/s3-assets',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -226,25 +214,16 @@ class ProtectionGroupsS3AssetsV1Controller:
 
         resp_instance: read_protection_group_s3_asset_response.ReadProtectionGroupS3AssetResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'read_protection_group_s3_asset for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_protection_group_s3_asset',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/protection-groups/s3-assets/{protection_group_s3_asset_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -304,23 +283,16 @@ class ProtectionGroupsS3AssetsV1Controller:
             read_protection_group_s3_asset_continuous_backup_stats_response.ReadProtectionGroupS3AssetContinuousBackupStatsResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_protection_group_s3_asset_continuous_backup_stats for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_protection_group_s3_asset_continuous_backup_stats',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/protection-groups/s3-assets/{protection_group_s3_asset_id}/continuous-backup-stats',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -391,23 +363,16 @@ class ProtectionGroupsS3AssetsV1Controller:
             list_protection_group_s3_asset_pitr_intervals_response.ListProtectionGroupS3AssetPitrIntervalsResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_protection_group_s3_asset_pitr_intervals for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_protection_group_s3_asset_pitr_intervals',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/protection-groups/s3-assets/{protection_group_s3_asset_id}/pitr-intervals',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -418,11 +383,6 @@ class ProtectionGroupsS3AssetsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_protection_group_s3_assets(
         self,
         limit: int | None = None,
@@ -432,7 +392,9 @@ class ProtectionGroupsS3AssetsV1ControllerPaginator:
         ) = None,
         lookback_days: int | None = None,
         **kwargs,
-    ) -> Iterator[list_protection_group_s3_assets_response.ListProtectionGroupS3AssetsResponse]:
+    ) -> pagination.PageIterator[
+        list_protection_group_s3_assets_response.ListProtectionGroupS3AssetsResponse
+    ]:
         """Returns a list of protection group S3 assets.
 
         Args:
@@ -538,28 +500,30 @@ class ProtectionGroupsS3AssetsV1ControllerPaginator:
             lookback_days:
                 Calculate backup status for the last `lookback_days` days.
         """
-        controller = ProtectionGroupsS3AssetsV1Controller(self.controller)
-        while True:
-            response = controller.list_protection_group_s3_assets(
-                limit=limit, start=start, filter=filter, lookback_days=lookback_days, **kwargs
+        controller = self.controller.get_controller(ProtectionGroupsS3AssetsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                protection_groups_s3_assets_types.ListProtectionGroupS3AssetsV1FilterT | None
+            ) = filter,
+        ) -> list_protection_group_s3_assets_response.ListProtectionGroupS3AssetsResponse:
+            return controller.list_protection_group_s3_assets(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                lookback_days=lookback_days,
+                **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
-
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='protection_groups_s3_assets_v1.list_protection_group_s3_assets',
+        )
+
     def list_protection_group_s3_asset_pitr_intervals(
         self,
         protection_group_s3_asset_id: str | None = None,
@@ -570,7 +534,7 @@ class ProtectionGroupsS3AssetsV1ControllerPaginator:
             | None
         ) = None,
         **kwargs,
-    ) -> Iterator[
+    ) -> pagination.PageIterator[
         list_protection_group_s3_asset_pitr_intervals_response.ListProtectionGroupS3AssetPitrIntervalsResponse
     ]:
         """Returns a list of time intervals (start timestamp and end timestamp) in which
@@ -600,23 +564,206 @@ class ProtectionGroupsS3AssetsV1ControllerPaginator:
                 +-----------+------------------+-----------------------------------------------+
 
         """
-        controller = ProtectionGroupsS3AssetsV1Controller(self.controller)
-        while True:
-            response = controller.list_protection_group_s3_asset_pitr_intervals(
+        controller = self.controller.get_controller(ProtectionGroupsS3AssetsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                protection_groups_s3_assets_types.ListProtectionGroupS3AssetPitrIntervalsV1FilterT
+                | None
+            ) = filter,
+        ) -> (
+            list_protection_group_s3_asset_pitr_intervals_response.ListProtectionGroupS3AssetPitrIntervalsResponse
+        ):
+            return controller.list_protection_group_s3_asset_pitr_intervals(
+                protection_group_s3_asset_id=protection_group_s3_asset_id,
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                **kwargs,
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='protection_groups_s3_assets_v1.list_protection_group_s3_asset_pitr_intervals',
+        )
+
+
+class ProtectionGroupsS3AssetsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for protection-groups-s3-assets resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_protection_group_s3_assets(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            protection_groups_s3_assets_types.ListProtectionGroupS3AssetsV1FilterT | None
+        ) = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> list_protection_group_s3_assets_response.ListProtectionGroupS3AssetsResponse:
+        """Asynchronous counterpart of ProtectionGroupsS3AssetsV1Controller.list_protection_group_s3_assets."""
+        controller = self.controller.get_controller(ProtectionGroupsS3AssetsV1Controller)
+        return await self.controller.call(
+            controller.list_protection_group_s3_assets,
+            limit=limit,
+            start=start,
+            filter=filter,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def read_protection_group_s3_asset(
+        self,
+        protection_group_s3_asset_id: str | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> read_protection_group_s3_asset_response.ReadProtectionGroupS3AssetResponse:
+        """Asynchronous counterpart of ProtectionGroupsS3AssetsV1Controller.read_protection_group_s3_asset."""
+        controller = self.controller.get_controller(ProtectionGroupsS3AssetsV1Controller)
+        return await self.controller.call(
+            controller.read_protection_group_s3_asset,
+            protection_group_s3_asset_id=protection_group_s3_asset_id,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def read_protection_group_s3_asset_continuous_backup_stats(
+        self,
+        protection_group_s3_asset_id: str | None = None,
+        bucket_name: str | None = None,
+        bucket_id: str | None = None,
+        begin_timestamp: str | None = None,
+        end_timestamp: str | None = None,
+        interval: str | None = None,
+        **kwargs,
+    ) -> (
+        read_protection_group_s3_asset_continuous_backup_stats_response.ReadProtectionGroupS3AssetContinuousBackupStatsResponse
+    ):
+        """Asynchronous counterpart of ProtectionGroupsS3AssetsV1Controller.read_protection_group_s3_asset_continuous_backup_stats."""
+        controller = self.controller.get_controller(ProtectionGroupsS3AssetsV1Controller)
+        return await self.controller.call(
+            controller.read_protection_group_s3_asset_continuous_backup_stats,
+            protection_group_s3_asset_id=protection_group_s3_asset_id,
+            bucket_name=bucket_name,
+            bucket_id=bucket_id,
+            begin_timestamp=begin_timestamp,
+            end_timestamp=end_timestamp,
+            interval=interval,
+            **kwargs,
+        )
+
+    async def list_protection_group_s3_asset_pitr_intervals(
+        self,
+        protection_group_s3_asset_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            protection_groups_s3_assets_types.ListProtectionGroupS3AssetPitrIntervalsV1FilterT
+            | None
+        ) = None,
+        **kwargs,
+    ) -> (
+        list_protection_group_s3_asset_pitr_intervals_response.ListProtectionGroupS3AssetPitrIntervalsResponse
+    ):
+        """Asynchronous counterpart of ProtectionGroupsS3AssetsV1Controller.list_protection_group_s3_asset_pitr_intervals."""
+        controller = self.controller.get_controller(ProtectionGroupsS3AssetsV1Controller)
+        return await self.controller.call(
+            controller.list_protection_group_s3_asset_pitr_intervals,
+            protection_group_s3_asset_id=protection_group_s3_asset_id,
+            limit=limit,
+            start=start,
+            filter=filter,
+            **kwargs,
+        )
+
+
+class ProtectionGroupsS3AssetsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for protection-groups-s3-assets resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_protection_group_s3_assets(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            protection_groups_s3_assets_types.ListProtectionGroupS3AssetsV1FilterT | None
+        ) = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_protection_group_s3_assets_response.ListProtectionGroupS3AssetsResponse
+    ]:
+        """Asynchronous counterpart of ProtectionGroupsS3AssetsV1ControllerPaginator.list_protection_group_s3_assets."""
+        controller = self.controller.get_controller(ProtectionGroupsS3AssetsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                protection_groups_s3_assets_types.ListProtectionGroupS3AssetsV1FilterT | None
+            ) = filter,
+        ) -> list_protection_group_s3_assets_response.ListProtectionGroupS3AssetsResponse:
+            return await controller.list_protection_group_s3_assets(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                lookback_days=lookback_days,
+                **kwargs,
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='protection_groups_s3_assets_v1.list_protection_group_s3_assets',
+        )
+
+    def list_protection_group_s3_asset_pitr_intervals(
+        self,
+        protection_group_s3_asset_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            protection_groups_s3_assets_types.ListProtectionGroupS3AssetPitrIntervalsV1FilterT
+            | None
+        ) = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_protection_group_s3_asset_pitr_intervals_response.ListProtectionGroupS3AssetPitrIntervalsResponse
+    ]:
+        """Asynchronous counterpart of ProtectionGroupsS3AssetsV1ControllerPaginator.list_protection_group_s3_asset_pitr_intervals."""
+        controller = self.controller.get_controller(ProtectionGroupsS3AssetsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                protection_groups_s3_assets_types.ListProtectionGroupS3AssetPitrIntervalsV1FilterT
+                | None
+            ) = filter,
+        ) -> (
+            list_protection_group_s3_asset_pitr_intervals_response.ListProtectionGroupS3AssetPitrIntervalsResponse
+        ):
+            return await controller.list_protection_group_s3_asset_pitr_intervals(
                 protection_group_s3_asset_id=protection_group_s3_asset_id,
                 limit=limit,
-                start=start,
-                filter=filter,
+                start=page_start,
+                filter=page_filter,
                 **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='protection_groups_s3_assets_v1.list_protection_group_s3_asset_pitr_intervals',
+        )
@@ -3,17 +3,15 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import protection_groups_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import add_bucket_protection_group_v1_request
 from clumioapi.models import add_bucket_to_protection_group_response
 from clumioapi.models import create_protection_group_response
@@ -24,7 +22,6 @@ from clumioapi.models import read_protection_group_response
 from clumioapi.models import update_protection_group_response
 from clumioapi.models import update_protection_group_v1_request
 import requests
-import retrying
 
 
 class ProtectionGroupsV1Controller:
@@ -131,23 +128,16 @@ class ProtectionGroupsV1Controller:
 
         resp_instance: list_protection_groups_response.ListProtectionGroupsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_protection_groups for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_protection_groups',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/protection-groups',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -179,23 +169,16 @@ class ProtectionGroupsV1Controller:
 
         resp_instance: read_protection_group_response.ReadProtectionGroupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_protection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_protection_group',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/datasources/protection-groups/{group_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -231,24 +214,17 @@ class ProtectionGroupsV1Controller:
 
         resp_instance: create_protection_group_response.CreateProtectionGroupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'create_protection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_protection_group',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/protection-groups',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -286,24 +262,17 @@ class ProtectionGroupsV1Controller:
 
         resp_instance: update_protection_group_response.UpdateProtectionGroupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.put(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_protection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_protection_group',
+            'put',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/protection-groups/{group_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -334,23 +303,16 @@ class ProtectionGroupsV1Controller:
 
         resp_instance: object
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'delete_protection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_protection_group',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/protection-groups/{group_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -391,26 +353,17 @@ class ProtectionGroupsV1Controller:
 
         resp_instance: add_bucket_to_protection_group_response.AddBucketToProtectionGroupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'add_bucket_protection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'add_bucket_protection_group',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/protection-groups/{group_id}/buckets',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -449,25 +402,16 @@ class ProtectionGroupsV1Controller:
             delete_bucket_from_protection_group_response.DeleteBucketFromProtectionGroupResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'delete_bucket_protection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_bucket_protection_group',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/protection-groups/{group_id}/buckets/{bucket_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -478,11 +422,6 @@ class ProtectionGroupsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_protection_groups(
         self,
         limit: int | None = None,
@@ -490,7 +429,7 @@ class ProtectionGroupsV1ControllerPaginator:
         filter: protection_groups_types.ListProtectionGroupsV1FilterT | None = None,
         lookback_days: int | None = None,
         **kwargs,
-    ) -> Iterator[list_protection_groups_response.ListProtectionGroupsResponse]:
+    ) -> pagination.PageIterator[list_protection_groups_response.ListProtectionGroupsResponse]:
         """Returns a list of protection groups.
 
         Args:
@@ -555,19 +494,154 @@ class ProtectionGroupsV1ControllerPaginator:
             lookback_days:
                 Calculate backup status for the last `lookback_days` days.
         """
-        controller = ProtectionGroupsV1Controller(self.controller)
-        while True:
-            response = controller.list_protection_groups(
-                limit=limit, start=start, filter=filter, lookback_days=lookback_days, **kwargs
+        controller = self.controller.get_controller(ProtectionGroupsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: protection_groups_types.ListProtectionGroupsV1FilterT | None = filter,
+        ) -> list_protection_groups_response.ListProtectionGroupsResponse:
+            return controller.list_protection_groups(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                lookback_days=lookback_days,
+                **kwargs,
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='protection_groups_v1.list_protection_groups',
+        )
+
+
+class ProtectionGroupsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for protection-groups resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_protection_groups(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: protection_groups_types.ListProtectionGroupsV1FilterT | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> list_protection_groups_response.ListProtectionGroupsResponse:
+        """Asynchronous counterpart of ProtectionGroupsV1Controller.list_protection_groups."""
+        controller = self.controller.get_controller(ProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.list_protection_groups,
+            limit=limit,
+            start=start,
+            filter=filter,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def read_protection_group(
+        self, group_id: str | None = None, lookback_days: int | None = None, **kwargs
+    ) -> read_protection_group_response.ReadProtectionGroupResponse:
+        """Asynchronous counterpart of ProtectionGroupsV1Controller.read_protection_group."""
+        controller = self.controller.get_controller(ProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.read_protection_group,
+            group_id=group_id,
+            lookback_days=lookback_days,
+            **kwargs,
+        )
+
+    async def create_protection_group(
+        self,
+        body: create_protection_group_v1_request.CreateProtectionGroupV1Request | None = None,
+        **kwargs,
+    ) -> create_protection_group_response.CreateProtectionGroupResponse:
+        """Asynchronous counterpart of ProtectionGroupsV1Controller.create_protection_group."""
+        controller = self.controller.get_controller(ProtectionGroupsV1Controller)
+        return await self.controller.call(controller.create_protection_group, body=body, **kwargs)
+
+    async def update_protection_group(
+        self,
+        group_id: str | None = None,
+        body: update_protection_group_v1_request.UpdateProtectionGroupV1Request | None = None,
+        **kwargs,
+    ) -> update_protection_group_response.UpdateProtectionGroupResponse:
+        """Asynchronous counterpart of ProtectionGroupsV1Controller.update_protection_group."""
+        controller = self.controller.get_controller(ProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.update_protection_group, group_id=group_id, body=body, **kwargs
+        )
+
+    async def delete_protection_group(self, group_id: str | None = None, **kwargs) -> object:
+        """Asynchronous counterpart of ProtectionGroupsV1Controller.delete_protection_group."""
+        controller = self.controller.get_controller(ProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.delete_protection_group, group_id=group_id, **kwargs
+        )
+
+    async def add_bucket_protection_group(
+        self,
+        group_id: str | None = None,
+        body: (
+            add_bucket_protection_group_v1_request.AddBucketProtectionGroupV1Request | None
+        ) = None,
+        **kwargs,
+    ) -> add_bucket_to_protection_group_response.AddBucketToProtectionGroupResponse:
+        """Asynchronous counterpart of ProtectionGroupsV1Controller.add_bucket_protection_group."""
+        controller = self.controller.get_controller(ProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.add_bucket_protection_group, group_id=group_id, body=body, **kwargs
+        )
+
+    async def delete_bucket_protection_group(
+        self, group_id: str | None = None, bucket_id: str | None = None, **kwargs
+    ) -> delete_bucket_from_protection_group_response.DeleteBucketFromProtectionGroupResponse:
+        """Asynchronous counterpart of ProtectionGroupsV1Controller.delete_bucket_protection_group."""
+        controller = self.controller.get_controller(ProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.delete_bucket_protection_group,
+            group_id=group_id,
+            bucket_id=bucket_id,
+            **kwargs,
+        )
+
+
+class ProtectionGroupsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for protection-groups resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_protection_groups(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: protection_groups_types.ListProtectionGroupsV1FilterT | None = None,
+        lookback_days: int | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_protection_groups_response.ListProtectionGroupsResponse]:
+        """Asynchronous counterpart of ProtectionGroupsV1ControllerPaginator.list_protection_groups."""
+        controller = self.controller.get_controller(ProtectionGroupsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: protection_groups_types.ListProtectionGroupsV1FilterT | None = filter,
+        ) -> list_protection_groups_response.ListProtectionGroupsResponse:
+            return await controller.list_protection_groups(
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                lookback_days=lookback_days,
+                **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='protection_groups_v1.list_protection_groups',
+        )
@@ -3,24 +3,21 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import report_compliance_runs_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_compliance_report_run_v1_request
 from clumioapi.models import create_compliance_run_response
 from clumioapi.models import list_compliance_runs_response
 from clumioapi.models import send_compliance_report_run_email_v1_request
 from clumioapi.models import send_compliance_run_email_response
 import requests
-import retrying
 
 
 class ReportComplianceRunsV1Controller:
@@ -108,25 +105,16 @@ class ReportComplianceRunsV1Controller:
 
         resp_instance: list_compliance_runs_response.ListComplianceRunsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'list_compliance_report_runs for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_compliance_report_runs',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/reports/compliance/configurations/{configuration_id}/runs',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -161,26 +149,17 @@ class ReportComplianceRunsV1Controller:
 
         resp_instance: create_compliance_run_response.CreateComplianceRunResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'create_compliance_report_run for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_compliance_report_run',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/reports/compliance/configurations/{configuration_id}/runs',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -210,25 +189,16 @@ class ReportComplianceRunsV1Controller:
 
         resp_instance: object
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'delete_compliance_report_run for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_compliance_report_run',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/reports/compliance/configurations/{configuration_id}/runs/{run_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -268,26 +238,17 @@ class ReportComplianceRunsV1Controller:
 
         resp_instance: send_compliance_run_email_response.SendComplianceRunEmailResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'send_compliance_report_run_email for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'send_compliance_report_run_email',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/reports/compliance/configurations/{configuration_id}/runs/{run_id}/_notify',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -298,11 +259,6 @@ class ReportComplianceRunsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_compliance_report_runs(
         self,
         configuration_id: str | None = None,
@@ -310,7 +266,7 @@ class ReportComplianceRunsV1ControllerPaginator:
         start: str | None = None,
         filter: report_compliance_runs_types.ListComplianceReportRunsV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_compliance_runs_response.ListComplianceRunsResponse]:
+    ) -> pagination.PageIterator[list_compliance_runs_response.ListComplianceRunsResponse]:
         """Get a list of all the compliance report runs belonging to the configuration.
 
         Args:
@@ -352,19 +308,140 @@ class ReportComplianceRunsV1ControllerPaginator:
                 For more information about filtering, refer to the
                 Filtering section of this guide.
         """
-        controller = ReportComplianceRunsV1Controller(self.controller)
-        while True:
-            response = controller.list_compliance_report_runs(
-                configuration_id=configuration_id, limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(ReportComplianceRunsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                report_compliance_runs_types.ListComplianceReportRunsV1FilterT | None
+            ) = filter,
+        ) -> list_compliance_runs_response.ListComplianceRunsResponse:
+            return controller.list_compliance_report_runs(
+                configuration_id=configuration_id,
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                **kwargs,
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='report_compliance_runs_v1.list_compliance_report_runs',
+        )
+
+
+class ReportComplianceRunsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for report-compliance-runs resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_compliance_report_runs(
+        self,
+        configuration_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: report_compliance_runs_types.ListComplianceReportRunsV1FilterT | None = None,
+        **kwargs,
+    ) -> list_compliance_runs_response.ListComplianceRunsResponse:
+        """Asynchronous counterpart of ReportComplianceRunsV1Controller.list_compliance_report_runs."""
+        controller = self.controller.get_controller(ReportComplianceRunsV1Controller)
+        return await self.controller.call(
+            controller.list_compliance_report_runs,
+            configuration_id=configuration_id,
+            limit=limit,
+            start=start,
+            filter=filter,
+            **kwargs,
+        )
+
+    async def create_compliance_report_run(
+        self,
+        configuration_id: str | None = None,
+        body: (
+            create_compliance_report_run_v1_request.CreateComplianceReportRunV1Request | None
+        ) = None,
+        **kwargs,
+    ) -> create_compliance_run_response.CreateComplianceRunResponse:
+        """Asynchronous counterpart of ReportComplianceRunsV1Controller.create_compliance_report_run."""
+        controller = self.controller.get_controller(ReportComplianceRunsV1Controller)
+        return await self.controller.call(
+            controller.create_compliance_report_run,
+            configuration_id=configuration_id,
+            body=body,
+            **kwargs,
+        )
+
+    async def delete_compliance_report_run(
+        self, configuration_id: str | None = None, run_id: str | None = None, **kwargs
+    ) -> object:
+        """Asynchronous counterpart of ReportComplianceRunsV1Controller.delete_compliance_report_run."""
+        controller = self.controller.get_controller(ReportComplianceRunsV1Controller)
+        return await self.controller.call(
+            controller.delete_compliance_report_run,
+            configuration_id=configuration_id,
+            run_id=run_id,
+            **kwargs,
+        )
+
+    async def send_compliance_report_run_email(
+        self,
+        configuration_id: str | None = None,
+        run_id: str | None = None,
+        body: (
+            send_compliance_report_run_email_v1_request.SendComplianceReportRunEmailV1Request | None
+        ) = None,
+        **kwargs,
+    ) -> send_compliance_run_email_response.SendComplianceRunEmailResponse:
+        """Asynchronous counterpart of ReportComplianceRunsV1Controller.send_compliance_report_run_email."""
+        controller = self.controller.get_controller(ReportComplianceRunsV1Controller)
+        return await self.controller.call(
+            controller.send_compliance_report_run_email,
+            configuration_id=configuration_id,
+            run_id=run_id,
+            body=body,
+            **kwargs,
+        )
+
+
+class ReportComplianceRunsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for report-compliance-runs resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_compliance_report_runs(
+        self,
+        configuration_id: str | None = None,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: report_compliance_runs_types.ListComplianceReportRunsV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_compliance_runs_response.ListComplianceRunsResponse]:
+        """Asynchronous counterpart of ReportComplianceRunsV1ControllerPaginator.list_compliance_report_runs."""
+        controller = self.controller.get_controller(ReportComplianceRunsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                report_compliance_runs_types.ListComplianceReportRunsV1FilterT | None
+            ) = filter,
+        ) -> list_compliance_runs_response.ListComplianceRunsResponse:
+            return await controller.list_compliance_report_runs(
+                configuration_id=configuration_id,
+                limit=limit,
+                start=page_start,
+                filter=page_filter,
+                **kwargs,
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='report_compliance_runs_v1.list_compliance_report_runs',
+        )
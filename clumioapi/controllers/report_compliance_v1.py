@@ -3,17 +3,15 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import report_compliance_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_compliance_configuration_response
 from clumioapi.models import create_compliance_report_configuration_v1_request
 from clumioapi.models import list_compliance_configurations_response
@@ -21,7 +19,6 @@ from clumioapi.models import read_compliance_configuration_response
 from clumioapi.models import update_compliance_configuration_response
 from clumioapi.models import update_compliance_report_configuration_v1_request
 import requests
-import retrying
 
 
 class ReportComplianceV1Controller:
@@ -101,23 +98,16 @@ class ReportComplianceV1Controller:
 
         resp_instance: list_compliance_configurations_response.ListComplianceConfigurationsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_compliance_report_configurations for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_compliance_report_configurations',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/reports/compliance/configurations',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -150,24 +140,17 @@ class ReportComplianceV1Controller:
             create_compliance_configuration_response.CreateComplianceConfigurationResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'create_compliance_report_configuration for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_compliance_report_configuration',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/reports/compliance/configurations',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -196,23 +179,16 @@ class ReportComplianceV1Controller:
 
         resp_instance: read_compliance_configuration_response.ReadComplianceConfigurationResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_compliance_report_configuration for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_compliance_report_configuration',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/reports/compliance/configurations/{configuration_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -251,24 +227,17 @@ class ReportComplianceV1Controller:
             update_compliance_configuration_response.UpdateComplianceConfigurationResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.put(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_compliance_report_configuration for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_compliance_report_configuration',
+            'put',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/reports/compliance/configurations/{configuration_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -296,23 +265,16 @@ class ReportComplianceV1Controller:
 
         resp_instance: object
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'delete_compliance_report_configuration for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_compliance_report_configuration',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/reports/compliance/configurations/{configuration_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -323,18 +285,15 @@ class ReportComplianceV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_compliance_report_configurations(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: report_compliance_types.ListComplianceReportConfigurationsV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_compliance_configurations_response.ListComplianceConfigurationsResponse]:
+    ) -> pagination.PageIterator[
+        list_compliance_configurations_response.ListComplianceConfigurationsResponse
+    ]:
         """Get a list of all the compliance report configurations.
 
         Args:
@@ -370,19 +329,137 @@ class ReportComplianceV1ControllerPaginator:
                 For more information about filtering, refer to the
                 Filtering section of this guide.
         """
-        controller = ReportComplianceV1Controller(self.controller)
-        while True:
-            response = controller.list_compliance_report_configurations(
-                limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(ReportComplianceV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                report_compliance_types.ListComplianceReportConfigurationsV1FilterT | None
+            ) = filter,
+        ) -> list_compliance_configurations_response.ListComplianceConfigurationsResponse:
+            return controller.list_compliance_report_configurations(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='report_compliance_v1.list_compliance_report_configurations',
+        )
+
+
+class ReportComplianceV1AsyncController:
+    """An asynchronous Controller to access Endpoints for report-compliance resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_compliance_report_configurations(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: report_compliance_types.ListComplianceReportConfigurationsV1FilterT | None = None,
+        **kwargs,
+    ) -> list_compliance_configurations_response.ListComplianceConfigurationsResponse:
+        """Asynchronous counterpart of ReportComplianceV1Controller.list_compliance_report_configurations."""
+        controller = self.controller.get_controller(ReportComplianceV1Controller)
+        return await self.controller.call(
+            controller.list_compliance_report_configurations,
+            limit=limit,
+            start=start,
+            filter=filter,
+            **kwargs,
+        )
+
+    async def create_compliance_report_configuration(
+        self,
+        body: (
+            create_compliance_report_configuration_v1_request.CreateComplianceReportConfigurationV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> create_compliance_configuration_response.CreateComplianceConfigurationResponse:
+        """Asynchronous counterpart of ReportComplianceV1Controller.create_compliance_report_configuration."""
+        controller = self.controller.get_controller(ReportComplianceV1Controller)
+        return await self.controller.call(
+            controller.create_compliance_report_configuration, body=body, **kwargs
+        )
+
+    async def read_compliance_report_configuration(
+        self, configuration_id: str | None = None, **kwargs
+    ) -> read_compliance_configuration_response.ReadComplianceConfigurationResponse:
+        """Asynchronous counterpart of ReportComplianceV1Controller.read_compliance_report_configuration."""
+        controller = self.controller.get_controller(ReportComplianceV1Controller)
+        return await self.controller.call(
+            controller.read_compliance_report_configuration,
+            configuration_id=configuration_id,
+            **kwargs,
+        )
+
+    async def update_compliance_report_configuration(
+        self,
+        configuration_id: str | None = None,
+        body: (
+            update_compliance_report_configuration_v1_request.UpdateComplianceReportConfigurationV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> update_compliance_configuration_response.UpdateComplianceConfigurationResponse:
+        """Asynchronous counterpart of ReportComplianceV1Controller.update_compliance_report_configuration."""
+        controller = self.controller.get_controller(ReportComplianceV1Controller)
+        return await self.controller.call(
+            controller.update_compliance_report_configuration,
+            configuration_id=configuration_id,
+            body=body,
+            **kwargs,
+        )
+
+    async def delete_compliance_report_configuration(
+        self, configuration_id: str | None = None, **kwargs
+    ) -> object:
+        """Asynchronous counterpart of ReportComplianceV1Controller.delete_compliance_report_configuration."""
+        controller = self.controller.get_controller(ReportComplianceV1Controller)
+        return await self.controller.call(
+            controller.delete_compliance_report_configuration,
+            configuration_id=configuration_id,
+            **kwargs,
+        )
+
+
+class ReportComplianceV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for report-compliance resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_compliance_report_configurations(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: report_compliance_types.ListComplianceReportConfigurationsV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_compliance_configurations_response.ListComplianceConfigurationsResponse
+    ]:
+        """Asynchronous counterpart of ReportComplianceV1ControllerPaginator.list_compliance_report_configurations."""
+        controller = self.controller.get_controller(ReportComplianceV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                report_compliance_types.ListComplianceReportConfigurationsV1FilterT | None
+            ) = filter,
+        ) -> list_compliance_configurations_response.ListComplianceConfigurationsResponse:
+            return await controller.list_compliance_report_configurations(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='report_compliance_v1.list_compliance_report_configurations',
+        )
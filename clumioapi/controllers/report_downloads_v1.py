@@ -3,22 +3,19 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import report_downloads_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_report_download_response
 from clumioapi.models import create_report_download_v1_request
 from clumioapi.models import list_report_downloads_response
 import requests
-import retrying
 
 
 class ReportDownloadsV1Controller:
@@ -97,23 +94,16 @@ class ReportDownloadsV1Controller:
 
         resp_instance: list_report_downloads_response.ListReportDownloadsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_report_downloads for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_report_downloads',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/reports/downloads',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -140,24 +130,17 @@ class ReportDownloadsV1Controller:
 
         resp_instance: create_report_download_response.CreateReportDownloadResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'create_report_download for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_report_download',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/reports/downloads',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -168,18 +151,13 @@ class ReportDownloadsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_report_downloads(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: report_downloads_types.ListReportDownloadsV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_report_downloads_response.ListReportDownloadsResponse]:
+    ) -> pagination.PageIterator[list_report_downloads_response.ListReportDownloadsResponse]:
         """Returns a list of unexpired, generated reports.
 
         Args:
@@ -218,19 +196,82 @@ class ReportDownloadsV1ControllerPaginator:
                 For more information about filtering, refer to the
                 Filtering section of this guide.
         """
-        controller = ReportDownloadsV1Controller(self.controller)
-        while True:
-            response = controller.list_report_downloads(
-                limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(ReportDownloadsV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: report_downloads_types.ListReportDownloadsV1FilterT | None = filter,
+        ) -> list_report_downloads_response.ListReportDownloadsResponse:
+            return controller.list_report_downloads(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='report_downloads_v1.list_report_downloads',
+        )
+
+
+class ReportDownloadsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for report-downloads resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_report_downloads(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: report_downloads_types.ListReportDownloadsV1FilterT | None = None,
+        **kwargs,
+    ) -> list_report_downloads_response.ListReportDownloadsResponse:
+        """Asynchronous counterpart of ReportDownloadsV1Controller.list_report_downloads."""
+        controller = self.controller.get_controller(ReportDownloadsV1Controller)
+        return await self.controller.call(
+            controller.list_report_downloads, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+    async def create_report_download(
+        self,
+        body: create_report_download_v1_request.CreateReportDownloadV1Request | None = None,
+        **kwargs,
+    ) -> create_report_download_response.CreateReportDownloadResponse:
+        """Asynchronous counterpart of ReportDownloadsV1Controller.create_report_download."""
+        controller = self.controller.get_controller(ReportDownloadsV1Controller)
+        return await self.controller.call(controller.create_report_download, body=body, **kwargs)
+
+
+class ReportDownloadsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for report-downloads resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_report_downloads(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: report_downloads_types.ListReportDownloadsV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_report_downloads_response.ListReportDownloadsResponse]:
+        """Asynchronous counterpart of ReportDownloadsV1ControllerPaginator.list_report_downloads."""
+        controller = self.controller.get_controller(ReportDownloadsV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: report_downloads_types.ListReportDownloadsV1FilterT | None = filter,
+        ) -> list_report_downloads_response.ListReportDownloadsResponse:
+            return await controller.list_report_downloads(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='report_downloads_v1.list_report_downloads',
+        )
@@ -3,20 +3,16 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_ec2_mssql_database_restore_response
 from clumioapi.models import restore_ec2_mssql_database_v1_request
 import requests
-import retrying
 
 
 class RestoreEc2MssqlDatabaseV1Controller:
@@ -77,26 +73,17 @@ class RestoreEc2MssqlDatabaseV1Controller:
             create_ec2_mssql_database_restore_response.CreateEC2MSSQLDatabaseRestoreResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'restore_ec2_mssql_database for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'restore_ec2_mssql_database',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/aws/ec2-mssql/databases',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -106,3 +93,29 @@ class RestoreEc2MssqlDatabaseV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class RestoreEc2MssqlDatabaseV1AsyncController:
+    """An asynchronous Controller to access Endpoints for restore-ec2-mssql-database resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def restore_ec2_mssql_database(
+        self,
+        embed: str | None = None,
+        body: restore_ec2_mssql_database_v1_request.RestoreEc2MssqlDatabaseV1Request | None = None,
+        **kwargs,
+    ) -> create_ec2_mssql_database_restore_response.CreateEC2MSSQLDatabaseRestoreResponse:
+        """Asynchronous counterpart of RestoreEc2MssqlDatabaseV1Controller.restore_ec2_mssql_database."""
+        controller = self.controller.get_controller(RestoreEc2MssqlDatabaseV1Controller)
+        return await self.controller.call(
+            controller.restore_ec2_mssql_database, embed=embed, body=body, **kwargs
+        )
+
+
+class RestoreEc2MssqlDatabaseV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for restore-ec2-mssql-database resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
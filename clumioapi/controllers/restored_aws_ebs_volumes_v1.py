@@ -3,20 +3,16 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import restore_aws_ebs_volume_v1_request
 from clumioapi.models import restore_ebs_response_v1
 import requests
-import retrying
 
 
 class RestoredAwsEbsVolumesV1Controller:
@@ -56,24 +52,17 @@ class RestoredAwsEbsVolumesV1Controller:
 
         resp_instance: restore_ebs_response_v1.RestoreEBSResponseV1
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'restore_aws_ebs_volume for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'restore_aws_ebs_volume',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/aws/ebs-volumes',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -83,3 +72,26 @@ class RestoredAwsEbsVolumesV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class RestoredAwsEbsVolumesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for restored-aws-ebs-volumes resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def restore_aws_ebs_volume(
+        self,
+        body: restore_aws_ebs_volume_v1_request.RestoreAwsEbsVolumeV1Request | None = None,
+        **kwargs,
+    ) -> restore_ebs_response_v1.RestoreEBSResponseV1:
+        """Asynchronous counterpart of RestoredAwsEbsVolumesV1Controller.restore_aws_ebs_volume."""
+        controller = self.controller.get_controller(RestoredAwsEbsVolumesV1Controller)
+        return await self.controller.call(controller.restore_aws_ebs_volume, body=body, **kwargs)
+
+
+class RestoredAwsEbsVolumesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for restored-aws-ebs-volumes resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
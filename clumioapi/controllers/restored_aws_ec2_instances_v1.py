@@ -3,20 +3,16 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import restore_aws_ec2_instance_v1_request
 from clumioapi.models import restore_ec2_response
 import requests
-import retrying
 
 
 class RestoredAwsEc2InstancesV1Controller:
@@ -72,24 +68,17 @@ class RestoredAwsEc2InstancesV1Controller:
 
         resp_instance: restore_ec2_response.RestoreEC2Response
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'restore_aws_ec2_instance for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'restore_aws_ec2_instance',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/aws/ec2-instances',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -99,3 +88,29 @@ class RestoredAwsEc2InstancesV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class RestoredAwsEc2InstancesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for restored-aws-ec2-instances resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def restore_aws_ec2_instance(
+        self,
+        embed: str | None = None,
+        body: restore_aws_ec2_instance_v1_request.RestoreAwsEc2InstanceV1Request | None = None,
+        **kwargs,
+    ) -> restore_ec2_response.RestoreEC2Response:
+        """Asynchronous counterpart of RestoredAwsEc2InstancesV1Controller.restore_aws_ec2_instance."""
+        controller = self.controller.get_controller(RestoredAwsEc2InstancesV1Controller)
+        return await self.controller.call(
+            controller.restore_aws_ec2_instance, embed=embed, body=body, **kwargs
+        )
+
+
+class RestoredAwsEc2InstancesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for restored-aws-ec2-instances resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
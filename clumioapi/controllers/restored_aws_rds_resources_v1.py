@@ -3,20 +3,16 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_rds_resource_restore_response
 from clumioapi.models import restore_aws_rds_resource_v1_request
 import requests
-import retrying
 
 
 class RestoredAwsRdsResourcesV1Controller:
@@ -77,24 +73,17 @@ class RestoredAwsRdsResourcesV1Controller:
 
         resp_instance: create_rds_resource_restore_response.CreateRdsResourceRestoreResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'restore_aws_rds_resource for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'restore_aws_rds_resource',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/aws/rds-resources',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -104,3 +93,29 @@ class RestoredAwsRdsResourcesV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class RestoredAwsRdsResourcesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for restored-aws-rds-resources resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def restore_aws_rds_resource(
+        self,
+        embed: str | None = None,
+        body: restore_aws_rds_resource_v1_request.RestoreAwsRdsResourceV1Request | None = None,
+        **kwargs,
+    ) -> create_rds_resource_restore_response.CreateRdsResourceRestoreResponse:
+        """Asynchronous counterpart of RestoredAwsRdsResourcesV1Controller.restore_aws_rds_resource."""
+        controller = self.controller.get_controller(RestoredAwsRdsResourcesV1Controller)
+        return await self.controller.call(
+            controller.restore_aws_rds_resource, embed=embed, body=body, **kwargs
+        )
+
+
+class RestoredAwsRdsResourcesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for restored-aws-rds-resources resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
@@ -3,23 +3,19 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import preview_aws_s3_bucket_v1_request
 from clumioapi.models import preview_details_s3_bucket_response
 from clumioapi.models import preview_s3_bucket_response
 from clumioapi.models import restore_aws_s3_bucket_v1_request
 from clumioapi.models import restore_s3_bucket_response
 import requests
-import retrying
 
 
 class RestoredAwsS3BucketsV1Controller:
@@ -60,24 +56,17 @@ class RestoredAwsS3BucketsV1Controller:
 
         resp_instance: restore_s3_bucket_response.RestoreS3BucketResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'restore_aws_s3_bucket for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'restore_aws_s3_bucket',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/aws/s3-buckets',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -109,24 +98,17 @@ class RestoredAwsS3BucketsV1Controller:
 
         resp_instance: preview_s3_bucket_response.PreviewS3BucketResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'preview_aws_s3_bucket for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'preview_aws_s3_bucket',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/aws/s3-buckets/{bucket_id}/previews',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -157,25 +139,16 @@ class RestoredAwsS3BucketsV1Controller:
 
         resp_instance: preview_details_s3_bucket_response.PreviewDetailsS3BucketResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'preview_details_aws_s3_bucket for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'preview_details_aws_s3_bucket',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/aws/s3-buckets/{bucket_id}/previews/{preview_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -185,3 +158,50 @@ class RestoredAwsS3BucketsV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class RestoredAwsS3BucketsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for restored-aws-s3-buckets resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def restore_aws_s3_bucket(
+        self,
+        body: restore_aws_s3_bucket_v1_request.RestoreAwsS3BucketV1Request | None = None,
+        **kwargs,
+    ) -> restore_s3_bucket_response.RestoreS3BucketResponse:
+        """Asynchronous counterpart of RestoredAwsS3BucketsV1Controller.restore_aws_s3_bucket."""
+        controller = self.controller.get_controller(RestoredAwsS3BucketsV1Controller)
+        return await self.controller.call(controller.restore_aws_s3_bucket, body=body, **kwargs)
+
+    async def preview_aws_s3_bucket(
+        self,
+        bucket_id: str | None = None,
+        body: preview_aws_s3_bucket_v1_request.PreviewAwsS3BucketV1Request | None = None,
+        **kwargs,
+    ) -> preview_s3_bucket_response.PreviewS3BucketResponse:
+        """Asynchronous counterpart of RestoredAwsS3BucketsV1Controller.preview_aws_s3_bucket."""
+        controller = self.controller.get_controller(RestoredAwsS3BucketsV1Controller)
+        return await self.controller.call(
+            controller.preview_aws_s3_bucket, bucket_id=bucket_id, body=body, **kwargs
+        )
+
+    async def preview_details_aws_s3_bucket(
+        self, bucket_id: str | None = None, preview_id: str | None = None, **kwargs
+    ) -> preview_details_s3_bucket_response.PreviewDetailsS3BucketResponse:
+        """Asynchronous counterpart of RestoredAwsS3BucketsV1Controller.preview_details_aws_s3_bucket."""
+        controller = self.controller.get_controller(RestoredAwsS3BucketsV1Controller)
+        return await self.controller.call(
+            controller.preview_details_aws_s3_bucket,
+            bucket_id=bucket_id,
+            preview_id=preview_id,
+            **kwargs,
+        )
+
+
+class RestoredAwsS3BucketsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for restored-aws-s3-buckets resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
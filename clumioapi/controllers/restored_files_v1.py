@@ -3,17 +3,15 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import restored_files_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import download_shared_file_response
 from clumioapi.models import download_shared_file_v1_request
 from clumioapi.models import generate_restored_file_passcode_response
@@ -23,7 +21,6 @@ from clumioapi.models import restored_files_response
 from clumioapi.models import share_file_restore_email_response
 from clumioapi.models import share_restored_file_v1_request
 import requests
-import retrying
 
 
 class RestoredFilesV1Controller:
@@ -96,23 +93,16 @@ class RestoredFilesV1Controller:
 
         resp_instance: restored_files_response.RestoredFilesResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_restored_files for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_restored_files',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/files',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -154,24 +144,17 @@ class RestoredFilesV1Controller:
 
         resp_instance: restore_file_response.RestoreFileResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'restore_files for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'restore_files',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/files',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -198,24 +181,17 @@ class RestoredFilesV1Controller:
 
         resp_instance: download_shared_file_response.DownloadSharedFileResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'download_shared_file for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'download_shared_file',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/files/_download',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -249,25 +225,16 @@ class RestoredFilesV1Controller:
 
         resp_instance: generate_restored_file_passcode_response.GenerateRestoredFilePasscodeResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'generate_restored_file_passcode for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'generate_restored_file_passcode',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/files/{restored_file_id}/_generate_passcode',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -311,24 +278,17 @@ class RestoredFilesV1Controller:
 
         resp_instance: share_file_restore_email_response.ShareFileRestoreEmailResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'share_restored_file for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'share_restored_file',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/files/{restored_file_id}/_share',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -339,18 +299,13 @@ class RestoredFilesV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_restored_files(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: restored_files_types.ListRestoredFilesV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[restored_files_response.RestoredFilesResponse]:
+    ) -> pagination.PageIterator[restored_files_response.RestoredFilesResponse]:
         """Gets the list of active restored files for an asset.
 
         Args:
@@ -381,19 +336,115 @@ class RestoredFilesV1ControllerPaginator:
                 +------------+------------------+----------------------------------------------+
 
         """
-        controller = RestoredFilesV1Controller(self.controller)
-        while True:
-            response = controller.list_restored_files(
-                limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(RestoredFilesV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: restored_files_types.ListRestoredFilesV1FilterT | None = filter,
+        ) -> restored_files_response.RestoredFilesResponse:
+            return controller.list_restored_files(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='restored_files_v1.list_restored_files',
+        )
+
+
+class RestoredFilesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for restored-files resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_restored_files(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: restored_files_types.ListRestoredFilesV1FilterT | None = None,
+        **kwargs,
+    ) -> restored_files_response.RestoredFilesResponse:
+        """Asynchronous counterpart of RestoredFilesV1Controller.list_restored_files."""
+        controller = self.controller.get_controller(RestoredFilesV1Controller)
+        return await self.controller.call(
+            controller.list_restored_files, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+    async def restore_files(
+        self,
+        embed: str | None = None,
+        body: restore_files_v1_request.RestoreFilesV1Request | None = None,
+        **kwargs,
+    ) -> restore_file_response.RestoreFileResponse:
+        """Asynchronous counterpart of RestoredFilesV1Controller.restore_files."""
+        controller = self.controller.get_controller(RestoredFilesV1Controller)
+        return await self.controller.call(
+            controller.restore_files, embed=embed, body=body, **kwargs
+        )
+
+    async def download_shared_file(
+        self,
+        body: download_shared_file_v1_request.DownloadSharedFileV1Request | None = None,
+        **kwargs,
+    ) -> download_shared_file_response.DownloadSharedFileResponse:
+        """Asynchronous counterpart of RestoredFilesV1Controller.download_shared_file."""
+        controller = self.controller.get_controller(RestoredFilesV1Controller)
+        return await self.controller.call(controller.download_shared_file, body=body, **kwargs)
+
+    async def generate_restored_file_passcode(
+        self, restored_file_id: str | None = None, **kwargs
+    ) -> generate_restored_file_passcode_response.GenerateRestoredFilePasscodeResponse:
+        """Asynchronous counterpart of RestoredFilesV1Controller.generate_restored_file_passcode."""
+        controller = self.controller.get_controller(RestoredFilesV1Controller)
+        return await self.controller.call(
+            controller.generate_restored_file_passcode, restored_file_id=restored_file_id, **kwargs
+        )
+
+    async def share_restored_file(
+        self,
+        restored_file_id: str | None = None,
+        body: share_restored_file_v1_request.ShareRestoredFileV1Request | None = None,
+        **kwargs,
+    ) -> share_file_restore_email_response.ShareFileRestoreEmailResponse:
+        """Asynchronous counterpart of RestoredFilesV1Controller.share_restored_file."""
+        controller = self.controller.get_controller(RestoredFilesV1Controller)
+        return await self.controller.call(
+            controller.share_restored_file, restored_file_id=restored_file_id, body=body, **kwargs
+        )
+
+
+class RestoredFilesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for restored-files resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_restored_files(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: restored_files_types.ListRestoredFilesV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[restored_files_response.RestoredFilesResponse]:
+        """Asynchronous counterpart of RestoredFilesV1ControllerPaginator.list_restored_files."""
+        controller = self.controller.get_controller(RestoredFilesV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: restored_files_types.ListRestoredFilesV1FilterT | None = filter,
+        ) -> restored_files_response.RestoredFilesResponse:
+            return await controller.list_restored_files(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='restored_files_v1.list_restored_files',
+        )
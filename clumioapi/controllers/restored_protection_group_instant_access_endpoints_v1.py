@@ -3,14 +3,13 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import restored_protection_group_instant_access_endpoints_types
 from clumioapi.exceptions import clumio_exception
@@ -32,7 +31,6 @@ from clumioapi.models import update_protection_group_instant_access_endpoint_v1_
 from clumioapi.models import update_s3_instant_access_endpoint_response
 from clumioapi.models import update_s3_instant_access_endpoint_role_response
 import requests
-import retrying
 
 
 class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
@@ -111,23 +109,16 @@ class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
             list_s3_instant_access_endpoints_response.ListS3InstantAccessEndpointsResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_protection_group_instant_access_endpoints for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_protection_group_instant_access_endpoints',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/instant-access-endpoints',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -162,24 +153,17 @@ class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
             create_s3_instant_access_endpoint_response.CreateS3InstantAccessEndpointResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'create_protection_group_instant_access_endpoint for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_protection_group_instant_access_endpoint',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/instant-access-endpoints',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -233,24 +217,17 @@ class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
             estimate_cost_s3_instant_access_endpoint_async_response.EstimateCostS3InstantAccessEndpointAsyncResponse,
         ]
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'cost_estimates_protection_group_instant_access_endpoint for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'cost_estimates_protection_group_instant_access_endpoint',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/instant-access-endpoints/cost-estimates',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -286,23 +263,16 @@ class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
             estimate_cost_details_s3_instant_access_endpoint_response.EstimateCostDetailsS3InstantAccessEndpointResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'cost_estimates_details_protection_group_instant_access_endpoint for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'cost_estimates_details_protection_group_instant_access_endpoint',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/instant-access-endpoints/cost-estimates/{estimate_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -331,23 +301,16 @@ class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
 
         resp_instance: read_s3_instant_access_endpoint_response.ReadS3InstantAccessEndpointResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_protection_group_instant_access_endpoint for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_protection_group_instant_access_endpoint',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/instant-access-endpoints/{endpoint_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -386,24 +349,17 @@ class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
             update_s3_instant_access_endpoint_response.UpdateS3InstantAccessEndpointResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.put(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_protection_group_instant_access_endpoint for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_protection_group_instant_access_endpoint',
+            'put',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/instant-access-endpoints/{endpoint_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -430,23 +386,16 @@ class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
 
         resp_instance: object
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'delete_protection_group_instant_access_endpoint for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_protection_group_instant_access_endpoint',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/instant-access-endpoints/{endpoint_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -477,23 +426,16 @@ class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
             read_s3_instant_access_endpoint_uri_response.ReadS3InstantAccessEndpointUriResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_protection_group_instant_access_endpoint_uri for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_protection_group_instant_access_endpoint_uri',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/instant-access-endpoints/{endpoint_id}/_get_uri',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -532,24 +474,17 @@ class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
             add_s3_instant_access_endpoint_role_response.AddS3InstantAccessEndpointRoleResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'add_protection_group_instant_access_endpoint_role for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'add_protection_group_instant_access_endpoint_role',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/instant-access-endpoints/{endpoint_id}/roles',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -586,23 +521,16 @@ class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
             read_s3_instant_access_endpoint_role_permission_response.ReadS3InstantAccessEndpointRolePermissionResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_protection_group_instant_access_endpoint_role_permission for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_protection_group_instant_access_endpoint_role_permission',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/instant-access-endpoints/{endpoint_id}/roles/permissions',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -648,24 +576,17 @@ class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
             update_s3_instant_access_endpoint_role_response.UpdateS3InstantAccessEndpointRoleResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.put(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_protection_group_instant_access_endpoint_role for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_protection_group_instant_access_endpoint_role',
+            'put',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/instant-access-endpoints/{endpoint_id}/roles/{role_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -701,23 +622,16 @@ class RestoredProtectionGroupInstantAccessEndpointsV1Controller:
             delete_s3_instant_access_endpoint_role_response.DeleteS3InstantAccessEndpointRoleResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'delete_protection_group_instant_access_endpoint_role for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_protection_group_instant_access_endpoint_role',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/instant-access-endpoints/{endpoint_id}/roles/{role_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -728,11 +642,6 @@ class RestoredProtectionGroupInstantAccessEndpointsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_protection_group_instant_access_endpoints(
         self,
         limit: int | None = None,
@@ -742,7 +651,9 @@ class RestoredProtectionGroupInstantAccessEndpointsV1ControllerPaginator:
             | None
         ) = None,
         **kwargs,
-    ) -> Iterator[list_s3_instant_access_endpoints_response.ListS3InstantAccessEndpointsResponse]:
+    ) -> pagination.PageIterator[
+        list_s3_instant_access_endpoints_response.ListS3InstantAccessEndpointsResponse
+    ]:
         """Lists S3 instant access endpoints depending on the filters present in the body.
 
         Args:
@@ -774,19 +685,277 @@ class RestoredProtectionGroupInstantAccessEndpointsV1ControllerPaginator:
                 +-----------------------------+------------------+-----------------------------+
 
         """
-        controller = RestoredProtectionGroupInstantAccessEndpointsV1Controller(self.controller)
-        while True:
-            response = controller.list_protection_group_instant_access_endpoints(
-                limit=limit, start=start, filter=filter, **kwargs
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                restored_protection_group_instant_access_endpoints_types.ListProtectionGroupInstantAccessEndpointsV1FilterT
+                | None
+            ) = filter,
+        ) -> list_s3_instant_access_endpoints_response.ListS3InstantAccessEndpointsResponse:
+            return controller.list_protection_group_instant_access_endpoints(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
             )
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+
+        return pagination.PageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='restored_protection_group_instant_access_endpoints_v1.list_protection_group_instant_access_endpoints',
+        )
+
+
+class RestoredProtectionGroupInstantAccessEndpointsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for restored-protection-group-instant-access-endpoints resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_protection_group_instant_access_endpoints(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            restored_protection_group_instant_access_endpoints_types.ListProtectionGroupInstantAccessEndpointsV1FilterT
+            | None
+        ) = None,
+        **kwargs,
+    ) -> list_s3_instant_access_endpoints_response.ListS3InstantAccessEndpointsResponse:
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1Controller.list_protection_group_instant_access_endpoints."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+        return await self.controller.call(
+            controller.list_protection_group_instant_access_endpoints,
+            limit=limit,
+            start=start,
+            filter=filter,
+            **kwargs,
+        )
+
+    async def create_protection_group_instant_access_endpoint(
+        self,
+        body: (
+            create_protection_group_instant_access_endpoint_v1_request.CreateProtectionGroupInstantAccessEndpointV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> create_s3_instant_access_endpoint_response.CreateS3InstantAccessEndpointResponse:
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1Controller.create_protection_group_instant_access_endpoint."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+        return await self.controller.call(
+            controller.create_protection_group_instant_access_endpoint, body=body, **kwargs
+        )
+
+    async def cost_estimates_protection_group_instant_access_endpoint(
+        self,
+        body: (
+            cost_estimates_protection_group_instant_access_endpoint_v1_request.CostEstimatesProtectionGroupInstantAccessEndpointV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> Union[
+        estimate_cost_s3_instant_access_endpoint_sync_response.EstimateCostS3InstantAccessEndpointSyncResponse,
+        estimate_cost_s3_instant_access_endpoint_async_response.EstimateCostS3InstantAccessEndpointAsyncResponse,
+    ]:
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1Controller.cost_estimates_protection_group_instant_access_endpoint."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+        return await self.controller.call(
+            controller.cost_estimates_protection_group_instant_access_endpoint, body=body, **kwargs
+        )
+
+    async def cost_estimates_details_protection_group_instant_access_endpoint(
+        self, estimate_id: str | None = None, **kwargs
+    ) -> (
+        estimate_cost_details_s3_instant_access_endpoint_response.EstimateCostDetailsS3InstantAccessEndpointResponse
+    ):
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1Controller.cost_estimates_details_protection_group_instant_access_endpoint."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+        return await self.controller.call(
+            controller.cost_estimates_details_protection_group_instant_access_endpoint,
+            estimate_id=estimate_id,
+            **kwargs,
+        )
+
+    async def read_protection_group_instant_access_endpoint(
+        self, endpoint_id: str | None = None, **kwargs
+    ) -> read_s3_instant_access_endpoint_response.ReadS3InstantAccessEndpointResponse:
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1Controller.read_protection_group_instant_access_endpoint."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+        return await self.controller.call(
+            controller.read_protection_group_instant_access_endpoint,
+            endpoint_id=endpoint_id,
+            **kwargs,
+        )
+
+    async def update_protection_group_instant_access_endpoint(
+        self,
+        endpoint_id: str | None = None,
+        body: (
+            update_protection_group_instant_access_endpoint_v1_request.UpdateProtectionGroupInstantAccessEndpointV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> update_s3_instant_access_endpoint_response.UpdateS3InstantAccessEndpointResponse:
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1Controller.update_protection_group_instant_access_endpoint."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+        return await self.controller.call(
+            controller.update_protection_group_instant_access_endpoint,
+            endpoint_id=endpoint_id,
+            body=body,
+            **kwargs,
+        )
+
+    async def delete_protection_group_instant_access_endpoint(
+        self, endpoint_id: str | None = None, **kwargs
+    ) -> object:
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1Controller.delete_protection_group_instant_access_endpoint."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+        return await self.controller.call(
+            controller.delete_protection_group_instant_access_endpoint,
+            endpoint_id=endpoint_id,
+            **kwargs,
+        )
+
+    async def read_protection_group_instant_access_endpoint_uri(
+        self, endpoint_id: str | None = None, **kwargs
+    ) -> read_s3_instant_access_endpoint_uri_response.ReadS3InstantAccessEndpointUriResponse:
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1Controller.read_protection_group_instant_access_endpoint_uri."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+        return await self.controller.call(
+            controller.read_protection_group_instant_access_endpoint_uri,
+            endpoint_id=endpoint_id,
+            **kwargs,
+        )
+
+    async def add_protection_group_instant_access_endpoint_role(
+        self,
+        endpoint_id: str | None = None,
+        body: (
+            add_protection_group_instant_access_endpoint_role_v1_request.AddProtectionGroupInstantAccessEndpointRoleV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> add_s3_instant_access_endpoint_role_response.AddS3InstantAccessEndpointRoleResponse:
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1Controller.add_protection_group_instant_access_endpoint_role."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+        return await self.controller.call(
+            controller.add_protection_group_instant_access_endpoint_role,
+            endpoint_id=endpoint_id,
+            body=body,
+            **kwargs,
+        )
+
+    async def read_protection_group_instant_access_endpoint_role_permission(
+        self, endpoint_id: str | None = None, **kwargs
+    ) -> (
+        read_s3_instant_access_endpoint_role_permission_response.ReadS3InstantAccessEndpointRolePermissionResponse
+    ):
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1Controller.read_protection_group_instant_access_endpoint_role_permission."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+        return await self.controller.call(
+            controller.read_protection_group_instant_access_endpoint_role_permission,
+            endpoint_id=endpoint_id,
+            **kwargs,
+        )
+
+    async def update_protection_group_instant_access_endpoint_role(
+        self,
+        endpoint_id: str | None = None,
+        role_id: str | None = None,
+        body: (
+            update_protection_group_instant_access_endpoint_role_v1_request.UpdateProtectionGroupInstantAccessEndpointRoleV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> update_s3_instant_access_endpoint_role_response.UpdateS3InstantAccessEndpointRoleResponse:
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1Controller.update_protection_group_instant_access_endpoint_role."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+        return await self.controller.call(
+            controller.update_protection_group_instant_access_endpoint_role,
+            endpoint_id=endpoint_id,
+            role_id=role_id,
+            body=body,
+            **kwargs,
+        )
+
+    async def delete_protection_group_instant_access_endpoint_role(
+        self, endpoint_id: str | None = None, role_id: str | None = None, **kwargs
+    ) -> delete_s3_instant_access_endpoint_role_response.DeleteS3InstantAccessEndpointRoleResponse:
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1Controller.delete_protection_group_instant_access_endpoint_role."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1Controller
+        )
+        return await self.controller.call(
+            controller.delete_protection_group_instant_access_endpoint_role,
+            endpoint_id=endpoint_id,
+            role_id=role_id,
+            **kwargs,
+        )
+
+
+class RestoredProtectionGroupInstantAccessEndpointsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for restored-protection-group-instant-access-endpoints resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_protection_group_instant_access_endpoints(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: (
+            restored_protection_group_instant_access_endpoints_types.ListProtectionGroupInstantAccessEndpointsV1FilterT
+            | None
+        ) = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[
+        list_s3_instant_access_endpoints_response.ListS3InstantAccessEndpointsResponse
+    ]:
+        """Asynchronous counterpart of RestoredProtectionGroupInstantAccessEndpointsV1ControllerPaginator.list_protection_group_instant_access_endpoints."""
+        controller = self.controller.get_controller(
+            RestoredProtectionGroupInstantAccessEndpointsV1AsyncController
+        )
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: (
+                restored_protection_group_instant_access_endpoints_types.ListProtectionGroupInstantAccessEndpointsV1FilterT
+                | None
+            ) = filter,
+        ) -> list_s3_instant_access_endpoints_response.ListS3InstantAccessEndpointsResponse:
+            return await controller.list_protection_group_instant_access_endpoints(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page,
+            start,
+            self.controller.config,
+            filter,
+            operation='restored_protection_group_instant_access_endpoints_v1.list_protection_group_instant_access_endpoints',
+        )
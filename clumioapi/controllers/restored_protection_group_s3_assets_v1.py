@@ -3,9 +3,7 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
@@ -20,7 +18,6 @@ from clumioapi.models import preview_protection_group_s3_asset_v1_request
 from clumioapi.models import restore_protection_group_s3_asset_response
 from clumioapi.models import restore_protection_group_s3_asset_v1_request
 import requests
-import retrying
 
 
 class RestoredProtectionGroupS3AssetsV1Controller:
@@ -84,24 +81,17 @@ class RestoredProtectionGroupS3AssetsV1Controller:
             restore_protection_group_s3_asset_response.RestoreProtectionGroupS3AssetResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'restore_protection_group_s3_asset for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'restore_protection_group_s3_asset',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/s3-assets',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -159,24 +149,17 @@ class RestoredProtectionGroupS3AssetsV1Controller:
             preview_protection_group_s3_asset_async_response.PreviewProtectionGroupS3AssetAsyncResponse,
         ]
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'preview_protection_group_s3_asset for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'preview_protection_group_s3_asset',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/s3-assets/{protection_group_s3_asset_id}/previews',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -218,23 +201,16 @@ class RestoredProtectionGroupS3AssetsV1Controller:
             preview_protection_group_s3_asset_details_response.PreviewProtectionGroupS3AssetDetailsResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'preview_details_protection_group_s3_asset for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'preview_details_protection_group_s3_asset',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/s3-assets/{protection_group_s3_asset_id}/previews/{preview_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -244,3 +220,70 @@ class RestoredProtectionGroupS3AssetsV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class RestoredProtectionGroupS3AssetsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for restored-protection-group-s3-assets resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def restore_protection_group_s3_asset(
+        self,
+        embed: str | None = None,
+        body: (
+            restore_protection_group_s3_asset_v1_request.RestoreProtectionGroupS3AssetV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> restore_protection_group_s3_asset_response.RestoreProtectionGroupS3AssetResponse:
+        """Asynchronous counterpart of RestoredProtectionGroupS3AssetsV1Controller.restore_protection_group_s3_asset."""
+        controller = self.controller.get_controller(RestoredProtectionGroupS3AssetsV1Controller)
+        return await self.controller.call(
+            controller.restore_protection_group_s3_asset, embed=embed, body=body, **kwargs
+        )
+
+    async def preview_protection_group_s3_asset(
+        self,
+        protection_group_s3_asset_id: str | None = None,
+        body: (
+            preview_protection_group_s3_asset_v1_request.PreviewProtectionGroupS3AssetV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> Union[
+        preview_protection_group_s3_asset_sync_response.PreviewProtectionGroupS3AssetSyncResponse,
+        preview_protection_group_s3_asset_async_response.PreviewProtectionGroupS3AssetAsyncResponse,
+    ]:
+        """Asynchronous counterpart of RestoredProtectionGroupS3AssetsV1Controller.preview_protection_group_s3_asset."""
+        controller = self.controller.get_controller(RestoredProtectionGroupS3AssetsV1Controller)
+        return await self.controller.call(
+            controller.preview_protection_group_s3_asset,
+            protection_group_s3_asset_id=protection_group_s3_asset_id,
+            body=body,
+            **kwargs,
+        )
+
+    async def preview_details_protection_group_s3_asset(
+        self,
+        protection_group_s3_asset_id: str | None = None,
+        preview_id: str | None = None,
+        **kwargs,
+    ) -> (
+        preview_protection_group_s3_asset_details_response.PreviewProtectionGroupS3AssetDetailsResponse
+    ):
+        """Asynchronous counterpart of RestoredProtectionGroupS3AssetsV1Controller.preview_details_protection_group_s3_asset."""
+        controller = self.controller.get_controller(RestoredProtectionGroupS3AssetsV1Controller)
+        return await self.controller.call(
+            controller.preview_details_protection_group_s3_asset,
+            protection_group_s3_asset_id=protection_group_s3_asset_id,
+            preview_id=preview_id,
+            **kwargs,
+        )
+
+
+class RestoredProtectionGroupS3AssetsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for restored-protection-group-s3-assets resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
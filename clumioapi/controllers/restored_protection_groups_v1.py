@@ -3,9 +3,7 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
@@ -22,7 +20,6 @@ from clumioapi.models import restore_protection_group_response
 from clumioapi.models import restore_protection_group_s3_objects_v1_request
 from clumioapi.models import restore_protection_group_v1_request
 import requests
-import retrying
 
 
 class RestoredProtectionGroupsV1Controller:
@@ -81,24 +78,17 @@ class RestoredProtectionGroupsV1Controller:
 
         resp_instance: restore_protection_group_response.RestoreProtectionGroupResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'restore_protection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'restore_protection_group',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -153,24 +143,17 @@ class RestoredProtectionGroupsV1Controller:
             preview_protection_group_async_response.PreviewProtectionGroupAsyncResponse,
         ]
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'preview_protection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'preview_protection_group',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/{protection_group_id}/previews',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -203,25 +186,16 @@ class RestoredProtectionGroupsV1Controller:
             preview_details_protection_group_response.PreviewDetailsProtectionGroupResponse
         )
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = (
-                f'preview_details_protection_group for url {urllib.parse.unquote(resp.url)} failed.'
-            )
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'preview_details_protection_group',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/{protection_group_id}/previews/{preview_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -272,24 +246,17 @@ class RestoredProtectionGroupsV1Controller:
 
         resp_instance: restore_objects_response.RestoreObjectsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'restore_protection_group_s3_objects for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'restore_protection_group_s3_objects',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/protection-groups/{protection_group_id}/s3-objects',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -299,3 +266,79 @@ class RestoredProtectionGroupsV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class RestoredProtectionGroupsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for restored-protection-groups resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def restore_protection_group(
+        self,
+        embed: str | None = None,
+        body: restore_protection_group_v1_request.RestoreProtectionGroupV1Request | None = None,
+        **kwargs,
+    ) -> restore_protection_group_response.RestoreProtectionGroupResponse:
+        """Asynchronous counterpart of RestoredProtectionGroupsV1Controller.restore_protection_group."""
+        controller = self.controller.get_controller(RestoredProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.restore_protection_group, embed=embed, body=body, **kwargs
+        )
+
+    async def preview_protection_group(
+        self,
+        protection_group_id: str | None = None,
+        body: preview_protection_group_v1_request.PreviewProtectionGroupV1Request | None = None,
+        **kwargs,
+    ) -> Union[
+        preview_protection_group_sync_response.PreviewProtectionGroupSyncResponse,
+        preview_protection_group_async_response.PreviewProtectionGroupAsyncResponse,
+    ]:
+        """Asynchronous counterpart of RestoredProtectionGroupsV1Controller.preview_protection_group."""
+        controller = self.controller.get_controller(RestoredProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.preview_protection_group,
+            protection_group_id=protection_group_id,
+            body=body,
+            **kwargs,
+        )
+
+    async def preview_details_protection_group(
+        self, protection_group_id: str | None = None, preview_id: str | None = None, **kwargs
+    ) -> preview_details_protection_group_response.PreviewDetailsProtectionGroupResponse:
+        """Asynchronous counterpart of RestoredProtectionGroupsV1Controller.preview_details_protection_group."""
+        controller = self.controller.get_controller(RestoredProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.preview_details_protection_group,
+            protection_group_id=protection_group_id,
+            preview_id=preview_id,
+            **kwargs,
+        )
+
+    async def restore_protection_group_s3_objects(
+        self,
+        protection_group_id: str | None = None,
+        embed: str | None = None,
+        body: (
+            restore_protection_group_s3_objects_v1_request.RestoreProtectionGroupS3ObjectsV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> restore_objects_response.RestoreObjectsResponse:
+        """Asynchronous counterpart of RestoredProtectionGroupsV1Controller.restore_protection_group_s3_objects."""
+        controller = self.controller.get_controller(RestoredProtectionGroupsV1Controller)
+        return await self.controller.call(
+            controller.restore_protection_group_s3_objects,
+            protection_group_id=protection_group_id,
+            embed=embed,
+            body=body,
+            **kwargs,
+        )
+
+
+class RestoredProtectionGroupsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for restored-protection-groups resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
@@ -3,9 +3,7 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
@@ -17,7 +15,6 @@ from clumioapi.models import restore_records_aws_dynamodb_table_v1_request
 from clumioapi.models import restore_records_response_async
 from clumioapi.models import restore_records_response_sync
 import requests
-import retrying
 
 
 class RestoredRecordsAwsDynamodbTablesV1Controller:
@@ -98,24 +95,17 @@ class RestoredRecordsAwsDynamodbTablesV1Controller:
             restore_records_response_async.RestoreRecordsResponseAsync,
         ]
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'restore_records_aws_dynamodb_table for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'restore_records_aws_dynamodb_table',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/restores/aws/dynamodb-tables/records',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -125,3 +115,35 @@ class RestoredRecordsAwsDynamodbTablesV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class RestoredRecordsAwsDynamodbTablesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for restored-records-aws-dynamodb-tables resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def restore_records_aws_dynamodb_table(
+        self,
+        embed: str | None = None,
+        body: (
+            restore_records_aws_dynamodb_table_v1_request.RestoreRecordsAwsDynamodbTableV1Request
+            | None
+        ) = None,
+        **kwargs,
+    ) -> Union[
+        restore_records_response_sync.RestoreRecordsResponseSync,
+        restore_records_response_async.RestoreRecordsResponseAsync,
+    ]:
+        """Asynchronous counterpart of RestoredRecordsAwsDynamodbTablesV1Controller.restore_records_aws_dynamodb_table."""
+        controller = self.controller.get_controller(RestoredRecordsAwsDynamodbTablesV1Controller)
+        return await self.controller.call(
+            controller.restore_records_aws_dynamodb_table, embed=embed, body=body, **kwargs
+        )
+
+
+class RestoredRecordsAwsDynamodbTablesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for restored-records-aws-dynamodb-tables resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
@@ -3,21 +3,17 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_permissions_response
 from clumioapi.models import list_roles_response
 from clumioapi.models import read_role_response
 import requests
-import retrying
 
 
 class RolesV1Controller:
@@ -52,23 +48,16 @@ class RolesV1Controller:
 
         resp_instance: list_roles_response.ListRolesResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_roles for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_roles',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/roles',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -85,23 +74,16 @@ class RolesV1Controller:
 
         resp_instance: list_permissions_response.ListPermissionsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_permissions for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_permissions',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/roles/permissions',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -126,23 +108,16 @@ class RolesV1Controller:
 
         resp_instance: read_role_response.ReadRoleResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_role for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_role',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/roles/{role_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -152,3 +127,34 @@ class RolesV1ControllerPaginator:
 
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
+
+
+class RolesV1AsyncController:
+    """An asynchronous Controller to access Endpoints for roles resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_roles(self, **kwargs):
+        """Asynchronous counterpart of RolesV1Controller.list_roles."""
+        controller = self.controller.get_controller(RolesV1Controller)
+        return await self.controller.call(controller.list_roles, **kwargs)
+
+    async def list_permissions(self, **kwargs):
+        """Asynchronous counterpart of RolesV1Controller.list_permissions."""
+        controller = self.controller.get_controller(RolesV1Controller)
+        return await self.controller.call(controller.list_permissions, **kwargs)
+
+    async def read_role(
+        self, role_id: str | None = None, **kwargs
+    ) -> read_role_response.ReadRoleResponse:
+        """Asynchronous counterpart of RolesV1Controller.read_role."""
+        controller = self.controller.get_controller(RolesV1Controller)
+        return await self.controller.call(controller.read_role, role_id=role_id, **kwargs)
+
+
+class RolesV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for roles resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
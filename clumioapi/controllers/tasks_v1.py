@@ -3,23 +3,20 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import tasks_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import list_tasks_response
 from clumioapi.models import read_task_response
 from clumioapi.models import update_task_response
 from clumioapi.models import update_task_v1_request
 import requests
-import retrying
 
 
 class TasksV1Controller:
@@ -204,23 +201,16 @@ class TasksV1Controller:
 
         resp_instance: list_tasks_response.ListTasksResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_tasks for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_tasks',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/tasks',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -245,23 +235,16 @@ class TasksV1Controller:
 
         resp_instance: read_task_response.ReadTaskResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_task for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_task',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/tasks/{task_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -292,24 +275,17 @@ class TasksV1Controller:
 
         resp_instance: update_task_response.UpdateTaskResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.patch(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_task for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_task',
+            'patch',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/tasks/{task_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -320,18 +296,13 @@ class TasksV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_tasks(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: tasks_types.ListTasksV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_tasks_response.ListTasksResponse]:
+    ) -> pagination.PageIterator[list_tasks_response.ListTasksResponse]:
         """Returns a list of tasks. Tasks include scheduled backup and on-demand restore
         related tasks.
 
@@ -476,17 +447,84 @@ class TasksV1ControllerPaginator:
                 +----------------------+------------------+------------------------------------+
 
         """
-        controller = TasksV1Controller(self.controller)
-        while True:
-            response = controller.list_tasks(limit=limit, start=start, filter=filter, **kwargs)
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+        controller = self.controller.get_controller(TasksV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: tasks_types.ListTasksV1FilterT | None = filter,
+        ) -> list_tasks_response.ListTasksResponse:
+            return controller.list_tasks(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page, start, self.controller.config, filter, operation='tasks_v1.list_tasks'
+        )
+
+
+class TasksV1AsyncController:
+    """An asynchronous Controller to access Endpoints for tasks resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_tasks(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: tasks_types.ListTasksV1FilterT | None = None,
+        **kwargs,
+    ) -> list_tasks_response.ListTasksResponse:
+        """Asynchronous counterpart of TasksV1Controller.list_tasks."""
+        controller = self.controller.get_controller(TasksV1Controller)
+        return await self.controller.call(
+            controller.list_tasks, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+    async def read_task(
+        self, task_id: str | None = None, **kwargs
+    ) -> read_task_response.ReadTaskResponse:
+        """Asynchronous counterpart of TasksV1Controller.read_task."""
+        controller = self.controller.get_controller(TasksV1Controller)
+        return await self.controller.call(controller.read_task, task_id=task_id, **kwargs)
+
+    async def update_task(
+        self,
+        task_id: str | None = None,
+        body: update_task_v1_request.UpdateTaskV1Request | None = None,
+        **kwargs,
+    ) -> update_task_response.UpdateTaskResponse:
+        """Asynchronous counterpart of TasksV1Controller.update_task."""
+        controller = self.controller.get_controller(TasksV1Controller)
+        return await self.controller.call(
+            controller.update_task, task_id=task_id, body=body, **kwargs
+        )
+
+
+class TasksV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for tasks resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_tasks(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: tasks_types.ListTasksV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_tasks_response.ListTasksResponse]:
+        """Asynchronous counterpart of TasksV1ControllerPaginator.list_tasks."""
+        controller = self.controller.get_controller(TasksV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: tasks_types.ListTasksV1FilterT | None = filter,
+        ) -> list_tasks_response.ListTasksResponse:
+            return await controller.list_tasks(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page, start, self.controller.config, filter, operation='tasks_v1.list_tasks'
+        )
@@ -1,10 +1,14 @@
 #
 # Copyright 2025. Clumio, A Commvault Company.
 #
-from typing import Any, Final
+import json
+import typing
+from typing import Any, Final, Iterator, Mapping, Self
+from urllib import parse
 
 from clumioapi.api_helper import camel_to_snake
 from pydantic import BaseModel
+from pydantic import PrivateAttr
 
 operations: Final[list[str]] = [
     'eq',
@@ -30,10 +34,28 @@ operations: Final[list[str]] = [
 class BaseControllerFilterTypes(BaseModel):
     """Base class for filter types used in controllers."""
 
+    # Incremented on every field assignment, to invalidate the cached query string.
+    _revision: int = PrivateAttr(default=0)
+    _query_cache: tuple[Any, str] | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._revision += 1
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied._query_cache = None
+        return copied
+
     @property
     def query_str(self) -> str:
         """Generates a query string from the filter attributes.
 
+        The string is computed once and reused until a field of the filter, or of a nested
+        filter, is assigned. Values modified in place, such as a list appended to, are not
+        detected: assign the field again or use a new filter.
+
         Example:
             ```
             filter = BaseControllerFilterTypes()
@@ -47,66 +69,190 @@ class BaseControllerFilterTypes(BaseModel):
             }'
             ```
         """
+        state = self._state()
+        private = typing.cast(dict[str, Any], self.__pydantic_private__)
+        cached = private['_query_cache']
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        conditions: dict[str, str] = {}
+        self._add_conditions(conditions, '')
+        query_str = _encode_object(conditions)
+        private['_query_cache'] = (state, query_str)
+        return query_str
+
+    def split(self, max_length: int) -> list[Self]:
+        """Splits the $in lists of the filter so that each filter's query string fits.
+
+        Every returned filter is a copy of this one whose longest $in list is replaced by a
+        chunk of its values, the chunks covering all the values once. An item matches this
+        filter if and only if it matches one of the returned filters. Filters with several
+        long $in lists are split on each in turn.
+
+        Args:
+            max_length: Maximum length of the URL-encoded query string of a filter.
+        Returns:
+            [self] if its query string fits, else the filters to query instead.
+        Raises:
+            ValueError: If the filter cannot be split into filters that fit.
+        """
+        length = _encoded_length(self.query_str)
+        if length <= max_length:
+            return [self]
+        in_lists = [(path, values) for path, values in self._in_lists() if len(values) > 1]
+        if not in_lists:
+            raise ValueError(
+                f'The filter query string is {length} characters long and its $in lists cannot '
+                f'be split into filters of at most {max_length} characters.'
+            )
+        path, values = max(in_lists, key=lambda in_list: len(in_list[1]))
+        values_length = _encoded_length(_encode_value(values))
+        unique_values = list(dict.fromkeys(values))
+        # The length of a chunk is that of its brackets, values and separating commas.
+        budget = max_length - (length - values_length) - 2 * _ENCODED_BRACKET_LENGTH
+        chunks: list[list[Any]] = [[]]
+        chunk_length = 0
+        for value in unique_values:
+            value_length = _encoded_length(_encode_value(value))
+            if chunks[-1]:
+                value_length += _ENCODED_COMMA_LENGTH
+                if chunk_length + value_length > budget:
+                    chunks.append([])
+                    value_length -= _ENCODED_COMMA_LENGTH
+                    chunk_length = 0
+            chunks[-1].append(value)
+            chunk_length += value_length
+        if len(chunks) == 1 and len(unique_values) == len(values):
+            # Only happens if the length of the list is not that of its values.
+            raise ValueError(f'The $in list of {".".join(path)} cannot be split.')
+        return [
+            split_filter
+            for chunk in chunks
+            for split_filter in self._with_in_list(path, chunk).split(max_length)
+        ]
 
-        def _format_dict_value(value: dict) -> str:
-            """Formats a dictionary value for inclusion in the query string."""
-            dict_str = ''
-            for k, v in value.items():
-                if dict_str:
-                    dict_str += ','
-                dict_str += f'"{'$' if k in operations else ''}{k.lower()}":{format_value(v)}'
-            return f'{{{dict_str}}}'
-
-        def _format_nested_filter(value: BaseControllerFilterTypes, parent_key: str) -> str:
-            """Formats a nested filter object for inclusion in the query string."""
-            nested_query_str = value.query_str
-            if not (nested_query_str.startswith('{') and nested_query_str.endswith('}')):
-                raise ValueError('Nested filter query_str must be enclosed in braces')
-
-            nested_str = value.query_str[1:-1]  # Remove the surrounding braces
-            formatted_str = ''
-            for part in nested_str.split(','):
-                key, val = part.split(':', 1)
-                formatted_str += f',"{parent_key}.{key.replace('"','')}":{val}'
-            return formatted_str.strip(',')
-
-        def format_value(value: Any, prefix: str = '') -> str:
-            """Formats the value for inclusion in the query string, handling nested objects."""
-            if isinstance(value, dict):
-                if not value:
-                    return f'"{prefix}":{{}}' if prefix else '{}'
-                # Check if the dict is a tag
-                is_tag = False
-                if ['Key', 'Value'] == list(value.keys()):
-                    is_tag = True
-                if not is_tag and (key := list(value.keys())[0]).lower() != key:
-                    # Handle nested objects like SubFilterType
-                    result = ''
-                    new_prefix = (
-                        f'{prefix}.{camel_to_snake(key)}' if prefix else camel_to_snake(key)
-                    )
-                    result += format_value(value[key], new_prefix)
-                    return result
-                dict_str = _format_dict_value(value)
-                return f'"{prefix}":{dict_str}' if prefix else dict_str
-            if isinstance(value, bool):
-                formatted_bool = str(value).lower()
-                return f'"{prefix}":{formatted_bool}' if prefix else formatted_bool
-            if isinstance(value, str):
-                formatted_str = f'"{value}"'
-                return f'"{prefix}":{formatted_str}' if prefix else formatted_str
-            if isinstance(value, list):
-                formatted_list = ', '.join(format_value(v) for v in value)
-                return f'"{prefix}":[{formatted_list}]' if prefix else f'[{formatted_list}]'
-            if isinstance(value, int):
-                return f'"{prefix}":{value}' if prefix else str(value)
+    def _in_lists(self) -> Iterator[tuple[tuple[str, ...], list[Any]]]:
+        """Yields the path of field names and the values of the $in lists of the filter."""
+        fields_set = self.model_fields_set
+        for name, _ in _field_keys(type(self)):
+            if name not in fields_set or (value := getattr(self, name)) is None:
+                continue
             if isinstance(value, BaseControllerFilterTypes):
-                return _format_nested_filter(value, prefix)
-            raise ValueError(f'Unsupported value type: {type(value)}')
-
-        converted_str_list: list[str] = []
-        for key in self.model_fields_set:
-            value = getattr(self, key)
-            if value is not None:
-                converted_str_list.append(format_value(value, camel_to_snake(key)))
-        return f'{{{','.join(converted_str_list)}}}'
+                for path, values in value._in_lists():
+                    yield (name, *path), values
+            elif isinstance(value, dict) and isinstance(value.get('in'), list):
+                yield (name,), value['in']
+
+    def _with_in_list(self, path: tuple[str, ...], values: list[Any]) -> Self:
+        """Returns a copy of the filter with the $in list at the path replaced by values."""
+        name, *rest = path
+        value = getattr(self, name)
+        if rest:
+            return self.model_copy(update={name: value._with_in_list(tuple(rest), values)})
+        return self.model_copy(update={name: {**value, 'in': values}})
+
+    def _state(self) -> Any:
+        """Returns a value that changes whenever the filter or a nested filter is assigned to."""
+        revision = self.__pydantic_private__['_revision']  # type: ignore
+        nested_fields = _nested_fields(type(self))
+        if not nested_fields:
+            return revision
+        nested = [
+            value._state()
+            for name in nested_fields
+            if isinstance(value := getattr(self, name), BaseControllerFilterTypes)
+        ]
+        return (revision, *nested)
+
+    def _add_conditions(self, conditions: dict[str, str], prefix: str) -> None:
+        """Adds the encoded conditions of the set fields, their keys under the prefix."""
+        fields_set = self.model_fields_set
+        for name, key in _field_keys(type(self)):
+            if name in fields_set and (value := getattr(self, name)) is not None:
+                _add_condition(conditions, f'{prefix}.{key}' if prefix else key, value)
+
+
+# The (field name, snake case key) pairs of each filter class, in declaration order.
+_filter_field_keys: dict[type, tuple[tuple[str, str], ...]] = {}
+
+# The names of the fields of each filter class that may hold a nested filter.
+_filter_nested_fields: dict[type, tuple[str, ...]] = {}
+
+# Keys of the operations in the query string.
+_operation_keys: Final[dict[str, str]] = {op: f'${op}' for op in operations}
+
+_SCALAR_TYPES: Final[set[type]] = {str, int, float, bool}
+
+# Query strings have no spaces, except after the commas separating the items of lists.
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+_list_encoder = json.JSONEncoder(ensure_ascii=False, separators=(', ', ':'))
+
+_ENCODED_BRACKET_LENGTH: Final[int] = len(parse.quote_plus('['))
+_ENCODED_COMMA_LENGTH: Final[int] = len(parse.quote_plus(', '))
+
+
+def _encoded_length(value: str) -> int:
+    """Returns the length of a string once URL-encoded as a query parameter."""
+    return len(parse.quote_plus(value))
+
+
+def _field_keys(cls: type[BaseControllerFilterTypes]) -> tuple[tuple[str, str], ...]:
+    """Returns the field names of a filter class with their keys in the query string."""
+    try:
+        return _filter_field_keys[cls]
+    except KeyError:
+        keys = tuple((name, camel_to_snake(name)) for name in cls.model_fields)
+        return _filter_field_keys.setdefault(cls, keys)
+
+
+def _nested_fields(cls: type[BaseControllerFilterTypes]) -> tuple[str, ...]:
+    """Returns the names of the fields of a filter class that may hold a nested filter."""
+    try:
+        return _filter_nested_fields[cls]
+    except KeyError:
+        names = tuple(
+            name
+            for name, field in cls.model_fields.items()
+            if any(
+                isinstance(arg, type) and issubclass(arg, BaseControllerFilterTypes)
+                for arg in (field.annotation, *typing.get_args(field.annotation))
+            )
+        )
+        return _filter_nested_fields.setdefault(cls, names)
+
+
+def _add_condition(conditions: dict[str, str], key: str, value: Any) -> None:
+    """Adds the encoded condition of a field, flattening nested filters and objects."""
+    if isinstance(value, BaseControllerFilterTypes):
+        value._add_conditions(conditions, key)
+        return
+    if isinstance(value, dict) and value and list(value) != ['Key', 'Value']:
+        # A dictionary keyed by a field name, rather than by operations, is a nested object.
+        first_key = next(iter(value))
+        if first_key.lower() != first_key:
+            _add_condition(conditions, f'{key}.{camel_to_snake(first_key)}', value[first_key])
+            return
+    conditions[key] = _encode_value(value)
+
+
+def _encode_object(members: Mapping[str, str]) -> str:
+    """Encodes a JSON object from its keys and their encoded values."""
+    return '{' + ','.join(f'{_encoder.encode(key)}:{value}' for key, value in members.items()) + '}'
+
+
+def _encode_value(value: Any) -> str:
+    """Encodes a condition in JSON, prefixing the operations with '$'."""
+    if isinstance(value, dict):
+        return _encode_object(
+            {_operation_keys.get(k) or k.lower(): _encode_value(v) for k, v in value.items()}
+        )
+    if isinstance(value, list):
+        if set(map(type, value)) <= _SCALAR_TYPES:
+            return _list_encoder.encode(value)
+        return '[' + ', '.join(map(_encode_value, value)) + ']'
+    if isinstance(value, (str, int, float)):
+        return _encoder.encode(value)
+    if isinstance(value, BaseControllerFilterTypes):
+        conditions: dict[str, str] = {}
+        value._add_conditions(conditions, '')
+        return _encode_object(conditions)
+    raise ValueError(f'Unsupported value type: {type(value)}')
@@ -3,17 +3,15 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import users_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import change_password_response
 from clumioapi.models import change_password_v1_request
 from clumioapi.models import create_user_response_v1
@@ -26,7 +24,6 @@ from clumioapi.models import update_user_profile_v1_request
 from clumioapi.models import update_user_response_v1
 from clumioapi.models import update_user_v1_request
 import requests
-import retrying
 
 
 class UsersV1Controller:
@@ -89,23 +86,16 @@ class UsersV1Controller:
 
         resp_instance: list_users_response_v1.ListUsersResponseV1
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_users for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_users',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -131,24 +121,17 @@ class UsersV1Controller:
 
         resp_instance: create_user_response_v1.CreateUserResponseV1
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'create_user for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_user',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -174,24 +157,17 @@ class UsersV1Controller:
 
         resp_instance: edit_profile_response_v1.EditProfileResponseV1
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.patch(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_user_profile for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_user_profile',
+            'patch',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users/my-profile',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -216,23 +192,16 @@ class UsersV1Controller:
 
         resp_instance: read_user_response_v1.ReadUserResponseV1
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_user for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_user',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users/{user_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -258,23 +227,16 @@ class UsersV1Controller:
 
         resp_instance: delete_user_response_v1.DeleteUserResponseV1
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'delete_user for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_user',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users/{user_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -306,24 +268,17 @@ class UsersV1Controller:
 
         resp_instance: update_user_response_v1.UpdateUserResponseV1
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.patch(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_user for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_user',
+            'patch',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users/{user_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -353,24 +308,17 @@ class UsersV1Controller:
 
         resp_instance: change_password_response.ChangePasswordResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.put(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'change_password for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'change_password',
+            'put',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users/{user_id}/password',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -381,18 +329,13 @@ class UsersV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_users(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: users_types.ListUsersV1FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_users_response_v1.ListUsersResponseV1]:
+    ) -> pagination.PageIterator[list_users_response_v1.ListUsersResponseV1]:
         """Returns a list of Clumio users.
 
         Args:
@@ -415,17 +358,119 @@ class UsersV1ControllerPaginator:
                 +-------+------------------+---------------------------------------------------+
 
         """
-        controller = UsersV1Controller(self.controller)
-        while True:
-            response = controller.list_users(limit=limit, start=start, filter=filter, **kwargs)
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+        controller = self.controller.get_controller(UsersV1Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: users_types.ListUsersV1FilterT | None = filter,
+        ) -> list_users_response_v1.ListUsersResponseV1:
+            return controller.list_users(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page, start, self.controller.config, filter, operation='users_v1.list_users'
+        )
+
+
+class UsersV1AsyncController:
+    """An asynchronous Controller to access Endpoints for users resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_users(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: users_types.ListUsersV1FilterT | None = None,
+        **kwargs,
+    ) -> list_users_response_v1.ListUsersResponseV1:
+        """Asynchronous counterpart of UsersV1Controller.list_users."""
+        controller = self.controller.get_controller(UsersV1Controller)
+        return await self.controller.call(
+            controller.list_users, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+    async def create_user(
+        self, body: create_user_v1_request.CreateUserV1Request | None = None, **kwargs
+    ) -> create_user_response_v1.CreateUserResponseV1:
+        """Asynchronous counterpart of UsersV1Controller.create_user."""
+        controller = self.controller.get_controller(UsersV1Controller)
+        return await self.controller.call(controller.create_user, body=body, **kwargs)
+
+    async def update_user_profile(
+        self,
+        body: update_user_profile_v1_request.UpdateUserProfileV1Request | None = None,
+        **kwargs,
+    ) -> edit_profile_response_v1.EditProfileResponseV1:
+        """Asynchronous counterpart of UsersV1Controller.update_user_profile."""
+        controller = self.controller.get_controller(UsersV1Controller)
+        return await self.controller.call(controller.update_user_profile, body=body, **kwargs)
+
+    async def read_user(
+        self, user_id: int | None = None, **kwargs
+    ) -> read_user_response_v1.ReadUserResponseV1:
+        """Asynchronous counterpart of UsersV1Controller.read_user."""
+        controller = self.controller.get_controller(UsersV1Controller)
+        return await self.controller.call(controller.read_user, user_id=user_id, **kwargs)
+
+    async def delete_user(
+        self, user_id: int | None = None, **kwargs
+    ) -> delete_user_response_v1.DeleteUserResponseV1:
+        """Asynchronous counterpart of UsersV1Controller.delete_user."""
+        controller = self.controller.get_controller(UsersV1Controller)
+        return await self.controller.call(controller.delete_user, user_id=user_id, **kwargs)
+
+    async def update_user(
+        self,
+        user_id: int | None = None,
+        body: update_user_v1_request.UpdateUserV1Request | None = None,
+        **kwargs,
+    ) -> update_user_response_v1.UpdateUserResponseV1:
+        """Asynchronous counterpart of UsersV1Controller.update_user."""
+        controller = self.controller.get_controller(UsersV1Controller)
+        return await self.controller.call(
+            controller.update_user, user_id=user_id, body=body, **kwargs
+        )
+
+    async def change_password(
+        self,
+        user_id: int | None = None,
+        body: change_password_v1_request.ChangePasswordV1Request | None = None,
+        **kwargs,
+    ) -> change_password_response.ChangePasswordResponse:
+        """Asynchronous counterpart of UsersV1Controller.change_password."""
+        controller = self.controller.get_controller(UsersV1Controller)
+        return await self.controller.call(
+            controller.change_password, user_id=user_id, body=body, **kwargs
+        )
+
+
+class UsersV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for users resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_users(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: users_types.ListUsersV1FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_users_response_v1.ListUsersResponseV1]:
+        """Asynchronous counterpart of UsersV1ControllerPaginator.list_users."""
+        controller = self.controller.get_controller(UsersV1AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: users_types.ListUsersV1FilterT | None = filter,
+        ) -> list_users_response_v1.ListUsersResponseV1:
+            return await controller.list_users(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page, start, self.controller.config, filter, operation='users_v1.list_users'
+        )
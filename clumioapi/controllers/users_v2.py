@@ -3,17 +3,15 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
 from clumioapi.controllers.types import users_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import change_password_response
 from clumioapi.models import change_password_v2_request
 from clumioapi.models import create_user_response
@@ -25,7 +23,6 @@ from clumioapi.models import update_user_profile_v2_request
 from clumioapi.models import update_user_response
 from clumioapi.models import update_user_v2_request
 import requests
-import retrying
 
 
 class UsersV2Controller:
@@ -95,23 +92,16 @@ class UsersV2Controller:
 
         resp_instance: list_users_response.ListUsersResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_users for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_users',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -137,24 +127,17 @@ class UsersV2Controller:
 
         resp_instance: create_user_response.CreateUserResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'create_user for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_user',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -179,24 +162,17 @@ class UsersV2Controller:
 
         resp_instance: change_password_response.ChangePasswordResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.put(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'change_password for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'change_password',
+            'put',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users/_change_password',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -222,24 +198,17 @@ class UsersV2Controller:
 
         resp_instance: edit_profile_response.EditProfileResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.patch(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_user_profile for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_user_profile',
+            'patch',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users/my-profile',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -264,23 +233,16 @@ class UsersV2Controller:
 
         resp_instance: read_user_response.ReadUserResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_user for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_user',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users/{user_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -304,23 +266,16 @@ class UsersV2Controller:
 
         resp_instance: object
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'delete_user for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_user',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users/{user_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -352,24 +307,17 @@ class UsersV2Controller:
 
         resp_instance: update_user_response.UpdateUserResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.patch(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'update_user for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'update_user',
+            'patch',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/users/{user_id}',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -380,18 +328,13 @@ class UsersV2ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_users(
         self,
         limit: int | None = None,
         start: str | None = None,
         filter: users_types.ListUsersV2FilterT | None = None,
         **kwargs,
-    ) -> Iterator[list_users_response.ListUsersResponse]:
+    ) -> pagination.PageIterator[list_users_response.ListUsersResponse]:
         """Returns a list of Clumio users.
 
         Args:
@@ -421,17 +364,112 @@ class UsersV2ControllerPaginator:
                 +------------------------+------------------+----------------------------------+
 
         """
-        controller = UsersV2Controller(self.controller)
-        while True:
-            response = controller.list_users(limit=limit, start=start, filter=filter, **kwargs)
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+        controller = self.controller.get_controller(UsersV2Controller)
+
+        def fetch_page(
+            page_start: str | None,
+            page_filter: users_types.ListUsersV2FilterT | None = filter,
+        ) -> list_users_response.ListUsersResponse:
+            return controller.list_users(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.PageIterator(
+            fetch_page, start, self.controller.config, filter, operation='users_v2.list_users'
+        )
+
+
+class UsersV2AsyncController:
+    """An asynchronous Controller to access Endpoints for users resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_users(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: users_types.ListUsersV2FilterT | None = None,
+        **kwargs,
+    ) -> list_users_response.ListUsersResponse:
+        """Asynchronous counterpart of UsersV2Controller.list_users."""
+        controller = self.controller.get_controller(UsersV2Controller)
+        return await self.controller.call(
+            controller.list_users, limit=limit, start=start, filter=filter, **kwargs
+        )
+
+    async def create_user(
+        self, body: create_user_v2_request.CreateUserV2Request | None = None, **kwargs
+    ) -> create_user_response.CreateUserResponse:
+        """Asynchronous counterpart of UsersV2Controller.create_user."""
+        controller = self.controller.get_controller(UsersV2Controller)
+        return await self.controller.call(controller.create_user, body=body, **kwargs)
+
+    async def change_password(
+        self, body: change_password_v2_request.ChangePasswordV2Request | None = None, **kwargs
+    ) -> change_password_response.ChangePasswordResponse:
+        """Asynchronous counterpart of UsersV2Controller.change_password."""
+        controller = self.controller.get_controller(UsersV2Controller)
+        return await self.controller.call(controller.change_password, body=body, **kwargs)
+
+    async def update_user_profile(
+        self,
+        body: update_user_profile_v2_request.UpdateUserProfileV2Request | None = None,
+        **kwargs,
+    ) -> edit_profile_response.EditProfileResponse:
+        """Asynchronous counterpart of UsersV2Controller.update_user_profile."""
+        controller = self.controller.get_controller(UsersV2Controller)
+        return await self.controller.call(controller.update_user_profile, body=body, **kwargs)
+
+    async def read_user(
+        self, user_id: int | None = None, **kwargs
+    ) -> read_user_response.ReadUserResponse:
+        """Asynchronous counterpart of UsersV2Controller.read_user."""
+        controller = self.controller.get_controller(UsersV2Controller)
+        return await self.controller.call(controller.read_user, user_id=user_id, **kwargs)
+
+    async def delete_user(self, user_id: int | None = None, **kwargs) -> object:
+        """Asynchronous counterpart of UsersV2Controller.delete_user."""
+        controller = self.controller.get_controller(UsersV2Controller)
+        return await self.controller.call(controller.delete_user, user_id=user_id, **kwargs)
+
+    async def update_user(
+        self,
+        user_id: int | None = None,
+        body: update_user_v2_request.UpdateUserV2Request | None = None,
+        **kwargs,
+    ) -> update_user_response.UpdateUserResponse:
+        """Asynchronous counterpart of UsersV2Controller.update_user."""
+        controller = self.controller.get_controller(UsersV2Controller)
+        return await self.controller.call(
+            controller.update_user, user_id=user_id, body=body, **kwargs
+        )
+
+
+class UsersV2AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for users resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_users(
+        self,
+        limit: int | None = None,
+        start: str | None = None,
+        filter: users_types.ListUsersV2FilterT | None = None,
+        **kwargs,
+    ) -> pagination.AsyncPageIterator[list_users_response.ListUsersResponse]:
+        """Asynchronous counterpart of UsersV2ControllerPaginator.list_users."""
+        controller = self.controller.get_controller(UsersV2AsyncController)
+
+        async def fetch_page(
+            page_start: str | None,
+            page_filter: users_types.ListUsersV2FilterT | None = filter,
+        ) -> list_users_response.ListUsersResponse:
+            return await controller.list_users(
+                limit=limit, start=page_start, filter=page_filter, **kwargs
+            )
+
+        return pagination.AsyncPageIterator(
+            fetch_page, start, self.controller.config, filter, operation='users_v2.list_users'
+        )
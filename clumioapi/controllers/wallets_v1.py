@@ -3,23 +3,20 @@
 #
 
 import json
-import re
 from typing import Any, Iterator, Optional, Union
-import urllib.parse
 
 from clumioapi import api_helper
 from clumioapi import configuration
 from clumioapi import sdk_version
 from clumioapi.controllers import base_controller
+from clumioapi.controllers import pagination
 from clumioapi.controllers.types import aws_s3_buckets_v1_bucket_matcher_types
-from clumioapi.exceptions import clumio_exception
 from clumioapi.models import create_wallet_response
 from clumioapi.models import create_wallet_v1_request
 from clumioapi.models import list_wallets_response
 from clumioapi.models import read_wallet_response
 from clumioapi.models import refresh_wallet_response
 import requests
-import retrying
 
 
 class WalletsV1Controller:
@@ -67,23 +64,16 @@ class WalletsV1Controller:
 
         resp_instance: list_wallets_response.ListWalletsResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'list_wallets for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'list_wallets',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/wallets',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -107,24 +97,17 @@ class WalletsV1Controller:
 
         resp_instance: create_wallet_response.CreateWalletResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                json=body.dict() if body else None,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'create_wallet for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'create_wallet',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/wallets',
+            json=body.dict() if body else None,
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -151,23 +134,16 @@ class WalletsV1Controller:
 
         resp_instance: read_wallet_response.ReadWalletResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.get(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'read_wallet for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'read_wallet',
+            'get',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/wallets/{wallet_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -192,23 +168,16 @@ class WalletsV1Controller:
 
         resp_instance: object
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.delete(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'delete_wallet for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'delete_wallet',
+            'delete',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/wallets/{wallet_id}',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -236,23 +205,16 @@ class WalletsV1Controller:
 
         resp_instance: refresh_wallet_response.RefreshWalletResponse
         # Execute request
-        resp: requests.Response
-        try:
-            resp = self.client.post(
-                _url_path,
-                headers=self.headers,
-                params=_query_parameters,
-                raw_response=True,
-                **kwargs,
-            )
-        except requests.exceptions.HTTPError as e:
-            resp = e.response
-
-        if not resp.ok:
-            error_str = f'refresh_wallet for url {urllib.parse.unquote(resp.url)} failed.'
-            raise clumio_exception.ClumioException(error_str, resp=resp)
-
-        resp_instance = get_instance_from_response(resp)
+        resp_instance = self.controller.request(
+            'refresh_wallet',
+            'post',
+            _url_path,
+            get_instance_from_response,
+            headers=self.headers,
+            params=_query_parameters,
+            url_template='/wallets/{wallet_id}/_refresh',
+            **kwargs,
+        )
 
         return resp_instance
 
@@ -263,14 +225,9 @@ class WalletsV1ControllerPaginator:
     def __init__(self, controller: base_controller.BaseController) -> None:
         self.controller = controller
 
-    @retrying.retry(
-        retry_on_exception=requests.exceptions.ConnectionError,
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
-    )
     def list_wallets(
         self, limit: int | None = None, start: str | None = None, **kwargs
-    ) -> Iterator[list_wallets_response.ListWalletsResponse]:
+    ) -> pagination.PageIterator[list_wallets_response.ListWalletsResponse]:
         """Returns a list of wallets.
 
         Args:
@@ -281,17 +238,73 @@ class WalletsV1ControllerPaginator:
                 get the first page.
                 Other pages can be traversed using HATEOAS links.
         """
-        controller = WalletsV1Controller(self.controller)
-        while True:
-            response = controller.list_wallets(limit=limit, start=start, **kwargs)
-            yield response
-            next_link = response.Links.Next  # type: ignore
-            if not next_link:
-                break
-            next_link = next_link.Href
-            if match := re.search(r'start=([^&]+)', next_link):  # type: ignore
-                start = match.group(1)
-            else:
-                raise clumio_exception.ClumioException(
-                    'Next link is malformed. Please contact clumio support.'
-                )
+        controller = self.controller.get_controller(WalletsV1Controller)
+
+        def fetch_page(page_start: str | None) -> list_wallets_response.ListWalletsResponse:
+            return controller.list_wallets(limit=limit, start=page_start, **kwargs)
+
+        return pagination.PageIterator(
+            fetch_page, start, self.controller.config, operation='wallets_v1.list_wallets'
+        )
+
+
+class WalletsV1AsyncController:
+    """An asynchronous Controller to access Endpoints for wallets resource."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    async def list_wallets(
+        self, limit: int | None = None, start: str | None = None, **kwargs
+    ) -> list_wallets_response.ListWalletsResponse:
+        """Asynchronous counterpart of WalletsV1Controller.list_wallets."""
+        controller = self.controller.get_controller(WalletsV1Controller)
+        return await self.controller.call(
+            controller.list_wallets, limit=limit, start=start, **kwargs
+        )
+
+    async def create_wallet(
+        self, body: create_wallet_v1_request.CreateWalletV1Request | None = None, **kwargs
+    ) -> create_wallet_response.CreateWalletResponse:
+        """Asynchronous counterpart of WalletsV1Controller.create_wallet."""
+        controller = self.controller.get_controller(WalletsV1Controller)
+        return await self.controller.call(controller.create_wallet, body=body, **kwargs)
+
+    async def read_wallet(
+        self, wallet_id: str | None = None, **kwargs
+    ) -> read_wallet_response.ReadWalletResponse:
+        """Asynchronous counterpart of WalletsV1Controller.read_wallet."""
+        controller = self.controller.get_controller(WalletsV1Controller)
+        return await self.controller.call(controller.read_wallet, wallet_id=wallet_id, **kwargs)
+
+    async def delete_wallet(self, wallet_id: str | None = None, **kwargs) -> object:
+        """Asynchronous counterpart of WalletsV1Controller.delete_wallet."""
+        controller = self.controller.get_controller(WalletsV1Controller)
+        return await self.controller.call(controller.delete_wallet, wallet_id=wallet_id, **kwargs)
+
+    async def refresh_wallet(
+        self, wallet_id: str | None = None, **kwargs
+    ) -> refresh_wallet_response.RefreshWalletResponse:
+        """Asynchronous counterpart of WalletsV1Controller.refresh_wallet."""
+        controller = self.controller.get_controller(WalletsV1Controller)
+        return await self.controller.call(controller.refresh_wallet, wallet_id=wallet_id, **kwargs)
+
+
+class WalletsV1AsyncControllerPaginator:
+    """An asynchronous Controller to access Endpoints for wallets resource with pagination."""
+
+    def __init__(self, controller: base_controller.AsyncBaseController) -> None:
+        self.controller = controller
+
+    def list_wallets(
+        self, limit: int | None = None, start: str | None = None, **kwargs
+    ) -> pagination.AsyncPageIterator[list_wallets_response.ListWalletsResponse]:
+        """Asynchronous counterpart of WalletsV1ControllerPaginator.list_wallets."""
+        controller = self.controller.get_controller(WalletsV1AsyncController)
+
+        async def fetch_page(page_start: str | None) -> list_wallets_response.ListWalletsResponse:
+            return await controller.list_wallets(limit=limit, start=page_start, **kwargs)
+
+        return pagination.AsyncPageIterator(
+            fetch_page, start, self.controller.config, operation='wallets_v1.list_wallets'
+        )
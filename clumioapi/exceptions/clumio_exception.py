@@ -18,6 +18,7 @@ class ClumioException(Exception):
                 to be raised.
             resp: The response object from the API call that caused the exception.
         """
+        self.resp = resp
         resp_str = ''
         if resp is not None:
             resp_str = (
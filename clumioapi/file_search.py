@@ -0,0 +1,199 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Searches the backups of many assets for many file name patterns at once."""
+
+import collections
+from concurrent import futures
+import dataclasses
+from typing import Iterable, Iterator
+
+from clumioapi import clumioapi_client
+from clumioapi.controllers import pagination
+from clumioapi.controllers.types import backups_files_types
+from clumioapi.models import file_search_response
+from clumioapi.models import file_search_result
+from clumioapi.models import file_version
+
+
+@dataclasses.dataclass(slots=True)
+class FileMatch:
+    """A file found by a batch search, with its versions.
+
+    Attributes:
+        asset_type: The type of the asset the file was found in, such as 'aws_ebs_volume'.
+        asset_id: The ID of the asset the file was found in.
+        pattern: The pattern of the search that found the file first.
+        file: The search result of the file.
+        versions: The backed up versions of the file, as listed by list_file_versions.
+    """
+
+    asset_type: str
+    asset_id: str
+    pattern: str
+    file: file_search_result.FileSearchResult
+    versions: list[file_version.FileVersion]
+
+
+@dataclasses.dataclass(slots=True)
+class _Search:
+    """A page of the search of an asset for a pattern."""
+
+    asset_type: str
+    asset_id: str
+    pattern: str
+    start: str | None = None
+
+
+class BatchFileSearch:
+    """Searches many assets for many file name patterns, looking up the versions of each file.
+
+    Every (asset, pattern) pair is searched with list_files, and list_file_versions is called
+    for every file found. The searches and version lookups run on a pool of max_workers
+    threads. A file matching several patterns of an asset is only looked up and yielded
+    once.
+
+    Version lookups are scheduled before new search pages, and no search page is requested
+    while files wait for their lookup or the consumer processes a match, so memory use does
+    not grow with the number of results. Only the paths of the files found in the assets
+    being searched are kept, to skip the duplicates when there are several patterns, and
+    they are dropped once all the patterns of an asset are searched.
+
+    Example:
+        ```
+        search = BatchFileSearch(client, max_workers=16)
+        assets = [('aws_ebs_volume', volume_id) for volume_id in volume_ids]
+        for match in search.search(assets, [r'invoice_2024.*\\.pdf', r'.*\\.pst']):
+            print(match.asset_id, match.file.Path, [v.BackupId for v in match.versions])
+        ```
+
+    Attributes:
+        client: The ClumioAPIClient making the calls.
+        max_workers: Maximum number of calls made at the same time.
+        limit: Number of items fetched per page of search results and of versions.
+    """
+
+    def __init__(
+        self,
+        client: clumioapi_client.ClumioAPIClient,
+        max_workers: int = 8,
+        limit: int | None = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+        self.client = client
+        self.max_workers = max_workers
+        self.limit = limit
+
+    def search(
+        self, assets: Iterable[tuple[str, str]], patterns: Iterable[str]
+    ) -> Iterator[FileMatch]:
+        """Yields the files of the assets whose name matches any of the patterns.
+
+        The matches are yielded as their versions are retrieved, in no particular order.
+
+        Args:
+            assets: The (asset type, asset ID) pairs of the assets to search, such as
+                ('aws_ec2_instance', instance_id).
+            patterns: The regex patterns matched against the file names.
+        Returns:
+            An iterator over the matches, one per file of an asset.
+        Raises:
+            ClumioException: If a search or version lookup fails.
+        """
+        patterns = list(dict.fromkeys(patterns))
+        new_searches = (
+            _Search(asset_type, asset_id, pattern)
+            for asset_type, asset_id in dict.fromkeys(assets)
+            for pattern in patterns
+        )
+        # Searches with more pages to fetch, and files waiting for their version lookup.
+        next_pages: collections.deque[_Search] = collections.deque()
+        lookups: collections.deque[tuple[_Search, file_search_result.FileSearchResult]] = (
+            collections.deque()
+        )
+        # The paths found in every asset being searched, if searched for several patterns, and
+        # the number of its searches not finished, keyed by asset type and ID.
+        seen: dict[tuple[str, str], set[str] | None] = {}
+        remaining: collections.Counter[tuple[str, str]] = collections.Counter()
+        in_flight: dict[
+            futures.Future, tuple[_Search, file_search_result.FileSearchResult | None]
+        ] = {}
+
+        with futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='clumioapi-file-search'
+        ) as executor:
+            try:
+                while True:
+                    while len(in_flight) < self.max_workers:
+                        if lookups:
+                            lookup = lookups.popleft()
+                            in_flight[executor.submit(self._versions, lookup[1])] = lookup
+                            continue
+                        next_search = (
+                            next_pages.popleft() if next_pages else next(new_searches, None)
+                        )
+                        if next_search is None:
+                            break
+                        asset = (next_search.asset_type, next_search.asset_id)
+                        if asset not in remaining:
+                            remaining[asset] = len(patterns)
+                            seen[asset] = set() if len(patterns) > 1 else None
+                        future: futures.Future = executor.submit(self._search_page, next_search)
+                        in_flight[future] = (next_search, None)
+                    if not in_flight:
+                        return
+
+                    done, _ = futures.wait(in_flight, return_when=futures.FIRST_COMPLETED)
+                    for future in done:
+                        search, found = in_flight.pop(future)
+                        if found is not None:
+                            yield FileMatch(
+                                search.asset_type,
+                                search.asset_id,
+                                search.pattern,
+                                found,
+                                future.result(),
+                            )
+                            continue
+                        page = future.result()
+                        asset = (search.asset_type, search.asset_id)
+                        asset_seen = seen[asset]
+                        for item in pagination.page_items(page):
+                            if asset_seen is None:
+                                lookups.append((search, item))
+                            elif item.Path not in asset_seen:
+                                asset_seen.add(item.Path)
+                                lookups.append((search, item))
+                        if (next_page_start := pagination.next_start(page)) is not None:
+                            next_pages.append(dataclasses.replace(search, start=next_page_start))
+                            continue
+                        remaining[asset] -= 1
+                        if not remaining[asset]:
+                            del remaining[asset]
+                            del seen[asset]
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    def _search_page(self, search: _Search) -> file_search_response.FileSearchResponse:
+        """Returns a page of the search of an asset for a pattern."""
+        return self.client.backups_files_v1.list_files(
+            limit=self.limit,
+            start=search.start,
+            filter=backups_files_types.ListFilesV1FilterT(
+                AssetType={'eq': search.asset_type},
+                AssetId={'eq': search.asset_id},
+                Name={'regex': search.pattern},
+            ),
+        )
+
+    def _versions(
+        self, found: file_search_result.FileSearchResult
+    ) -> list[file_version.FileVersion]:
+        """Returns all the versions of a file found by a search."""
+        pages = self.client.backups_files_v1_paginator.list_file_versions(
+            search_result_id=found.SearchResultId, limit=self.limit
+        )
+        return list(pages.iter_items())
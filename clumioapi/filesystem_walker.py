@@ -0,0 +1,231 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Parallel breadth-first traversal of the filesystems of backups."""
+
+import collections
+from concurrent import futures
+import dataclasses
+import json
+import os
+import time
+from typing import Any, Callable, Iterator
+
+from clumioapi import clumioapi_client
+from clumioapi.controllers import pagination
+from clumioapi.models import directory
+from clumioapi.models import read_directory_response
+
+
+@dataclasses.dataclass(slots=True)
+class WalkEntry:
+    """A file or directory found by a walk.
+
+    Attributes:
+        path: Path of the entry from the directory the walk started at, such as '/etc/hosts'.
+        depth: Depth of the entry, 1 for the entries of the starting directory.
+        entry: The entry as listed by read_backup_filesystem_directory.
+    """
+
+    path: str
+    depth: int
+    entry: directory.Directory
+
+    @property
+    def is_directory(self) -> bool:
+        """Whether the entry is a directory that can be walked."""
+        return bool(self.entry.IsDirectory and self.entry.DirectoryId)
+
+
+@dataclasses.dataclass(slots=True)
+class _PageRequest:
+    """A page of a directory to list, as saved in the checkpoint."""
+
+    directory_id: str
+    path: str
+    depth: int
+    start: str | None = None
+
+
+class FilesystemWalker:
+    """Walks the directory tree of a backup filesystem, listing sibling directories in parallel.
+
+    The tree is traversed breadth first. Up to max_workers pages of different directories are
+    listed at the same time; the pages of a single directory are listed one after the other,
+    as each page gives the start token of the next one. Entries are yielded as their pages
+    arrive, and no page is requested while the consumer processes the entries of another, so
+    at most max_workers pages are held in memory whatever the size of the tree.
+
+    When a checkpoint path is given, the frontier of the walk, the pages still to list, is
+    saved to it every checkpoint_interval seconds and when the walk raises or is closed
+    before completing. Walking again with the same arguments and checkpoint resumes from the
+    frontier. The entries of the pages being listed or yielded when the walk stopped are
+    yielded again. The checkpoint is removed once the walk completes.
+
+    Example:
+        ```
+        walker = FilesystemWalker(client, max_workers=16, checkpoint_path='walk.json')
+        for found in walker.walk(
+            backup_id,
+            filesystem_id,
+            root_directory_id,
+            max_depth=6,
+            descend=lambda found: found.entry.Name not in ('proc', 'sys'),
+            include=lambda found: found.path.endswith('.log') and found.entry.Size > 2**20,
+        ):
+            print(found.path, found.entry.Size)
+        ```
+
+    Attributes:
+        client: The ClumioAPIClient used to list the directories.
+        max_workers: Maximum number of directory pages listed at the same time.
+        limit: Number of entries fetched per page.
+        checkpoint_path: Path of the JSON file in which the frontier is saved, if any.
+        checkpoint_interval: Minimum number of seconds between two saves of the frontier.
+    """
+
+    def __init__(
+        self,
+        client: clumioapi_client.ClumioAPIClient,
+        max_workers: int = 8,
+        limit: int | None = None,
+        checkpoint_path: str | None = None,
+        checkpoint_interval: float = 30.0,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+        self.client = client
+        self.max_workers = max_workers
+        self.limit = limit
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+
+    def walk(
+        self,
+        backup_id: str,
+        filesystem_id: str,
+        directory_id: str,
+        max_depth: int | None = None,
+        include: Callable[[WalkEntry], bool] | None = None,
+        descend: Callable[[WalkEntry], bool] | None = None,
+    ) -> Iterator[WalkEntry]:
+        """Yields the entries of a directory and of all its subdirectories.
+
+        Args:
+            backup_id: The ID of the backup.
+            filesystem_id: The ID of the filesystem within the backup.
+            directory_id: The ID of the directory to start from.
+            max_depth: Depth of the deepest entries yielded, or None for no limit. 1 only
+                yields the entries of the starting directory.
+            include: Returns whether an entry is yielded. Defaults to all the entries.
+                Directories that are not yielded are still walked.
+            descend: Returns whether a directory is walked. Defaults to all the directories
+                within max_depth.
+        Returns:
+            An iterator over the entries, in breadth-first order across the directories.
+        Raises:
+            ClumioException: If listing a directory fails. The frontier is saved first.
+            ValueError: If the checkpoint was saved by a walk with other arguments.
+        """
+        root = {
+            'backup_id': backup_id,
+            'filesystem_id': filesystem_id,
+            'directory_id': directory_id,
+        }
+        frontier = self._load_checkpoint(root)
+        if frontier is None:
+            frontier = collections.deque([_PageRequest(directory_id, '', 0)])
+        controller = self.client.backup_filesystem_directories_v1
+
+        def list_page(request: _PageRequest) -> read_directory_response.ReadDirectoryResponse:
+            return controller.read_backup_filesystem_directory(
+                backup_id=backup_id,
+                filesystem_id=filesystem_id,
+                directory_id=request.directory_id,
+                limit=self.limit,
+                start=request.start,
+            )
+
+        in_flight: dict[futures.Future, _PageRequest] = {}
+        saved_at = time.monotonic()
+        with futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='clumioapi-walker'
+        ) as executor:
+            try:
+                while frontier or in_flight:
+                    while frontier and len(in_flight) < self.max_workers:
+                        request = frontier.popleft()
+                        in_flight[executor.submit(list_page, request)] = request
+                    done, _ = futures.wait(in_flight, return_when=futures.FIRST_COMPLETED)
+                    for future in done:
+                        request = in_flight[future]
+                        page = future.result()
+                        next_page_start = pagination.next_start(page)
+                        items = pagination.page_items(page)
+                        del page
+                        # The subdirectories join the frontier once all the entries of the
+                        # page are yielded, so that a page listed again after a resume does
+                        # not add them twice.
+                        subdirectories = []
+                        for item in items:
+                            found = WalkEntry(
+                                f'{request.path}/{item.Name}', request.depth + 1, item
+                            )
+                            if (
+                                found.is_directory
+                                and (max_depth is None or found.depth < max_depth)
+                                and (descend is None or descend(found))
+                            ):
+                                subdirectories.append(
+                                    _PageRequest(item.DirectoryId, found.path, found.depth)
+                                )
+                            if include is None or include(found):
+                                yield found
+                        frontier.extend(subdirectories)
+                        if next_page_start is not None:
+                            # The remaining pages of a directory are listed before the
+                            # directories found since, to finish the directories in order.
+                            frontier.appendleft(dataclasses.replace(request, start=next_page_start))
+                        del in_flight[future]
+                    if (
+                        self.checkpoint_path
+                        and time.monotonic() - saved_at >= self.checkpoint_interval
+                    ):
+                        self._save_checkpoint(root, [*in_flight.values(), *frontier])
+                        saved_at = time.monotonic()
+            finally:
+                for future in in_flight:
+                    future.cancel()
+                if in_flight or frontier:
+                    self._save_checkpoint(root, [*in_flight.values(), *frontier])
+                elif self.checkpoint_path and os.path.exists(self.checkpoint_path):
+                    os.remove(self.checkpoint_path)
+
+    def _load_checkpoint(self, root: dict[str, str]) -> collections.deque[_PageRequest] | None:
+        """Returns the frontier saved in the checkpoint, if any and not empty."""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path, encoding='utf-8') as f:
+            saved = json.load(f)
+        if saved.get('root') != root:
+            raise ValueError(
+                f'The checkpoint {self.checkpoint_path} was saved by another walk: '
+                f'{saved.get("root")}.'
+            )
+        if not saved['frontier']:
+            return None
+        return collections.deque(_PageRequest(**request) for request in saved['frontier'])
+
+    def _save_checkpoint(self, root: dict[str, str], frontier: list[_PageRequest]) -> None:
+        """Atomically replaces the checkpoint with the given frontier."""
+        if not self.checkpoint_path:
+            return
+        saved: dict[str, Any] = {
+            'root': root,
+            'frontier': [dataclasses.asdict(request) for request in frontier],
+        }
+        tmp_path = f'{self.checkpoint_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(saved, f)
+        os.replace(tmp_path, self.checkpoint_path)
@@ -0,0 +1,370 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Fleet-wide snapshot of the protection status of the AWS assets, in a columnar table."""
+
+import array
+import collections
+from concurrent import futures
+import dataclasses
+import itertools
+import threading
+from typing import Any, Collection, Iterable, Mapping, Sequence
+
+from clumioapi import clumioapi_client
+from clumioapi.controllers import pagination
+
+try:
+    import pyarrow
+    from pyarrow import compute
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+# The asset types of a snapshot, with the paginator and method listing them.
+ASSET_TYPES: Mapping[str, tuple[str, str]] = {
+    'aws_ec2_instance': ('aws_ec2_instances_v1_paginator', 'list_aws_ec2_instances'),
+    'aws_ebs_volume': ('aws_ebs_volumes_v1_paginator', 'list_aws_ebs_volumes'),
+    'aws_rds_resource': ('aws_rds_resources_v1_paginator', 'list_aws_rds_resources'),
+    'aws_dynamodb_table': ('aws_dynamodb_tables_v1_paginator', 'list_aws_dynamodb_tables'),
+    'aws_s3_bucket': ('aws_s3_buckets_v1_paginator', 'list_aws_s3_buckets'),
+}
+
+# The columns of a FleetTable that can be grouped and filtered on. Their values are
+# dictionary encoded: every row holds the code of its value.
+CATEGORY_COLUMNS: tuple[str, ...] = (
+    'asset_type',
+    'environment_id',
+    'organizational_unit_id',
+    'protection_status',
+    'policy_id',
+    'backup_status',
+    'aws_region',
+    'account_native_id',
+)
+
+
+@dataclasses.dataclass(slots=True)
+class GroupStats:
+    """The assets of a group of a FleetTable.
+
+    Attributes:
+        count: Number of assets.
+        size: Total size in bytes of the assets whose size is known.
+    """
+
+    count: int = 0
+    size: int = 0
+
+
+class FleetTable:
+    """Columnar table of the assets of a fleet, keyed by asset ID.
+
+    Every asset is a row holding its ID, name, size in bytes and the values of the
+    CATEGORY_COLUMNS. The values of a category column are stored once, each row holding a
+    4-byte code in an array, so a row takes a few bytes besides its ID and name, and
+    grouping or filtering rows compares integers.
+
+    The protection status is the one listed by the API: 'protected', 'unprotected' or
+    'unsupported'. Deleted assets have the 'deleted' status, and S3 buckets are protected
+    when they belong to a protection group. The policy is the one protecting the asset,
+    and the backup status the status of its latest backup, such as 'failure'.
+
+    Example:
+        ```
+        table = FleetSnapshot(client).take()
+        by_ou = table.group_by('organizational_unit_id', 'protection_status')
+        unprotected = table.asset_ids(
+            where={'protection_status': 'unprotected', 'asset_type': ['aws_ebs_volume']}
+        )
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[str, int] = {}
+        self._ids: list[str] = []
+        self._names: list[str | None] = []
+        # Sizes in bytes, -1 if unknown.
+        self._sizes = array.array('q')
+        self._codes = {column: array.array('I') for column in CATEGORY_COLUMNS}
+        # The values of each category column, by code, and their codes. Code 0 is None.
+        self._values: dict[str, list[str | None]] = {column: [None] for column in CATEGORY_COLUMNS}
+        self._value_codes: dict[str, dict[str | None, int]] = {
+            column: {None: 0} for column in CATEGORY_COLUMNS
+        }
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, asset_id: object) -> bool:
+        return asset_id in self._rows
+
+    def get(self, asset_id: str) -> dict[str, Any]:
+        """Returns the row of an asset, as a dictionary keyed by column.
+
+        Raises:
+            KeyError: If the asset is not in the table.
+        """
+        row = self._rows[asset_id]
+        size = self._sizes[row]
+        values: dict[str, Any] = {
+            'asset_id': asset_id,
+            'name': self._names[row],
+            'size': None if size < 0 else size,
+        }
+        for column, codes in self._codes.items():
+            values[column] = self._values[column][codes[row]]
+        return values
+
+    def values(self, column: str) -> list[str | None]:
+        """Returns the distinct values of a category column, None excluded.
+
+        Raises:
+            ValueError: If the column is not a category column.
+        """
+        return self._values[_category(column)][1:]
+
+    def asset_ids(self, where: Mapping[str, Any] | None = None) -> list[str]:
+        """Returns the IDs of the assets matching the conditions, in the order listed.
+
+        Args:
+            where: The value, or a collection of the values, each column must have. None
+                matches the assets without a value.
+        Raises:
+            ValueError: If a column is not a category column.
+        """
+        rows = self._matching(where)
+        if rows is None:
+            return list(self._ids)
+        ids = self._ids
+        return [ids[row] for row in rows]
+
+    def group_by(
+        self, *columns: str, where: Mapping[str, Any] | None = None
+    ) -> dict[tuple[str | None, ...], GroupStats]:
+        """Counts the assets and their size by the values of the given columns.
+
+        Args:
+            columns: The category columns to group on. Without columns, the matching assets
+                form a single group, keyed by ().
+            where: The value, or a collection of the values, each column must have, as for
+                asset_ids.
+        Returns:
+            The statistics of every group, keyed by its values of the columns, in order.
+        Raises:
+            ValueError: If a column is not a category column.
+        """
+        key_codes = [self._codes[_category(column)] for column in columns]
+        rows = self._matching(where)
+        if rows is None:
+            rows = range(len(self._ids))
+            keys: Iterable[tuple[int, ...]] = zip(*key_codes) if columns else itertools.repeat(())
+        else:
+            keys = (tuple(codes[row] for codes in key_codes) for row in rows)
+        groups: dict[tuple[int, ...], GroupStats] = {}
+        sizes = self._sizes
+        for row, key in zip(rows, keys):
+            stats = groups.get(key)
+            if stats is None:
+                stats = groups[key] = GroupStats()
+            stats.count += 1
+            if (size := sizes[row]) > 0:
+                stats.size += size
+        values = [self._values[column] for column in columns]
+        return {
+            tuple(column_values[code] for column_values, code in zip(values, key)): stats
+            for key, stats in groups.items()
+        }
+
+    def count_by(
+        self, *columns: str, where: Mapping[str, Any] | None = None
+    ) -> dict[tuple[str | None, ...], int]:
+        """Counts the assets by the values of the given columns, as group_by without sizes."""
+        key_codes = [self._codes[_category(column)] for column in columns]
+        rows = self._matching(where)
+        if rows is None and not columns:
+            counts: collections.Counter[tuple[int, ...]] = collections.Counter(
+                itertools.repeat((), len(self._ids))
+            )
+        elif rows is None:
+            counts = collections.Counter(zip(*key_codes))
+        else:
+            counts = collections.Counter(tuple(codes[row] for codes in key_codes) for row in rows)
+        values = [self._values[column] for column in columns]
+        return {
+            tuple(column_values[code] for column_values, code in zip(values, key)): count
+            for key, count in counts.items()
+        }
+
+    def to_arrow(self) -> Any:
+        """Returns the table as a pyarrow.Table, with dictionary-encoded category columns.
+
+        Arrow is an optional dependency of the SDK and must be installed separately with
+        `pip install pyarrow`.
+        """
+        if pyarrow is None:
+            raise ImportError(
+                'pyarrow is required for FleetTable.to_arrow. Install it with '
+                '`pip install pyarrow`.'
+            )
+        sizes = pyarrow.array(self._sizes, pyarrow.int64())
+        arrays = {
+            'asset_id': pyarrow.array(self._ids, pyarrow.string()),
+            'name': pyarrow.array(self._names, pyarrow.string()),
+            'size': compute.if_else(compute.less(sizes, 0), None, sizes),
+        }
+        for column, codes in self._codes.items():
+            indices = pyarrow.array(codes, pyarrow.uint32())
+            arrays[column] = pyarrow.DictionaryArray.from_arrays(
+                compute.if_else(compute.equal(indices, 0), None, indices),
+                pyarrow.array(self._values[column], pyarrow.string()),
+            )
+        return pyarrow.table(arrays)
+
+    def _add(self, rows: Iterable[tuple[Any, ...]]) -> None:
+        """Adds or replaces the rows of assets, given as (asset ID, name, size, *categories)."""
+        all_codes = [self._codes[column] for column in CATEGORY_COLUMNS]
+        all_values = [self._values[column] for column in CATEGORY_COLUMNS]
+        all_value_codes = [self._value_codes[column] for column in CATEGORY_COLUMNS]
+        for asset_id, name, size, *categories in rows:
+            row_codes = []
+            for value, values, value_codes in zip(categories, all_values, all_value_codes):
+                code = value_codes.get(value)
+                if code is None:
+                    code = value_codes[value] = len(values)
+                    values.append(value)
+                row_codes.append(code)
+            size = -1 if size is None else size
+            row = self._rows.get(asset_id)
+            if row is None:
+                # Listed for the first time.
+                self._rows[asset_id] = len(self._ids)
+                self._ids.append(asset_id)
+                self._names.append(name)
+                self._sizes.append(size)
+                for codes, code in zip(all_codes, row_codes):
+                    codes.append(code)
+                continue
+            self._names[row] = name
+            self._sizes[row] = size
+            for codes, code in zip(all_codes, row_codes):
+                codes[row] = code
+
+    def _matching(self, where: Mapping[str, Any] | None) -> Sequence[int] | None:
+        """Returns the rows matching the conditions, or None if there are no conditions."""
+        if not where:
+            return None
+        conditions = []
+        for column, wanted in where.items():
+            value_codes = self._value_codes[_category(column)]
+            if wanted is None or isinstance(wanted, str) or not isinstance(wanted, Collection):
+                wanted = (wanted,)
+            allowed = {value_codes[value] for value in wanted if value in value_codes}
+            conditions.append((self._codes[column], allowed))
+        codes, allowed = conditions[0]
+        rows = [row for row, code in enumerate(codes) if code in allowed]
+        for codes, allowed in conditions[1:]:
+            rows = [row for row in rows if codes[row] in allowed]
+        return rows
+
+
+class FleetSnapshot:
+    """Takes a snapshot of the protection status of all the AWS assets of the fleet.
+
+    The assets of every type are listed concurrently, one thread per type, from the
+    decoded JSON of the pages: no model is built. The items of a page are normalized into
+    rows of a FleetTable as the page arrives and the page is dropped, so besides the table
+    only the pages being listed are held in memory. An asset listed twice, as the
+    collection changes while it is listed, is kept once with its last listed values.
+
+    Example:
+        ```
+        table = FleetSnapshot(client, limit=1000).take()
+        for (ou, status), stats in table.group_by(
+            'organizational_unit_id', 'protection_status'
+        ).items():
+            print(ou, status, stats.count, stats.size)
+        ```
+
+    Attributes:
+        client: The ClumioAPIClient used to list the assets.
+        asset_types: The types of the assets to list, keys of ASSET_TYPES.
+        limit: Number of assets fetched per page.
+    """
+
+    def __init__(
+        self,
+        client: clumioapi_client.ClumioAPIClient,
+        asset_types: Iterable[str] = tuple(ASSET_TYPES),
+        limit: int | None = None,
+    ) -> None:
+        self.client = client
+        self.asset_types = list(asset_types)
+        for asset_type in self.asset_types:
+            if asset_type not in ASSET_TYPES:
+                raise ValueError(f'Unsupported asset type {asset_type}.')
+        self.limit = limit
+
+    def take(self) -> FleetTable:
+        """Lists the assets and returns the snapshot.
+
+        Raises:
+            ClumioException: If listing the assets of a type fails.
+        """
+        table = FleetTable()
+        lock = threading.Lock()
+        with futures.ThreadPoolExecutor(
+            max_workers=max(1, len(self.asset_types)),
+            thread_name_prefix='clumioapi-fleet-snapshot',
+        ) as executor:
+            loads = [
+                executor.submit(self._load, asset_type, table, lock)
+                for asset_type in self.asset_types
+            ]
+            for future in futures.as_completed(loads):
+                future.result()
+        return table
+
+    def _load(self, asset_type: str, table: FleetTable, lock: threading.Lock) -> None:
+        """Lists the assets of a type into the table."""
+        paginator, method = ASSET_TYPES[asset_type]
+        pages = getattr(getattr(self.client, paginator), method)(limit=self.limit, raw_json=True)
+        for page in pages:
+            rows = [_row(asset_type, item) for item in pagination.page_items(page)]
+            del page
+            with lock:
+                table._add(rows)
+
+
+def _row(asset_type: str, item: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Normalizes the decoded JSON of an asset into a row of a FleetTable."""
+    if asset_type == 'aws_s3_bucket':
+        status: str | None = 'protected' if item.get('protection_group_count') else 'unprotected'
+        size = item.get('size_bytes')
+    else:
+        status = item.get('protection_status')
+        size = item.get('size')
+    if item.get('is_deleted'):
+        status = 'deleted'
+    protection_info = item.get('protection_info') or {}
+    backup_status_info = item.get('backup_status_info') or {}
+    return (
+        item.get('id'),
+        item.get('name'),
+        size,
+        asset_type,
+        item.get('environment_id'),
+        item.get('organizational_unit_id'),
+        status,
+        protection_info.get('policy_id') or item.get('direct_assignment_policy_id'),
+        backup_status_info.get('backup_status'),
+        item.get('aws_region'),
+        item.get('account_native_id'),
+    )
+
+
+def _category(column: str) -> str:
+    """Returns the column, raising ValueError if it is not a category column."""
+    if column not in CATEGORY_COLUMNS:
+        raise ValueError(f'{column} is not one of the category columns {CATEGORY_COLUMNS}.')
+    return column
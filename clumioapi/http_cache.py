@@ -0,0 +1,321 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Opt-in cache of the responses to GET requests made by the controllers."""
+
+import collections
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Mapping, Protocol
+from urllib import parse
+
+from clumioapi import api_helper
+import requests
+from requests import structures
+
+# Request headers not part of the key of a response: the token is in its namespace.
+_UNKEYED_HEADERS = frozenset(('authorization', 'content-type', 'if-none-match'))
+
+
+@dataclasses.dataclass(slots=True)
+class CacheEntry:
+    """A cached response.
+
+    Attributes:
+        path: The path of the request, used to invalidate the entry.
+        stored_at: Time at which the response was received or last revalidated, in seconds
+            since the epoch.
+        status_code: The HTTP status code of the response.
+        headers: The headers of the response.
+        content: The body of the response.
+        url: The URL of the response.
+    """
+
+    path: str
+    stored_at: float
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    url: str
+
+    @property
+    def etag(self) -> str | None:
+        """The entity tag of the response, if the server sent one."""
+        return structures.CaseInsensitiveDict(self.headers).get('ETag')
+
+    def to_response(self) -> requests.Response:
+        """Rebuilds the cached response."""
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.reason = 'OK'
+        response.headers = structures.CaseInsensitiveDict(self.headers)
+        response.url = self.url
+        response.encoding = 'utf-8'
+        response._content = self.content
+        return response
+
+
+class CacheBackend(Protocol):
+    """Storage of the cached responses."""
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Returns the entry stored under the key, if any."""
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Stores an entry under the key, replacing any previous one."""
+
+    def invalidate(self, paths: list[str], prefix: str) -> None:
+        """Removes the entries of the given paths and of all the paths under the prefix."""
+
+    def clear(self) -> None:
+        """Removes all the entries."""
+
+
+class MemoryCache:
+    """In-memory least recently used cache backend.
+
+    Attributes:
+        max_entries: Maximum number of responses kept.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1.')
+        self.max_entries = max_entries
+        self._entries: collections.OrderedDict[str, CacheEntry] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, paths: list[str], prefix: str) -> None:
+        with self._lock:
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if entry.path in paths or entry.path.startswith(prefix)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache:
+    """On-disk cache backend, persisted in a SQLite database.
+
+    The database can be shared by successive processes, so that a short-lived script does not
+    start with an empty cache.
+
+    Attributes:
+        path: Path of the database file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, path TEXT, stored_at REAL, status_code INTEGER, '
+            'headers TEXT, content BLOB, url TEXT)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_path ON responses (path)')
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._db.execute(
+                'SELECT path, stored_at, status_code, headers, content, url FROM responses '
+                'WHERE key = ?',
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        path, stored_at, status_code, headers, content, url = row
+        return CacheEntry(path, stored_at, status_code, json.loads(headers), content, url)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (
+                    key,
+                    entry.path,
+                    entry.stored_at,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.url,
+                ),
+            )
+
+    def invalidate(self, paths: list[str], prefix: str) -> None:
+        escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        with self._lock:
+            self._db.execute(
+                f'DELETE FROM responses WHERE path IN ({", ".join("?" * len(paths))}) '
+                "OR path LIKE ? ESCAPE '\\'",
+                (*paths, f'{escaped}%'),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        """Closes the database."""
+        self._db.close()
+
+
+class ResponseCache:
+    """Caches the responses to GET requests and revalidates them with their ETag.
+
+    A cached response is served without contacting the server while it is younger than the
+    TTL of its endpoint family. Once expired, a response that came with an ETag header is
+    revalidated with an If-None-Match request, and served again if the server answers 304 Not
+    Modified. The TTL of a family may be 0 to always revalidate.
+
+    A successful write (POST, PUT, PATCH or DELETE) made through the SDK invalidates the
+    cached responses of its path, of the paths below it and of its parent paths, so that
+    neither the resource nor the collections containing it are served stale.
+
+    Responses are cached per namespace, identifying the server and the API token, path, query
+    parameters and request headers, such as the API version, the organizational unit and the
+    custom headers. A backend can thus be shared by clients of different tenants or regions.
+
+    Example:
+        ```
+        cache = ResponseCache(
+            SQLiteCache('clumio_cache.db'),
+            default_ttl=0,
+            ttls={'/policies/*': 300, '/roles': 3600, '/datasources/aws/environments': 600},
+        )
+        config = Configuration(api_token=api_token, response_cache=cache)
+        ```
+
+    Attributes:
+        backend: Where the responses are stored. Defaults to a MemoryCache.
+        default_ttl: TTL in seconds of the paths matching no family, or None not to cache them.
+        ttls: TTLs in seconds keyed by path pattern, matched as the families of a RateLimiter.
+            The first matching pattern applies. A TTL of None disables caching for the family.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        default_ttl: float | None = 60.0,
+        ttls: Mapping[str, float | None] | None = None,
+    ) -> None:
+        self.backend: CacheBackend = backend if backend is not None else MemoryCache()
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+
+    def ttl(self, url_path: str) -> float | None:
+        """Returns the TTL in seconds of the responses of a path, or None if not cached."""
+        for pattern, ttl in self.ttls.items():
+            if api_helper.path_matches(url_path, pattern):
+                return ttl
+        return self.default_ttl
+
+    def fetch(
+        self,
+        url_path: str,
+        headers: Mapping[str, Any],
+        params: Mapping[str, Any],
+        send: Callable[[Mapping[str, Any]], requests.Response],
+        namespace: str = '',
+    ) -> requests.Response:
+        """Returns the response to a GET request, from the cache if possible.
+
+        Args:
+            url_path: The path of the request.
+            headers: The headers of the request.
+            params: The query parameters of the request.
+            send: Sends the request with the given headers and returns the response.
+            namespace: Identifies the server and the credentials of the request, see
+                cache_namespace. Only the responses cached in the same namespace are served.
+        Returns:
+            The cached or received response.
+        """
+        ttl = self.ttl(url_path)
+        if ttl is None:
+            return send(headers)
+        key = self._key(namespace, url_path, headers, params)
+        entry = self.backend.get(key)
+        if entry is not None and time.time() - entry.stored_at < ttl:
+            return entry.to_response()
+
+        if entry is not None and entry.etag:
+            headers = {**headers, 'If-None-Match': entry.etag}
+        response = send(headers)
+        if response.status_code == 304:
+            if entry is not None and entry.etag:
+                entry.stored_at = time.time()
+                self.backend.set(key, entry)
+                return entry.to_response()
+            # No response to serve, as when If-None-Match was given by the caller: get it whole.
+            headers = {k: v for k, v in headers.items() if k.lower() != 'if-none-match'}
+            response = send(headers)
+        if response.status_code == 200 and (ttl > 0 or response.headers.get('ETag')):
+            self.backend.set(
+                key,
+                CacheEntry(
+                    url_path,
+                    time.time(),
+                    response.status_code,
+                    dict(response.headers),
+                    response.content,
+                    response.url,
+                ),
+            )
+        return response
+
+    def invalidate(self, url_path: str) -> None:
+        """Removes the cached responses of a path, of the paths below it and of its parents."""
+        path = url_path.split('?', 1)[0].rstrip('/')
+        parts = path.split('/')
+        parents = ['/'.join(parts[:i]) for i in range(2, len(parts))]
+        self.backend.invalidate([path, *parents], f'{path}/')
+
+    def clear(self) -> None:
+        """Removes all the cached responses."""
+        self.backend.clear()
+
+    @staticmethod
+    def _key(
+        namespace: str, url_path: str, headers: Mapping[str, Any], params: Mapping[str, Any]
+    ) -> str:
+        query = parse.urlencode(sorted((k, str(v)) for k, v in params.items() if v is not None))
+        header_values = parse.urlencode(
+            sorted(
+                (k.lower(), str(v))
+                for k, v in headers.items()
+                if v and k.lower() not in _UNKEYED_HEADERS
+            )
+        )
+        return '|'.join((namespace, f'{url_path}?{query}', header_values))
+
+
+def cache_namespace(hostname: str, api_token: str) -> str:
+    """Returns the namespace of the responses of a server to the requests made with a token.
+
+    Only a digest of the token is part of the namespace, so it is not stored by the backend.
+    """
+    return f'{hostname}|{hashlib.sha256(api_token.encode()).hexdigest()}'
@@ -0,0 +1,365 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Hooks observing the requests made by the controllers, and two implementations of them.
+
+Every controller method sends its request through BaseController.request, which calls the
+hooks of the configuration, or of the hooks keyword argument of the call:
+
+- pre_request, once before the request is sent;
+- on_retry, before waiting to send the request again;
+- post_response, once the final response is received, whether successful or not;
+- on_error, if the call raises, after post_response if a response was received.
+
+The hooks receive a RequestInfo describing the call, tagged with the name of the controller
+method, the URL template of the endpoint and the organizational unit context. An exception
+raised by a hook propagates to the caller of the controller method.
+
+HistogramCollector records latency histograms in process, for benchmarks, and
+OpenTelemetryHooks exports a span and metrics for every call through OpenTelemetry.
+
+Example:
+    ```
+    collector = HistogramCollector()
+    config = Configuration(api_token=api_token, hooks=[collector])
+    ...
+    for operation, stats in collector.stats().items():
+        print(operation, stats.count, stats.percentile(50), stats.percentile(99))
+    ```
+"""
+
+import contextvars
+import dataclasses
+import math
+import threading
+import time
+from typing import Any, Callable, Mapping
+
+import requests
+
+try:
+    from opentelemetry import context as otel_context
+    from opentelemetry import metrics
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore[assignment]
+
+_current: contextvars.ContextVar['RequestInfo | None'] = contextvars.ContextVar(
+    '_current', default=None
+)
+
+
+@dataclasses.dataclass(slots=True)
+class RequestInfo:
+    """Describes a call of a controller method, as passed to the hooks.
+
+    Attributes:
+        operation: Name of the controller method, such as 'list_tasks'.
+        method: The HTTP verb of the request, in lower case.
+        url_template: The path template of the endpoint, such as '/tasks/{task_id}'.
+        url_path: The path of the request, with the template parameters replaced.
+        organizational_unit: The organizational unit context of the request, or ''.
+        params: The query parameters of the request.
+        start: Value of time.perf_counter() when the call started.
+        attempt: The number of the attempt being made, starting at 1.
+        status_code: The status code of the final response, once received.
+        context: Free for the hooks to keep state between their calls, such as a span.
+    """
+
+    operation: str
+    method: str
+    url_template: str
+    url_path: str
+    organizational_unit: str = ''
+    params: Mapping[str, Any] = dataclasses.field(default_factory=dict)
+    start: float = dataclasses.field(default_factory=time.perf_counter)
+    attempt: int = 1
+    status_code: int | None = None
+    context: dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    @property
+    def elapsed(self) -> float:
+        """Number of seconds since the call started."""
+        return time.perf_counter() - self.start
+
+
+class RequestHooks:
+    """Base class of the hooks. Every method does nothing unless overridden."""
+
+    def pre_request(self, info: RequestInfo) -> None:
+        """Called once before the request of a call is sent."""
+
+    def on_retry(
+        self,
+        info: RequestInfo,
+        delay: float,
+        response: requests.Response | None,
+        error: Exception | None,
+    ) -> None:
+        """Called before waiting delay seconds to retry a failed attempt.
+
+        info.attempt is the number of the failed attempt. response is the error response of
+        the attempt, or error the exception it raised if no response was received.
+        """
+
+    def post_response(self, info: RequestInfo, response: requests.Response) -> None:
+        """Called once the final response of a call is received, successful or not."""
+
+    def on_error(self, info: RequestInfo, error: Exception) -> None:
+        """Called when a call raises. info.status_code is None if no response was received."""
+
+
+def current_request() -> RequestInfo | None:
+    """Returns the call whose request is being sent in this context, if any."""
+    return _current.get()
+
+
+def set_current_request(info: RequestInfo | None) -> contextvars.Token:
+    """Makes info the current request, until reset with the returned token."""
+    return _current.set(info)
+
+
+def reset_current_request(token: contextvars.Token) -> None:
+    """Restores the current request replaced by set_current_request."""
+    _current.reset(token)
+
+
+def response_size(response: requests.Response) -> int:
+    """Returns the size in bytes of the body of a response."""
+    return len(response.content) if response.content else 0
+
+
+@dataclasses.dataclass(slots=True)
+class OperationStats:
+    """Statistics of the calls recorded by a HistogramCollector for a key.
+
+    The latencies are kept in logarithmic buckets, each BUCKETS_PER_DOUBLING buckets covering
+    a doubling of the latency, so percentiles are within 3% of the recorded values whatever
+    the number of calls.
+
+    Attributes:
+        count: Number of calls.
+        errors: Number of calls that raised.
+        retries: Number of retries made by the calls.
+        status_codes: Number of calls by status code of their final response.
+        response_bytes: Total size in bytes of the bodies of the final responses.
+        total: Sum of the latencies in seconds.
+        min: Smallest latency in seconds.
+        max: Largest latency in seconds.
+        buckets: Number of calls by latency bucket.
+    """
+
+    BUCKETS_PER_DOUBLING = 16
+
+    count: int = 0
+    errors: int = 0
+    retries: int = 0
+    status_codes: dict[int, int] = dataclasses.field(default_factory=dict)
+    response_bytes: int = 0
+    total: float = 0.0
+    min: float = math.inf
+    max: float = 0.0
+    buckets: dict[int, int] = dataclasses.field(default_factory=dict)
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, latency: float) -> None:
+        """Adds the latency in seconds of a call."""
+        self.count += 1
+        self.total += latency
+        self.min = min(self.min, latency)
+        self.max = max(self.max, latency)
+        bucket = math.floor(math.log2(max(latency, 1e-9)) * self.BUCKETS_PER_DOUBLING)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, q: float) -> float:
+        """Returns the latency in seconds below which q percent of the calls fall."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                # The geometric middle of the bucket, within the recorded range.
+                value = 2 ** ((bucket + 0.5) / self.BUCKETS_PER_DOUBLING)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def copy(self) -> 'OperationStats':
+        """Returns a copy of the statistics."""
+        return dataclasses.replace(
+            self, status_codes=dict(self.status_codes), buckets=dict(self.buckets)
+        )
+
+
+class HistogramCollector(RequestHooks):
+    """Records the latency, retries, status codes and response sizes of the calls in process.
+
+    Attributes:
+        key: Returns the key under which a call is recorded. Defaults to its operation.
+    """
+
+    def __init__(self, key: Callable[[RequestInfo], Any] | None = None) -> None:
+        self.key = key or (lambda info: info.operation)
+        self._stats: dict[Any, OperationStats] = {}
+        self._lock = threading.Lock()
+
+    def on_retry(
+        self,
+        info: RequestInfo,
+        delay: float,
+        response: requests.Response | None,
+        error: Exception | None,
+    ) -> None:
+        with self._lock:
+            self._stats_of(info).retries += 1
+
+    def post_response(self, info: RequestInfo, response: requests.Response) -> None:
+        latency = info.elapsed
+        size = response_size(response)
+        with self._lock:
+            stats = self._stats_of(info)
+            stats.record(latency)
+            stats.status_codes[response.status_code] = (
+                stats.status_codes.get(response.status_code, 0) + 1
+            )
+            stats.response_bytes += size
+
+    def on_error(self, info: RequestInfo, error: Exception) -> None:
+        latency = info.elapsed
+        with self._lock:
+            stats = self._stats_of(info)
+            stats.errors += 1
+            if info.status_code is None:
+                # No response was received, so the call was not recorded by post_response.
+                stats.record(latency)
+
+    def stats(self) -> dict[Any, OperationStats]:
+        """Returns a copy of the statistics recorded so far, by key."""
+        with self._lock:
+            return {key: stats.copy() for key, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        """Forgets the recorded calls."""
+        with self._lock:
+            self._stats.clear()
+
+    def _stats_of(self, info: RequestInfo) -> OperationStats:
+        key = self.key(info)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = OperationStats()
+        return stats
+
+
+class OpenTelemetryHooks(RequestHooks):
+    """Exports a client span and metrics for every call through OpenTelemetry.
+
+    Spans are named after the HTTP verb and the URL template, such as 'GET /tasks/{task_id}',
+    and the retries are recorded as span events. The span is the current span while the
+    request is sent, so the spans and logs of the HTTP library are its children. The metrics are the
+    http.client.request.duration and http.client.response.body.size histograms and the
+    clumio.client.retries counter. All carry the operation, URL template, HTTP verb,
+    organizational unit and status code attributes.
+
+    The OpenTelemetry API is an optional dependency of the SDK and must be installed
+    separately with `pip install opentelemetry-api`, along with an SDK and exporters.
+
+    Attributes:
+        tracer: The tracer creating the spans.
+        meter: The meter creating the instruments.
+    """
+
+    def __init__(self, tracer_provider: Any = None, meter_provider: Any = None) -> None:
+        if trace is None:
+            raise ImportError(
+                'opentelemetry-api is required for OpenTelemetryHooks. Install it with '
+                '`pip install opentelemetry-api`.'
+            )
+        self.tracer = trace.get_tracer(__name__, tracer_provider=tracer_provider)
+        self.meter = metrics.get_meter(__name__, meter_provider=meter_provider)
+        self._duration = self.meter.create_histogram(
+            'http.client.request.duration', unit='s', description='Duration of the API calls.'
+        )
+        self._body_size = self.meter.create_histogram(
+            'http.client.response.body.size',
+            unit='By',
+            description='Size of the bodies of the API responses.',
+        )
+        self._retries = self.meter.create_counter(
+            'clumio.client.retries', unit='{retry}', description='Retries of the API calls.'
+        )
+
+    def pre_request(self, info: RequestInfo) -> None:
+        span = info.context['otel_span'] = self.tracer.start_span(
+            f'{info.method.upper()} {info.url_template}',
+            kind=trace.SpanKind.CLIENT,
+            attributes={**_attributes(info), 'url.path': info.url_path},
+        )
+        info.context['otel_token'] = otel_context.attach(trace.set_span_in_context(span))
+
+    def on_retry(
+        self,
+        info: RequestInfo,
+        delay: float,
+        response: requests.Response | None,
+        error: Exception | None,
+    ) -> None:
+        attributes = _attributes(info)
+        self._retries.add(1, attributes)
+        span = info.context.get('otel_span')
+        if span is not None:
+            event: dict[str, Any] = {
+                'clumio.retry.attempt': info.attempt,
+                'clumio.retry.delay': delay,
+            }
+            if response is not None:
+                event['http.response.status_code'] = response.status_code
+            if error is not None:
+                event['error.type'] = type(error).__name__
+            span.add_event('retry', event)
+
+    def post_response(self, info: RequestInfo, response: requests.Response) -> None:
+        attributes = _attributes(info)
+        if not response.ok:
+            attributes['error.type'] = str(response.status_code)
+        self._duration.record(info.elapsed, attributes)
+        self._body_size.record(response_size(response), attributes)
+        span = info.context.pop('otel_span', None)
+        if span is not None:
+            otel_context.detach(info.context.pop('otel_token'))
+            span.set_attributes({**attributes, 'clumio.attempts': info.attempt})
+            if not response.ok:
+                span.set_status(trace.Status(trace.StatusCode.ERROR))
+            span.end()
+
+    def on_error(self, info: RequestInfo, error: Exception) -> None:
+        span = info.context.pop('otel_span', None)
+        if span is None:
+            # The span was ended with the error response.
+            return
+        otel_context.detach(info.context.pop('otel_token'))
+        attributes = {**_attributes(info), 'error.type': type(error).__name__}
+        self._duration.record(info.elapsed, attributes)
+        span.set_attributes({**attributes, 'clumio.attempts': info.attempt})
+        span.record_exception(error)
+        span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+        span.end()
+
+
+def _attributes(info: RequestInfo) -> dict[str, Any]:
+    """Returns the OpenTelemetry attributes of a call."""
+    attributes: dict[str, Any] = {
+        'clumio.operation': info.operation,
+        'url.template': info.url_template,
+        'http.request.method': info.method.upper(),
+        'clumio.organizational_unit': info.organizational_unit,
+    }
+    if info.status_code is not None:
+        attributes['http.response.status_code'] = info.status_code
+    return attributes
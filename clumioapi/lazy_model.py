@@ -0,0 +1,183 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Lazy construction of the models created from API responses.
+
+A lazy model wraps the decoded JSON of a response and only converts a field, creating its
+nested models, when the field is first read. The converted value is cached, so every later
+read returns the same object. Reading a few fields of a large list response thus costs a
+fraction of building all its models.
+
+Lazy models are instances of subclasses of the model classes: isinstance checks, dict(),
+dataclasses.fields and assignments behave as with the eagerly built models. The nested
+models of a lazy model are lazy too. A lazy model equals the eager model with the same
+values. Pickling, copying or replacing fields of a lazy model builds an eager model, with
+its fields converted as if they were read.
+"""
+
+import collections.abc
+import contextlib
+import contextvars
+import dataclasses
+import types
+import typing
+from typing import Any, Callable, Iterator, Mapping, TypeVar
+
+T = TypeVar('T')
+
+_enabled: contextvars.ContextVar[bool] = contextvars.ContextVar('_enabled', default=False)
+
+# The lazy subclass of each model class, created on first use.
+_lazy_classes: dict[type, type] = {}
+
+
+def is_enabled() -> bool:
+    """Returns whether the models created from responses in this context are lazy."""
+    return _enabled.get()
+
+
+@contextlib.contextmanager
+def enabled(value: bool = True) -> Iterator[None]:
+    """Makes the models created from responses within the block lazy, or eager if not value."""
+    token = _enabled.set(value)
+    try:
+        yield
+    finally:
+        _enabled.reset(token)
+
+
+def wrap(cls: type[T], data: Mapping[str, Any] | None) -> T | None:
+    """Returns a lazy instance of a model class over its decoded JSON.
+
+    As with from_dictionary, None is returned for empty data.
+    """
+    if not data:
+        return None
+    lazy_cls = _lazy_classes.get(cls) or _lazy_class(cls)
+    if lazy_cls is cls:
+        return cls.from_dictionary(data)  # type: ignore
+    instance: Any = object.__new__(lazy_cls)
+    instance._data = data
+    instance._values = {}
+    return instance
+
+
+class _LazyModel:
+    """Base of the lazy subclasses, making them behave as their model class."""
+
+    __slots__ = ()
+    _model_class: type
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        # Called by dataclasses.replace, for example: build an eager model instead.
+        return cls._model_class(*args, **kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _LazyModel):
+            other = other._eager()
+        return self._eager() == other
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return _new_model, (self._model_class,), self._eager().__getstate__()
+
+    def __replace__(self, **changes: Any) -> Any:
+        return dataclasses.replace(self._eager(), **changes)  # type: ignore
+
+    def _eager(self) -> Any:
+        """Returns the eager model with the values of the fields, converted if not yet read."""
+        model: Any = object.__new__(self._model_class)
+        for field in dataclasses.fields(model):
+            setattr(model, field.name, getattr(self, field.name))
+        return model
+
+
+def _new_model(cls: type) -> Any:
+    """Creates an uninitialized model, to which pickle restores the state of a lazy model."""
+    return object.__new__(cls)
+
+
+class _KeyRecorder(dict):
+    """Records the keys a from_dictionary method reads, in order."""
+
+    def __init__(self) -> None:
+        # from_dictionary returns None for an empty dictionary.
+        super().__init__(_=None)
+        self.keys_read: list[str] = []
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self.keys_read.append(key)
+        # An empty object reads as missing with every conversion from_dictionary applies.
+        return {}
+
+
+def _lazy_class(cls: type) -> type:
+    """Creates the lazy subclass of a model class, or returns the class itself if unsupported."""
+    fields = [field for field in dataclasses.fields(cls) if field.name != 'raw_response']
+    recorder = _KeyRecorder()
+    try:
+        cls.from_dictionary(recorder)  # type: ignore
+    except Exception:
+        recorder.keys_read = []
+    if len(recorder.keys_read) != len(fields):
+        # The model is not built field by field from its keys, build it eagerly.
+        return _lazy_classes.setdefault(cls, cls)
+
+    namespace: dict[str, Any] = {
+        '__slots__': ('_data', '_values'),
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+        '_model_class': cls,
+    }
+    for field, key in zip(fields, recorder.keys_read):
+        namespace[field.name] = _lazy_field(field.name, key, _converter(field.type))
+    if 'raw_response' in cls.__dataclass_fields__:  # type: ignore
+        namespace['raw_response'] = _lazy_field('raw_response', None, lambda value: None)
+    lazy_cls = type(cls.__name__, (_LazyModel, cls), namespace)
+    return _lazy_classes.setdefault(cls, lazy_cls)
+
+
+def _lazy_field(name: str, key: str | None, convert: Callable[[Any], Any]) -> property:
+    """Returns the property converting a field from the JSON on first read."""
+
+    def get(self: Any) -> Any:
+        values = self._values
+        try:
+            return values[name]
+        except KeyError:
+            value = values[name] = convert(self._data.get(key))
+            return value
+
+    def set_(self: Any, value: Any) -> None:
+        self._values[name] = value
+
+    return property(get, set_)
+
+
+def _converter(field_type: Any) -> Callable[[Any], Any]:
+    """Returns the function converting the JSON value of a field of the given type.
+
+    Nested models are wrapped lazily, and lists and maps of models hold lazy models, as built
+    by from_dictionary. Other values are used as decoded.
+    """
+    args = [arg for arg in typing.get_args(field_type) if arg is not type(None)]
+    if typing.get_origin(field_type) in (typing.Union, types.UnionType) and len(args) == 1:
+        field_type = args[0]
+    if dataclasses.is_dataclass(field_type):
+        return lambda value: wrap(field_type, value)  # type: ignore
+    item_types = typing.get_args(field_type)
+    if (
+        typing.get_origin(field_type) in (list, collections.abc.Sequence)
+        and item_types
+        and dataclasses.is_dataclass(item_types[0])
+    ):
+        item_type: Any = item_types[0]
+        return lambda value: [wrap(item_type, item) for item in value] if value else []
+    if (
+        typing.get_origin(field_type) in (dict, collections.abc.Mapping)
+        and len(item_types) == 2
+        and dataclasses.is_dataclass(item_types[1])
+    ):
+        value_type: Any = item_types[1]
+        return lambda value: {key: wrap(value_type, item) for key, item in (value or {}).items()}
+    return lambda value: value
@@ -2,6 +2,9 @@
 # Copyright 2023. Clumio, A Commvault Company.
 #
 
+import importlib
+from typing import Any
+
 __all__ = [
     'add_bucket_protection_group_v1_request',
     'add_bucket_to_protection_group_response',
@@ -823,3 +826,10 @@ __all__ = [
     'warm_tier_protect_config',
     'warm_tier_protect_template_info',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the submodules listed in __all__ on first access."""
+    if name in __all__:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
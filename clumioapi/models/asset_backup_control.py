@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     time_unit_param_asset_backup_min_retention_duration as \
     time_unit_param_asset_backup_min_retention_duration_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='AssetBackupControl')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AssetBackupControl:
     """Implementation of the 'AssetBackupControl' model.
 
@@ -48,9 +48,7 @@ class AssetBackupControl:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -116,5 +114,5 @@ class AssetBackupControl:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import asset_group_filter as asset_group_filter_
 from clumioapi.models import tag as tag_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='AssetFilter')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AssetFilter:
     """Implementation of the 'AssetFilter' model.
 
@@ -38,9 +38,7 @@ class AssetFilter:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -110,5 +108,5 @@ class AssetFilter:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
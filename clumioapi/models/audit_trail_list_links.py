@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import hateoas_first_link as hateoas_first_link_
 from clumioapi.models import hateoas_last_link as hateoas_last_link_
 from clumioapi.models import hateoas_next_link as hateoas_next_link_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='AuditTrailListLinks')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AuditTrailListLinks:
     """Implementation of the 'AuditTrailListLinks' model.
 
@@ -47,9 +47,7 @@ class AuditTrailListLinks:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -119,5 +117,5 @@ class AuditTrailListLinks:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import audit_parent_entity as audit_parent_entity_
 from clumioapi.models import audit_primary_entity as audit_primary_entity_
 from clumioapi.models import details as details_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='AuditTrails')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AuditTrails:
     """Implementation of the 'AuditTrails' model.
 
@@ -189,9 +189,7 @@ class AuditTrails:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -289,5 +287,5 @@ class AuditTrails:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
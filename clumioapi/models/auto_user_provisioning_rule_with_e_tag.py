@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     auto_user_provisioning_rule_embedded as auto_user_provisioning_rule_embedded_
 from clumioapi.models import auto_user_provisioning_rule_links as auto_user_provisioning_rule_links_
@@ -14,7 +14,7 @@ import requests
 T = TypeVar('T', bound='AutoUserProvisioningRuleWithETag')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AutoUserProvisioningRuleWithETag:
     """Implementation of the 'AutoUserProvisioningRuleWithETag' model.
 
@@ -80,9 +80,7 @@ class AutoUserProvisioningRuleWithETag:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -162,5 +160,5 @@ class AutoUserProvisioningRuleWithETag:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_environment_embedded as aws_environment_embedded_
 from clumioapi.models import aws_environment_links as aws_environment_links_
 from clumioapi.models import consolidated_config as consolidated_config_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='AWSEnvironment')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AWSEnvironment:
     """Implementation of the 'AWSEnvironment' model.
 
@@ -98,9 +98,7 @@ class AWSEnvironment:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -218,5 +216,5 @@ class AWSEnvironment:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import hateoas_link as hateoas_link_
 from clumioapi.models import hateoas_self_link as hateoas_self_link_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='AWSEnvironmentLinks')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AWSEnvironmentLinks:
     """Implementation of the 'AWSEnvironmentLinks' model.
 
@@ -32,9 +32,7 @@ class AWSEnvironmentLinks:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -92,5 +90,5 @@ class AWSEnvironmentLinks:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
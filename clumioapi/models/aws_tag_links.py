@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import hateoas_link as hateoas_link_
 from clumioapi.models import hateoas_self_link as hateoas_self_link_
 from clumioapi.models import protect_entities_hateoas_link as protect_entities_hateoas_link_
@@ -16,7 +16,7 @@ import requests
 T = TypeVar('T', bound='AwsTagLinks')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AwsTagLinks:
     """Implementation of the 'AwsTagLinks' model.
 
@@ -71,9 +71,7 @@ class AwsTagLinks:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -183,5 +181,5 @@ class AwsTagLinks:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
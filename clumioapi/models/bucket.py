@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_tag_model as aws_tag_model_
 from clumioapi.models import bucket_links as bucket_links_
 from clumioapi.models import \
@@ -19,7 +19,7 @@ import requests
 T = TypeVar('T', bound='Bucket')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Bucket:
     """Implementation of the 'Bucket' model.
 
@@ -135,9 +135,7 @@ class Bucket:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -293,5 +291,5 @@ class Bucket:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import clumio_role_resource as clumio_role_resource_
 from clumioapi.models import clumio_rule_resource as clumio_rule_resource_
 from clumioapi.models import clumio_ssm_document_resource as clumio_ssm_document_resource_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='CategorisedResources')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CategorisedResources:
     """Implementation of the 'CategorisedResources' model.
 
@@ -51,9 +51,7 @@ class CategorisedResources:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -135,5 +133,5 @@ class CategorisedResources:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     clumio_ssm_document_parameter_value as clumio_ssm_document_parameter_value_
 from clumioapi.models import clumio_ssm_document_step as clumio_ssm_document_step_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='ClumioSsmDocumentResource')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ClumioSsmDocumentResource:
     """Implementation of the 'ClumioSsmDocumentResource' model.
 
@@ -43,9 +43,7 @@ class ClumioSsmDocumentResource:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -125,5 +123,5 @@ class ClumioSsmDocumentResource:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import compliance_configuration_links as compliance_configuration_links_
 from clumioapi.models import latest_run as latest_run_
 from clumioapi.models import notification_setting as notification_setting_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='ComplianceConfiguration')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ComplianceConfiguration:
     """Implementation of the 'ComplianceConfiguration' model.
 
@@ -69,9 +69,7 @@ class ComplianceConfiguration:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -163,5 +161,5 @@ class ComplianceConfiguration:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import hateoas_first_link as hateoas_first_link_
 from clumioapi.models import hateoas_link as hateoas_link_
 from clumioapi.models import hateoas_next_link as hateoas_next_link_
@@ -14,7 +14,7 @@ import requests
 T = TypeVar('T', bound='ComplianceConfigurationListLinks')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ComplianceConfigurationListLinks:
     """Implementation of the 'ComplianceConfigurationListLinks' model.
 
@@ -42,9 +42,7 @@ class ComplianceConfigurationListLinks:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -110,5 +108,5 @@ class ComplianceConfigurationListLinks:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
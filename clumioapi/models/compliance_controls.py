@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import asset_backup_control as asset_backup_control_
 from clumioapi.models import asset_protection_control as asset_protection_control_
 from clumioapi.models import policy_control as policy_control_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='ComplianceControls')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ComplianceControls:
     """Implementation of the 'ComplianceControls' model.
 
@@ -44,9 +44,7 @@ class ComplianceControls:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -108,5 +106,5 @@ class ComplianceControls:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
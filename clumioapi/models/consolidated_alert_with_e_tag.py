@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import consolidated_alert_details as consolidated_alert_details_
 from clumioapi.models import consolidated_alert_links as consolidated_alert_links_
 from clumioapi.models import consolidated_alert_parent_entity as consolidated_alert_parent_entity_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='ConsolidatedAlertWithETag')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ConsolidatedAlertWithETag:
     """Implementation of the 'ConsolidatedAlertWithETag' model.
 
@@ -99,9 +99,7 @@ class ConsolidatedAlertWithETag:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -213,5 +211,5 @@ class ConsolidatedAlertWithETag:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
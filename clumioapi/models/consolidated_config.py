@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import dynamodb_asset_info as dynamodb_asset_info_
 from clumioapi.models import ebs_asset_info as ebs_asset_info_
 from clumioapi.models import ec2_asset_info as ec2_asset_info_
@@ -19,7 +19,7 @@ import requests
 T = TypeVar('T', bound='ConsolidatedConfig')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ConsolidatedConfig:
     """Implementation of the 'ConsolidatedConfig' model.
 
@@ -86,9 +86,7 @@ class ConsolidatedConfig:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -186,5 +184,5 @@ class ConsolidatedConfig:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
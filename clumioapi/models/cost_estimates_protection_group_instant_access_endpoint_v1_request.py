@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     s3_instant_access_source_pitr_options as s3_instant_access_source_pitr_options_
 from clumioapi.models import source_object_filters as source_object_filters_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='CostEstimatesProtectionGroupInstantAccessEndpointV1Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CostEstimatesProtectionGroupInstantAccessEndpointV1Request:
     """Implementation of the 'CostEstimatesProtectionGroupInstantAccessEndpointV1Request' model.
 
@@ -57,9 +57,7 @@ class CostEstimatesProtectionGroupInstantAccessEndpointV1Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -133,5 +131,5 @@ class CostEstimatesProtectionGroupInstantAccessEndpointV1Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import categorised_resources as categorised_resources_
 from clumioapi.models import template_configuration_v2 as template_configuration_v2_
 from clumioapi.models import template_links as template_links_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='CreateAWSTemplateV2Response')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateAWSTemplateV2Response:
     """Implementation of the 'CreateAWSTemplateV2Response' model.
 
@@ -53,9 +53,7 @@ class CreateAWSTemplateV2Response:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -133,6 +131,6 @@ class CreateAWSTemplateV2Response:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
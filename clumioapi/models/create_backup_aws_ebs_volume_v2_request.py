@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import on_demand_setting as on_demand_setting_
 import requests
 
@@ -16,7 +16,7 @@ TypeValues = [
 ]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateBackupAwsEbsVolumeV2Request:
     """Implementation of the 'CreateBackupAwsEbsVolumeV2Request' model.
 
@@ -40,9 +40,7 @@ class CreateBackupAwsEbsVolumeV2Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -104,5 +102,5 @@ class CreateBackupAwsEbsVolumeV2Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import notification_setting as notification_setting_
 from clumioapi.models import parameter as parameter_
 from clumioapi.models import schedule_setting as schedule_setting_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='CreateComplianceReportConfigurationV1Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateComplianceReportConfigurationV1Request:
     """Implementation of the 'CreateComplianceReportConfigurationV1Request' model.
 
@@ -45,9 +45,7 @@ class CreateComplianceReportConfigurationV1Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -117,5 +115,5 @@ class CreateComplianceReportConfigurationV1Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     create_compliance_run_hateoas_links as create_compliance_run_hateoas_links_
 from clumioapi.models import read_task_hateoas_outer_embedded as read_task_hateoas_outer_embedded_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='CreateComplianceRunResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateComplianceRunResponse:
     """Implementation of the 'CreateComplianceRunResponse' model.
 
@@ -39,9 +39,7 @@ class CreateComplianceRunResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -109,6 +107,6 @@ class CreateComplianceRunResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
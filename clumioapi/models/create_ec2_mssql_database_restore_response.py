@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     create_ec2_mssql_database_restore_response_links as \
     create_ec2_mssql_database_restore_response_links_
@@ -14,7 +14,7 @@ import requests
 T = TypeVar('T', bound='CreateEC2MSSQLDatabaseRestoreResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateEC2MSSQLDatabaseRestoreResponse:
     """Implementation of the 'CreateEC2MSSQLDatabaseRestoreResponse' model.
 
@@ -42,9 +42,7 @@ class CreateEC2MSSQLDatabaseRestoreResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -110,6 +108,6 @@ class CreateEC2MSSQLDatabaseRestoreResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
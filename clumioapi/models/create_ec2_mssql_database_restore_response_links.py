@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import hateoas_self_link as hateoas_self_link_
 from clumioapi.models import read_task_hateoas_link as read_task_hateoas_link_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='CreateEC2MSSQLDatabaseRestoreResponseLinks')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateEC2MSSQLDatabaseRestoreResponseLinks:
     """Implementation of the 'CreateEC2MSSQLDatabaseRestoreResponseLinks' model.
 
@@ -33,9 +33,7 @@ class CreateEC2MSSQLDatabaseRestoreResponseLinks:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -93,6 +91,6 @@ class CreateEC2MSSQLDatabaseRestoreResponseLinks:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import entity_model as entity_model_
 from clumioapi.models import user_with_role as user_with_role_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='CreateOrganizationalUnitV2Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateOrganizationalUnitV2Request:
     """Implementation of the 'CreateOrganizationalUnitV2Request' model.
 
@@ -48,9 +48,7 @@ class CreateOrganizationalUnitV2Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -128,5 +126,5 @@ class CreateOrganizationalUnitV2Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
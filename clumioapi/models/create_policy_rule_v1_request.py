@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import rule_action as rule_action_
 from clumioapi.models import rule_priority as rule_priority_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='CreatePolicyRuleV1Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreatePolicyRuleV1Request:
     """Implementation of the 'CreatePolicyRuleV1Request' model.
 
@@ -84,9 +84,7 @@ class CreatePolicyRuleV1Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -152,5 +150,5 @@ class CreatePolicyRuleV1Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import backup_tier_stat as backup_tier_stat_
 from clumioapi.models import object_filter as object_filter_
 from clumioapi.models import protection_group_version_links as protection_group_version_links_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='CreateProtectionGroupResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateProtectionGroupResponse:
     """Implementation of the 'CreateProtectionGroupResponse' model.
 
@@ -157,9 +157,7 @@ class CreateProtectionGroupResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -295,6 +293,6 @@ class CreateProtectionGroupResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     create_rds_database_restore_response_links as create_rds_database_restore_response_links_
 from clumioapi.models import read_task_hateoas_outer_embedded as read_task_hateoas_outer_embedded_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='CreateRdsResourceRestoreResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateRdsResourceRestoreResponse:
     """Implementation of the 'CreateRdsResourceRestoreResponse' model.
 
@@ -40,9 +40,7 @@ class CreateRdsResourceRestoreResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -108,6 +106,6 @@ class CreateRdsResourceRestoreResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     create_s3_instant_access_endpoint_response_embedded as \
     create_s3_instant_access_endpoint_response_embedded_
@@ -16,7 +16,7 @@ import requests
 T = TypeVar('T', bound='CreateS3InstantAccessEndpointResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateS3InstantAccessEndpointResponse:
     """Implementation of the 'CreateS3InstantAccessEndpointResponse' model.
 
@@ -52,9 +52,7 @@ class CreateS3InstantAccessEndpointResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -124,6 +122,6 @@ class CreateS3InstantAccessEndpointResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
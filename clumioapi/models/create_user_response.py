@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import role_for_organizational_units as role_for_organizational_units_
 from clumioapi.models import user_embedded as user_embedded_
 from clumioapi.models import user_links as user_links_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='CreateUserResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateUserResponse:
     """Implementation of the 'CreateUserResponse' model.
 
@@ -90,9 +90,7 @@ class CreateUserResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -200,6 +198,6 @@ class CreateUserResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     direct_download_data_access_object as direct_download_data_access_object_
 from clumioapi.models import email_download_data_access_object as email_download_data_access_object_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='DataAccessObject')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DataAccessObject:
     """Implementation of the 'DataAccessObject' model.
 
@@ -41,9 +41,7 @@ class DataAccessObject:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -105,5 +103,5 @@ class DataAccessObject:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
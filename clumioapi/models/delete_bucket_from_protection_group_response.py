@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import backup_tier_stat as backup_tier_stat_
 import requests
 
 T = TypeVar('T', bound='DeleteBucketFromProtectionGroupResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DeleteBucketFromProtectionGroupResponse:
     """Implementation of the 'DeleteBucketFromProtectionGroupResponse' model.
 
@@ -108,9 +108,7 @@ class DeleteBucketFromProtectionGroupResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -246,6 +244,6 @@ class DeleteBucketFromProtectionGroupResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import entity_group_embedded as entity_group_embedded_
 from clumioapi.models import \
     organizational_unit_links_for_delete as organizational_unit_links_for_delete_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='DeleteOrganizationalUnitResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DeleteOrganizationalUnitResponse:
     """Implementation of the 'DeleteOrganizationalUnitResponse' model.
 
@@ -40,9 +40,7 @@ class DeleteOrganizationalUnitResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -108,6 +106,6 @@ class DeleteOrganizationalUnitResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import hateoas_common_links as hateoas_common_links_
 import requests
 
 T = TypeVar('T', bound='DeleteUserResponseV1')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DeleteUserResponseV1:
     """Implementation of the 'DeleteUserResponseV1' model.
 
@@ -26,9 +26,7 @@ class DeleteUserResponseV1:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -82,6 +80,6 @@ class DeleteUserResponseV1:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import hateoas_first_link as hateoas_first_link_
 from clumioapi.models import hateoas_next_link as hateoas_next_link_
 from clumioapi.models import hateoas_self_link as hateoas_self_link_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='DirectoryBrowseLinks')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DirectoryBrowseLinks:
     """Implementation of the 'DirectoryBrowseLinks' model.
 
@@ -37,9 +37,7 @@ class DirectoryBrowseLinks:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -101,5 +99,5 @@ class DirectoryBrowseLinks:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import download_shared_file_links as download_shared_file_links_
 import requests
 
 T = TypeVar('T', bound='DownloadSharedFileResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DownloadSharedFileResponse:
     """Implementation of the 'DownloadSharedFileResponse' model.
 
@@ -31,9 +31,7 @@ class DownloadSharedFileResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -91,6 +89,6 @@ class DownloadSharedFileResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
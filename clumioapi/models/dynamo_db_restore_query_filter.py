@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import dynamo_db_key_filter as dynamo_db_key_filter_
 from clumioapi.models import dynamo_db_restore_key_filters as dynamo_db_restore_key_filters_
 from clumioapi.models import dynamo_dbgrr_attribute_filter as dynamo_dbgrr_attribute_filter_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='DynamoDBRestoreQueryFilter')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DynamoDBRestoreQueryFilter:
     """Implementation of the 'DynamoDBRestoreQueryFilter' model.
 
@@ -43,9 +43,7 @@ class DynamoDBRestoreQueryFilter:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -123,5 +121,5 @@ class DynamoDBRestoreQueryFilter:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import dynamo_db_table_backup_with_e_tag as dynamo_db_table_backup_with_e_tag_
 import requests
 
 T = TypeVar('T', bound='DynamoDBTableBackupListEmbedded')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DynamoDBTableBackupListEmbedded:
     """Implementation of the 'DynamoDBTableBackupListEmbedded' model.
 
@@ -27,9 +27,7 @@ class DynamoDBTableBackupListEmbedded:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -91,5 +89,5 @@ class DynamoDBTableBackupListEmbedded:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
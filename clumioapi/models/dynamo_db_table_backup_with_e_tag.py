@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_tag_common_model as aws_tag_common_model_
 from clumioapi.models import dynamo_db_table_backup_links as dynamo_db_table_backup_links_
 from clumioapi.models import global_secondary_index as global_secondary_index_
@@ -18,7 +18,7 @@ import requests
 T = TypeVar('T', bound='DynamoDBTableBackupWithETag')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DynamoDBTableBackupWithETag:
     """Implementation of the 'DynamoDBTableBackupWithETag' model.
 
@@ -174,9 +174,7 @@ class DynamoDBTableBackupWithETag:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -348,5 +346,5 @@ class DynamoDBTableBackupWithETag:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     dynamo_db_restore_source_backup_options as dynamo_db_restore_source_backup_options_
 from clumioapi.models import \
@@ -14,7 +14,7 @@ import requests
 T = TypeVar('T', bound='DynamoDBTableRestoreSource')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DynamoDBTableRestoreSource:
     """Implementation of the 'DynamoDBTableRestoreSource' model.
 
@@ -40,9 +40,7 @@ class DynamoDBTableRestoreSource:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -106,5 +104,5 @@ class DynamoDBTableRestoreSource:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
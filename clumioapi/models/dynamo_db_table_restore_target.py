@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_tag_common_model as aws_tag_common_model_
 from clumioapi.models import global_secondary_index as global_secondary_index_
 from clumioapi.models import local_secondary_index as local_secondary_index_
@@ -17,7 +17,7 @@ import requests
 T = TypeVar('T', bound='DynamoDBTableRestoreTarget')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DynamoDBTableRestoreTarget:
     """Implementation of the 'DynamoDBTableRestoreTarget' model.
 
@@ -157,9 +157,7 @@ class DynamoDBTableRestoreTarget:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -295,5 +293,5 @@ class DynamoDBTableRestoreTarget:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import dynamo_db_key_filter as dynamo_db_key_filter_
 from clumioapi.models import dynamo_db_restore_key_filters as dynamo_db_restore_key_filters_
 from clumioapi.models import dynamo_dbgrr_attribute_filter as dynamo_dbgrr_attribute_filter_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='DynamoDBGRRQueryFilter')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DynamoDBGRRQueryFilter:
     """Implementation of the 'DynamoDBGRRQueryFilter' model.
 
@@ -47,9 +47,7 @@ class DynamoDBGRRQueryFilter:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -131,5 +129,5 @@ class DynamoDBGRRQueryFilter:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_tag_model as aws_tag_model_
 from clumioapi.models import backup_status_info as backup_status_info_
 from clumioapi.models import ebs_volume_embedded as ebs_volume_embedded_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='EBS')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EBS:
     """Implementation of the 'EBS' model.
 
@@ -154,9 +154,7 @@ class EBS:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -318,5 +316,5 @@ class EBS:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
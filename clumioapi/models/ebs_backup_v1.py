@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_tag_common_model as aws_tag_common_model_
 from clumioapi.models import ebs_backup_links_v1 as ebs_backup_links_v1_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='EBSBackupV1')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EBSBackupV1:
     """Implementation of the 'EBSBackupV1' model.
 
@@ -94,9 +94,7 @@ class EBSBackupV1:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -214,5 +212,5 @@ class EBSBackupV1:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
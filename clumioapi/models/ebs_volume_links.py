@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import hateoas_self_link as hateoas_self_link_
 from clumioapi.models import \
     read_policy_definition_hateoas_link as read_policy_definition_hateoas_link_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='EbsVolumeLinks')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EbsVolumeLinks:
     """Implementation of the 'EbsVolumeLinks' model.
 
@@ -36,9 +36,7 @@ class EbsVolumeLinks:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -100,5 +98,5 @@ class EbsVolumeLinks:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_tag_model as aws_tag_model_
 from clumioapi.models import backup_status_info as backup_status_info_
 from clumioapi.models import ec2_instance_embedded as ec2_instance_embedded_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='EC2')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EC2:
     """Implementation of the 'EC2' model.
 
@@ -153,9 +153,7 @@ class EC2:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -317,5 +315,5 @@ class EC2:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
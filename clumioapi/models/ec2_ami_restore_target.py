@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_tag_common_model as aws_tag_common_model_
 from clumioapi.models import \
     ec2_restore_ebs_block_device_mapping as ec2_restore_ebs_block_device_mapping_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='EC2AMIRestoreTarget')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EC2AMIRestoreTarget:
     """Implementation of the 'EC2AMIRestoreTarget' model.
 
@@ -51,9 +51,7 @@ class EC2AMIRestoreTarget:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -135,5 +133,5 @@ class EC2AMIRestoreTarget:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
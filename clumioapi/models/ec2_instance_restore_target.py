@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_tag_common_model as aws_tag_common_model_
 from clumioapi.models import \
     ec2_restore_ebs_block_device_mapping as ec2_restore_ebs_block_device_mapping_
@@ -14,7 +14,7 @@ import requests
 T = TypeVar('T', bound='EC2InstanceRestoreTarget')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EC2InstanceRestoreTarget:
     """Implementation of the 'EC2InstanceRestoreTarget' model.
 
@@ -83,9 +83,7 @@ class EC2InstanceRestoreTarget:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -197,5 +195,5 @@ class EC2InstanceRestoreTarget:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import backup_status_info as backup_status_info_
 from clumioapi.models import ec2_mssql_database_embedded as ec2_mssql_database_embedded_
 from clumioapi.models import ec2_mssql_database_links as ec2_mssql_database_links_
@@ -14,7 +14,7 @@ import requests
 T = TypeVar('T', bound='EC2MSSQLDatabase')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EC2MSSQLDatabase:
     """Implementation of the 'EC2MSSQLDatabase' model.
 
@@ -160,9 +160,7 @@ class EC2MSSQLDatabase:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -328,5 +326,5 @@ class EC2MSSQLDatabase:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     ec2_mssql_database_backup_embedded as ec2_mssql_database_backup_embedded_
 from clumioapi.models import ec2_mssql_database_backup_links as ec2_mssql_database_backup_links_
@@ -14,7 +14,7 @@ import requests
 T = TypeVar('T', bound='EC2MSSQLDatabaseBackup')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EC2MSSQLDatabaseBackup:
     """Implementation of the 'EC2MSSQLDatabaseBackup' model.
 
@@ -87,9 +87,7 @@ class EC2MSSQLDatabaseBackup:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -209,5 +207,5 @@ class EC2MSSQLDatabaseBackup:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
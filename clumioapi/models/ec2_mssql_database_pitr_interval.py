@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     ec2_mssql_database_pitr_interval_links as ec2_mssql_database_pitr_interval_links_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='EC2MssqlDatabasePitrInterval')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EC2MssqlDatabasePitrInterval:
     """Implementation of the 'EC2MssqlDatabasePitrInterval' model.
 
@@ -38,9 +38,7 @@ class EC2MssqlDatabasePitrInterval:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -108,5 +106,5 @@ class EC2MssqlDatabasePitrInterval:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_tag_common_model as aws_tag_common_model_
 import requests
 
 T = TypeVar('T', bound='EC2RestoreEbsBlockDeviceMapping')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EC2RestoreEbsBlockDeviceMapping:
     """Implementation of the 'EC2RestoreEbsBlockDeviceMapping' model.
 
@@ -41,9 +41,7 @@ class EC2RestoreEbsBlockDeviceMapping:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -113,5 +111,5 @@ class EC2RestoreEbsBlockDeviceMapping:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,13 +4,13 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 import requests
 
 T = TypeVar('T', bound='EC2RestoreNetworkInterface')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EC2RestoreNetworkInterface:
     """Implementation of the 'EC2RestoreNetworkInterface' model.
 
@@ -58,9 +58,7 @@ class EC2RestoreNetworkInterface:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -134,5 +132,5 @@ class EC2RestoreNetworkInterface:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import ec2_ami_restore_target as ec2_ami_restore_target_
 from clumioapi.models import ec2_instance_restore_target as ec2_instance_restore_target_
 from clumioapi.models import ec2_volumes_restore_target as ec2_volumes_restore_target_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='EC2RestoreTarget')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EC2RestoreTarget:
     """Implementation of the 'EC2RestoreTarget' model.
 
@@ -38,9 +38,7 @@ class EC2RestoreTarget:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -106,5 +104,5 @@ class EC2RestoreTarget:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
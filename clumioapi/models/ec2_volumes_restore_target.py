@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     ec2_restore_ebs_block_device_mapping as ec2_restore_ebs_block_device_mapping_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='EC2VolumesRestoreTarget')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EC2VolumesRestoreTarget:
     """Implementation of the 'EC2VolumesRestoreTarget' model.
 
@@ -48,9 +48,7 @@ class EC2VolumesRestoreTarget:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -124,5 +122,5 @@ class EC2VolumesRestoreTarget:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import user_embedded_v1 as user_embedded_v1_
 from clumioapi.models import user_links as user_links_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='EditProfileResponseV1')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EditProfileResponseV1:
     """Implementation of the 'EditProfileResponseV1' model.
 
@@ -84,9 +84,7 @@ class EditProfileResponseV1:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -184,6 +182,6 @@ class EditProfileResponseV1:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
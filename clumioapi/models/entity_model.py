@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import organizational_unit_parent_entity as organizational_unit_parent_entity_
 from clumioapi.models import \
     organizational_unit_primary_entity as organizational_unit_primary_entity_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='EntityModel')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EntityModel:
     """Implementation of the 'EntityModel' model.
 
@@ -35,9 +35,7 @@ class EntityModel:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -99,5 +97,5 @@ class EntityModel:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     estimate_cost_s3_instant_access_endpoint_async_response_links as \
     estimate_cost_s3_instant_access_endpoint_async_response_links_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='EstimateCostS3InstantAccessEndpointAsyncResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EstimateCostS3InstantAccessEndpointAsyncResponse:
     """Implementation of the 'EstimateCostS3InstantAccessEndpointAsyncResponse' model.
 
@@ -44,9 +44,7 @@ class EstimateCostS3InstantAccessEndpointAsyncResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -110,6 +108,6 @@ class EstimateCostS3InstantAccessEndpointAsyncResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import file_versions_list_embedded as file_versions_list_embedded_
 from clumioapi.models import file_versions_list_links as file_versions_list_links_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='FileListResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FileListResponse:
     """Implementation of the 'FileListResponse' model.
 
@@ -43,9 +43,7 @@ class FileListResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -115,6 +113,6 @@ class FileListResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import key_schema_element as key_schema_element_
 from clumioapi.models import projection as projection_
 from clumioapi.models import provisioned_throughput as provisioned_throughput_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='GlobalSecondaryIndex')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GlobalSecondaryIndex:
     """Implementation of the 'GlobalSecondaryIndex' model.
 
@@ -55,9 +55,7 @@ class GlobalSecondaryIndex:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -133,5 +131,5 @@ class GlobalSecondaryIndex:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
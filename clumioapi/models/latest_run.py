@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import compliance_info as compliance_info_
 from clumioapi.models import parameter as parameter_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='LatestRun')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class LatestRun:
     """Implementation of the 'LatestRun' model.
 
@@ -69,9 +69,7 @@ class LatestRun:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -165,5 +163,5 @@ class LatestRun:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
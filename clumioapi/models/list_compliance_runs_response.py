@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     compliance_run_list_hateoas_embedded as compliance_run_list_hateoas_embedded_
 from clumioapi.models import compliance_run_list_hateoas_links as compliance_run_list_hateoas_links_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='ListComplianceRunsResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ListComplianceRunsResponse:
     """Implementation of the 'ListComplianceRunsResponse' model.
 
@@ -49,9 +49,7 @@ class ListComplianceRunsResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -131,6 +129,6 @@ class ListComplianceRunsResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
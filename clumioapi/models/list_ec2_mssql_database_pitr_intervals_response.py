@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     ec2_mssql_database_pitr_interval_list_embedded as \
     ec2_mssql_database_pitr_interval_list_embedded_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='ListEC2MssqlDatabasePitrIntervalsResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ListEC2MssqlDatabasePitrIntervalsResponse:
     """Implementation of the 'ListEC2MssqlDatabasePitrIntervalsResponse' model.
 
@@ -58,9 +58,7 @@ class ListEC2MssqlDatabasePitrIntervalsResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -138,6 +136,6 @@ class ListEC2MssqlDatabasePitrIntervalsResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
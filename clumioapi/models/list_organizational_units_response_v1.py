@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     organizational_unit_list_embedded_v1 as organizational_unit_list_embedded_v1_
 from clumioapi.models import organizational_unit_list_links as organizational_unit_list_links_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='ListOrganizationalUnitsResponseV1')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ListOrganizationalUnitsResponseV1:
     """Implementation of the 'ListOrganizationalUnitsResponseV1' model.
 
@@ -57,9 +57,7 @@ class ListOrganizationalUnitsResponseV1:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -145,6 +143,6 @@ class ListOrganizationalUnitsResponseV1:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
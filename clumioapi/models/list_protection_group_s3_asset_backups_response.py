@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     protection_group_s3_asset_backup_list_embedded as \
     protection_group_s3_asset_backup_list_embedded_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='ListProtectionGroupS3AssetBackupsResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ListProtectionGroupS3AssetBackupsResponse:
     """Implementation of the 'ListProtectionGroupS3AssetBackupsResponse' model.
 
@@ -64,9 +64,7 @@ class ListProtectionGroupS3AssetBackupsResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -152,6 +150,6 @@ class ListProtectionGroupS3AssetBackupsResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import prefix_filter as prefix_filter_
 import requests
 
 T = TypeVar('T', bound='ObjectFilter')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ObjectFilter:
     """Implementation of the 'ObjectFilter' model.
 
@@ -46,9 +46,7 @@ class ObjectFilter:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -118,5 +116,5 @@ class ObjectFilter:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
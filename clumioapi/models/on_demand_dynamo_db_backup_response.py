@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import on_demand_dynamo_db_backup_links as on_demand_dynamo_db_backup_links_
 from clumioapi.models import read_task_hateoas_outer_embedded as read_task_hateoas_outer_embedded_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='OnDemandDynamoDBBackupResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OnDemandDynamoDBBackupResponse:
     """Implementation of the 'OnDemandDynamoDBBackupResponse' model.
 
@@ -37,9 +37,7 @@ class OnDemandDynamoDBBackupResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -105,6 +103,6 @@ class OnDemandDynamoDBBackupResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
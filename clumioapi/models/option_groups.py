@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import option_groups_links as option_groups_links_
 from clumioapi.models import option_model as option_model_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='OptionGroups')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OptionGroups:
     """Implementation of the 'OptionGroups' model.
 
@@ -78,9 +78,7 @@ class OptionGroups:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -182,5 +180,5 @@ class OptionGroups:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_ds_grouping_criteria as aws_ds_grouping_criteria_
 from clumioapi.models import m365_grouping_criteria as m365_grouping_criteria_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='OUGroupingCriteria')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OUGroupingCriteria:
     """Implementation of the 'OUGroupingCriteria' model.
 
@@ -35,9 +35,7 @@ class OUGroupingCriteria:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -95,5 +93,5 @@ class OUGroupingCriteria:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
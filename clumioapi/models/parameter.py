@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import compliance_controls as compliance_controls_
 from clumioapi.models import compliance_filters as compliance_filters_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='Parameter')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Parameter:
     """Implementation of the 'Parameter' model.
 
@@ -32,9 +32,7 @@ class Parameter:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -92,5 +90,5 @@ class Parameter:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import entity_group_embedded as entity_group_embedded_
 from clumioapi.models import organizational_unit_links as organizational_unit_links_
 from clumioapi.models import user_with_role as user_with_role_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='PatchOrganizationalUnitResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PatchOrganizationalUnitResponse:
     """Implementation of the 'PatchOrganizationalUnitResponse' model.
 
@@ -84,9 +84,7 @@ class PatchOrganizationalUnitResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -188,6 +186,6 @@ class PatchOrganizationalUnitResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import update_entities as update_entities_
 from clumioapi.models import update_user_assignments as update_user_assignments_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='PatchOrganizationalUnitV1Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PatchOrganizationalUnitV1Request:
     """Implementation of the 'PatchOrganizationalUnitV1Request' model.
 
@@ -41,9 +41,7 @@ class PatchOrganizationalUnitV1Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -109,5 +107,5 @@ class PatchOrganizationalUnitV1Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import update_entities as update_entities_
 from clumioapi.models import \
     update_protection_group_assignments as update_protection_group_assignments_
@@ -14,7 +14,7 @@ import requests
 T = TypeVar('T', bound='PatchOrganizationalUnitV2Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PatchOrganizationalUnitV2Request:
     """Implementation of the 'PatchOrganizationalUnitV2Request' model.
 
@@ -52,9 +52,7 @@ class PatchOrganizationalUnitV2Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -130,5 +128,5 @@ class PatchOrganizationalUnitV2Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import policy_embedded as policy_embedded_
 from clumioapi.models import policy_links as policy_links_
 from clumioapi.models import policy_operation as policy_operation_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='Policy')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Policy:
     """Implementation of the 'Policy' model.
 
@@ -84,9 +84,7 @@ class Policy:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -184,5 +182,5 @@ class Policy:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import ebs_backup_advanced_setting as ebs_backup_advanced_setting_
 from clumioapi.models import ec2_backup_advanced_setting as ec2_backup_advanced_setting_
 from clumioapi.models import \
@@ -32,7 +32,7 @@ import requests
 T = TypeVar('T', bound='PolicyAdvancedSettings')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PolicyAdvancedSettings:
     """Implementation of the 'PolicyAdvancedSettings' model.
 
@@ -135,9 +135,7 @@ class PolicyAdvancedSettings:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -269,5 +267,5 @@ class PolicyAdvancedSettings:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
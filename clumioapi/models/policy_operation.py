@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import backup_sla as backup_sla_
 from clumioapi.models import backup_window as backup_window_
 from clumioapi.models import policy_advanced_settings as policy_advanced_settings_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='PolicyOperation')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PolicyOperation:
     """Implementation of the 'PolicyOperation' model.
 
@@ -80,9 +80,7 @@ class PolicyOperation:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -178,5 +176,5 @@ class PolicyOperation:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,13 +4,13 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 import requests
 
 T = TypeVar('T', bound='PostProcessAwsConnectionV1Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PostProcessAwsConnectionV1Request:
     """Implementation of the 'PostProcessAwsConnectionV1Request' model.
 
@@ -65,9 +65,7 @@ class PostProcessAwsConnectionV1Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -157,5 +155,5 @@ class PostProcessAwsConnectionV1Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
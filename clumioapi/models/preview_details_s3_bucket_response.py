@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import object_v2 as object_v2_
 from clumioapi.models import preview_details_s3_bucket_links as preview_details_s3_bucket_links_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='PreviewDetailsS3BucketResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PreviewDetailsS3BucketResponse:
     """Implementation of the 'PreviewDetailsS3BucketResponse' model.
 
@@ -31,9 +31,7 @@ class PreviewDetailsS3BucketResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -97,6 +95,6 @@ class PreviewDetailsS3BucketResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     preview_protection_group_s3_asset_async_links as preview_protection_group_s3_asset_async_links_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='PreviewProtectionGroupS3AssetAsyncResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PreviewProtectionGroupS3AssetAsyncResponse:
     """Implementation of the 'PreviewProtectionGroupS3AssetAsyncResponse' model.
 
@@ -44,9 +44,7 @@ class PreviewProtectionGroupS3AssetAsyncResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -110,6 +108,6 @@ class PreviewProtectionGroupS3AssetAsyncResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
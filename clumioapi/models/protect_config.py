@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import ebs_asset_info as ebs_asset_info_
 from clumioapi.models import rds_asset_info as rds_asset_info_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='ProtectConfig')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProtectConfig:
     """Implementation of the 'ProtectConfig' model.
 
@@ -44,9 +44,7 @@ class ProtectConfig:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -112,5 +110,5 @@ class ProtectConfig:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import backup_status_stats as backup_status_stats_
 from clumioapi.models import backup_tier_stat as backup_tier_stat_
 from clumioapi.models import object_filter as object_filter_
@@ -17,7 +17,7 @@ import requests
 T = TypeVar('T', bound='ProtectionGroup')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProtectionGroup:
     """Implementation of the 'ProtectionGroup' model.
 
@@ -186,9 +186,7 @@ class ProtectionGroup:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -344,5 +342,5 @@ class ProtectionGroup:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import backup_status_info as backup_status_info_
 from clumioapi.models import backup_tier_stat as backup_tier_stat_
 from clumioapi.models import protection_group_bucket_embedded as protection_group_bucket_embedded_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='ProtectionGroupBucket')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProtectionGroupBucket:
     """Implementation of the 'ProtectionGroupBucket' model.
 
@@ -142,9 +142,7 @@ class ProtectionGroupBucket:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -306,5 +304,5 @@ class ProtectionGroupBucket:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     protection_group_restore_source_pitr_options as protection_group_restore_source_pitr_options_
 from clumioapi.models import source_object_filters as source_object_filters_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='ProtectionGroupRestoreSource')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProtectionGroupRestoreSource:
     """Implementation of the 'ProtectionGroupRestoreSource' model.
 
@@ -51,9 +51,7 @@ class ProtectionGroupRestoreSource:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -121,5 +119,5 @@ class ProtectionGroupRestoreSource:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     protection_group_s3_asset_backup_links as protection_group_s3_asset_backup_links_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='ProtectionGroupS3AssetBackup')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProtectionGroupS3AssetBackup:
     """Implementation of the 'ProtectionGroupS3AssetBackup' model.
 
@@ -96,9 +96,7 @@ class ProtectionGroupS3AssetBackup:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -218,5 +216,5 @@ class ProtectionGroupS3AssetBackup:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
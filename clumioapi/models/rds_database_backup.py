@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_tag_common_model as aws_tag_common_model_
 from clumioapi.models import rds_database_backup_links as rds_database_backup_links_
 from clumioapi.models import rds_instance_model as rds_instance_model_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='RdsDatabaseBackup')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RdsDatabaseBackup:
     """Implementation of the 'RdsDatabaseBackup' model.
 
@@ -115,9 +115,7 @@ class RdsDatabaseBackup:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -259,5 +257,5 @@ class RdsDatabaseBackup:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
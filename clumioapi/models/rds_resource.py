@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_tag_model as aws_tag_model_
 from clumioapi.models import backup_status_info as backup_status_info_
 from clumioapi.models import protection_info_with_rule as protection_info_with_rule_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='RdsResource')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RdsResource:
     """Implementation of the 'RdsResource' model.
 
@@ -197,9 +197,7 @@ class RdsResource:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -393,5 +391,5 @@ class RdsResource:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
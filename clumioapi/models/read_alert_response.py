@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import alert_embedded as alert_embedded_
 from clumioapi.models import alert_links as alert_links_
 from clumioapi.models import alert_parent_entity as alert_parent_entity_
@@ -16,7 +16,7 @@ import requests
 T = TypeVar('T', bound='ReadAlertResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ReadAlertResponse:
     """Implementation of the 'ReadAlertResponse' model.
 
@@ -115,9 +115,7 @@ class ReadAlertResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -243,6 +241,6 @@ class ReadAlertResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
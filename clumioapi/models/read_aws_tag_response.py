@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_tag_embedded as aws_tag_embedded_
 from clumioapi.models import aws_tag_links as aws_tag_links_
 from clumioapi.models import protection_info as protection_info_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='ReadAwsTagResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ReadAwsTagResponse:
     """Implementation of the 'ReadAwsTagResponse' model.
 
@@ -62,9 +62,7 @@ class ReadAwsTagResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -150,6 +148,6 @@ class ReadAwsTagResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import compliance_configuration_links as compliance_configuration_links_
 from clumioapi.models import latest_run as latest_run_
 from clumioapi.models import notification_setting as notification_setting_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='ReadComplianceConfigurationResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ReadComplianceConfigurationResponse:
     """Implementation of the 'ReadComplianceConfigurationResponse' model.
 
@@ -74,9 +74,7 @@ class ReadComplianceConfigurationResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -172,6 +170,6 @@ class ReadComplianceConfigurationResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
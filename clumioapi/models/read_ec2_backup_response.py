@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import ami_model as ami_model_
 from clumioapi.models import attached_ebs_volume_full_model as attached_ebs_volume_full_model_
 from clumioapi.models import aws_tag_common_model as aws_tag_common_model_
@@ -18,7 +18,7 @@ import requests
 T = TypeVar('T', bound='ReadEC2BackupResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ReadEC2BackupResponse:
     """Implementation of the 'ReadEC2BackupResponse' model.
 
@@ -161,9 +161,7 @@ class ReadEC2BackupResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -357,6 +355,6 @@ class ReadEC2BackupResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
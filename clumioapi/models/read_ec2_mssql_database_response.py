@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import backup_status_info as backup_status_info_
 from clumioapi.models import ec2_mssql_database_embedded as ec2_mssql_database_embedded_
 from clumioapi.models import ec2_mssql_database_links as ec2_mssql_database_links_
@@ -14,7 +14,7 @@ import requests
 T = TypeVar('T', bound='ReadEC2MSSQLDatabaseResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ReadEC2MSSQLDatabaseResponse:
     """Implementation of the 'ReadEC2MSSQLDatabaseResponse' model.
 
@@ -161,9 +161,7 @@ class ReadEC2MSSQLDatabaseResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -329,6 +327,6 @@ class ReadEC2MSSQLDatabaseResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import general_settings_links as general_settings_links_
 from clumioapi.models import ou_grouping_criteria as ou_grouping_criteria_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='ReadGeneralSettingsResponseV2')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ReadGeneralSettingsResponseV2:
     """Implementation of the 'ReadGeneralSettingsResponseV2' model.
 
@@ -61,9 +61,7 @@ class ReadGeneralSettingsResponseV2:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -135,6 +133,6 @@ class ReadGeneralSettingsResponseV2:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
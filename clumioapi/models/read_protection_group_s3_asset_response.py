@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import backup_status_info as backup_status_info_
 from clumioapi.models import backup_tier_stat as backup_tier_stat_
 from clumioapi.models import protection_group_bucket_embedded as protection_group_bucket_embedded_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='ReadProtectionGroupS3AssetResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ReadProtectionGroupS3AssetResponse:
     """Implementation of the 'ReadProtectionGroupS3AssetResponse' model.
 
@@ -143,9 +143,7 @@ class ReadProtectionGroupS3AssetResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -307,6 +305,6 @@ class ReadProtectionGroupS3AssetResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
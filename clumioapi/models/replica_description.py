@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import on_demand_throughput_override as on_demand_throughput_override_
 from clumioapi.models import provisioned_throughput_override as provisioned_throughput_override_
 from clumioapi.models import \
@@ -14,7 +14,7 @@ import requests
 T = TypeVar('T', bound='ReplicaDescription')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ReplicaDescription:
     """Implementation of the 'ReplicaDescription' model.
 
@@ -62,9 +62,7 @@ class ReplicaDescription:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -150,5 +148,5 @@ class ReplicaDescription:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import event_rules as event_rules_
 from clumioapi.models import service_instance_profiles as service_instance_profiles_
 from clumioapi.models import service_roles as service_roles_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='Resources')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Resources:
     """Implementation of the 'Resources' model.
 
@@ -47,9 +47,7 @@ class Resources:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -125,5 +123,5 @@ class Resources:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
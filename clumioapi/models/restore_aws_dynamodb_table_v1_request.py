@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import dynamo_db_restore_query_filter as dynamo_db_restore_query_filter_
 from clumioapi.models import dynamo_db_table_restore_source as dynamo_db_table_restore_source_
 from clumioapi.models import dynamo_db_table_restore_target as dynamo_db_table_restore_target_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='RestoreAwsDynamodbTableV1Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RestoreAwsDynamodbTableV1Request:
     """Implementation of the 'RestoreAwsDynamodbTableV1Request' model.
 
@@ -44,9 +44,7 @@ class RestoreAwsDynamodbTableV1Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -110,5 +108,5 @@ class RestoreAwsDynamodbTableV1Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
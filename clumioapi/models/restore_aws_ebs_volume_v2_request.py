@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import ebs_restore_source as ebs_restore_source_
 from clumioapi.models import ebs_restore_target as ebs_restore_target_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='RestoreAwsEbsVolumeV2Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RestoreAwsEbsVolumeV2Request:
     """Implementation of the 'RestoreAwsEbsVolumeV2Request' model.
 
@@ -30,9 +30,7 @@ class RestoreAwsEbsVolumeV2Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -90,5 +88,5 @@ class RestoreAwsEbsVolumeV2Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import read_task_hateoas_outer_embedded as read_task_hateoas_outer_embedded_
 from clumioapi.models import \
     restore_protection_group_s3_asset_links as restore_protection_group_s3_asset_links_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='RestoreProtectionGroupS3AssetResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RestoreProtectionGroupS3AssetResponse:
     """Implementation of the 'RestoreProtectionGroupS3AssetResponse' model.
 
@@ -38,9 +38,7 @@ class RestoreProtectionGroupS3AssetResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -106,6 +104,6 @@ class RestoreProtectionGroupS3AssetResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import protection_group_restore_target as protection_group_restore_target_
 from clumioapi.models import \
     protection_group_s3_asset_restore_source as protection_group_s3_asset_restore_source_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='RestoreProtectionGroupS3AssetV1Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RestoreProtectionGroupS3AssetV1Request:
     """Implementation of the 'RestoreProtectionGroupS3AssetV1Request' model.
 
@@ -34,9 +34,7 @@ class RestoreProtectionGroupS3AssetV1Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -98,5 +96,5 @@ class RestoreProtectionGroupS3AssetV1Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
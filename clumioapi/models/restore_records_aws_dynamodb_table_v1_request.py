@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import dynamo_db_grr_source as dynamo_db_grr_source_
 from clumioapi.models import dynamo_db_grr_target as dynamo_db_grr_target_
 from clumioapi.models import dynamo_dbgrr_query_filter as dynamo_dbgrr_query_filter_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='RestoreRecordsAwsDynamodbTableV1Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RestoreRecordsAwsDynamodbTableV1Request:
     """Implementation of the 'RestoreRecordsAwsDynamodbTableV1Request' model.
 
@@ -44,9 +44,7 @@ class RestoreRecordsAwsDynamodbTableV1Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -108,5 +106,5 @@ class RestoreRecordsAwsDynamodbTableV1Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
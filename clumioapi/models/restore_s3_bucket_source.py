@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     restore_s3_bucket_source_pitr_options as restore_s3_bucket_source_pitr_options_
 from clumioapi.models import \
@@ -16,7 +16,7 @@ import requests
 T = TypeVar('T', bound='RestoreS3BucketSource')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RestoreS3BucketSource:
     """Implementation of the 'RestoreS3BucketSource' model.
 
@@ -52,9 +52,7 @@ class RestoreS3BucketSource:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -126,5 +124,5 @@ class RestoreS3BucketSource:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import rule_action as rule_action_
 from clumioapi.models import rule_embedded as rule_embedded_
 from clumioapi.models import rule_links as rule_links_
@@ -14,7 +14,7 @@ import requests
 T = TypeVar('T', bound='Rule')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Rule:
     """Implementation of the 'Rule' model.
 
@@ -105,9 +105,7 @@ class Rule:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -189,5 +187,5 @@ class Rule:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import s3_bucket_size_res as s3_bucket_size_res_
 import requests
 
 T = TypeVar('T', bound='S3CloudwatchMetrics')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class S3CloudwatchMetrics:
     """Implementation of the 'S3CloudwatchMetrics' model.
 
@@ -51,9 +51,7 @@ class S3CloudwatchMetrics:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -131,5 +129,5 @@ class S3CloudwatchMetrics:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import s3_access_control_translation as s3_access_control_translation_
 from clumioapi.models import s3_encryption_configuration as s3_encryption_configuration_
 from clumioapi.models import s3_metrics as s3_metrics_
@@ -14,7 +14,7 @@ import requests
 T = TypeVar('T', bound='S3Destination')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class S3Destination:
     """Implementation of the 'S3Destination' model.
 
@@ -60,9 +60,7 @@ class S3Destination:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -144,5 +142,5 @@ class S3Destination:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
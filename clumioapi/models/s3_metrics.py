@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import s3_replication_time_value as s3_replication_time_value_
 import requests
 
 T = TypeVar('T', bound='S3Metrics')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class S3Metrics:
     """Implementation of the 'S3Metrics' model.
 
@@ -33,9 +33,7 @@ class S3Metrics:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -93,5 +91,5 @@ class S3Metrics:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
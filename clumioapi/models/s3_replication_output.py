@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import s3_replication_configuration as s3_replication_configuration_
 import requests
 
 T = TypeVar('T', bound='S3ReplicationOutput')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class S3ReplicationOutput:
     """Implementation of the 'S3ReplicationOutput' model.
 
@@ -28,9 +28,7 @@ class S3ReplicationOutput:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -86,5 +84,5 @@ class S3ReplicationOutput:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
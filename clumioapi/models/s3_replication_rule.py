@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import s3_delete_marker_replication as s3_delete_marker_replication_
 from clumioapi.models import s3_destination as s3_destination_
 from clumioapi.models import s3_existing_object_replication as s3_existing_object_replication_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='S3ReplicationRule')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class S3ReplicationRule:
     """Implementation of the 'S3ReplicationRule' model.
 
@@ -64,9 +64,7 @@ class S3ReplicationRule:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -154,5 +152,5 @@ class S3ReplicationRule:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
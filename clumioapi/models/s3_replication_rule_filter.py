@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import s3_replication_rule_and_operator as s3_replication_rule_and_operator_
 from clumioapi.models import s3_tag as s3_tag_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='S3ReplicationRuleFilter')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class S3ReplicationRuleFilter:
     """Implementation of the 'S3ReplicationRuleFilter' model.
 
@@ -39,9 +39,7 @@ class S3ReplicationRuleFilter:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -105,5 +103,5 @@ class S3ReplicationRuleFilter:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
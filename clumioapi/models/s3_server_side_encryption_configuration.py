@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import s3_server_side_encryption_rule as s3_server_side_encryption_rule_
 import requests
 
 T = TypeVar('T', bound='S3ServerSideEncryptionConfiguration')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class S3ServerSideEncryptionConfiguration:
     """Implementation of the 'S3ServerSideEncryptionConfiguration' model.
 
@@ -28,9 +28,7 @@ class S3ServerSideEncryptionConfiguration:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -92,5 +90,5 @@ class S3ServerSideEncryptionConfiguration:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
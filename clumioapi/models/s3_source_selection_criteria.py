@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import s3_replica_modifications as s3_replica_modifications_
 from clumioapi.models import s3_sse_kms_encrypted_objects as s3_sse_kms_encrypted_objects_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='S3SourceSelectionCriteria')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class S3SourceSelectionCriteria:
     """Implementation of the 'S3SourceSelectionCriteria' model.
 
@@ -34,9 +34,7 @@ class S3SourceSelectionCriteria:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -98,5 +96,5 @@ class S3SourceSelectionCriteria:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
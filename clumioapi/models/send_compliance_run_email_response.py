@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import compliance_run_hateoas_links as compliance_run_hateoas_links_
 import requests
 
 T = TypeVar('T', bound='SendComplianceRunEmailResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SendComplianceRunEmailResponse:
     """Implementation of the 'SendComplianceRunEmailResponse' model.
 
@@ -30,9 +30,7 @@ class SendComplianceRunEmailResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -90,6 +88,6 @@ class SendComplianceRunEmailResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import mssql_service_roles as mssql_service_roles_
 from clumioapi.models import s3_service_roles as s3_service_roles_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='ServiceRoles')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ServiceRoles:
     """Implementation of the 'ServiceRoles' model.
 
@@ -28,9 +28,7 @@ class ServiceRoles:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -88,5 +86,5 @@ class ServiceRoles:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import set_assignments_response_links as set_assignments_response_links_
 import requests
 
 T = TypeVar('T', bound='SetAssignmentsResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SetAssignmentsResponse:
     """Implementation of the 'SetAssignmentsResponse' model.
 
@@ -30,9 +30,7 @@ class SetAssignmentsResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -90,6 +88,6 @@ class SetAssignmentsResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
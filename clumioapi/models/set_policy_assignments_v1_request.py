@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import assignment_input_model as assignment_input_model_
 import requests
 
 T = TypeVar('T', bound='SetPolicyAssignmentsV1Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SetPolicyAssignmentsV1Request:
     """Implementation of the 'SetPolicyAssignmentsV1Request' model.
 
@@ -27,9 +27,7 @@ class SetPolicyAssignmentsV1Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -89,5 +87,5 @@ class SetPolicyAssignmentsV1Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import share_file_restore_email_links as share_file_restore_email_links_
 import requests
 
 T = TypeVar('T', bound='ShareFileRestoreEmailResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShareFileRestoreEmailResponse:
     """Implementation of the 'ShareFileRestoreEmailResponse' model.
 
@@ -26,9 +26,7 @@ class ShareFileRestoreEmailResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -82,6 +80,6 @@ class ShareFileRestoreEmailResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
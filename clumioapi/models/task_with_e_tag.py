@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import task_links as task_links_
 from clumioapi.models import task_parent_entity as task_parent_entity_
 from clumioapi.models import task_primary_entity as task_primary_entity_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='TaskWithETag')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TaskWithETag:
     """Implementation of the 'TaskWithETag' model.
 
@@ -123,9 +123,7 @@ class TaskWithETag:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -231,5 +229,5 @@ class TaskWithETag:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import dynamodb_template_info as dynamodb_template_info_
 from clumioapi.models import ebs_template_info as ebs_template_info_
 from clumioapi.models import ec2_mssql_template_info as ec2_mssql_template_info_
@@ -20,7 +20,7 @@ import requests
 T = TypeVar('T', bound='TemplateConfigurationV2')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TemplateConfigurationV2:
     """Implementation of the 'TemplateConfigurationV2' model.
 
@@ -77,9 +77,7 @@ class TemplateConfigurationV2:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -179,5 +177,5 @@ class TemplateConfigurationV2:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import rule_provision as rule_provision_
 import requests
 
 T = TypeVar('T', bound='UpdateAutoUserProvisioningRuleV1Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UpdateAutoUserProvisioningRuleV1Request:
     """Implementation of the 'UpdateAutoUserProvisioningRuleV1Request' model.
 
@@ -63,9 +63,7 @@ class UpdateAutoUserProvisioningRuleV1Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -127,5 +125,5 @@ class UpdateAutoUserProvisioningRuleV1Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
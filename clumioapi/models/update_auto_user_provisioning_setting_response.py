@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import \
     auto_user_provisioning_setting_links as auto_user_provisioning_setting_links_
 import requests
@@ -12,7 +12,7 @@ import requests
 T = TypeVar('T', bound='UpdateAutoUserProvisioningSettingResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UpdateAutoUserProvisioningSettingResponse:
     """Implementation of the 'UpdateAutoUserProvisioningSettingResponse' model.
 
@@ -31,9 +31,7 @@ class UpdateAutoUserProvisioningSettingResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -95,6 +93,6 @@ class UpdateAutoUserProvisioningSettingResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,13 +4,13 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 import requests
 
 T = TypeVar('T', bound='UpdateAutoUserProvisioningSettingV1Request')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UpdateAutoUserProvisioningSettingV1Request:
     """Implementation of the 'UpdateAutoUserProvisioningSettingV1Request' model.
 
@@ -24,9 +24,7 @@ class UpdateAutoUserProvisioningSettingV1Request:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -80,5 +78,5 @@ class UpdateAutoUserProvisioningSettingV1Request:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import aws_connection_links as aws_connection_links_
 from clumioapi.models import connection_resources_resp as connection_resources_resp_
 from clumioapi.models import consolidated_config as consolidated_config_
@@ -15,7 +15,7 @@ import requests
 T = TypeVar('T', bound='UpdateAWSConnectionResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UpdateAWSConnectionResponse:
     """Implementation of the 'UpdateAWSConnectionResponse' model.
 
@@ -178,9 +178,7 @@ class UpdateAWSConnectionResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -350,6 +348,6 @@ class UpdateAWSConnectionResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import task_links as task_links_
 from clumioapi.models import task_parent_entity as task_parent_entity_
 from clumioapi.models import task_primary_entity as task_primary_entity_
@@ -13,7 +13,7 @@ import requests
 T = TypeVar('T', bound='UpdateTaskResponse')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UpdateTaskResponse:
     """Implementation of the 'UpdateTaskResponse' model.
 
@@ -124,9 +124,7 @@ class UpdateTaskResponse:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -232,6 +230,6 @@ class UpdateTaskResponse:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         model_instance.raw_response = response
         return model_instance
@@ -4,14 +4,14 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import user_hateoas_v1 as user_hateoas_v1_
 import requests
 
 T = TypeVar('T', bound='UserListEmbeddedV1')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UserListEmbeddedV1:
     """Implementation of the 'UserListEmbeddedV1' model.
 
@@ -27,9 +27,7 @@ class UserListEmbeddedV1:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -87,5 +85,5 @@ class UserListEmbeddedV1:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
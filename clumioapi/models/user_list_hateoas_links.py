@@ -4,7 +4,7 @@
 import dataclasses
 from typing import Any, Dict, Mapping, Optional, overload, Sequence, TypeVar
 
-from clumioapi.api_helper import camel_to_snake
+from clumioapi.api_helper import decode_json, model_from_json, model_to_dict
 from clumioapi.models import hateoas_first_link as hateoas_first_link_
 from clumioapi.models import hateoas_last_link as hateoas_last_link_
 from clumioapi.models import hateoas_link as hateoas_link_
@@ -16,7 +16,7 @@ import requests
 T = TypeVar('T', bound='UserListHateoasLinks')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UserListHateoasLinks:
     """Implementation of the 'UserListHateoasLinks' model.
 
@@ -52,9 +52,7 @@ class UserListHateoasLinks:
 
     def dict(self) -> Dict[str, Any]:
         """Returns the dictionary representation of the model."""
-        return dataclasses.asdict(
-            self, dict_factory=lambda x: {camel_to_snake(k): v for (k, v) in x}
-        )
+        return model_to_dict(self)
 
     @overload
     @classmethod
@@ -128,5 +126,5 @@ class UserListHateoasLinks:
         Returns:
             object: An instance of this structure class.
         """
-        model_instance = cls.from_dictionary(response.json())
+        model_instance = model_from_json(cls, decode_json(response.content))
         return model_instance
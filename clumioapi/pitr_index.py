@@ -0,0 +1,424 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""In-memory index of the point-in-time restore intervals of S3 assets and MSSQL databases."""
+
+import bisect
+from concurrent import futures
+import datetime
+import itertools
+import threading
+import time
+from typing import Any, Iterable, Iterator
+
+from clumioapi import clumioapi_client
+from clumioapi.controllers.types import ec2_mssql_databases_types
+from clumioapi.controllers.types import protection_groups_s3_assets_types
+from dateutil import parser
+
+# Asset types whose intervals can be indexed.
+S3_ASSET = 'protection_group_s3_asset'
+MSSQL_DATABASE = 'aws_ec2_mssql_database'
+
+
+class IntervalSet:
+    """The restorable time of an asset, as sorted disjoint intervals.
+
+    Overlapping and adjacent intervals are merged as they are added, so the set holds the
+    disjoint [start, end] intervals covering the restorable time, sorted, as two lists of
+    POSIX timestamps. Point and range queries are binary searches, in O(log n) for n
+    intervals. Adding an interval after all the others is O(1).
+    """
+
+    __slots__ = ('_starts', '_ends')
+
+    def __init__(self, intervals: Iterable[tuple[float, float]] = ()) -> None:
+        self._starts: list[float] = []
+        self._ends: list[float] = []
+        for start, end in intervals:
+            self.add(start, end)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        return zip(self._starts, self._ends)
+
+    @property
+    def earliest(self) -> float | None:
+        """The earliest restorable time, if any."""
+        return self._starts[0] if self._starts else None
+
+    @property
+    def latest(self) -> float | None:
+        """The latest restorable time, if any."""
+        return self._ends[-1] if self._ends else None
+
+    @property
+    def last_start(self) -> float | None:
+        """The start of the latest interval, if any."""
+        return self._starts[-1] if self._starts else None
+
+    def add(self, start: float, end: float) -> None:
+        """Adds the interval from start to end, both included."""
+        if end < start:
+            raise ValueError(f'The interval ends at {end}, before its start {start}.')
+        starts, ends = self._starts, self._ends
+        if not starts or start > ends[-1]:
+            starts.append(start)
+            ends.append(end)
+            return
+        # The intervals from lo to hi, excluded, overlap or touch the new one.
+        lo = bisect.bisect_left(ends, start)
+        hi = bisect.bisect_right(starts, end)
+        if lo < hi:
+            start = min(start, starts[lo])
+            end = max(end, ends[hi - 1])
+        starts[lo:hi] = [start]
+        ends[lo:hi] = [end]
+
+    def interval_at(self, timestamp: float) -> tuple[float, float] | None:
+        """Returns the interval containing the timestamp, if any."""
+        i = bisect.bisect_right(self._starts, timestamp) - 1
+        if i >= 0 and timestamp <= self._ends[i]:
+            return self._starts[i], self._ends[i]
+        return None
+
+    def contains(self, timestamp: float) -> bool:
+        """Returns whether the timestamp is restorable."""
+        i = bisect.bisect_right(self._starts, timestamp) - 1
+        return i >= 0 and timestamp <= self._ends[i]
+
+    def covers(self, start: float, end: float) -> bool:
+        """Returns whether every timestamp from start to end is restorable."""
+        if end < start:
+            raise ValueError(f'The interval ends at {end}, before its start {start}.')
+        i = bisect.bisect_right(self._starts, start) - 1
+        return i >= 0 and end <= self._ends[i]
+
+    def latest_before(self, timestamp: float) -> float | None:
+        """Returns the latest restorable time at or before the timestamp, if any."""
+        i = bisect.bisect_right(self._starts, timestamp) - 1
+        return min(timestamp, self._ends[i]) if i >= 0 else None
+
+    def copy(self) -> 'IntervalSet':
+        """Returns a copy of the set."""
+        copied = IntervalSet()
+        copied._starts = list(self._starts)
+        copied._ends = list(self._ends)
+        return copied
+
+
+class PitrIndex:
+    """Answers point-in-time restore queries for many assets from an in-memory index.
+
+    The restore intervals of every added asset are listed with
+    list_protection_group_s3_asset_pitr_intervals or list_ec2_mssql_database_pitr_intervals,
+    max_workers assets at a time, and added to its IntervalSet as the pages arrive. Queries
+    then need no API call and run in O(log n) for n intervals of an asset.
+
+    refresh() lists the intervals again. By default it only lists those from the start of
+    the last known interval of each asset, which is still growing for a protected asset,
+    and merges them in; a full refresh lists them all, dropping the expired ones. start()
+    refreshes the index in a background thread. A refresh builds new sets and swaps them
+    in, so the queries made meanwhile see the previous or the new intervals of an asset,
+    never a mix.
+
+    Example:
+        ```
+        index = PitrIndex(client, max_workers=16)
+        index.add_assets(S3_ASSET, s3_asset_ids)
+        index.add_assets(MSSQL_DATABASE, database_ids)
+        index.refresh()
+        index.start(interval=300)
+        if index.is_restorable(database_id, '2025-01-31T23:00:00Z'):
+            ...
+        consistent_point = index.latest_common_point(database_ids)
+        ```
+
+    Attributes:
+        client: The ClumioAPIClient used to list the intervals.
+        max_workers: Maximum number of assets whose intervals are listed at the same time.
+        limit: Number of intervals fetched per page.
+        last_refresh: When the last successful refresh completed, if any.
+        last_error: The exception raised by the last background refresh, if it failed.
+    """
+
+    def __init__(
+        self,
+        client: clumioapi_client.ClumioAPIClient,
+        max_workers: int = 8,
+        limit: int | None = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+        self.client = client
+        self.max_workers = max_workers
+        self.limit = limit
+        self.last_refresh: datetime.datetime | None = None
+        self.last_error: Exception | None = None
+        self._asset_types: dict[str, str] = {}
+        self._sets: dict[str, IntervalSet] = {}
+        self._refresh_lock = threading.Lock()
+        self._stop: threading.Event | None = None
+        self._thread: threading.Thread | None = None
+
+    def add_assets(self, asset_type: str, asset_ids: Iterable[str]) -> None:
+        """Adds assets to the index. Their intervals are listed by the next refresh.
+
+        Args:
+            asset_type: S3_ASSET or MSSQL_DATABASE.
+            asset_ids: The IDs of the protection group S3 assets or MSSQL databases.
+        Raises:
+            ValueError: If the asset type is not supported.
+        """
+        if asset_type not in (S3_ASSET, MSSQL_DATABASE):
+            raise ValueError(f'Unsupported asset type {asset_type}.')
+        for asset_id in asset_ids:
+            self._asset_types[asset_id] = asset_type
+
+    def remove_assets(self, asset_ids: Iterable[str]) -> None:
+        """Removes assets and their intervals from the index."""
+        for asset_id in asset_ids:
+            self._asset_types.pop(asset_id, None)
+            self._sets.pop(asset_id, None)
+
+    def refresh(self, asset_ids: Iterable[str] | None = None, full: bool = False) -> None:
+        """Lists the intervals of the assets and updates the index.
+
+        Args:
+            asset_ids: The assets to refresh. Defaults to all the assets of the index.
+            full: Whether to list all the intervals, rather than the recent ones of the
+                assets already indexed.
+        Raises:
+            KeyError: If an asset was not added to the index.
+            ClumioException: If listing the intervals fails. The assets refreshed before
+                the failure are updated.
+        """
+        asset_ids = list(self._asset_types if asset_ids is None else asset_ids)
+        asset_types = [self._asset_types[asset_id] for asset_id in asset_ids]
+        with self._refresh_lock:
+            with futures.ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix='clumioapi-pitr-index'
+            ) as executor:
+                intervals = executor.map(
+                    self._list_intervals, asset_types, asset_ids, itertools.repeat(full)
+                )
+                for asset_id, asset_intervals in zip(asset_ids, intervals):
+                    if asset_id in self._asset_types:
+                        self._sets[asset_id] = asset_intervals
+            self.last_refresh = datetime.datetime.now(datetime.timezone.utc)
+
+    def start(self, interval: float = 300.0, full_interval: float = 3600.0) -> None:
+        """Refreshes the index every interval seconds in a background thread, until stopped.
+
+        A refresh that fails is recorded in last_error, and retried at the next interval.
+
+        Args:
+            interval: Number of seconds between two refreshes.
+            full_interval: Minimum number of seconds between two full refreshes.
+        Raises:
+            RuntimeError: If the background refresh is already running.
+        """
+        if self._thread is not None:
+            raise RuntimeError('The background refresh of the index is already running.')
+        stop = self._stop = threading.Event()
+
+        def run() -> None:
+            full_at = time.monotonic() + full_interval
+            while not stop.wait(interval):
+                full = time.monotonic() >= full_at
+                try:
+                    self.refresh(full=full)
+                except Exception as e:
+                    self.last_error = e
+                    continue
+                self.last_error = None
+                if full:
+                    full_at = time.monotonic() + full_interval
+
+        self._thread = threading.Thread(target=run, name='clumioapi-pitr-refresh', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background refresh, waiting for a running refresh to complete."""
+        if self._thread is None:
+            return
+        self._stop.set()  # type: ignore
+        self._thread.join()
+        self._thread = self._stop = None
+
+    def intervals(self, asset_id: str) -> IntervalSet:
+        """Returns the restorable intervals of an asset, in POSIX timestamps.
+
+        Raises:
+            KeyError: If the asset is not indexed.
+        """
+        return self._sets[asset_id]
+
+    def is_restorable(self, asset_id: str, timestamp: datetime.datetime | str) -> bool:
+        """Returns whether an asset can be restored to the given time.
+
+        Raises:
+            KeyError: If the asset is not indexed.
+        """
+        return self._sets[asset_id].contains(_posix(timestamp))
+
+    def is_range_restorable(
+        self,
+        asset_id: str,
+        start: datetime.datetime | str,
+        end: datetime.datetime | str,
+    ) -> bool:
+        """Returns whether an asset can be restored to any time from start to end.
+
+        Raises:
+            KeyError: If the asset is not indexed.
+        """
+        return self._sets[asset_id].covers(_posix(start), _posix(end))
+
+    def interval_at(
+        self, asset_id: str, timestamp: datetime.datetime | str
+    ) -> tuple[datetime.datetime, datetime.datetime] | None:
+        """Returns the restorable interval of an asset containing the given time, if any.
+
+        Raises:
+            KeyError: If the asset is not indexed.
+        """
+        interval = self._sets[asset_id].interval_at(_posix(timestamp))
+        if interval is None:
+            return None
+        return _datetime(interval[0]), _datetime(interval[1])
+
+    def latest_restorable(
+        self, asset_ids: Iterable[str] | None = None
+    ) -> dict[str, datetime.datetime | None]:
+        """Returns the latest restorable time of the assets.
+
+        Args:
+            asset_ids: The assets to look up. Defaults to all the indexed assets.
+        Returns:
+            The latest restorable time of every asset, or None if it has no interval, keyed
+            by asset ID.
+        Raises:
+            KeyError: If an asset is not indexed.
+        """
+        sets = self._sets
+        latest: dict[str, datetime.datetime | None] = {}
+        for asset_id in list(sets) if asset_ids is None else asset_ids:
+            timestamp = sets[asset_id].latest
+            latest[asset_id] = None if timestamp is None else _datetime(timestamp)
+        return latest
+
+    def restorable_assets(
+        self, timestamp: datetime.datetime | str, asset_ids: Iterable[str] | None = None
+    ) -> list[str]:
+        """Returns the assets that can be restored to the given time.
+
+        Args:
+            timestamp: The time to restore to.
+            asset_ids: The assets to look up. Defaults to all the indexed assets.
+        Raises:
+            KeyError: If an asset is not indexed.
+        """
+        point = _posix(timestamp)
+        sets = self._sets
+        return [
+            asset_id
+            for asset_id in (list(sets) if asset_ids is None else asset_ids)
+            if sets[asset_id].contains(point)
+        ]
+
+    def latest_common_point(
+        self,
+        asset_ids: Iterable[str],
+        before: datetime.datetime | str | None = None,
+    ) -> datetime.datetime | None:
+        """Returns the latest time to which all the assets can be restored.
+
+        Restoring a set of databases or buckets to this time gives a consistent view of
+        their data.
+
+        Args:
+            asset_ids: The assets to restore together.
+            before: The latest time to consider. Defaults to no limit.
+        Returns:
+            The latest time in the intervals of all the assets, at or before the given time,
+            or None if there is none.
+        Raises:
+            KeyError: If an asset is not indexed.
+        """
+        sets = [self._sets[asset_id] for asset_id in asset_ids]
+        latest = [intervals.latest for intervals in sets]
+        if not sets or None in latest:
+            return None
+        point: float = min(latest)  # type: ignore
+        if before is not None:
+            point = min(point, _posix(before))
+        # Moves the point back to the end of the previous interval of any asset that cannot
+        # be restored to it, until all can.
+        moved = True
+        while moved:
+            moved = False
+            for intervals in sets:
+                restorable = intervals.latest_before(point)
+                if restorable is None:
+                    return None
+                if restorable < point:
+                    point, moved = restorable, True
+        return _datetime(point)
+
+    def _list_intervals(self, asset_type: str, asset_id: str, full: bool) -> IntervalSet:
+        """Returns the intervals of an asset, updated with the intervals listed now."""
+        current = self._sets.get(asset_id)
+        since = None if full or current is None else current.last_start
+        intervals = IntervalSet() if current is None or since is None else current.copy()
+        for item in self._list_items(asset_type, asset_id, since):
+            if item.StartTimestamp and item.EndTimestamp:
+                intervals.add(_posix(item.StartTimestamp), _posix(item.EndTimestamp))
+        return intervals
+
+    def _list_items(self, asset_type: str, asset_id: str, since: float | None) -> Iterator[Any]:
+        """Yields the intervals of an asset listed by the API, those ending from since on."""
+        if asset_type == S3_ASSET:
+            s3_filter_type = (
+                protection_groups_s3_assets_types.ListProtectionGroupS3AssetPitrIntervalsV1FilterT
+            )
+            s3_filter = None
+            if since is not None:
+                s3_filter = s3_filter_type(Timestamp={'gte': _format(since)})
+            s3_assets = self.client.protection_groups_s3_assets_v1_paginator
+            return s3_assets.list_protection_group_s3_asset_pitr_intervals(
+                protection_group_s3_asset_id=asset_id, limit=self.limit, filter=s3_filter
+            ).iter_items()
+        mssql_filter = None
+        if since is not None:
+            # The filter is exclusive, and the timestamps are to the second.
+            mssql_filter = ec2_mssql_databases_types.ListEc2MssqlDatabasePitrIntervalsV1FilterT(
+                Timestamp={'gt': _format(since - 1)}
+            )
+        databases = self.client.ec2_mssql_databases_v1_paginator
+        return databases.list_ec2_mssql_database_pitr_intervals(
+            database_id=asset_id, limit=self.limit, filter=mssql_filter
+        ).iter_items()
+
+
+def _posix(timestamp: datetime.datetime | str) -> float:
+    """Returns the POSIX timestamp of a datetime or RFC-3339 string, assuming UTC if naive."""
+    parsed: datetime.datetime = (
+        parser.isoparse(timestamp) if isinstance(timestamp, str) else timestamp
+    )
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+def _datetime(timestamp: float) -> datetime.datetime:
+    """Returns the UTC datetime of a POSIX timestamp."""
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+
+
+def _format(timestamp: float) -> str:
+    """Formats a POSIX timestamp in RFC-3339 format, in UTC."""
+    return _datetime(timestamp).strftime('%Y-%m-%dT%H:%M:%SZ')
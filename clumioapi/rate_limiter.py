@@ -0,0 +1,104 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Client-side rate limiting of the requests made by the controllers."""
+
+import asyncio
+import threading
+import time
+from typing import Mapping
+
+from clumioapi import api_helper
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Callers reserve a token and then wait for the time the reservation takes to become
+    valid, outside of the lock. Reservations are served in order, so concurrent callers are
+    spaced evenly at the configured rate instead of all waking up at once.
+
+    Attributes:
+        rate: Number of tokens added per second.
+        burst: Maximum number of tokens the bucket holds.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError('rate must be positive.')
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token and returns the number of seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class RateLimiter:
+    """Limits the rate of requests globally and per endpoint family.
+
+    Endpoint families are given as path patterns, matched with fnmatch against the path of
+    the request. A pattern without wildcards also matches the paths below it, so '/tasks'
+    covers '/tasks/{task_id}'. A request takes a token from the global bucket and from the
+    bucket of every family it matches.
+
+    Example:
+        ```
+        limiter = RateLimiter(
+            requests_per_second=10,
+            families={'/tasks': 2, '/backups/*': 5, '/restores/*': 1},
+        )
+        config = Configuration(api_token=api_token, rate_limiter=limiter)
+        ```
+
+    Attributes:
+        requests_per_second: The global budget, or None for no global limit.
+        burst: Number of requests that may be sent at once after a period of inactivity.
+            Defaults to the rate of each bucket.
+        families: Budgets in requests per second, keyed by path pattern.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float | None = None,
+        burst: float | None = None,
+        families: Mapping[str, float] | None = None,
+    ) -> None:
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.families = dict(families or {})
+        self._global = TokenBucket(requests_per_second, burst) if requests_per_second else None
+        self._family_buckets = {
+            pattern: TokenBucket(rate, burst) for pattern, rate in self.families.items()
+        }
+
+    def _buckets(self, url_path: str) -> list[TokenBucket]:
+        """Returns the buckets a request to the given path takes a token from."""
+        buckets = [self._global] if self._global else []
+        for pattern, bucket in self._family_buckets.items():
+            if api_helper.path_matches(url_path, pattern):
+                buckets.append(bucket)
+        return buckets
+
+    def reserve(self, url_path: str) -> float:
+        """Reserves a request to the given path and returns the seconds to wait before it."""
+        return max((bucket.reserve() for bucket in self._buckets(url_path)), default=0.0)
+
+    def acquire(self, url_path: str) -> None:
+        """Blocks until a request to the given path may be sent."""
+        if delay := self.reserve(url_path):
+            time.sleep(delay)
+
+    async def acquire_async(self, url_path: str) -> None:
+        """Waits, without blocking the event loop, until a request to the path may be sent."""
+        if delay := self.reserve(url_path):
+            await asyncio.sleep(delay)
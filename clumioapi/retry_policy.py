@@ -0,0 +1,105 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Retry policy applied to every request made by the controllers."""
+
+import dataclasses
+from email import utils
+import random
+import time
+
+import requests
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    The delay before a retry is drawn uniformly between zero and an exponentially growing
+    cap ("full jitter"), so that clients throttled at the same time do not retry in lockstep.
+    When the response carries a Retry-After header, the delay is at least the time it asks for.
+
+    Requests with an idempotent method are retried on connection errors, timeouts and any of
+    the retry_statuses. Other requests (POST, PATCH) may create or change resources twice if
+    retried after the server received them, so they are only retried when the request was
+    not processed: on a connect timeout or on one of the non_idempotent_retry_statuses.
+
+    Attributes:
+        max_attempts: Maximum number of attempts of a request, including the first one.
+        base_delay: Cap in seconds of the delay before the first retry.
+        max_delay: Maximum cap in seconds of the jittered delay.
+        retry_statuses: HTTP status codes retried for idempotent methods.
+        non_idempotent_retry_statuses: HTTP status codes retried for all methods.
+        idempotent_methods: HTTP verbs, in lower case, that are safe to repeat.
+        respect_retry_after: Whether to wait for the time given by the Retry-After header.
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    non_idempotent_retry_statuses: frozenset[int] = frozenset({429})
+    idempotent_methods: frozenset[str] = frozenset({'get', 'head', 'put', 'delete'})
+    respect_retry_after: bool = True
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: requests.Response | None = None,
+        error: Exception | None = None,
+    ) -> bool:
+        """Returns whether a failed attempt of a request should be retried.
+
+        Args:
+            method: The HTTP verb of the request.
+            attempt: The number of attempts made so far, starting at 1.
+            response: The error response of the attempt, if any.
+            error: The exception raised by the attempt, if no response was received.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        idempotent = method.lower() in self.idempotent_methods
+        if response is not None:
+            if idempotent:
+                return response.status_code in self.retry_statuses
+            return response.status_code in self.non_idempotent_retry_statuses
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        return idempotent and isinstance(
+            error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+        )
+
+    def delay(self, attempt: int, response: requests.Response | None = None) -> float:
+        """Returns the number of seconds to wait before the next attempt of a request.
+
+        Args:
+            attempt: The number of attempts made so far, starting at 1.
+            response: The error response of the attempt, if any.
+        """
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay = random.uniform(0, cap)
+        if self.respect_retry_after and response is not None:
+            retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                delay += retry_after
+        return delay
+
+
+NO_RETRIES = RetryPolicy(max_attempts=1)
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Parses a Retry-After header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -0,0 +1,363 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+"""Waits for the completion of many tasks with batched status checks."""
+
+import asyncio
+import dataclasses
+import fnmatch
+import time
+from typing import Any, Callable, Iterable, Mapping
+
+from clumioapi import async_clumioapi_client
+from clumioapi import clumioapi_client
+from clumioapi.controllers import tasks_v1
+from clumioapi.controllers.types import tasks_types
+from clumioapi.models import task_with_e_tag
+
+# Statuses of the tasks that will not change anymore.
+TERMINAL_STATUSES: frozenset[str] = frozenset({'completed', 'failed', 'aborted'})
+
+# Base polling intervals in seconds, keyed by task type pattern. The first matching pattern
+# applies. Backups and seeding run for minutes to hours, so they are polled less often than
+# restores.
+DEFAULT_TYPE_INTERVALS: Mapping[str, float] = {
+    '*_seeding': 30.0,
+    '*_indexing': 30.0,
+    '*_backup': 15.0,
+    '*_restore': 5.0,
+}
+
+
+@dataclasses.dataclass(slots=True)
+class _TaskState:
+    """Polling state of a waited task."""
+
+    task_id: str
+    interval: float
+    next_poll: float
+    task: task_with_e_tag.TaskWithETag | None = None
+
+
+class _PollSchedule:
+    """Decides when each waited task is polled next.
+
+    A task is polled at the base interval of its type. Every poll that finds it unchanged
+    multiplies its interval by the backoff factor, up to max_interval; a change of status or
+    progress resets it to the base interval. Queued tasks are polled at twice the interval
+    of running ones.
+    """
+
+    def __init__(
+        self,
+        task_ids: Iterable[str],
+        poll_interval: float,
+        max_interval: float,
+        backoff: float,
+        type_intervals: Mapping[str, float],
+        on_done: Callable[[task_with_e_tag.TaskWithETag], None] | None,
+    ) -> None:
+        self.poll_interval = poll_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.type_intervals = type_intervals
+        self.on_done = on_done
+        now = time.monotonic()
+        self.pending = {
+            task_id: _TaskState(task_id, poll_interval, now) for task_id in dict.fromkeys(task_ids)
+        }
+        self.done: dict[str, task_with_e_tag.TaskWithETag] = {}
+
+    def due(self) -> list[str]:
+        """Returns the IDs of the pending tasks that must be polled now."""
+        now = time.monotonic()
+        return [state.task_id for state in self.pending.values() if state.next_poll <= now]
+
+    def seconds_to_next_poll(self) -> float:
+        """Returns the number of seconds until a pending task must be polled."""
+        next_poll = min(state.next_poll for state in self.pending.values())
+        return max(0.0, next_poll - time.monotonic())
+
+    def update(self, polled: Iterable[str], tasks: Iterable[task_with_e_tag.TaskWithETag]) -> None:
+        """Records the tasks returned by a poll of the given task IDs."""
+        now = time.monotonic()
+        returned = set()
+        for task in tasks:
+            state = self.pending.get(task.Id)  # type: ignore
+            if state is None:
+                continue
+            returned.add(state.task_id)
+            if task.Status in TERMINAL_STATUSES:
+                del self.pending[state.task_id]
+                self.done[state.task_id] = task
+                if self.on_done is not None:
+                    self.on_done(task)
+                continue
+            previous, state.task = state.task, task
+            if (
+                previous is None
+                or previous.Status != task.Status
+                or previous.ProgressPercentage != task.ProgressPercentage
+            ):
+                state.interval = self._base_interval(task)
+            else:
+                state.interval = min(self.max_interval, state.interval * self.backoff)
+        for task_id in polled:
+            if (state := self.pending.get(task_id)) is None:
+                continue
+            if task_id not in returned:
+                # The task is not listed yet, back off as if it were unchanged.
+                state.interval = min(self.max_interval, state.interval * self.backoff)
+            state.next_poll = now + state.interval
+
+    def _base_interval(self, task: task_with_e_tag.TaskWithETag) -> float:
+        """Returns the polling interval of a task whose status or progress just changed."""
+        interval = self.poll_interval
+        for pattern, type_interval in self.type_intervals.items():
+            if task.Type and fnmatch.fnmatchcase(task.Type, pattern):
+                interval = type_interval
+                break
+        if task.Status == 'queued':
+            interval *= 2
+        return min(self.max_interval, interval)
+
+
+class _BaseTaskWaiter:
+    """Options shared by the blocking and asynchronous task waiters."""
+
+    def __init__(
+        self,
+        poll_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        type_intervals: Mapping[str, float] | None = None,
+        batch_size: int = 100,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1.')
+        self.poll_interval = poll_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.type_intervals = dict(
+            DEFAULT_TYPE_INTERVALS if type_intervals is None else type_intervals
+        )
+        self.batch_size = batch_size
+
+    def _schedule(
+        self,
+        task_ids: Iterable[str],
+        on_done: Callable[[task_with_e_tag.TaskWithETag], None] | None,
+    ) -> _PollSchedule:
+        return _PollSchedule(
+            task_ids,
+            self.poll_interval,
+            self.max_interval,
+            self.backoff,
+            self.type_intervals,
+            on_done,
+        )
+
+    def _batches(
+        self, task_ids: list[str]
+    ) -> list[tuple[list[str], tasks_types.ListTasksV1FilterT]]:
+        """Splits the task IDs to poll into list_tasks filters of at most batch_size IDs."""
+        batches = []
+        for i in range(0, len(task_ids), self.batch_size):
+            batch = task_ids[i : i + self.batch_size]
+            batches.append((batch, tasks_types.ListTasksV1FilterT(Id={'in': batch})))
+        return batches
+
+    @staticmethod
+    def _remaining(deadline: float | None) -> float | None:
+        """Returns the seconds left before the deadline, raising TimeoutError when it passed."""
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError('Timed out waiting for the tasks to complete.')
+        return remaining
+
+
+class TaskWaiter(_BaseTaskWaiter):
+    """Waits for tasks to complete, polling their status in batches.
+
+    Instead of reading each task, the waiter lists the tasks that are due for a poll with a
+    single list_tasks call filtered on their IDs, so waiting for hundreds of tasks costs a
+    few requests per poll cycle. The polling interval of each task adapts to its type and
+    status, see DEFAULT_TYPE_INTERVALS.
+
+    Example:
+        ```
+        waiter = TaskWaiter(client)
+        tasks = waiter.wait_for_all([resp.TaskId for resp in restores], timeout=3600)
+        failed = [task for task in tasks.values() if task.Status != 'completed']
+        ```
+
+    Attributes:
+        client: The ClumioAPIClient used to list the tasks.
+        poll_interval: Base polling interval in seconds of the tasks whose type matches no
+            pattern of type_intervals.
+        max_interval: Maximum polling interval in seconds of a task.
+        backoff: Factor applied to the interval of a task each time it is found unchanged.
+        type_intervals: Base polling intervals in seconds, keyed by task type pattern.
+            Defaults to DEFAULT_TYPE_INTERVALS.
+        batch_size: Maximum number of task IDs in the filter of a list_tasks call.
+    """
+
+    def __init__(self, client: clumioapi_client.ClumioAPIClient, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.client = client
+
+    def wait_for_all(
+        self,
+        task_ids: Iterable[str],
+        timeout: float | None = None,
+        on_done: Callable[[task_with_e_tag.TaskWithETag], None] | None = None,
+    ) -> dict[str, task_with_e_tag.TaskWithETag]:
+        """Blocks until all the tasks have completed, failed or were aborted.
+
+        Args:
+            task_ids: The IDs of the tasks to wait for.
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely.
+            on_done: Called with the final state of each task as soon as it is found finished.
+        Returns:
+            The final state of the tasks, keyed by task ID.
+        Raises:
+            TimeoutError: If the tasks did not all finish within the timeout.
+            ClumioException: If listing the tasks fails.
+        """
+        schedule = self._schedule(task_ids, on_done)
+        self._wait(schedule, timeout, lambda: not schedule.pending)
+        return schedule.done
+
+    def wait_for_any(
+        self,
+        task_ids: Iterable[str],
+        timeout: float | None = None,
+        on_done: Callable[[task_with_e_tag.TaskWithETag], None] | None = None,
+    ) -> dict[str, task_with_e_tag.TaskWithETag]:
+        """Blocks until at least one of the tasks has completed, failed or was aborted.
+
+        Args:
+            task_ids: The IDs of the tasks to wait for.
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely.
+            on_done: Called with the final state of each task as soon as it is found finished.
+        Returns:
+            The final state of the tasks found finished by the last poll, keyed by task ID.
+        Raises:
+            TimeoutError: If no task finished within the timeout.
+            ClumioException: If listing the tasks fails.
+        """
+        schedule = self._schedule(task_ids, on_done)
+        self._wait(schedule, timeout, lambda: bool(schedule.done) or not schedule.pending)
+        return schedule.done
+
+    def _wait(self, schedule: _PollSchedule, timeout: float | None, finished: Any) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not finished():
+            remaining = self._remaining(deadline)
+            for batch, task_filter in self._batches(schedule.due()):
+                tasks = self.client.tasks_v1_paginator.list_tasks(
+                    limit=len(batch), filter=task_filter
+                ).iter_items()
+                schedule.update(batch, tasks)
+            if finished():
+                return
+            delay = schedule.seconds_to_next_poll()
+            time.sleep(delay if remaining is None else min(delay, remaining))
+
+
+class AsyncTaskWaiter(_BaseTaskWaiter):
+    """Asynchronous counterpart of TaskWaiter, driven by an AsyncClumioAPIClient.
+
+    The batches of a poll cycle are listed concurrently.
+
+    Example:
+        ```
+        async with AsyncClumioAPIClient(config) as client:
+            tasks = await AsyncTaskWaiter(client).wait_for_all(task_ids)
+        ```
+
+    Attributes:
+        client: The AsyncClumioAPIClient used to list the tasks.
+        poll_interval: Base polling interval in seconds of the tasks whose type matches no
+            pattern of type_intervals.
+        max_interval: Maximum polling interval in seconds of a task.
+        backoff: Factor applied to the interval of a task each time it is found unchanged.
+        type_intervals: Base polling intervals in seconds, keyed by task type pattern.
+            Defaults to DEFAULT_TYPE_INTERVALS.
+        batch_size: Maximum number of task IDs in the filter of a list_tasks call.
+    """
+
+    def __init__(self, client: async_clumioapi_client.AsyncClumioAPIClient, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.client = client
+
+    async def wait_for_all(
+        self,
+        task_ids: Iterable[str],
+        timeout: float | None = None,
+        on_done: Callable[[task_with_e_tag.TaskWithETag], None] | None = None,
+    ) -> dict[str, task_with_e_tag.TaskWithETag]:
+        """Waits until all the tasks have completed, failed or were aborted.
+
+        Args:
+            task_ids: The IDs of the tasks to wait for.
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely.
+            on_done: Called with the final state of each task as soon as it is found finished.
+        Returns:
+            The final state of the tasks, keyed by task ID.
+        Raises:
+            TimeoutError: If the tasks did not all finish within the timeout.
+            ClumioException: If listing the tasks fails.
+            TypeError: If the client is not an AsyncClumioAPIClient.
+        """
+        schedule = self._schedule(task_ids, on_done)
+        await self._wait(schedule, timeout, lambda: not schedule.pending)
+        return schedule.done
+
+    async def wait_for_any(
+        self,
+        task_ids: Iterable[str],
+        timeout: float | None = None,
+        on_done: Callable[[task_with_e_tag.TaskWithETag], None] | None = None,
+    ) -> dict[str, task_with_e_tag.TaskWithETag]:
+        """Waits until at least one of the tasks has completed, failed or was aborted.
+
+        Args:
+            task_ids: The IDs of the tasks to wait for.
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely.
+            on_done: Called with the final state of each task as soon as it is found finished.
+        Returns:
+            The final state of the tasks found finished by the last poll, keyed by task ID.
+        Raises:
+            TimeoutError: If no task finished within the timeout.
+            ClumioException: If listing the tasks fails.
+            TypeError: If the client is not an AsyncClumioAPIClient.
+        """
+        schedule = self._schedule(task_ids, on_done)
+        await self._wait(schedule, timeout, lambda: bool(schedule.done) or not schedule.pending)
+        return schedule.done
+
+    async def _wait(self, schedule: _PollSchedule, timeout: float | None, finished: Any) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not finished():
+            remaining = self._remaining(deadline)
+            batches = self._batches(schedule.due())
+            results = await asyncio.gather(*(self._list(*batch) for batch in batches))
+            for (batch, _), tasks in zip(batches, results):
+                schedule.update(batch, tasks)
+            if finished():
+                return
+            delay = schedule.seconds_to_next_poll()
+            await asyncio.sleep(delay if remaining is None else min(delay, remaining))
+
+    async def _list(
+        self, batch: list[str], task_filter: tasks_types.ListTasksV1FilterT
+    ) -> list[task_with_e_tag.TaskWithETag]:
+        paginator = self.client.tasks_v1_paginator
+        if not isinstance(paginator, tasks_v1.TasksV1AsyncControllerPaginator):
+            raise TypeError('AsyncTaskWaiter requires an AsyncClumioAPIClient.')
+        pages = paginator.list_tasks(limit=len(batch), filter=task_filter)
+        return [task async for task in pages.iter_items()]
@@ -31,10 +31,12 @@ setup(
     package_data={'clumioapi': ['py.typed']},
     install_requires=[
         'requests>=2.32.4',
-        'jsonpickle>=2.2.0',
         'python-dateutil>=2.9.0.post0',
         'urllib3>=2.5.0',
         'rest3client>=0.5.0',
         'pydantic>=2.11.7',
     ],
+    extras_require={
+        'async': ['httpx>=0.27.0'],
+    },
 )
@@ -0,0 +1,114 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+import hashlib
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+from clumioapi import artifact_download
+from clumioapi import configuration
+from clumioapi import retry_policy
+from clumioapi.exceptions import clumio_exception
+import requests
+
+_ARTIFACT = bytes(range(256)) * 4
+
+
+class _Response:
+    """A streamed response, dropping its connection after drop_after bytes if given."""
+
+    def __init__(self, status_code, body, headers, drop_after=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.reason = ''
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+        self.body = body
+        self.drop_after = drop_after
+
+    def iter_content(self, chunk_size):
+        end = len(self.body) if self.drop_after is None else self.drop_after
+        for i in range(0, end, chunk_size):
+            yield self.body[i : min(i + chunk_size, end)]
+        if self.drop_after is not None:
+            raise requests.exceptions.ChunkedEncodingError('Connection dropped.')
+
+    def close(self):
+        pass
+
+
+class _Server:
+    """Serves the artifact, honouring the ranges of the first ranged_requests requests."""
+
+    def __init__(self, ranged_requests, etag='"v1"', drop_after=None):
+        self.ranged_requests = ranged_requests
+        self.etag = etag
+        self.drop_after = drop_after
+        self.ranges: list[str] = []
+
+    def get(self, url, headers, stream, timeout):
+        self.ranges.append(headers['Range'])
+        drop_after, self.drop_after = self.drop_after, None
+        if len(self.ranges) > self.ranged_requests:
+            return _Response(200, _ARTIFACT, {'ETag': self.etag}, drop_after)
+        start, end = re.fullmatch(r'bytes=(\d+)-(\d*)', headers['Range']).groups()
+        end = int(end) if end else len(_ARTIFACT) - 1
+        content_range = f'bytes {start}-{end}/{len(_ARTIFACT)}'
+        body = _ARTIFACT[int(start) : end + 1]
+        return _Response(206, body, {'ETag': '"v1"', 'Content-Range': content_range}, drop_after)
+
+
+class ArtifactDownloaderTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'report.csv')
+        client = mock.Mock()
+        client.base_controller.config = configuration.Configuration(
+            api_token='token', retry_policy=retry_policy.RetryPolicy(base_delay=0)
+        )
+        self.downloader = artifact_download.ArtifactDownloader(
+            client, chunk_size=100, parallel_threshold=1 << 20
+        )
+
+    def _download(self, server: _Server) -> artifact_download.DownloadResult:
+        self.downloader.session = mock.Mock(get=server.get)
+        return self.downloader.download('https://example.com/report.csv', self.path)
+
+    def test_download(self) -> None:
+        server = _Server(ranged_requests=2, drop_after=250)
+        result = self._download(server)
+        self.assertEqual(server.ranges, ['bytes=0-', 'bytes=250-1023'])
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), _ARTIFACT)
+        self.assertEqual(result.digest, hashlib.sha256(_ARTIFACT).hexdigest())
+
+    def test_range_ignored_on_resume(self) -> None:
+        server = _Server(ranged_requests=1, drop_after=250)
+        result = self._download(server)
+        self.assertEqual(server.ranges, ['bytes=0-', 'bytes=250-1023'])
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), _ARTIFACT)
+        self.assertEqual(result.digest, hashlib.sha256(_ARTIFACT).hexdigest())
+
+    def test_range_ignored_by_segments(self) -> None:
+        self.downloader.parallel_threshold = self.downloader.segment_size = 300
+        server = _Server(ranged_requests=1)
+        result = self._download(server)
+        self.assertEqual(result.segments, 4)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), _ARTIFACT)
+        self.assertEqual(result.digest, hashlib.sha256(_ARTIFACT).hexdigest())
+
+    def test_changed_on_resume(self) -> None:
+        server = _Server(ranged_requests=1, etag='"v2"', drop_after=250)
+        with self.assertRaises(clumio_exception.ClumioException):
+            self._download(server)
+
+
+if __name__ == '__main__':
+    unittest.main()
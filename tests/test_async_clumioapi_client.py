@@ -0,0 +1,134 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+import asyncio
+import inspect
+import json
+import unittest
+from unittest import mock
+
+from clumioapi import async_clumioapi_client
+from clumioapi import async_transport
+from clumioapi import clumioapi_client
+from clumioapi import configuration
+from clumioapi import retry_policy
+from clumioapi.controllers import tasks_v1
+from clumioapi.exceptions import clumio_exception
+import requests
+
+
+def _response(status_code: int, body: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    response.url = 'https://api.clumio.com/tasks'
+    return response
+
+
+class _Transport:
+    """Records the requests and answers them with the given responses in turn."""
+
+    def __init__(self, *responses: requests.Response) -> None:
+        self.responses = list(responses)
+        self.requests: list[tuple[str, str, dict]] = []
+
+    async def request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        self.requests.append((method, endpoint, kwargs))
+        return self.responses.pop(0)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class AsyncClumioAPIClientTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.config = configuration.Configuration(
+            api_token='token', retry_policy=retry_policy.RetryPolicy(base_delay=0)
+        )
+
+    def _client(self, *responses: requests.Response) -> async_clumioapi_client.AsyncClumioAPIClient:
+        return async_clumioapi_client.AsyncClumioAPIClient(self.config, _Transport(*responses))
+
+    def test_request(self) -> None:
+        client = self._client(_response(200, {'id': '1', 'status': 'completed'}))
+        with mock.patch.object(
+            tasks_v1.TasksV1Controller,
+            'read_task',
+            autospec=True,
+            side_effect=tasks_v1.TasksV1Controller.read_task,
+        ) as read_task:
+            task = asyncio.run(client.tasks_v1.read_task(task_id='1'))
+        self.assertEqual((task.Id, task.Status), ('1', 'completed'))
+        self.assertEqual(read_task.call_count, 1)
+        method, endpoint, kwargs = client.transport.requests[0]  # type: ignore
+        self.assertEqual((method, endpoint), ('get', '/tasks/1'))
+        self.assertEqual(kwargs['headers']['accept'], 'application/api.clumio.tasks=v1+json')
+
+    def test_retry_and_error(self) -> None:
+        client = self._client(_response(503, {}), _response(404, {'errors': []}))
+        hooks = mock.Mock()
+        with self.assertRaises(clumio_exception.ClumioException) as error:
+            asyncio.run(client.tasks_v1.read_task(task_id='1', hooks=[hooks]))
+        self.assertEqual(error.exception.resp.status_code, 404)  # type: ignore
+        self.assertEqual(len(client.transport.requests), 2)  # type: ignore
+        self.assertEqual(hooks.on_retry.call_count, 1)
+        self.assertEqual(hooks.on_error.call_count, 1)
+
+    def test_paginator(self) -> None:
+        client = self._client(
+            _response(
+                200,
+                {
+                    '_embedded': {'items': [{'id': '1'}]},
+                    '_links': {'_next': {'href': '/tasks?start=2'}},
+                },
+            ),
+            _response(200, {'_embedded': {'items': [{'id': '2'}]}, '_links': {}}),
+        )
+
+        async def list_ids() -> list[str]:
+            pages = client.tasks_v1_paginator.list_tasks(limit=1)
+            return [task.Id async for task in pages.iter_items()]
+
+        self.assertEqual(asyncio.run(list_ids()), ['1', '2'])
+        requests_sent = client.transport.requests  # type: ignore
+        self.assertEqual([kwargs['params']['start'] for _, _, kwargs in requests_sent], [None, '2'])
+
+    def test_controllers(self) -> None:
+        # Every controller and paginator has an asynchronous counterpart of the same signature.
+        client = self._client()
+        properties = [
+            name
+            for name, value in vars(clumioapi_client.ClumioAPIClient).items()
+            if isinstance(value, property)
+        ]
+        self.assertGreater(len(properties), 100)
+        for name in properties:
+            controller = getattr(clumioapi_client.ClumioAPIClient(self.config), name)
+            async_controller = getattr(client, name)
+            methods = [m for m in vars(type(controller)) if not m.startswith('_')]
+            async_methods = [m for m in vars(type(async_controller)) if not m.startswith('_')]
+            self.assertEqual(methods, async_methods, name)
+            for method in methods:
+                signature = inspect.signature(getattr(controller, method))
+                async_method = getattr(async_controller, method)
+                self.assertEqual(signature.parameters, inspect.signature(async_method).parameters)
+                self.assertEqual(
+                    inspect.iscoroutinefunction(async_method), not name.endswith('_paginator')
+                )
+
+
+@unittest.skipIf(async_transport.httpx is None, 'httpx is not installed.')
+class AsyncTransportTest(unittest.TestCase):
+
+    def test_unsupported_argument(self) -> None:
+        transport = async_transport.AsyncTransport(configuration.Configuration(api_token='token'))
+        with self.assertRaises(TypeError):
+            asyncio.run(transport.request('get', '/tasks', verify=False))  # type: ignore
+        asyncio.run(transport.aclose())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+import datetime
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from clumioapi import audit_trail_sync
+from clumioapi.models import audit_trails
+
+
+class AuditTrailSyncTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.state_path = os.path.join(directory.name, 'audit_trails.json')
+        self.items: list[audit_trails.AuditTrails] = []
+        self.filters: list = []
+        self.client = mock.Mock()
+        self.client.audit_trails_v1_paginator.list_audit_trails.side_effect = self._list
+
+    def _list(self, limit=None, filter=None):
+        self.filters.append(filter)
+        items = self.items
+        if filter is not None:
+            since = audit_trail_sync._parse(filter.StartTimestamp['gte'])
+            items = [
+                item
+                for item in items
+                if not item.Timestamp or audit_trail_sync._parse(item.Timestamp) >= since
+            ]
+        return mock.Mock(iter_items=lambda: iter(items))
+
+    def _sync(self) -> list[str]:
+        delivered: list[str] = []
+        sync = audit_trail_sync.AuditTrailSync(
+            self.client, lambda item: delivered.append(item.Id), state_path=self.state_path
+        )
+        sync.sync()
+        return delivered
+
+    def test_incremental(self) -> None:
+        self.items = [
+            audit_trails.AuditTrails(Id='1', Timestamp='2025-01-01T00:00:00Z'),
+            audit_trails.AuditTrails(Id='2', Timestamp='2025-01-01T00:10:00Z'),
+        ]
+        self.assertEqual(self._sync(), ['1', '2'])
+        self.assertIsNone(self.filters[-1])
+
+        self.items.append(audit_trails.AuditTrails(Id='3', Timestamp='2025-01-01T00:08:00Z'))
+        self.assertEqual(self._sync(), ['3'])
+        self.assertEqual(self.filters[-1].StartTimestamp, {'gte': '2025-01-01T00:05:00Z'})
+
+    def test_without_timestamp(self) -> None:
+        self.items = [
+            audit_trails.AuditTrails(Id='1'),
+            audit_trails.AuditTrails(Id='2', Timestamp='2025-01-01T00:10:00+00:00'),
+        ]
+        self.assertEqual(self._sync(), ['1', '2'])
+        self.assertEqual(self._sync(), [])
+        sync = audit_trail_sync.AuditTrailSync(self.client, print, state_path=self.state_path)
+        self.assertEqual(
+            sync.high_water_mark,
+            datetime.datetime(2025, 1, 1, 0, 10, tzinfo=datetime.timezone.utc),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
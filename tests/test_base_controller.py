@@ -0,0 +1,46 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+from concurrent import futures
+import json
+import unittest
+from unittest import mock
+
+from clumioapi import clumioapi_client
+from clumioapi import configuration
+import requests
+
+
+def _response() -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps({'id': '1'}).encode()
+    return response
+
+
+class BaseControllerTest(unittest.TestCase):
+
+    def test_headers_copied_per_request(self) -> None:
+        config = configuration.Configuration(
+            api_token='token', custom_headers={'x-custom': 'value'}
+        )
+        client = clumioapi_client.ClumioAPIClient(config)
+        session = client.base_controller.client.session = mock.Mock()
+        session.request.side_effect = lambda *args, **kwargs: _response()
+        controller = client.tasks_v1
+        headers = dict(controller.headers)
+
+        with futures.ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: controller.read_task(task_id=str(i)), range(50)))
+
+        self.assertEqual(controller.headers, headers)
+        sent = [call.kwargs['headers'] for call in session.request.call_args_list]
+        self.assertEqual(len({id(request_headers) for request_headers in sent}), 50)
+        for request_headers in sent:
+            self.assertEqual(request_headers['Authorization'], 'Bearer token')
+            self.assertEqual(request_headers['x-custom'], 'value')
+
+
+if __name__ == '__main__':
+    unittest.main()
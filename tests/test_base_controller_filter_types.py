@@ -0,0 +1,253 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+import importlib
+import inspect
+import json
+import pkgutil
+import random
+import string
+import typing
+from typing import Any
+import unittest
+from urllib import parse
+
+from clumioapi.api_helper import camel_to_snake
+from clumioapi.controllers import types
+from clumioapi.controllers.types import audit_trails_types
+from clumioapi.controllers.types import base_controller_filter_types
+from clumioapi.controllers.types import tasks_types
+
+_BaseFilter = base_controller_filter_types.BaseControllerFilterTypes
+
+
+def _baseline_query_str(query_filter: _BaseFilter) -> str:
+    """The query string of a filter as serialized before the JSON encoder.
+
+    The fields are in declaration order, rather than in the arbitrary order of the set of
+    assigned fields, so that the strings can be compared.
+    """
+
+    def format_dict_value(value: dict) -> str:
+        dict_str = ''
+        for k, v in value.items():
+            if dict_str:
+                dict_str += ','
+            operation = '$' if k in base_controller_filter_types.operations else ''
+            dict_str += f'"{operation}{k.lower()}":{format_value(v)}'
+        return f'{{{dict_str}}}'
+
+    def format_nested_filter(value: _BaseFilter, parent_key: str) -> str:
+        nested_query_str = _baseline_query_str(value)
+        nested_str = nested_query_str[1:-1]
+        formatted_str = ''
+        for part in nested_str.split(','):
+            key, val = part.split(':', 1)
+            formatted_str += ',"{}.{}":{}'.format(parent_key, key.replace('"', ''), val)
+        return formatted_str.strip(',')
+
+    def format_value(value: Any, prefix: str = '') -> str:
+        if isinstance(value, dict):
+            if not value:
+                return f'"{prefix}":{{}}' if prefix else '{}'
+            if ['Key', 'Value'] != list(value.keys()) and (key := list(value)[0]).lower() != key:
+                new_prefix = f'{prefix}.{camel_to_snake(key)}' if prefix else camel_to_snake(key)
+                return format_value(value[key], new_prefix)
+            dict_str = format_dict_value(value)
+            return f'"{prefix}":{dict_str}' if prefix else dict_str
+        if isinstance(value, bool):
+            return f'"{prefix}":{str(value).lower()}' if prefix else str(value).lower()
+        if isinstance(value, str):
+            return f'"{prefix}":"{value}"' if prefix else f'"{value}"'
+        if isinstance(value, list):
+            formatted_list = ', '.join(format_value(v) for v in value)
+            return f'"{prefix}":[{formatted_list}]' if prefix else f'[{formatted_list}]'
+        if isinstance(value, int):
+            return f'"{prefix}":{value}' if prefix else str(value)
+        if isinstance(value, _BaseFilter):
+            return format_nested_filter(value, prefix)
+        raise ValueError(f'Unsupported value type: {type(value)}')
+
+    converted = [
+        format_value(value, camel_to_snake(name))
+        for name in type(query_filter).model_fields
+        if name in query_filter.model_fields_set
+        and (value := getattr(query_filter, name)) is not None
+    ]
+    return '{' + ','.join(converted) + '}'
+
+
+def _filter_classes() -> list[type[_BaseFilter]]:
+    """Returns the filter classes of all the controllers."""
+    classes = []
+    for module_info in pkgutil.iter_modules(types.__path__):
+        module = importlib.import_module(f'{types.__name__}.{module_info.name}')
+        classes.extend(
+            cls
+            for cls in vars(module).values()
+            if inspect.isclass(cls)
+            and issubclass(cls, _BaseFilter)
+            and cls is not _BaseFilter
+            and cls.__module__ == module.__name__
+        )
+    return classes
+
+
+class _FilterGenerator:
+    """Generates filters of any class, with values the baseline serialized correctly."""
+
+    def __init__(self, seed: int) -> None:
+        self.random = random.Random(seed)
+
+    def word(self) -> str:
+        letters = string.ascii_letters + string.digits + '-_/. '
+        return ''.join(self.random.choice(letters) for _ in range(self.random.randint(0, 8)))
+
+    def value(self, annotation: Any, depth: int) -> Any:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        value_type = args[0] if args else annotation
+        if inspect.isclass(value_type) and issubclass(value_type, _BaseFilter):
+            return self.filter(value_type, depth + 1) if depth < 2 else None
+        if typing.get_origin(value_type) is dict:
+            key_type, item_type = typing.get_args(value_type)
+            operation = self.random.choice(typing.get_args(key_type) or ('eq',))
+            item_types = typing.get_args(item_type) or (item_type,)
+            item_type = self.random.choice(item_types)
+            if item_type is dict:
+                return {operation: {'Key': self.word(), 'Value': self.word()}}
+            if item_type is list and dict in item_types:
+                return {operation: [{'Key': self.word(), 'Value': self.word()} for _ in range(2)]}
+            if item_type is list or typing.get_origin(item_type) is list:
+                return {operation: [self.word() for _ in range(self.random.randint(0, 4))]}
+            if item_type is int:
+                return {operation: self.random.randint(0, 10**6)}
+            if item_type is bool:
+                return {operation: self.random.choice([True, False])}
+            return {operation: self.word()}
+        if value_type is list or typing.get_origin(value_type) is list:
+            return [self.word() for _ in range(3)]
+        if value_type is bool:
+            return self.random.choice([True, False])
+        if value_type is int:
+            return self.random.randint(0, 9)
+        if value_type is str:
+            return self.word()
+        return None
+
+    def filter(self, cls: type[_BaseFilter], depth: int = 0) -> _BaseFilter:
+        values = {}
+        for name, field in cls.model_fields.items():
+            if self.random.random() < 0.5:
+                value = self.value(field.annotation, depth)
+                if value is not None:
+                    values[name] = value
+        for name in list(values):
+            try:
+                cls(**{name: values[name]})
+            except ValueError:
+                del values[name]
+        return cls(**values)
+
+
+class QueryStrTest(unittest.TestCase):
+
+    def test_baseline(self) -> None:
+        generator = _FilterGenerator(seed=7)
+        classes = _filter_classes()
+        self.assertGreater(len(classes), 50)
+        compared = 0
+        for _ in range(20):
+            for cls in classes:
+                query_filter = generator.filter(cls)
+                try:
+                    expected = _baseline_query_str(query_filter)
+                except ValueError:
+                    # The baseline could not serialize nested filters of several conditions.
+                    continue
+                self.assertEqual(query_filter.query_str, expected)
+                self.assertEqual(json.loads(query_filter.query_str), json.loads(expected))
+                compared += 1
+        self.assertGreater(compared, 1000)
+
+    def test_special_characters(self) -> None:
+        values = ['a,b', 'c:d', 'e"f', 'g\\h', 'ünï']
+        query_filter = audit_trails_types.ListAuditTrailsV1FilterT(
+            PrimaryEntity=audit_trails_types.ListAuditTrailsPrimaryEntityV1T(
+                Value={'in': values}, Id={'in': ['x']}
+            )
+        )
+        self.assertEqual(
+            json.loads(query_filter.query_str),
+            {'primary_entity.id': {'$in': ['x']}, 'primary_entity.value': {'$in': values}},
+        )
+
+    def test_cache_invalidated_by_assignment(self) -> None:
+        query_filter = audit_trails_types.ListAuditTrailsV1FilterT(
+            Category={'in': ['x']},
+            PrimaryEntity=audit_trails_types.ListAuditTrailsPrimaryEntityV1T(Id={'in': ['a']}),
+        )
+        first = query_filter.query_str
+        self.assertIs(query_filter.query_str, first)
+        query_filter.Category = {'in': ['y']}
+        self.assertEqual(
+            query_filter.query_str,
+            '{"category":{"$in":["y"]},"primary_entity.id":{"$in":["a"]}}',
+        )
+        query_filter.PrimaryEntity.Id = {'in': ['b', 'c']}  # type: ignore
+        self.assertEqual(
+            query_filter.query_str,
+            '{"category":{"$in":["y"]},"primary_entity.id":{"$in":["b", "c"]}}',
+        )
+
+    def test_cache_invalidated_by_model_copy(self) -> None:
+        query_filter = tasks_types.ListTasksV1FilterT(Status={'in': ['queued']})
+        original = query_filter.query_str
+        copied = query_filter.model_copy(update={'Status': {'in': ['failed', 'aborted']}})
+        self.assertEqual(copied.query_str, '{"status":{"$in":["failed", "aborted"]}}')
+        self.assertEqual(query_filter.query_str, original)
+        self.assertEqual(query_filter.model_copy().query_str, original)
+
+
+class SplitTest(unittest.TestCase):
+
+    def test_fits(self) -> None:
+        query_filter = tasks_types.ListTasksV1FilterT(Id={'in': ['1', '2']})
+        self.assertEqual(query_filter.split(100), [query_filter])
+
+    def test_split(self) -> None:
+        ids = [f'{i:032x}' for i in range(500)]
+        query_filter = tasks_types.ListTasksV1FilterT(
+            Id={'in': ids + ids[:10]}, Status={'in': ['queued', 'in_progress']}
+        )
+        for max_length in (200, 1000, 5000):
+            chunks = query_filter.split(max_length)
+            self.assertGreater(len(chunks), 1)
+            for chunk in chunks:
+                self.assertLessEqual(len(parse.quote_plus(chunk.query_str)), max_length)
+                self.assertEqual(chunk.Status, {'in': ['queued', 'in_progress']})
+            chunk_ids = [id_ for chunk in chunks for id_ in chunk.Id['in']]  # type: ignore
+            self.assertEqual(chunk_ids, ids)
+
+    def test_nested(self) -> None:
+        values = [str(i) for i in range(200)]
+        query_filter = audit_trails_types.ListAuditTrailsV1FilterT(
+            Category={'in': ['x']},
+            PrimaryEntity=audit_trails_types.ListAuditTrailsPrimaryEntityV1T(Value={'in': values}),
+        )
+        chunks = query_filter.split(300)
+        for chunk in chunks:
+            self.assertLessEqual(len(parse.quote_plus(chunk.query_str)), 300)
+        chunk_values = [
+            value for chunk in chunks for value in chunk.PrimaryEntity.Value['in']  # type: ignore
+        ]
+        self.assertEqual(chunk_values, values)
+
+    def test_cannot_split(self) -> None:
+        query_filter = tasks_types.ListTasksV1FilterT(Id={'in': ['x' * 200]})
+        with self.assertRaises(ValueError):
+            query_filter.split(100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from clumioapi import bulk_restore
+from clumioapi.exceptions import clumio_exception
+from clumioapi.models import restore_aws_ebs_volume_v2_request
+from clumioapi.models import task_with_e_tag
+import requests
+import urllib3
+
+
+def _response(status_code: int) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp.reason = 'Error'
+    resp._content = b'{}'
+    return resp
+
+
+def _connection_refused() -> requests.exceptions.ConnectionError:
+    reason = urllib3.exceptions.NewConnectionError(None, 'Connection refused')
+    return requests.exceptions.ConnectionError(
+        urllib3.exceptions.MaxRetryError(None, '/restores/aws/ebs-volumes', reason)
+    )
+
+
+class _Waiter:
+    """Completes every task at once."""
+
+    def wait_for_all(self, task_ids, timeout=None, on_done=None):
+        tasks = {
+            task_id: task_with_e_tag.TaskWithETag(Id=task_id, Status='completed')
+            for task_id in task_ids
+        }
+        for task in tasks.values():
+            on_done(task)
+        return tasks
+
+
+class BulkRestoreTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.checkpoint_path = os.path.join(directory.name, 'drill.json')
+        self.outcomes: dict[str, object] = {}
+        self.submitted: list[str] = []
+        self.client = mock.Mock()
+        self.client.restored_aws_ebs_volumes_v2.restore_aws_ebs_volume.side_effect = self._restore
+
+    def _restore(self, body, **kwargs):
+        key = body.Source.SnapshotId
+        self.submitted.append(key)
+        outcome = self.outcomes.get(key, f'task-{key}')
+        if isinstance(outcome, Exception):
+            raise outcome
+        return mock.Mock(TaskId=outcome)
+
+    def _run(self, keys: list[str]) -> bulk_restore.BulkRestoreReport:
+        self.submitted = []
+        engine = bulk_restore.BulkRestore(
+            self.client, checkpoint_path=self.checkpoint_path, waiter=_Waiter()
+        )
+        request = restore_aws_ebs_volume_v2_request.RestoreAwsEbsVolumeV2Request
+        return engine.run({key: request(Source=mock.Mock(SnapshotId=key)) for key in keys})
+
+    def test_outcome_of_errors(self) -> None:
+        self.outcomes = {
+            'rejected': clumio_exception.ClumioException('Rejected.', _response(400)),
+            'refused': _connection_refused(),
+            'connect_timeout': requests.exceptions.ConnectTimeout(),
+            'server_error': clumio_exception.ClumioException('Failed.', _response(503)),
+            'read_timeout': requests.exceptions.ReadTimeout(),
+            'reset': requests.exceptions.ConnectionError(
+                urllib3.exceptions.ProtocolError('Connection aborted.')
+            ),
+        }
+        report = self._run(list(self.outcomes) + ['ok'])
+        statuses = {key: result.status for key, result in report.results.items()}
+        self.assertEqual(
+            statuses,
+            {
+                'rejected': bulk_restore.SUBMIT_FAILED,
+                'refused': bulk_restore.SUBMIT_FAILED,
+                'connect_timeout': bulk_restore.SUBMIT_FAILED,
+                'server_error': bulk_restore.UNKNOWN,
+                'read_timeout': bulk_restore.UNKNOWN,
+                'reset': bulk_restore.UNKNOWN,
+                'ok': 'completed',
+            },
+        )
+        self.assertCountEqual(
+            [result.key for result in report.unknown], ['server_error', 'read_timeout', 'reset']
+        )
+
+    def test_resume_from_checkpoint(self) -> None:
+        self.outcomes = {
+            'rejected': clumio_exception.ClumioException('Rejected.', _response(400)),
+            'read_timeout': requests.exceptions.ReadTimeout(),
+        }
+        keys = ['ok', 'rejected', 'read_timeout']
+        self._run(keys)
+        with open(self.checkpoint_path, encoding='utf-8') as f:
+            saved = json.load(f)
+        self.assertEqual(saved['ok'], {'status': 'completed', 'task_id': 'task-ok', 'error': None})
+        self.assertEqual(saved['read_timeout']['status'], bulk_restore.UNKNOWN)
+
+        self.outcomes = {}
+        report = self._run(keys)
+        # Only the rejected restore is submitted again.
+        self.assertEqual(self.submitted, ['rejected'])
+        self.assertEqual(report.resumed, 2)
+        self.assertEqual(report.results['rejected'].status, 'completed')
+        self.assertEqual(report.results['read_timeout'].status, bulk_restore.UNKNOWN)
+
+    def test_resume_interrupted_submission(self) -> None:
+        with open(self.checkpoint_path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    'sending': {'status': bulk_restore.SUBMITTING, 'task_id': None, 'error': None},
+                    'sent': {'status': bulk_restore.SUBMITTED, 'task_id': 'task-1', 'error': None},
+                },
+                f,
+            )
+        report = self._run(['sending', 'sent', 'new'])
+        self.assertEqual(self.submitted, ['new'])
+        self.assertEqual(report.results['sending'].status, bulk_restore.UNKNOWN)
+        self.assertEqual(report.results['sent'].status, 'completed')
+        self.assertEqual(report.results['new'].status, 'completed')
+
+
+if __name__ == '__main__':
+    unittest.main()
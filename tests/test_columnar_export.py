@@ -0,0 +1,111 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from clumioapi import columnar_export
+from clumioapi import configuration
+from clumioapi.controllers import pagination
+
+try:
+    from pyarrow import parquet
+except ImportError:  # pragma: no cover
+    parquet = None
+
+
+def _pages(*pages: list[dict]) -> list[dict]:
+    """Returns the decoded JSON of list responses with the given items."""
+    return [{'_embedded': {'items': items}} for items in pages]
+
+
+@unittest.skipIf(parquet is None, 'pyarrow is not installed.')
+class ColumnarExportTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(directory.name, 'tasks.parquet')
+
+    def test_sparse_fields(self) -> None:
+        pages = _pages(
+            [{'id': '1', 'parent': None}],
+            [{'id': '2', 'parent': {'id': 'a'}}],
+            [{'id': '3', 'size': 5}],
+        )
+        self.assertEqual(columnar_export.write_parquet(pages, self.path), 3)
+        self.assertEqual(
+            parquet.read_table(self.path).to_pylist(),
+            [
+                {'id': '1', 'parent.id': None, 'size': None},
+                {'id': '2', 'parent.id': 'a', 'size': None},
+                {'id': '3', 'parent.id': None, 'size': 5},
+            ],
+        )
+        self.assertEqual(os.listdir(self.directory), ['tasks.parquet'])
+
+    def test_fields_of_null_object(self) -> None:
+        pages = _pages(
+            [{'id': '1', 'parent': None}],
+            [{'id': '2', 'parent': {'id': 'a', 'tags': {'env': 'prod'}}}, {'id': '3'}],
+        )
+        columnar_export.write_parquet(pages, self.path, buffer_rows=1)
+        self.assertEqual(
+            parquet.read_table(self.path).to_pylist(),
+            [
+                {'id': '1', 'parent': None},
+                {'id': '2', 'parent': json.dumps({'id': 'a', 'tags': {'env': 'prod'}})},
+                {'id': '3', 'parent': None},
+            ],
+        )
+
+    def test_failure_leaves_no_file(self) -> None:
+        pages = _pages([{'id': '1'}], [{'id': '2', 'size': 5}])
+        with self.assertRaises(ValueError):
+            columnar_export.write_parquet(pages, self.path, buffer_rows=1)
+        with self.assertRaises(ValueError):
+            columnar_export.write_csv(pages, self.path, buffer_rows=1)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_csv(self) -> None:
+        path = os.path.join(self.directory, 'tasks.csv')
+        pages = _pages([{'id': '1', 'tags': ['a', 'b']}], [{'id': '2', 'size': 1.5}])
+        self.assertEqual(columnar_export.write_csv(pages, path), 2)
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(
+            rows,
+            [
+                {'id': '1', 'tags': '["a", "b"]', 'size': ''},
+                {'id': '2', 'tags': '', 'size': '1.5'},
+            ],
+        )
+
+    def test_page_iterator(self) -> None:
+        pages = _pages([{'id': '1', 'size': 1}], [{'id': '2', 'size': 2.5}])
+        pages[0]['_links'] = {'_next': {'href': '/tasks?start=2'}}
+
+        def iterator() -> pagination.PageIterator[dict]:
+            return pagination.PageIterator(
+                lambda start: pages[int(start or 1) - 1],
+                None,
+                configuration.Configuration(api_token='token'),
+            )
+
+        table = iterator().to_arrow()
+        self.assertEqual(table.to_pylist(), [{'id': '1', 'size': 1.0}, {'id': '2', 'size': 2.5}])
+        self.assertEqual(iterator().write_parquet(self.path, compression='zstd'), 2)
+        self.assertEqual(parquet.read_table(self.path).to_pylist(), table.to_pylist())
+
+    def test_models(self) -> None:
+        with self.assertRaises(TypeError):
+            columnar_export.to_table([object()])  # type: ignore[list-item]
+
+
+if __name__ == '__main__':
+    unittest.main()
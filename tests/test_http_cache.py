@@ -0,0 +1,69 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+import unittest
+
+from clumioapi import http_cache
+import requests
+
+_HEADERS = {'accept': 'application/api.clumio.tasks=v1+json'}
+
+
+def _response(status_code: int, content: bytes = b'', etag: str | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    if etag:
+        response.headers['ETag'] = etag
+    return response
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.cache = http_cache.ResponseCache(default_ttl=60)
+        self.sent: list[dict] = []
+
+    def _fetch(self, namespace: str, headers: dict, *responses: requests.Response) -> bytes:
+        pending = list(responses)
+
+        def send(request_headers):
+            self.sent.append(dict(request_headers))
+            return pending.pop(0)
+
+        return self.cache.fetch('/tasks', headers, {}, send, namespace).content
+
+    def test_namespaces(self) -> None:
+        tenant_a = http_cache.cache_namespace('us-west-2.api.clumio.com', 'token-a')
+        tenant_b = http_cache.cache_namespace('us-west-2.api.clumio.com', 'token-b')
+        region_b = http_cache.cache_namespace('eu-central-1.api.clumio.com', 'token-a')
+        self.assertNotIn('token-a', tenant_a)
+        self.assertEqual(self._fetch(tenant_a, _HEADERS, _response(200, b'a')), b'a')
+        self.assertEqual(self._fetch(tenant_a, _HEADERS), b'a')
+        self.assertEqual(self._fetch(tenant_b, _HEADERS, _response(200, b'b')), b'b')
+        self.assertEqual(self._fetch(region_b, _HEADERS, _response(200, b'c')), b'c')
+        self.assertEqual(len(self.sent), 3)
+
+    def test_custom_headers(self) -> None:
+        namespace = http_cache.cache_namespace('api.clumio.com', 'token')
+        self.assertEqual(self._fetch(namespace, _HEADERS, _response(200, b'a')), b'a')
+        headers = {**_HEADERS, 'x-custom': 'value'}
+        self.assertEqual(self._fetch(namespace, headers, _response(200, b'b')), b'b')
+        self.assertEqual(self._fetch(namespace, {**_HEADERS, 'Authorization': 'x'}), b'a')
+
+    def test_not_modified_without_entry(self) -> None:
+        headers = {**_HEADERS, 'If-None-Match': '"v1"'}
+        content = self._fetch('', headers, _response(304), _response(200, b'a', '"v1"'))
+        self.assertEqual(content, b'a')
+        self.assertEqual(self.sent[1], _HEADERS)
+
+    def test_revalidation(self) -> None:
+        self.cache.default_ttl = 0
+        self.assertEqual(self._fetch('', _HEADERS, _response(200, b'a', '"v1"')), b'a')
+        self.assertEqual(self._fetch('', _HEADERS, _response(304)), b'a')
+        self.assertEqual(self.sent[1], {**_HEADERS, 'If-None-Match': '"v1"'})
+
+
+if __name__ == '__main__':
+    unittest.main()
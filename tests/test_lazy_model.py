@@ -0,0 +1,79 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+import copy
+import dataclasses
+import pickle
+import unittest
+
+from clumioapi import lazy_model
+from clumioapi.models import list_tasks_response
+
+_DATA = {
+    'current_count': 2,
+    'limit': 2,
+    '_embedded': {
+        'items': [
+            {
+                'id': str(i),
+                'type': 'aws_ebs_volume_restore',
+                'status': 'completed',
+                'primary_entity': {'id': f'vol-{i}', 'type': 'aws_ebs_volume'},
+            }
+            for i in range(2)
+        ]
+    },
+}
+
+
+class LazyModelTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.eager = list_tasks_response.ListTasksResponse.from_dictionary(_DATA)
+        self.lazy = lazy_model.wrap(list_tasks_response.ListTasksResponse, _DATA)
+
+    def test_is_lazy(self) -> None:
+        self.assertIsInstance(self.lazy, list_tasks_response.ListTasksResponse)
+        self.assertIsNot(type(self.lazy), list_tasks_response.ListTasksResponse)
+
+    def test_equals_eager(self) -> None:
+        self.assertEqual(self.lazy, self.eager)
+        self.assertEqual(self.eager, self.lazy)
+        self.assertEqual(self.lazy.Embedded.Items[0], self.eager.Embedded.Items[0])
+        self.assertEqual(self.lazy, lazy_model.wrap(list_tasks_response.ListTasksResponse, _DATA))
+        self.assertNotEqual(self.lazy, dataclasses.replace(self.eager, Limit=5))
+
+    def test_pickle(self) -> None:
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(self.lazy, protocol))
+            self.assertIs(type(unpickled), list_tasks_response.ListTasksResponse)
+            self.assertIs(
+                type(unpickled.Embedded.Items[0].PrimaryEntity),
+                type(self.eager.Embedded.Items[0].PrimaryEntity),
+            )
+            self.assertEqual(unpickled, self.eager)
+
+    def test_copy(self) -> None:
+        self.assertEqual(copy.copy(self.lazy), self.eager)
+        self.assertEqual(copy.deepcopy(self.lazy), self.eager)
+
+    def test_replace(self) -> None:
+        replaced = dataclasses.replace(self.lazy, Limit=5)
+        self.assertIs(type(replaced), list_tasks_response.ListTasksResponse)
+        self.assertEqual(replaced.Limit, 5)
+        self.assertEqual(replaced, dataclasses.replace(self.eager, Limit=5))
+        self.assertEqual(self.lazy.Limit, 2)
+
+    def test_replace_protocol(self) -> None:
+        replaced = self.lazy.__replace__(CurrentCount=1)
+        self.assertIs(type(replaced), list_tasks_response.ListTasksResponse)
+        self.assertEqual(replaced, dataclasses.replace(self.eager, CurrentCount=1))
+
+    def test_assignment(self) -> None:
+        self.lazy.Limit = 5
+        self.assertEqual(self.lazy, dataclasses.replace(self.eager, Limit=5))
+
+
+if __name__ == '__main__':
+    unittest.main()
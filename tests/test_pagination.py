@@ -0,0 +1,85 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+import asyncio
+import importlib
+import threading
+import unittest
+
+from clumioapi import configuration
+from clumioapi.controllers import pagination
+
+
+class _Collection:
+    """Serves pages whose Next links carry the given start tokens."""
+
+    def __init__(self, next_starts: dict[str | None, str | None], total_pages: int) -> None:
+        self.next_starts = next_starts
+        self.total_pages = total_pages
+        self.starts: list[str | None] = []
+        self.lock = threading.Lock()
+
+    def page(self, start: str | None) -> dict:
+        with self.lock:
+            self.starts.append(start)
+        next_start = self.next_starts.get(start)
+        return {
+            '_embedded': {'items': [{'id': start or '1'}]},
+            '_links': {'_next': {'href': f'/tasks?start={next_start}'}} if next_start else {},
+            'total_pages_count': self.total_pages,
+        }
+
+    async def page_async(self, start: str | None) -> dict:
+        return self.page(start)
+
+
+class PaginationTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.config = configuration.Configuration(api_token='token', page_prefetch_concurrency=4)
+
+    def test_page_number_operation(self) -> None:
+        # Page 2 has no Next link, but the pages up to TotalPagesCount are fetched by number.
+        collection = _Collection({None: '2'}, total_pages=4)
+        pages = pagination.PageIterator(
+            collection.page, None, self.config, operation='tasks_v1.list_tasks'
+        )
+        self.assertEqual([item['id'] for item in pages.iter_items()], ['1', '2', '3', '4'])
+        self.assertEqual(sorted(collection.starts[1:]), ['2', '3', '4'])
+
+    def test_token_operation(self) -> None:
+        # Numeric tokens of a collection that is not page-number based are not page numbers.
+        collection = _Collection({None: '500', '500': '900'}, total_pages=3)
+        pages = pagination.PageIterator(
+            collection.page, None, self.config, operation='aws_connections_v1.list_aws_connections'
+        )
+        self.assertEqual([item['id'] for item in pages.iter_items()], ['1', '500', '900'])
+        self.assertEqual(collection.starts, [None, '500', '900'])
+
+    def test_async(self) -> None:
+        async def ids(operation: str) -> list[str]:
+            pages = pagination.AsyncPageIterator(
+                collection.page_async, None, self.config, operation=operation
+            )
+            return [item['id'] async for item in pages.iter_items()]
+
+        collection = _Collection({None: '2'}, total_pages=3)
+        self.assertEqual(asyncio.run(ids('tasks_v1.list_tasks')), ['1', '2', '3'])
+        collection = _Collection({None: '2'}, total_pages=3)
+        self.assertEqual(asyncio.run(ids('aws_connections_v1.list_aws_connections')), ['1', '2'])
+
+    def test_page_number_operations_exist(self) -> None:
+        for operation in pagination.PAGE_NUMBER_OPERATIONS:
+            module_name, method = operation.split('.')
+            module = importlib.import_module(f'clumioapi.controllers.{module_name}')
+            paginators = [
+                cls for name, cls in vars(module).items() if name.endswith('ControllerPaginator')
+            ]
+            self.assertEqual(len(paginators), 2, operation)
+            for paginator in paginators:
+                self.assertTrue(hasattr(paginator, method), operation)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+#
+# Copyright 2025. Clumio, A Commvault Company.
+#
+
+import datetime
+import unittest
+from unittest import mock
+
+from clumioapi import pitr_index
+
+_DAY = datetime.datetime(2025, 1, 31, tzinfo=datetime.timezone.utc)
+
+
+def _at(hour: float) -> float:
+    return _DAY.timestamp() + hour * 3600
+
+
+def _rfc3339(hour: float) -> str:
+    return datetime.datetime.fromtimestamp(_at(hour), datetime.timezone.utc).strftime(
+        '%Y-%m-%dT%H:%M:%SZ'
+    )
+
+
+class IntervalSetTest(unittest.TestCase):
+
+    def test_add(self) -> None:
+        intervals = pitr_index.IntervalSet([(10, 20), (30, 40)])
+        self.assertEqual(list(intervals), [(10, 20), (30, 40)])
+        intervals.add(50, 60)
+        intervals.add(0, 5)
+        self.assertEqual(list(intervals), [(0, 5), (10, 20), (30, 40), (50, 60)])
+        # Overlapping and touching intervals are merged.
+        intervals.add(15, 30)
+        intervals.add(60, 70)
+        self.assertEqual(list(intervals), [(0, 5), (10, 40), (50, 70)])
+        intervals.add(-5, 100)
+        self.assertEqual(list(intervals), [(-5, 100)])
+        self.assertEqual(
+            (intervals.earliest, intervals.latest, intervals.last_start), (-5, 100, -5)
+        )
+        with self.assertRaises(ValueError):
+            intervals.add(2, 1)
+
+    def test_empty(self) -> None:
+        intervals = pitr_index.IntervalSet()
+        self.assertEqual(len(intervals), 0)
+        self.assertIsNone(intervals.last_start)
+        self.assertFalse(intervals.contains(0))
+        self.assertFalse(intervals.covers(0, 0))
+        self.assertIsNone(intervals.latest_before(0))
+
+    def test_covers(self) -> None:
+        intervals = pitr_index.IntervalSet([(10, 20), (30, 40)])
+        self.assertTrue(intervals.covers(10, 20))
+        self.assertTrue(intervals.covers(12, 12))
+        self.assertFalse(intervals.covers(15, 35))
+        self.assertFalse(intervals.covers(5, 15))
+        self.assertFalse(intervals.covers(21, 29))
+        with self.assertRaises(ValueError):
+            intervals.covers(20, 10)
+
+    def test_queries(self) -> None:
+        intervals = pitr_index.IntervalSet([(10, 20), (30, 40)])
+        self.assertEqual(intervals.interval_at(30), (30, 40))
+        self.assertIsNone(intervals.interval_at(25))
+        self.assertEqual(intervals.latest_before(25), 20)
+        self.assertEqual(intervals.latest_before(35), 35)
+        self.assertIsNone(intervals.latest_before(5))
+
+
+class PitrIndexTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.intervals: dict[str, list[tuple[float, float]]] = {}
+        self.filters: list = []
+        self.client = mock.Mock()
+        paginator = self.client.protection_groups_s3_assets_v1_paginator
+        paginator.list_protection_group_s3_asset_pitr_intervals.side_effect = self._list
+        self.index = pitr_index.PitrIndex(self.client)
+
+    def _list(self, protection_group_s3_asset_id, limit=None, filter=None):
+        self.filters.append(filter)
+        items = [
+            mock.Mock(StartTimestamp=_rfc3339(start), EndTimestamp=_rfc3339(end))
+            for start, end in self.intervals[protection_group_s3_asset_id]
+        ]
+        return mock.Mock(iter_items=lambda: iter(items))
+
+    def _add(self, intervals: dict[str, list[tuple[float, float]]]) -> None:
+        self.intervals = intervals
+        self.index.add_assets(pitr_index.S3_ASSET, intervals)
+        self.index.refresh()
+
+    def test_queries(self) -> None:
+        self._add({'a': [(0, 10), (12, 23)]})
+        self.assertTrue(self.index.is_restorable('a', '2025-01-31T22:00:00Z'))
+        self.assertTrue(self.index.is_restorable('a', _DAY + datetime.timedelta(hours=5)))
+        self.assertTrue(self.index.is_restorable('a', '2025-01-31T22:00:00+00:00'))
+        self.assertFalse(self.index.is_restorable('a', '2025-01-31T11:00:00Z'))
+        self.assertTrue(self.index.is_range_restorable('a', _rfc3339(12), _rfc3339(23)))
+        self.assertFalse(self.index.is_range_restorable('a', _rfc3339(9), _rfc3339(13)))
+        self.assertEqual(
+            self.index.latest_restorable(['a']), {'a': _DAY + datetime.timedelta(hours=23)}
+        )
+
+    def test_latest_common_point(self) -> None:
+        self._add(
+            {
+                'a': [(0, 10), (12, 23)],
+                'b': [(0, 11), (14, 20)],
+                'c': [(0, 24)],
+                'd': [(5, 6)],
+            }
+        )
+        hours = lambda hour: _DAY + datetime.timedelta(hours=hour)
+        self.assertEqual(self.index.latest_common_point(['a', 'b', 'c']), hours(20))
+        self.assertEqual(self.index.latest_common_point(['a', 'b'], before=_rfc3339(13)), hours(10))
+        self.assertEqual(self.index.latest_common_point(['a', 'b', 'd']), hours(6))
+        self.assertIsNone(self.index.latest_common_point(['a', 'd'], before=_rfc3339(4)))
+        self.assertIsNone(self.index.latest_common_point([]))
+
+    def test_incremental_refresh(self) -> None:
+        self._add({'a': [(0, 10), (12, 20)]})
+        self.assertIsNone(self.filters[-1])
+        # The latest interval grew, and a new one started.
+        self.intervals = {'a': [(12, 22), (23, 24)]}
+        self.index.refresh()
+        self.assertEqual(self.filters[-1].Timestamp, {'gte': _rfc3339(12)})
+        self.assertEqual(
+            list(self.index.intervals('a')),
+            [(_at(0), _at(10)), (_at(12), _at(22)), (_at(23), _at(24))],
+        )
+        # A full refresh drops the expired intervals.
+        self.index.refresh(full=True)
+        self.assertIsNone(self.filters[-1])
+        self.assertEqual(list(self.index.intervals('a')), [(_at(12), _at(22)), (_at(23), _at(24))])
+
+
+if __name__ == '__main__':
+    unittest.main()